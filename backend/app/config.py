@@ -42,6 +42,30 @@ class Config:
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:5173", "http://localhost:5174"]
     MAX_UPLOAD_SIZE: int = 100 * 1024 * 1024  # 100MB
 
+    # Phase 63-D: ZIP 묶음 압축 해제 한도 (내부 파일 하나 / 묶음 전체)
+    MAX_ZIP_MEMBER_SIZE: int = 100 * 1024 * 1024  # 100MB
+    MAX_ZIP_TOTAL_SIZE: int = 1024 * 1024 * 1024  # 1GB
+    # 일괄 업로드(/parse/batch) 파일 크기 합
+    MAX_BATCH_UPLOAD_SIZE: int = 1024 * 1024 * 1024  # 1GB
+
+    # Phase 63-I: 한글 파싱 결과 캐시 최대 용량
+    PARSE_CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # 512MB
+
+    # Phase 65-A: groups.json 메모리 캐시 최대 파일 수
+    GROUPS_CACHE_MAX_FILES: int = 4096
+
+    # Phase 66-A: 시험지 PDF 렌더링 (이미지 출력 DPI, 결과 캐시 최대 용량)
+    EXAM_PDF_IMAGE_DPI: int = 200
+    EXAM_RENDER_CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # 512MB
+
+    # Phase 67-B: 그룹 변경 이벤트 (배치 대기 시간, 대기 중인 페이지 최대 수)
+    GROUP_EVENTS_BATCH_MS: int = 100
+    GROUP_EVENTS_MAX_PENDING: int = 1024
+
+    # Phase 67-D: 작업 세션 로그 (스냅샷 주기, 되돌리기 이력 수)
+    SESSION_SNAPSHOT_EVERY: int = 200
+    SESSION_UNDO_DEPTH: int = 50
+
     @classmethod
     def load(cls) -> 'Config':
         """
@@ -91,6 +115,29 @@ class Config:
 
         config.MAX_UPLOAD_SIZE = int(os.getenv('MAX_UPLOAD_SIZE', str(100 * 1024 * 1024)))
 
+        # Phase 63-D: ZIP 압축 해제 한도
+        config.MAX_ZIP_MEMBER_SIZE = int(os.getenv('MAX_ZIP_MEMBER_SIZE', str(100 * 1024 * 1024)))
+        config.MAX_ZIP_TOTAL_SIZE = int(os.getenv('MAX_ZIP_TOTAL_SIZE', str(1024 * 1024 * 1024)))
+        config.MAX_BATCH_UPLOAD_SIZE = int(os.getenv('MAX_BATCH_UPLOAD_SIZE', str(1024 * 1024 * 1024)))
+
+        # Phase 63-I: 한글 파싱 결과 캐시
+        config.PARSE_CACHE_MAX_BYTES = int(os.getenv('PARSE_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+
+        # Phase 65-A: groups.json 캐시
+        config.GROUPS_CACHE_MAX_FILES = int(os.getenv('GROUPS_CACHE_MAX_FILES', '4096'))
+
+        # Phase 66-A: 시험지 PDF 렌더링
+        config.EXAM_PDF_IMAGE_DPI = int(os.getenv('EXAM_PDF_IMAGE_DPI', '200'))
+        config.EXAM_RENDER_CACHE_MAX_BYTES = int(os.getenv('EXAM_RENDER_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+
+        # Phase 67-B: 그룹 변경 이벤트
+        config.GROUP_EVENTS_BATCH_MS = int(os.getenv('GROUP_EVENTS_BATCH_MS', '100'))
+        config.GROUP_EVENTS_MAX_PENDING = int(os.getenv('GROUP_EVENTS_MAX_PENDING', '1024'))
+
+        # Phase 67-D: 작업 세션 로그
+        config.SESSION_SNAPSHOT_EVERY = int(os.getenv('SESSION_SNAPSHOT_EVERY', '200'))
+        config.SESSION_UNDO_DEPTH = int(os.getenv('SESSION_UNDO_DEPTH', '50'))
+
         # 경로 검증
         config.validate()
 
@@ -127,10 +174,22 @@ class Config:
         """Phase 14-2: 이미지 확장자 반환"""
         return ".webp" if self.IMAGE_FORMAT == "webp" else ".png"
 
+    def get_parse_cache_dir(self) -> Path:
+        """Phase 63-I: 한글 파싱 결과 캐시 디렉토리"""
+        return self.DATASET_ROOT / 'hangul_parse_cache'
+
     def get_work_session_path(self, session_id: str) -> Path:
         """Phase 32: 작업 세션 파일 경로 반환"""
         return self.WORK_SESSIONS_DIR / f"{session_id}.json"
 
+    def get_work_session_log_path(self, session_id: str) -> Path:
+        """Phase 67-D: 작업 세션 작업 로그 경로 반환"""
+        return self.WORK_SESSIONS_DIR / f"{session_id}.oplog"
+
+    def get_work_session_changes_path(self) -> Path:
+        """Phase 67-D: 작업 로그를 추가한 세션 ID 기록 파일 경로 반환"""
+        return self.WORK_SESSIONS_DIR / ".changes"
+
 
 # 전역 설정 인스턴스
 config = Config.load()
@@ -27,6 +27,10 @@ sys.path.insert(0, str(project_root / "src"))
 from app.config import config
 from app.routers import pdf, blocks, export, stats, documents, hangul, debug, classification, problems, exam_papers, matching, document_pairs, work_sessions
 from app.routers import config as config_router
+from app.services.hangul.batch_import import shutdown_import_pool
+from app.services.hangul.hwp_latex_converter import shutdown_equation_pool
+from app.services.exam import shutdown_render_pool
+from app.services.group_events import group_events
 
 
 # FastAPI 앱 생성
@@ -124,6 +128,18 @@ async def startup_event():
     logger.info("=" * 50)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Phase 63-D/63-H/66-A: 한글 일괄 가져오기 / 수식 변환 / 시험지 렌더링 프로세스 풀 종료
+    Phase 67-B: 남은 그룹 변경 이벤트 처리 후 이벤트 워커 종료
+    """
+    group_events.shutdown()
+    shutdown_import_pool()
+    shutdown_equation_pool()
+    shutdown_render_pool()
+
+
 if __name__ == "__main__":
     import uvicorn
 
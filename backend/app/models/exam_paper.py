@@ -166,6 +166,23 @@ class ExportExamRequest(BaseModel):
     includeAnswerKey: bool = Field(default=True, description="정답지 포함")
 
 
+# ========== Phase 66-C: 변형 일괄 생성 ==========
+
+class ExamVariantSpec(BaseModel):
+    """시험지 변형 1개 (문제/섹션 순서 섞기)"""
+    name: Optional[str] = Field(None, description="변형 이름 (ZIP 안 파일명, 기본: 시험지 이름 + 번호)")
+    seed: Optional[int] = Field(None, description="섞기 시드 (기본: 변형 순번 → 같은 요청은 같은 결과)")
+    shuffleProblems: bool = Field(default=True, description="섹션 안 문제 순서 섞기")
+    shuffleSections: bool = Field(default=False, description="섹션 순서 섞기")
+    sectionOrder: Optional[List[str]] = Field(None, description="섹션 ID 순서 (지정 시 shuffleSections 무시)")
+
+
+class BulkExamVariantsRequest(BaseModel):
+    """시험지 변형 일괄 PDF 생성 요청"""
+    variants: List[ExamVariantSpec] = Field(..., min_length=1, max_length=50, description="변형 목록")
+    includeAnswerKey: bool = Field(default=False, description="정답지 포함")
+
+
 class ExamPreviewData(BaseModel):
     """시험지 미리보기 데이터"""
     html: str = Field(..., description="렌더링된 HTML")
@@ -5,10 +5,18 @@ Phase 33: 통합 워크플로우
 - 시작 시 문제+해설 문서 동시 지정
 - 탭 전환으로 라벨링+매칭 통합
 - 그룹 생성 시 자동 문제은행 등록
+
+Phase 67-A: 페이지별 동기화 버전 (syncState) - 바뀐 페이지만 다시 동기화
+
+Phase 67-D: 작업 로그 (opSeq) - 스냅샷에 반영된 마지막 작업 번호
+
+Phase 67-E: 키 색인 (WorkSessionLookup) - 문제/연결 조회를 리스트 순회 없이
+
+Phase 68-A: 자동 매칭 요청/후보 (AutoMatchRequest, AutoMatchSuggestion)
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Dict, List, Optional, Literal
 from datetime import datetime
 from uuid import uuid4
 
@@ -46,6 +54,137 @@ class ProblemSolutionLink(BaseModel):
     )
 
 
+class PageSyncVersion(BaseModel):
+    """
+    Phase 67-A: 마지막 동기화 시점의 groups 파일 버전
+
+    mtimeNs/size가 그대로면 파일을 다시 읽지 않고,
+    바뀌었어도 hash(동기화에 쓰는 필드만)가 같으면 세션은 건드리지 않음
+    """
+    mtimeNs: int = Field(0, description="파일 수정 시각 (ns, 0 = 다음 동기화 때 내용 확인)")
+    size: int = Field(0, description="파일 크기")
+    hash: str = Field("", description="동기화 대상 내용 해시")
+    count: int = Field(0, description="이 페이지에서 세션에 반영된 항목 수")
+
+
+class SessionSyncState(BaseModel):
+    """
+    Phase 67-A: SyncManager 증분 동기화 상태
+
+    문서가 바뀌면 해당 쪽 페이지 버전은 버리고 전체 동기화
+    """
+    problemDocumentId: Optional[str] = Field(None, description="problemPages 기준 문제 문서")
+    solutionDocumentId: Optional[str] = Field(None, description="linkPages 기준 해설 문서")
+    problemPages: Dict[int, PageSyncVersion] = Field(
+        default_factory=dict, description="문제 문서 페이지별 버전 (groups.json → problems)"
+    )
+    linkPages: Dict[int, PageSyncVersion] = Field(
+        default_factory=dict, description="해설 문서 페이지별 버전 (links → groups.json)"
+    )
+
+
+def problem_key(page_index: int, group_id: str) -> str:
+    """Phase 67-E: 문제 복합 키 "페이지:그룹ID" (그룹 ID는 페이지마다 겹칠 수 있음)"""
+    return f"{page_index}:{group_id}"
+
+
+class WorkSessionLookup:
+    """
+    Phase 67-E: WorkSession 키 색인
+
+    - problem_by_key: "페이지:그룹ID" → 문제
+    - problems_by_group: 그룹 ID → 문제들 (목록 순서)
+    - links_by_problem: problemGroupId → 연결들
+    - links_by_solution: "해설 페이지:해설 그룹ID" → 연결들 (역방향)
+
+    만들 때의 problems / links 리스트 객체와 항목 수를 기억한다. 다른 경로에서 리스트를
+    교체하거나 항목 수가 바뀌면 다음 조회 때 다시 만든다.
+    값 리스트는 바꿀 때마다 새로 만들므로(copy-on-write) copy()한 색인과 공유해도 안전하다.
+    """
+
+    __slots__ = (
+        'problems', 'links', 'counts',
+        'problem_by_key', 'problems_by_group', 'links_by_problem', 'links_by_solution',
+    )
+
+    def __init__(self, problems: List[ProblemReference], links: List[ProblemSolutionLink]):
+        self.problems = problems
+        self.links = links
+        self.counts = (0, 0)
+        self.problem_by_key: Dict[str, ProblemReference] = {}
+        self.problems_by_group: Dict[str, List[ProblemReference]] = {}
+        self.links_by_problem: Dict[str, List[ProblemSolutionLink]] = {}
+        self.links_by_solution: Dict[str, List[ProblemSolutionLink]] = {}
+        for problem in problems:
+            self.add_problem(problem)
+        for link in links:
+            self.add_link(link)
+
+    def __deepcopy__(self, memo):
+        # 깊은 사본 세션의 리스트는 새 객체 → 첫 조회 때 다시 만듦
+        return None
+
+    def valid_for(self, problems: list, links: list) -> bool:
+        """이 리스트들로 만든 (또는 함께 갱신한) 색인인지"""
+        return (
+            self.problems is problems and self.links is links
+            and self.counts == (len(problems), len(links))
+        )
+
+    def copy(self, problems: list, links: list) -> "WorkSessionLookup":
+        """새 리스트(같은 항목의 얕은 사본)용 색인 - 딕셔너리만 복사"""
+        clone = WorkSessionLookup.__new__(WorkSessionLookup)
+        clone.problems = problems
+        clone.links = links
+        clone.counts = self.counts
+        clone.problem_by_key = dict(self.problem_by_key)
+        clone.problems_by_group = dict(self.problems_by_group)
+        clone.links_by_problem = dict(self.links_by_problem)
+        clone.links_by_solution = dict(self.links_by_solution)
+        return clone
+
+    # === 갱신 (리스트 변경과 함께 호출) ===
+
+    def add_problem(self, problem: ProblemReference) -> None:
+        self.problem_by_key.setdefault(problem_key(problem.pageIndex, problem.groupId), problem)
+        _append(self.problems_by_group, problem.groupId, problem)
+        self.counts = (self.counts[0] + 1, self.counts[1])
+
+    def remove_problem(self, problem: ProblemReference) -> None:
+        key = problem_key(problem.pageIndex, problem.groupId)
+        _discard(self.problems_by_group, problem.groupId, problem)
+        if self.problem_by_key.get(key) is problem:
+            # 같은 키의 다른 문제가 남아 있으면 그 문제로
+            del self.problem_by_key[key]
+            for other in self.problems_by_group.get(problem.groupId, ()):
+                if other.pageIndex == problem.pageIndex:
+                    self.problem_by_key[key] = other
+                    break
+        self.counts = (self.counts[0] - 1, self.counts[1])
+
+    def add_link(self, link: ProblemSolutionLink) -> None:
+        _append(self.links_by_problem, link.problemGroupId, link)
+        _append(self.links_by_solution, problem_key(link.solutionPageIndex, link.solutionGroupId), link)
+        self.counts = (self.counts[0], self.counts[1] + 1)
+
+    def remove_link(self, link: ProblemSolutionLink) -> None:
+        _discard(self.links_by_problem, link.problemGroupId, link)
+        _discard(self.links_by_solution, problem_key(link.solutionPageIndex, link.solutionGroupId), link)
+        self.counts = (self.counts[0], self.counts[1] - 1)
+
+
+def _append(index: dict, key: str, item) -> None:
+    index[key] = index.get(key, []) + [item]
+
+
+def _discard(index: dict, key: str, item) -> None:
+    remaining = [other for other in index.get(key, ()) if other is not item]
+    if remaining:
+        index[key] = remaining
+    else:
+        index.pop(key, None)
+
+
 class WorkSession(BaseModel):
     """
     작업 세션
@@ -84,6 +223,15 @@ class WorkSession(BaseModel):
     lastProblemPage: int = Field(default=0, description="마지막 문제 페이지")
     lastSolutionPage: int = Field(default=0, description="마지막 해설 페이지")
 
+    # Phase 67-A: 증분 동기화 상태
+    syncState: SessionSyncState = Field(
+        default_factory=SessionSyncState,
+        description="페이지별 동기화 버전"
+    )
+
+    # Phase 67-D: 작업 로그
+    opSeq: int = Field(default=0, description="마지막으로 반영된 작업 번호")
+
     # 메타데이터
     createdAt: int = Field(
         default_factory=lambda: int(datetime.now().timestamp() * 1000),
@@ -98,6 +246,53 @@ class WorkSession(BaseModel):
         description="세션 상태"
     )
 
+    # Phase 67-E: 키 색인 (직렬화 안 됨)
+    _lookup: Optional[WorkSessionLookup] = PrivateAttr(default=None)
+
+    def lookup(self) -> WorkSessionLookup:
+        """
+        Phase 67-E: 키 색인 (없거나 리스트가 바뀌었으면 이때 만듦)
+
+        problems / links 리스트를 교체하거나 항목을 추가/삭제하면 자동으로 다시 만든다.
+        항목 수를 유지한 채 리스트 안의 항목을 바꿔 넣었다면 invalidate_lookup() 호출.
+        """
+        # 비공개 속성은 BaseModel.__getattr__를 거치므로 직접 조회 (조회마다 호출됨)
+        private = self.__pydantic_private__
+        lookup = private.get('_lookup')
+        if lookup is None or not lookup.valid_for(self.problems, self.links):
+            lookup = private['_lookup'] = WorkSessionLookup(self.problems, self.links)
+        return lookup
+
+    def invalidate_lookup(self) -> None:
+        """Phase 67-E: 키 색인 버리기 (다음 조회 때 다시 만듦)"""
+        self._lookup = None
+
+    def find_problem(self, group_id: str, page_index: Optional[int] = None) -> Optional[ProblemReference]:
+        """문제 찾기 (page_index가 없으면 그 그룹 ID의 첫 번째 문제)"""
+        lookup = self.lookup()
+        if page_index is not None:
+            return lookup.problem_by_key.get(problem_key(page_index, group_id))
+        problems = lookup.problems_by_group.get(group_id)
+        return problems[0] if problems else None
+
+    def problems_for_group(self, group_id: str) -> List[ProblemReference]:
+        """그룹 ID가 같은 문제들 (여러 페이지)"""
+        return list(self.lookup().problems_by_group.get(group_id, ()))
+
+    def get_link(self, problem_group_id: str) -> Optional[ProblemSolutionLink]:
+        """문제 그룹의 연결 (여러 개면 첫 번째)"""
+        links = self.lookup().links_by_problem.get(problem_group_id)
+        return links[0] if links else None
+
+    def links_for_problem(self, problem_group_id: str) -> List[ProblemSolutionLink]:
+        """문제 그룹에 연결된 해설들 (보통 하나)"""
+        return list(self.lookup().links_by_problem.get(problem_group_id, ()))
+
+    def links_for_solution(self, solution_page_index: int, solution_group_id: str) -> List[ProblemSolutionLink]:
+        """해설 그룹을 가리키는 연결들 (역방향)"""
+        key = problem_key(solution_page_index, solution_group_id)
+        return list(self.lookup().links_by_solution.get(key, ()))
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -173,6 +368,35 @@ class CreateLinkRequest(BaseModel):
     solutionPageIndex: int = Field(..., description="해설 페이지 인덱스")
 
 
+class AutoMatchRequest(BaseModel):
+    """Phase 68-A: 자동 매칭 요청"""
+    apply: bool = Field(default=False, description="True면 신뢰도 기준 이상 후보를 연결 (작업 하나로 되돌리기 가능)")
+    minConfidence: float = Field(default=0.75, ge=0, le=1, description="자동 연결 신뢰도 기준 (미만은 검수 대상)")
+
+
+class AutoMatchSuggestion(BaseModel):
+    """Phase 68-A: 자동 매칭 후보"""
+    problemGroupId: str = Field(..., description="문제 그룹 ID")
+    problemPageIndex: int = Field(..., description="문제 페이지 인덱스")
+    problemNumber: str = Field(default="", description="문제 번호 (정규화)")
+    solutionGroupId: str = Field(..., description="해설 그룹 ID")
+    solutionDocumentId: str = Field(..., description="해설 문서 ID")
+    solutionPageIndex: int = Field(..., description="해설 페이지 인덱스")
+    solutionNumber: str = Field(default="", description="해설 번호 (정규화)")
+    confidence: float = Field(..., description="신뢰도 (0~1)")
+    reason: Literal["number", "position"] = Field(..., description="매칭 근거")
+    needsReview: bool = Field(default=True, description="검수 필요 (신뢰도 기준 미만)")
+
+
+class AutoMatchResponse(BaseModel):
+    """Phase 68-A: 자동 매칭 결과"""
+    suggestions: List[AutoMatchSuggestion] = Field(..., description="후보 (문제 읽기 순서)")
+    applied: int = Field(default=0, description="연결한 후보 수")
+    needsReview: int = Field(default=0, description="검수 필요 후보 수")
+    unmatched: int = Field(default=0, description="후보가 없는 미연결 문제 수")
+    session: Optional[WorkSession] = Field(default=None, description="연결 후 세션 (apply일 때)")
+
+
 class WorkSessionStats(BaseModel):
     """세션 통계"""
     totalProblems: int = Field(..., description="전체 문제 수")
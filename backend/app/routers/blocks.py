@@ -5,6 +5,8 @@ Phase 12: utils 모듈 적용
 Phase 14-1: On-Demand 이미지 변환 지원
 Phase 14-2: WebP 포맷 지원 (WebP 우선, PNG 폴백)
 Phase 14-3: 썸네일 지원 (quality 파라미터)
+Phase 65-A: groups.json 읽기/쓰기는 groups_cache 사용 (Write-Through)
+Phase 67-B: 그룹 저장/수정 시 group_events 발행 (세션/내보내기 메타 자동 동기화)
 """
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import FileResponse
@@ -13,7 +15,9 @@ from pathlib import Path
 import sys
 
 from app.config import config
-from app.utils import load_json, load_json_or_default, save_json
+from app.utils import load_json, save_json
+from app.services.groups_cache import groups_cache
+from app.services.group_events import group_events
 
 # Phase 14-1: PDF 처리 파이프라인 import
 project_root = Path(__file__).parent.parent.parent.parent
@@ -244,13 +248,13 @@ async def get_page_groups(document_id: str, page_index: int):
         doc_dir = config.get_document_dir(document_id)
         groups_file = doc_dir / "groups" / f"page_{page_index:04d}_groups.json"
 
-        # Phase 12: load_json_or_default 사용
+        # Phase 65-A: 캐시 조회 (파일 없으면 기본값)
         default_groups = {
             "document_id": document_id,
             "page_index": page_index,
             "groups": []
         }
-        return load_json_or_default(groups_file, default_groups)
+        return groups_cache.read_or_default(groups_file, default_groups)
 
     except Exception as e:
         print(f"[API 오류] 그룹 데이터 조회 실패: {str(e)}")
@@ -275,7 +279,8 @@ async def save_page_groups(document_id: str, page_index: int, groups_data: dict)
         groups_file = doc_dir / "groups" / f"page_{page_index:04d}_groups.json"
 
         # Phase 12: save_json 사용 (자동 디렉토리 생성)
-        save_json(groups_file, groups_data)
+        groups_cache.save(groups_file, groups_data)
+        group_events.publish(document_id, page_index, "saved")
 
         return {"message": f"페이지 {page_index}의 그룹 데이터가 저장되었습니다"}
 
@@ -353,7 +358,7 @@ async def update_group_info(document_id: str, page_index: int, group_id: str, up
             )
 
         # 기존 데이터 로드
-        data = load_json(groups_file)
+        data = groups_cache.load_for_update(groups_file)
         groups = data.get("groups", [])
 
         # 해당 그룹 찾기 및 업데이트
@@ -385,7 +390,8 @@ async def update_group_info(document_id: str, page_index: int, group_id: str, up
             )
 
         # 저장
-        save_json(groups_file, data)
+        groups_cache.save(groups_file, data)
+        group_events.publish(document_id, page_index, "updated", (group_id,))
 
         print(f"[Phase 31-H-4] Group updated: {document_id}/{page_index}/{group_id}")
         return {"message": "그룹 정보가 업데이트되었습니다", "group": updated_group}
@@ -430,7 +436,7 @@ async def get_all_groups(document_id: str):
                 # 파일명에서 page_index 추출 (예: page_0007_groups.json -> 7)
                 page_index = int(groups_file.stem.split("_")[1])
 
-                data = load_json(groups_file)
+                data = groups_cache.read(groups_file)
                 groups = data.get("groups", [])
 
                 if groups:  # 그룹이 있는 페이지만 포함
@@ -482,7 +488,7 @@ async def get_groups_summary(document_id: str):
                 page_index = int(groups_file.stem.split("_")[1])
 
                 # Phase 12: load_json 사용
-                data = load_json(groups_file)
+                data = groups_cache.read(groups_file)
                 groups = data.get("groups", [])
 
                 # 마지막 문항번호 찾기 (역순으로 검색)
@@ -564,7 +570,7 @@ async def save_group_and_export(
             }
         else:
             # 단일 그룹만 제공된 경우 기존 파일에서 업데이트
-            groups_data = load_json_or_default(groups_file, {
+            groups_data = groups_cache.load_for_update(groups_file, {
                 "document_id": document_id,
                 "page_index": page_index,
                 "groups": []
@@ -581,7 +587,8 @@ async def save_group_and_export(
             if not found:
                 groups_data["groups"].append(group)
 
-        save_json(groups_file, groups_data)
+        groups_cache.save(groups_file, groups_data)
+        group_events.publish(document_id, page_index, "saved")
         print(f"[B-5] Group saved: {document_id}/{page_index}/{group.get('id')}")
 
         # 2. 내보내기 (요청 시)
@@ -9,6 +9,7 @@ Phase 20-B: 디버그 API 엔드포인트
 - GET /debug/status: 컨버터 및 환경 상태 조회
 - POST /debug/test-convert: 테스트 변환 (상세 정보 포함)
 - POST /debug/reload-converter: 컨버터 강제 리로드 (개발 환경 전용)
+- GET /debug/locks: 파일 잠금 대기 통계 (Phase 65-B)
 """
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -17,6 +18,7 @@ import time
 
 from app.utils import get_env_info, is_development, is_production
 from app.services.hangul import hwp_latex_converter
+from app.services.file_lock import get_lock_stats
 
 
 router = APIRouter(prefix="/api/debug", tags=["Debug"])
@@ -172,3 +174,13 @@ async def get_patterns():
         ]
 
     return pattern_info
+
+
+@router.get("/locks")
+async def get_locks(top: int = 10):
+    """
+    Phase 65-B: 파일 잠금 대기 통계 (현재 워커 프로세스 기준)
+
+    대기 시간이 긴 스트라이프와 마지막으로 잠근 경로를 보여줍니다.
+    """
+    return get_lock_stats(top=top)
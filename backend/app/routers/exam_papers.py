@@ -2,11 +2,17 @@
 시험지(ExamPaper) API 라우터
 
 Phase 21+ D-1: 시험지 REST API
+Phase 66-A: PDF 내보내기는 exam_render_service (프로세스 풀 + 결과 캐시)
+Phase 66-B: PDF는 StreamingResponse로 청크 전송
+Phase 66-C: 변형 일괄 PDF (ZIP 스트리밍)
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from fastapi.responses import Response
-from typing import Optional, List
+from fastapi.responses import StreamingResponse
+from typing import Optional, List, Dict
+from urllib.parse import quote
 
 from ..models.exam_paper import (
     ExamPaper,
@@ -16,16 +22,29 @@ from ..models.exam_paper import (
     ExamPaperListResponse,
     AddProblemToExam,
     ReorderProblems,
+    BulkExamVariantsRequest,
 )
 from ..services.exam_paper import ExamPaperService, get_exam_paper_service
 from ..services.problems import ProblemService, get_problem_service
-from ..services.exam import ExamPdfExporter
-from ..config import config
+from ..services.exam import exam_render_service, open_pdf_stream, stream_pdfs_zip
 
 
 router = APIRouter(prefix="/api/exams", tags=["exam-papers"])
 
 
+def _attachment_headers(filename: str) -> Dict[str, str]:
+    """
+    다운로드 헤더 (Phase 66-B)
+
+    헤더는 latin-1로 인코딩되므로 한글 파일명은 filename*(RFC 5987)로 전달하고
+    filename에는 ASCII 대체 이름을 넣는다.
+    """
+    ascii_name = filename.encode('ascii', 'replace').decode('ascii').replace('?', '_').replace('"', '_')
+    return {
+        "Content-Disposition": f"attachment; filename=\"{ascii_name}\"; filename*=UTF-8''{quote(filename)}",
+    }
+
+
 # ========== CRUD 엔드포인트 ==========
 
 @router.get("", response_model=ExamPaperListResponse)
@@ -316,21 +335,71 @@ async def export_to_pdf(
     problems = problem_service.bulk_get(problem_ids)
     problems_map = {p.id: p for p in problems}
 
-    # PDF 생성
-    exporter = ExamPdfExporter(config.DATASET_ROOT)
-    pdf_bytes = exporter.export_to_pdf(
-        exam=exam,
-        problems_map=problems_map,
-        include_answer_key=include_answer_key,
-    )
+    # PDF 생성 (Phase 66-A: 워커 프로세스에서 렌더링, 같은 내용이면 캐시 반환)
+    pdf_path = await exam_render_service.render(exam, problems_map, include_answer_key)
 
     # 파일명 생성
     filename = f"{exam.name.replace(' ', '_')}.pdf"
 
-    return Response(
-        content=pdf_bytes,
+    # Phase 66-B: 전체를 메모리에 올리지 않고 청크 단위로 전송
+    stream, size = open_pdf_stream(pdf_path)
+    headers = _attachment_headers(filename)
+    headers["Content-Length"] = str(size)
+
+    return StreamingResponse(
+        stream,
         media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
+        headers=headers,
+    )
+
+
+@router.post("/{exam_id}/export/variants")
+async def export_variants(
+    exam_id: str,
+    request: BulkExamVariantsRequest,
+    exam_service: ExamPaperService = Depends(get_exam_paper_service),
+    problem_service: ProblemService = Depends(get_problem_service),
+):
+    """
+    시험지 변형 일괄 PDF 내보내기 (ZIP)
+
+    Phase 66-C: 문제/섹션 순서를 섞은 변형 N개를 한 번에 렌더링합니다.
+    - 문제는 한 번만 조회해 모든 변형이 공유
+    - 변형들은 프로세스 풀에서 동시에 렌더링 (같은 내용의 변형은 한 번만)
+    - 렌더링이 끝나는 순서대로 ZIP 항목을 스트리밍
+
+    Args:
+        exam_id: 시험지 ID
+        request: 변형 목록 (최대 50개), 정답지 포함 여부
+
+    Returns:
+        ZIP 파일 (변형별 PDF)
+    """
+    exam = exam_service.get(exam_id)
+    if not exam:
+        raise HTTPException(status_code=404, detail="시험지를 찾을 수 없습니다")
+
+    section_ids = {section.id for section in exam.sections}
+    for spec in request.variants:
+        unknown = [sid for sid in (spec.sectionOrder or []) if sid not in section_ids]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"시험지에 없는 섹션입니다: {', '.join(unknown)}")
+
+    # 문제 조회 (모든 변형 공유)
+    problem_ids = [item.problemId for section in exam.sections for item in section.problems]
+    problems_map = {p.id: p for p in problem_service.bulk_get(problem_ids)}
+
+    entries = []
+    for index, spec in enumerate(request.variants):
+        variant = exam_service.build_variant(exam, spec, index)
+        arcname = f"{index + 1:02d}_{variant.name.replace(' ', '_').replace('/', '_')}.pdf"
+        task = asyncio.ensure_future(
+            exam_render_service.render(variant, problems_map, request.includeAnswerKey)
+        )
+        entries.append((arcname, task))
+
+    return StreamingResponse(
+        stream_pdfs_zip(entries),
+        media_type="application/zip",
+        headers=_attachment_headers(f"{exam.name.replace(' ', '_')}_변형.zip"),
     )
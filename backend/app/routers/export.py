@@ -2,6 +2,8 @@
 문제 내보내기 라우터 (Phase 4)
 
 Phase 12: utils 모듈 적용
+Phase 65-A: groups.json 읽기/쓰기는 groups_cache 사용 (Write-Through)
+Phase 65-D: 문제별 해설 연결 조회는 session_index 사용
 """
 from fastapi import APIRouter, HTTPException
 from pathlib import Path
@@ -10,6 +12,8 @@ from PIL import Image
 
 from app.config import config
 from app.utils import load_json, save_json
+from app.services.groups_cache import groups_cache
+from app.services.session_index import session_index
 from app.utils.image_utils import calculate_bounding_box, add_padding, merge_images_vertically
 
 
@@ -50,7 +54,7 @@ async def export_page_problems(
         if not groups_file.exists():
             return {"exported_count": 0, "problems": []}
 
-        groups_data = load_json(groups_file)
+        groups_data = groups_cache.read(groups_file)
 
         # 블록 데이터 로드
         blocks_file = doc_dir / "blocks" / f"page_{page_index:04d}_blocks.json"
@@ -195,7 +199,7 @@ async def export_page_problems(
                     for other_page in range(page_index - 1, -1, -1):
                         other_groups_file = doc_dir / "groups" / f"page_{other_page:04d}_groups.json"
                         if other_groups_file.exists():
-                            other_groups = load_json(other_groups_file)
+                            other_groups = groups_cache.read(other_groups_file)
                             for g in other_groups.get("groups", []):
                                 if g["id"] == parent_group_id:
                                     parent_group = g
@@ -318,7 +322,7 @@ async def export_single_group(
         if not groups_file.exists():
             raise HTTPException(status_code=404, detail="그룹 파일을 찾을 수 없습니다")
 
-        groups_data = load_json(groups_file)
+        groups_data = groups_cache.load_for_update(groups_file)
 
         # 해당 그룹 찾기
         target_group = None
@@ -466,7 +470,7 @@ async def export_single_group(
                 for other_page in range(page_index - 1, -1, -1):
                     other_groups_file = doc_dir / "groups" / f"page_{other_page:04d}_groups.json"
                     if other_groups_file.exists():
-                        other_groups = load_json(other_groups_file)
+                        other_groups = groups_cache.read(other_groups_file)
                         for g in other_groups.get("groups", []):
                             if g["id"] == parent_group_id:
                                 parent_group = g
@@ -537,7 +541,7 @@ async def export_single_group(
         # 그룹 상태 업데이트 (confirmed)
         groups_data["groups"][target_index]["status"] = "confirmed"
         groups_data["groups"][target_index]["exportedAt"] = exported_at
-        save_json(groups_file, groups_data)
+        groups_cache.save(groups_file, groups_data)
 
         return {
             "success": True,
@@ -732,7 +736,7 @@ async def export_group_with_data(
         # 그룹 파일 업데이트 (상태 + segments/crossPageSegments)
         groups_file = doc_dir / "groups" / f"page_{page_index:04d}_groups.json"
         if groups_file.exists():
-            groups_data = load_json(groups_file)
+            groups_data = groups_cache.load_for_update(groups_file)
             for i, group in enumerate(groups_data.get("groups", [])):
                 if group["id"] == group_id:
                     groups_data["groups"][i]["status"] = "confirmed"
@@ -744,7 +748,7 @@ async def export_group_with_data(
                     if group_data.get("crossPageSegments"):
                         groups_data["groups"][i]["crossPageSegments"] = group_data["crossPageSegments"]
                     break
-            save_json(groups_file, groups_data)
+            groups_cache.save(groups_file, groups_data)
 
         return {
             "success": True,
@@ -1170,7 +1174,7 @@ async def migrate_problem_info():
                         errors += 1
                         continue
 
-                    groups_data = load_json(groups_file)
+                    groups_data = groups_cache.read(groups_file)
 
                     # 해당 그룹 찾기
                     target_group = None
@@ -1217,6 +1221,7 @@ async def get_problem_solution_link(document_id: str, page_index: int, group_id:
     Phase 57-C: 문제에 연결된 해설 정보 조회
 
     세션의 links 데이터에서 해당 문제의 해설 연결 정보를 찾아 반환
+    Phase 65-D: 세션 파일 스캔 대신 session_index 조회 (여러 세션에 있으면 가장 최근 연결)
 
     Args:
         document_id: 문제 문서 ID
@@ -1237,56 +1242,35 @@ async def get_problem_solution_link(document_id: str, page_index: int, group_id:
     from fastapi.responses import FileResponse
 
     try:
-        # 모든 세션 파일 스캔
-        sessions_dir = config.DATASET_ROOT / "work_sessions"
-        if not sessions_dir.exists():
-            return {"has_solution": False, "solution": None}
-
-        # 세션 파일들 검색
-        for session_file in sessions_dir.glob("*.json"):
-            try:
-                session_data = load_json(session_file)
-                if not session_data:
-                    continue
-
-                # 해당 문제를 포함하는 세션인지 확인
-                if session_data.get("problemDocumentId") != document_id:
-                    continue
-
-                # links에서 해당 문제의 연결 찾기
-                links = session_data.get("links", [])
-                for link in links:
-                    if link.get("problemGroupId") == group_id:
-                        solution_doc_id = link.get("solutionDocumentId")
-                        solution_page_idx = link.get("solutionPageIndex")
-                        solution_group_id = link.get("solutionGroupId")
-
-                        # 해설 이미지 경로 찾기
-                        solution_image_path = None
-                        if solution_doc_id and solution_group_id is not None:
-                            solution_doc_dir = config.get_document_dir(solution_doc_id)
-                            problems_dir = solution_doc_dir / "problems"
-
-                            # 파일 패턴으로 찾기
-                            pattern = f"{solution_doc_id}_p{solution_page_idx:04d}_{solution_group_id}.png"
-                            image_file = problems_dir / pattern
-
-                            if image_file.exists():
-                                solution_image_path = f"documents/{solution_doc_id}/problems/{pattern}"
-
-                        return {
-                            "has_solution": True,
-                            "solution": {
-                                "document_id": solution_doc_id,
-                                "page_index": solution_page_idx,
-                                "group_id": solution_group_id,
-                                "image_path": solution_image_path
-                            }
-                        }
-
-            except Exception as e:
-                print(f"[Phase 57-C] 세션 파일 읽기 오류: {session_file}: {str(e)}")
-                continue
+        # Phase 65-D: 세션 인덱스에서 (문서, 그룹) 키로 조회
+        link = session_index.get_solution_link(document_id, group_id)
+        if link is not None:
+            solution_doc_id = link.solutionDocumentId
+            solution_page_idx = link.solutionPageIndex
+            solution_group_id = link.solutionGroupId
+
+            # 해설 이미지 경로 찾기
+            solution_image_path = None
+            if solution_doc_id and solution_group_id is not None:
+                solution_doc_dir = config.get_document_dir(solution_doc_id)
+                problems_dir = solution_doc_dir / "problems"
+
+                # 파일 패턴으로 찾기
+                pattern = f"{solution_doc_id}_p{solution_page_idx:04d}_{solution_group_id}.png"
+                image_file = problems_dir / pattern
+
+                if image_file.exists():
+                    solution_image_path = f"documents/{solution_doc_id}/problems/{pattern}"
+
+            return {
+                "has_solution": True,
+                "solution": {
+                    "document_id": solution_doc_id,
+                    "page_index": solution_page_idx,
+                    "group_id": solution_group_id,
+                    "image_path": solution_image_path
+                }
+            }
 
         return {"has_solution": False, "solution": None}
 
@@ -5,6 +5,7 @@ Phase 21: 이미지 지원
 
 엔드포인트:
 - POST /api/hangul/parse: 파일 업로드 및 파싱
+- POST /api/hangul/parse/batch: 여러 파일 일괄 파싱 (NDJSON/SSE 스트리밍, Phase 63-D)
 - POST /api/hangul/save: 파싱 결과 저장
 - GET /api/hangul/trash: 휴지통 목록 조회
 - POST /api/hangul/trash/restore: 휴지통에서 복원
@@ -12,8 +13,9 @@ Phase 21: 이미지 지원
 - POST /api/hangul/problems/move-to-trash: 휴지통으로 이동 (Soft Delete)
 - GET /api/hangul/images/{image_id}: 이미지 조회 (Phase 21)
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse, Response
+from fastapi import APIRouter, UploadFile, File, Form, Query, HTTPException
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
@@ -23,11 +25,22 @@ import os
 import json
 import uuid
 import base64
+import hashlib
 from datetime import datetime
 
 from app.config import config
-from app.services.hangul import HMLParser, HWPXParser, ParseResult
-from app.services.file_lock import file_lock, atomic_json_write, safe_json_read
+from app.services.hangul.batch_import import (
+    SUPPORTED_EXTENSIONS,
+    MAX_BATCH_FILES,
+    COPY_CHUNK_SIZE,
+    ImportItem,
+    expand_zip,
+    parse_file_cached,
+    iter_import_results,
+    format_ndjson,
+    format_sse,
+)
+from app.services.file_lock import file_lock, atomic_json_write, atomic_json_write_many, safe_json_read
 
 
 router = APIRouter()
@@ -129,6 +142,7 @@ async def parse_hangul_file(file: UploadFile = File(...)):
     - HML: 순수 XML 형식
 
     Phase 21: 이미지 자동 추출 및 저장
+    Phase 63-I: 같은 파일 재업로드 시 파싱 결과 캐시 사용 (SHA-256 기반)
 
     Returns:
         파싱된 문제, 정답, 해설 목록
@@ -150,60 +164,25 @@ async def parse_hangul_file(file: UploadFile = File(...)):
     temp_file_path = Path(temp_dir) / file.filename
 
     try:
-        # 파일 저장
-        with open(temp_file_path, 'wb') as f:
-            content = await file.read()
-            f.write(content)
-
-        # 파서 선택 및 파싱
-        # Phase 20-C: HMLParser는 latex_converter 의존성 주입 지원
-        # 기본값 None → 싱글톤 hwp_to_latex 사용
-        # 테스트 시 Mock 컨버터 주입 가능
-        if file_ext == '.hml':
-            parser = HMLParser(str(temp_file_path))  # latex_converter=None (기본)
-        else:  # .hwpx
-            parser = HWPXParser(str(temp_file_path))
-
-        result: ParseResult = parser.parse()
-
-        # Phase 21: 이미지 저장 - Debug
-        print(f"[Phase 21 Debug] metadata keys: {list(result.detected_metadata.keys())}")
-        images_data = result.detected_metadata.get('images', {})
-        print(f"[Phase 21 Debug] images_data type: {type(images_data)}, keys: {list(images_data.keys()) if images_data else 'empty'}")
-        if images_data:
-            # 임시 이미지 디렉토리 생성
-            temp_images_dir = config.DATASET_ROOT / 'temp_images'
-            temp_images_dir.mkdir(parents=True, exist_ok=True)
-
-            # 세션 ID 생성 (이미지 그룹화용)
-            session_id = str(uuid.uuid4())[:8]
-
-            # 이미지 저장 및 URL 매핑
-            image_urls = {}
-            for bin_id, img_info in images_data.items():
-                img_data = img_info.get('data', b'')
-                img_format = img_info.get('format', 'bin')
-
-                # 이미지 파일명 생성
-                img_filename = f"{session_id}_{bin_id}.{img_format}"
-                img_path = temp_images_dir / img_filename
-
-                # 이미지 저장
-                img_path.write_bytes(img_data)
-
-                # URL 매핑
-                image_urls[bin_id] = f"/api/hangul/images/{img_filename}"
-
-            # 결과에 이미지 URL 정보 추가
-            result.detected_metadata['image_urls'] = image_urls
-            result.detected_metadata['session_id'] = session_id
-
-            # 바이너리 데이터는 응답에서 제외
-            del result.detected_metadata['images']
+        # 파일 저장 (Phase 63-I: 저장하면서 SHA-256 계산)
+        file_digest = hashlib.sha256()
+        await _spool_upload(file, temp_file_path, file_digest)
+
+        # 파싱 + 이미지 저장 (Phase 21)
+        # Phase 63-D: CPU 작업은 스레드풀에서 실행 (이벤트 루프 블로킹 방지)
+        result = await run_in_threadpool(
+            parse_file_cached,
+            str(temp_file_path),
+            str(config.DATASET_ROOT / 'temp_images'),
+            str(config.get_parse_cache_dir()),
+            file_digest.hexdigest()
+        )
 
         # 결과 반환
-        return JSONResponse(content=result.to_dict())
+        return JSONResponse(content=result)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파싱 오류: {str(e)}")
 
@@ -213,6 +192,181 @@ async def parse_hangul_file(file: UploadFile = File(...)):
             shutil.rmtree(temp_dir)
 
 
+@router.post("/parse/batch")
+async def parse_hangul_files_batch(
+    files: List[UploadFile] = File(...),
+    save: bool = Form(False),
+    metadata: Optional[str] = Form(None),
+    stream_format: str = Query("ndjson", alias="format", pattern="^(ndjson|sse)$"),
+):
+    """
+    Phase 63-D: 한글 파일 일괄 파싱 (및 선택적 저장)
+
+    - 여러 HML/HWPX 파일 또는 이를 담은 ZIP 업로드
+    - 프로세스 풀에서 병렬 파싱, 완료되는 순서대로 파일별 결과 스트리밍
+    - save=true: 파싱 성공한 파일의 문제를 바로 문제은행에 저장 (/save 호출 불필요)
+
+    Args:
+        files: HML/HWPX/ZIP 파일 목록
+        save: 파싱 성공 시 저장 여부
+        metadata: 저장 시 사용할 ProblemMetadata JSON 문자열
+        format: "ndjson" (기본) | "sse"
+
+    Returns:
+        StreamingResponse - {"type": "file", ...} 레코드들과 마지막 {"type": "summary", ...}
+    """
+    save_metadata = ProblemMetadata()
+    if metadata:
+        try:
+            save_metadata = ProblemMetadata.model_validate_json(metadata)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"메타데이터 형식 오류: {str(e)}")
+
+    work_dir = Path(tempfile.mkdtemp(prefix='hangul_batch_'))
+
+    try:
+        items = await _collect_import_items(files, work_dir)
+    except BaseException:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+
+    if not items:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise HTTPException(status_code=400, detail="가져올 HWPX/HML 파일이 없습니다.")
+
+    if save:
+        metadata_dict = save_metadata.model_dump()
+
+        async def on_success(result: Dict[str, Any]) -> Dict[str, Any]:
+            saved_ids = await run_in_threadpool(
+                _save_problems_to_bank, result['problems'], metadata_dict
+            )
+            return {
+                'success': True,
+                'saved_count': len(saved_ids),
+                'problem_ids': saved_ids,
+                'message': f"{len(saved_ids)}개 문제가 저장되었습니다.",
+            }
+    else:
+        on_success = None
+
+    formatter = format_sse if stream_format == "sse" else format_ndjson
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+
+    async def event_stream():
+        try:
+            async for record in iter_import_results(
+                items, config.DATASET_ROOT / 'temp_images', on_success,
+                config.get_parse_cache_dir()
+            ):
+                yield formatter(record)
+        finally:
+            await run_in_threadpool(shutil.rmtree, work_dir, True)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type=media_type,
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+async def _spool_upload(
+    file: UploadFile, dest_path: Path, digest=None, batch_remaining: Optional[int] = None
+) -> int:
+    """
+    Phase 63-D: 업로드 파일을 청크 단위로 디스크에 저장
+
+    Phase 63-I: digest(hashlib 객체)가 주어지면 같은 청크로 해시도 갱신
+
+    Args:
+        batch_remaining: 일괄 업로드에서 남은 크기 합 한도 (None이면 파일 한도만 적용)
+
+    Raises:
+        HTTPException: MAX_UPLOAD_SIZE / 일괄 업로드 크기 합 초과 (413)
+
+    Returns:
+        저장된 바이트 수
+    """
+    size = 0
+    with open(dest_path, 'wb') as f:
+        while True:
+            chunk = await file.read(COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > config.MAX_UPLOAD_SIZE:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"파일이 너무 큽니다: {file.filename}"
+                )
+            if batch_remaining is not None and size > batch_remaining:
+                raise HTTPException(
+                    status_code=413,
+                    detail=(
+                        f"업로드 파일 크기 합이 너무 큽니다 "
+                        f"(최대 {config.MAX_BATCH_UPLOAD_SIZE // (1024 * 1024)}MB): {file.filename}"
+                    )
+                )
+            if digest is not None:
+                digest.update(chunk)
+            f.write(chunk)
+    return size
+
+
+async def _collect_import_items(files: List[UploadFile], work_dir: Path) -> List[ImportItem]:
+    """
+    Phase 63-D: 업로드 파일을 작업 디렉토리에 저장하고 가져오기 대상 목록 생성
+
+    - HML/HWPX: 그대로 대상
+    - ZIP: 내부 HML/HWPX 파일을 꺼내 대상에 추가
+    - 그 외: 오류 항목으로 기록 (배치 전체는 계속 진행)
+
+    Raises:
+        HTTPException: 파일 수가 MAX_BATCH_FILES 초과 (400),
+                       업로드 크기 합이 MAX_BATCH_UPLOAD_SIZE 초과 (413 - 저장 중 바로 중단)
+    """
+    items: List[ImportItem] = []
+    spooled = 0
+
+    for file in files:
+        if len(items) >= MAX_BATCH_FILES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 최대 {MAX_BATCH_FILES}개 파일까지 가져올 수 있습니다."
+            )
+
+        filename = Path((file.filename or '').replace('\\', '/')).name
+        file_ext = Path(filename).suffix.lower()
+        index = len(items)
+
+        if file_ext not in SUPPORTED_EXTENSIONS + ('.zip',):
+            items.append(ImportItem(
+                index=index,
+                filename=filename,
+                error=f"지원하지 않는 파일 형식입니다: {file_ext or '(없음)'}"
+            ))
+            continue
+
+        dest_dir = work_dir / str(index)
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        dest_path = dest_dir / filename
+        spooled += await _spool_upload(
+            file, dest_path, batch_remaining=config.MAX_BATCH_UPLOAD_SIZE - spooled
+        )
+
+        if file_ext == '.zip':
+            zip_items = await run_in_threadpool(
+                expand_zip, dest_path, work_dir / f"zip_{index}", filename,
+                index, MAX_BATCH_FILES - index
+            )
+            dest_path.unlink(missing_ok=True)
+            items.extend(zip_items)
+        else:
+            items.append(ImportItem(index=index, filename=filename, path=dest_path))
+
+    return items
+
+
 @router.post("/save", response_model=SaveResponse)
 async def save_parsed_problems(request: SaveRequest):
     """
@@ -228,6 +382,37 @@ async def save_parsed_problems(request: SaveRequest):
     Returns:
         저장 결과
     """
+    try:
+        saved_ids = _save_problems_to_bank(
+            request.problems, request.metadata.model_dump()
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"저장 오류: {str(e)}")
+
+    return SaveResponse(
+        success=True,
+        saved_count=len(saved_ids),
+        problem_ids=saved_ids,
+        message=f"{len(saved_ids)}개 문제가 저장되었습니다."
+    )
+
+
+def _save_problems_to_bank(problems: List[Dict[str, Any]], metadata: Dict[str, Any]) -> List[str]:
+    """
+    문제들을 문제은행에 저장 (/save, /parse/batch 공용)
+
+    - 파일 잠금으로 동시 쓰기 방지
+    - 원자적 저장으로 부분 실패 방지
+    - 실패 시 롤백 후 예외 재발생
+    - Phase 65-C: 문제/정답/해설 파일을 한 배치로 쓰기 (파일마다 fsync 대기 없음)
+
+    Args:
+        problems: 문제 데이터 목록
+        metadata: ProblemMetadata 딕셔너리
+
+    Returns:
+        저장된 문제 ID 목록
+    """
     problem_bank_dir = config.DATASET_ROOT / 'problem_bank'
     problems_dir = problem_bank_dir / 'problems'
     answers_dir = problem_bank_dir / 'answers'
@@ -239,6 +424,7 @@ async def save_parsed_problems(request: SaveRequest):
         dir_path.mkdir(parents=True, exist_ok=True)
 
     saved_ids = []
+    pending_writes = []  # (경로, 레코드) - Phase 65-C: 한 번에 저장
     created_files = []  # 롤백용 추적
 
     try:
@@ -251,9 +437,7 @@ async def save_parsed_problems(request: SaveRequest):
                 'updated_at': datetime.now().isoformat()
             })
 
-            metadata = request.metadata.model_dump()
-
-            for problem_data in request.problems:
+            for problem_data in problems:
                 problem_id = problem_data.get('id') or str(uuid.uuid4())
 
                 # 문제 레코드 생성
@@ -275,7 +459,7 @@ async def save_parsed_problems(request: SaveRequest):
                     'created_at': datetime.now().isoformat(),
                 }
 
-                # 정답 저장 (원자적)
+                # 정답 레코드
                 answer_id = None
                 if problem_data.get('answer'):
                     answer_id = str(uuid.uuid4())
@@ -286,12 +470,10 @@ async def save_parsed_problems(request: SaveRequest):
                         'answer_type': problem_data.get('answer_type', 'unknown'),
                         'created_at': datetime.now().isoformat(),
                     }
-                    answer_path = answers_dir / f'{answer_id}.json'
-                    atomic_json_write(answer_path, answer_record)
-                    created_files.append(answer_path)
+                    pending_writes.append((answers_dir / f'{answer_id}.json', answer_record))
                     problem_record['answer_id'] = answer_id
 
-                # 해설 저장 (원자적)
+                # 해설 레코드
                 explanation_id = None
                 if problem_data.get('explanation'):
                     explanation_id = str(uuid.uuid4())
@@ -301,15 +483,11 @@ async def save_parsed_problems(request: SaveRequest):
                         'content': problem_data.get('explanation'),
                         'created_at': datetime.now().isoformat(),
                     }
-                    explanation_path = explanations_dir / f'{explanation_id}.json'
-                    atomic_json_write(explanation_path, explanation_record)
-                    created_files.append(explanation_path)
+                    pending_writes.append((explanations_dir / f'{explanation_id}.json', explanation_record))
                     problem_record['explanation_id'] = explanation_id
 
-                # 문제 파일 저장 (원자적)
-                problem_path = problems_dir / f'{problem_id}.json'
-                atomic_json_write(problem_path, problem_record)
-                created_files.append(problem_path)
+                # 문제 레코드 (정답/해설 뒤에 저장)
+                pending_writes.append((problems_dir / f'{problem_id}.json', problem_record))
 
                 # 인덱스에 추가
                 index_data['problems'].append({
@@ -324,18 +502,18 @@ async def save_parsed_problems(request: SaveRequest):
 
                 saved_ids.append(problem_id)
 
+            # 문제/정답/해설 일괄 저장 (원자적)
+            # 실패 시 새로 만든 파일만 롤백 (기존 ID 파일은 삭제하지 않음)
+            created_files.extend(path for path, _ in pending_writes if not path.exists())
+            atomic_json_write_many(pending_writes)
+
             # 인덱스 업데이트 (원자적)
             index_data['updated_at'] = datetime.now().isoformat()
             atomic_json_write(index_path, index_data)
 
-        return SaveResponse(
-            success=True,
-            saved_count=len(saved_ids),
-            problem_ids=saved_ids,
-            message=f"{len(saved_ids)}개 문제가 저장되었습니다."
-        )
+        return saved_ids
 
-    except Exception as e:
+    except Exception:
         # 롤백: 생성된 파일 삭제
         for file_path in created_files:
             try:
@@ -344,7 +522,7 @@ async def save_parsed_problems(request: SaveRequest):
             except Exception:
                 pass  # 롤백 실패는 무시
 
-        raise HTTPException(status_code=500, detail=f"저장 오류: {str(e)}")
+        raise
 
 
 @router.get("/problems")
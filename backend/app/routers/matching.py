@@ -406,6 +406,7 @@ async def get_linked_solutions():
     문제은행에서 해설이 연결된 문제를 표시하기 위해 사용됩니다.
 
     Phase 57-G: MatchingSession.matchedPairs 대신 WorkSession.links 사용
+    Phase 65-D: session_index 사용
 
     Returns:
         {
@@ -420,45 +421,11 @@ async def get_linked_solutions():
             "total": int
         }
     """
-    from ..config import config
-    from ..utils.file_utils import load_json
-    from ..models.work_session import WorkSession
-
-    # 문제 키 -> 해설 정보 맵
-    links = {}
-
-    # Phase 57-G: WorkSession에서 links 읽기
-    if config.WORK_SESSIONS_DIR.exists():
-        for session_file in config.WORK_SESSIONS_DIR.glob("ws-*.json"):
-            try:
-                data = load_json(session_file)
-                session = WorkSession(**data)
-
-                # problems를 그룹 ID로 인덱싱
-                problems_by_group = {p.groupId: p for p in session.problems}
-
-                for link in session.links:
-                    # 문제 정보 찾기
-                    problem = problems_by_group.get(link.problemGroupId)
-                    if not problem:
-                        continue
-
-                    # 문제 고유 키: documentId|pageIndex|groupId
-                    key = f"{problem.documentId}|{problem.pageIndex}|{problem.groupId}"
-
-                    # 이미 링크가 있으면 더 최신 것을 사용
-                    if key not in links or link.linkedAt > links[key].get("matchedAt", 0):
-                        links[key] = {
-                            "solutionDocumentId": link.solutionDocumentId,
-                            "solutionPageIndex": link.solutionPageIndex,
-                            "solutionGroupId": link.solutionGroupId,
-                            "sessionId": session.sessionId,
-                            "matchedAt": link.linkedAt,
-                            "problemNumber": problem.problemNumber
-                        }
-            except Exception as e:
-                print(f"[linked-solutions] 세션 로드 실패: {session_file.name}, {e}")
-                continue
+    from ..services.session_index import session_index
+
+    # Phase 65-D: 세션 인덱스에서 집계 (세션 파일 재파싱 없음)
+    # 같은 문제에 여러 연결이 있으면 더 최신 것을 사용
+    links = session_index.linked_solutions()
 
     return {
         "links": links,
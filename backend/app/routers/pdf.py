@@ -1,9 +1,12 @@
 """
 PDF 업로드 및 처리 라우터 (Phase 1: Lazy Loading, Phase 14-1: 점진적 변환)
 Phase 34-B: 메타데이터 구조화
+Phase 64-A: 스트리밍 업로드 (최종 위치에 바로 기록 + SHA-256 + PDF 구조 검사)
+Phase 64-B: 내용 해시 기반 중복 제거 (같은 PDF 재업로드 시 렌더링/분석 재사용)
 """
 from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Request
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path
 from typing import Optional
 import shutil
@@ -17,6 +20,8 @@ sys.path.insert(0, str(project_root / "src"))
 from app.config import config
 from pdf_pipeline import PDFPipeline
 from app.services.task_queue import BackgroundTaskQueue
+from app.services.pdf_ingest import PDFIngestError, ingest_upload, safe_pdf_filename
+from app.services.blob_store import get_blob_store
 
 
 router = APIRouter()
@@ -49,10 +54,12 @@ async def upload_pdf(
         }
     """
     # 파일 검증
-    if not file.filename.endswith('.pdf'):
-        raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다")
+    try:
+        pdf_filename = safe_pdf_filename(file.filename)
+    except PDFIngestError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
 
-    if file.size > config.MAX_UPLOAD_SIZE:
+    if file.size is not None and file.size > config.MAX_UPLOAD_SIZE:
         raise HTTPException(
             status_code=413,
             detail=f"파일 크기가 너무 큽니다 (최대 {config.MAX_UPLOAD_SIZE / 1024 / 1024}MB)"
@@ -72,43 +79,91 @@ async def upload_pdf(
         print(f"[API] metadata: grade={meta_grade}, course={meta_course}, series={meta_series}, type={meta_type}")
 
         # 커스텀 document_id 사용, 없으면 파일명에서 추출
-        final_document_id = custom_document_id if custom_document_id else Path(file.filename).stem
+        final_document_id = custom_document_id if custom_document_id else Path(pdf_filename).stem
         print(f"[API] final_document_id: {final_document_id}")
-        upload_path = config.UPLOADS_DIR / file.filename
-
-        with upload_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-
-        # raw_pdfs로 이동
-        pdf_path = config.RAW_PDFS_DIR / file.filename
-        shutil.move(str(upload_path), str(pdf_path))
 
-        print(f"[API] PDF 업로드 완료: {pdf_path}")
+        # Phase 64-A: raw_pdfs에 바로 스트리밍 저장 (헤더/크기 검사 + SHA-256)
+        ingested = await ingest_upload(
+            file, config.RAW_PDFS_DIR / pdf_filename, config.MAX_UPLOAD_SIZE
+        )
 
-        # Phase 14-1: 점진적 처리 (첫 N페이지만 이미지 변환 + 블록 분석)
-        result = pipeline.process_pdf_progressive(
-            pdf_path=pdf_path,
-            document_id=final_document_id,  # Phase 35: 커스텀 ID 사용
-            initial_pages=config.INITIAL_PAGES,
-            dpi=config.DEFAULT_DPI
+        # Phase 64-A: 업로드 완료 즉시 메타데이터 추출 (PyMuPDF로 열리는지 검증 겸용)
+        try:
+            pdf_metadata = await run_in_threadpool(
+                pipeline.pdf_processor.get_pdf_metadata, ingested.path
+            )
+            if pdf_metadata["total_pages"] == 0:
+                raise PDFIngestError("페이지가 없는 PDF입니다")
+        except PDFIngestError:
+            ingested.discard()
+            raise
+        except Exception as e:
+            ingested.discard()
+            reason = "잘렸거나 손상된 PDF입니다" if not ingested.trailer_ok else "PDF를 열 수 없습니다"
+            raise PDFIngestError(f"{reason}: {str(e)}")
+
+        if not ingested.trailer_ok:
+            print("[API] 경고: PDF 끝부분에 startxref/%EOF 없음 (PyMuPDF 복구로 처리)")
+
+        # 검증 통과 → 최종 파일명으로 게시 (rename, 추가 복사 없음)
+        pdf_path = ingested.publish()
+        print(f"[API] PDF 업로드 완료: {pdf_path} (sha256={ingested.sha256[:12]})")
+
+        # Phase 64-B: 원본 PDF를 blob 저장소에 등록 (같은 내용이면 하드 링크로 공간 공유)
+        blob_store = get_blob_store()
+        await run_in_threadpool(blob_store.adopt, pdf_path, ingested.sha256)
+
+        # Phase 64-B: 같은 원본으로 처리가 끝난 문서가 있으면 페이지/블록 복제 (렌더링 생략)
+        reused_meta = await run_in_threadpool(
+            blob_store.reuse_document, ingested.sha256, final_document_id, pdf_path
         )
 
+        if reused_meta is not None:
+            print(f"[API] 중복 PDF: {reused_meta['deduplicated_from']} 결과 재사용")
+            result = {
+                "document_id": final_document_id,
+                "total_pages": reused_meta["total_pages"],
+                "converted_pages": reused_meta["total_pages"],
+                "analyzed_pages": reused_meta.get("analyzed_pages", reused_meta["total_pages"]),
+                "status": "ready",
+                "remaining_pages": 0
+            }
+        else:
+            # Phase 14-1: 점진적 처리 (첫 N페이지만 이미지 변환 + 블록 분석)
+            # Phase 64-A: 이미 추출한 메타데이터 전달 (PDF 재오픈 생략), 스레드풀에서 실행
+            result = await run_in_threadpool(
+                pipeline.process_pdf_progressive,
+                pdf_path=pdf_path,
+                document_id=final_document_id,  # Phase 35: 커스텀 ID 사용
+                initial_pages=config.INITIAL_PAGES,
+                dpi=config.DEFAULT_DPI,
+                metadata=pdf_metadata
+            )
+
         # Phase 34-B: 메타데이터를 meta.json에 추가 저장
-        if any([meta_grade, meta_course, meta_series, meta_type]):
-            doc_dir = config.get_document_dir(result["document_id"])
-            meta_path = doc_dir / "meta.json"
-            if meta_path.exists():
-                with open(meta_path, 'r', encoding='utf-8') as f:
-                    meta = json.load(f)
+        # Phase 64-A: 원본 PDF 해시/크기도 함께 기록
+        doc_dir = config.get_document_dir(result["document_id"])
+        meta_path = doc_dir / "meta.json"
+        if meta_path.exists():
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            meta["source_sha256"] = ingested.sha256
+            meta["file_size"] = ingested.size
+            if any([meta_grade, meta_course, meta_series, meta_type]):
                 meta["metadata"] = {
                     "grade": meta_grade,
                     "course": meta_course,
                     "series": meta_series,
                     "type": meta_type
                 }
-                with open(meta_path, 'w', encoding='utf-8') as f:
-                    json.dump(meta, f, indent=2, ensure_ascii=False)
                 print(f"[API] metadata saved to meta.json: {meta['metadata']}")
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, indent=2, ensure_ascii=False)
+
+        # Phase 64-B: 원본 해시 색인 등록 + 초기 렌더링 결과 중복 제거 + 원본 PDF 기록 (삭제 시 정리)
+        await run_in_threadpool(blob_store.register_source, ingested.sha256, result["document_id"])
+        await run_in_threadpool(blob_store.dedup_document, doc_dir)
+        await run_in_threadpool(blob_store.record_pdf, doc_dir, pdf_path, ingested.sha256)
 
         # 백그라운드 작업 등록 (나머지 페이지 이미지 변환 + 분석)
         if result["remaining_pages"] > 0:
@@ -141,9 +196,13 @@ async def upload_pdf(
                 "total_pages": result["total_pages"],
                 "analyzed_pages": result["analyzed_pages"],
                 "status": "completed",
-                "message": "모든 페이지 처리 완료"
+                "message": "모든 페이지 처리 완료",
+                "deduplicated_from": reused_meta["deduplicated_from"] if reused_meta else None
             }
 
+    except PDFIngestError as e:
+        # Phase 64-A: 검증 실패 (임시 파일은 이미 삭제됨)
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         print(f"[API 오류] PDF 업로드 실패: {str(e)}")
         import traceback
@@ -275,9 +334,17 @@ async def delete_document(document_id: str):
         if not doc_dir.exists():
             raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다")
 
+        # Phase 64-B: 참조하던 blob 목록을 먼저 읽어 둠
+        blob_store = get_blob_store()
+        digests = blob_store.release_document(doc_dir)
+
         # 디렉토리 전체 삭제
         shutil.rmtree(doc_dir)
 
+        # Phase 64-B: 더 이상 참조되지 않는 blob 정리
+        blob_store.unregister_document(document_id)
+        blob_store.collect(digests)
+
         return {"message": f"문서 '{document_id}'가 삭제되었습니다"}
 
     except HTTPException:
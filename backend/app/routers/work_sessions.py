@@ -8,51 +8,143 @@ Phase 33: 통합 워크플로우
 Phase 37-D: SyncManager 통합
 - 링크 생성/삭제 시 groups.json과 자동 동기화
 - full_sync 및 sync_status API 추가
+
+Phase 65-A: groups.json 읽기는 groups_cache 사용 (반복 동기화 시 재파싱 생략)
+
+Phase 65-D: 세션 목록/문서별 찾기는 session_index 사용 (세션 파일 전체 스캔 없음)
+
+Phase 67-A: full_sync는 바뀐 페이지만 동기화 (세션의 syncState에 페이지 버전 기록)
+
+Phase 67-B: 그룹 저장/수정/삭제 시 group_events로 관련 세션이 자동 동기화되므로
+            sync-problems / full-sync / validate-sync 등은 다른 워커의 변경이나
+            기존 데이터 정리용으로만 필요
+
+Phase 67-C: validate-sync는 페이지당 groups.json 한 번 (그룹 ID 집합), dry_run 지원
+
+Phase 67-D: 문제 추가/삭제, 연결 생성/삭제는 session_store 작업 로그에 한 줄 추가
+            (세션 파일 전체 파싱/직렬화 없음), undo / history API 추가
+            세션 전체를 고치는 경로는 _update_session (조건부 저장 - 그 사이 추가된 작업을 덮어쓰지 않음)
+
+Phase 67-E: 문제/연결 조회는 WorkSession 키 색인 사용 (리스트 순회 없음)
+
+Phase 68-A: auto-match API (번호 + 순서 + 블록 배치로 연결 후보, 신뢰도 기준 이상 일괄 연결)
 """
 
 from fastapi import APIRouter, HTTPException
-from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from app.config import config
-from app.utils import load_json, save_json
+from app.utils import load_json
 from app.models.work_session import (
     WorkSession,
     WorkSessionCreate,
     WorkSessionUpdate,
     AddProblemRequest,
     CreateLinkRequest,
+    AutoMatchRequest,
+    AutoMatchResponse,
     ProblemReference,
     ProblemSolutionLink,
     WorkSessionStats,
     WorkSessionListResponse,
     WorkSessionDetailResponse,
 )
+from app.services.auto_matcher import auto_matcher
 from app.services.sync_manager import sync_manager
+from app.services.groups_cache import groups_cache
+from app.services.session_index import session_index
+from app.services.session_store import Version, changed_groups, link_change, problem_change, session_store
 
 router = APIRouter()
 
+# 조건부 저장 재시도 횟수 (그 사이 다른 작업/저장이 있으면 다시 로드해 재적용)
+_UPDATE_RETRIES = 5
+
+T = TypeVar('T')
 
-def _get_session_path(session_id: str) -> Path:
-    """세션 파일 경로 반환"""
-    return config.get_work_session_path(session_id)
+
+def _session_not_found(session_id: str) -> HTTPException:
+    return HTTPException(status_code=404, detail=f"세션 '{session_id}'을 찾을 수 없습니다")
 
 
 def _load_session(session_id: str) -> WorkSession:
-    """세션 로드"""
-    session_path = _get_session_path(session_id)
-    if not session_path.exists():
-        raise HTTPException(status_code=404, detail=f"세션 '{session_id}'을 찾을 수 없습니다")
-    data = load_json(session_path)
-    return WorkSession(**data)
+    """
+    세션 로드 (수정용 사본)
 
+    Phase 67-D: session_store의 현재 상태 (스냅샷 + 작업 로그) 사본
+    """
+    loaded = session_store.load_for_update(session_id)
+    if loaded is None:
+        raise _session_not_found(session_id)
+    return loaded[0]
+
+
+def _save_session(session: WorkSession, expected: Optional[Version] = None) -> bool:
+    """
+    세션 저장
+
+    Phase 65-D: 원자적 쓰기 후 session_index 갱신
+    (os.replace로 디렉토리 mtime이 바뀌므로 다른 워커의 인덱스도 변경을 감지)
+    Phase 67-B: 세션 잠금 안에서 저장 (이벤트 동기화의 조건부 저장과 직렬화)
+    Phase 67-D: session_store 스냅샷 저장 (여러 항목을 한 번에 바꾸는 경로용)
 
-def _save_session(session: WorkSession) -> None:
-    """세션 저장"""
-    session_path = _get_session_path(session.sessionId)
+    Args:
+        expected: load_for_update 시점의 버전 (None이면 무조건 저장 - 새 세션 생성용)
+
+    Returns:
+        저장 여부 (expected 이후 다른 저장/작업이 있었으면 False)
+    """
     session.updatedAt = int(datetime.now().timestamp() * 1000)
-    save_json(session_path, session.model_dump())
+    stored = session_store.save(session, expected=expected)
+    if stored is None:
+        return False
+    session_index.put(stored)
+    return True
+
+
+def _update_session(
+    session_id: str,
+    apply: Callable[[WorkSession], Tuple[bool, T]]
+) -> Tuple[WorkSession, T]:
+    """
+    Phase 67-D: 세션 사본 로드 → apply → 바뀌었으면 조건부 저장
+
+    apply(사본) → (저장 여부, 결과). 로드 이후 연결 생성/자동 매칭/되돌리기 등의 작업이나
+    다른 저장이 있으면 덮어쓰지 않고 다시 로드해 재적용한다 (sync_manager.update_session과 같은 방식).
+
+    Returns:
+        (apply를 적용한 세션, apply 결과)
+
+    Raises:
+        HTTPException: 세션 없음 (404), 계속 변경되어 저장하지 못함 (409)
+    """
+    for _ in range(_UPDATE_RETRIES):
+        loaded = session_store.load_for_update(session_id)
+        if loaded is None:
+            raise _session_not_found(session_id)
+        session, version = loaded
+
+        changed, result = apply(session)
+        if not changed or _save_session(session, expected=version):
+            return session, result
+
+    raise HTTPException(status_code=409, detail="세션이 계속 변경되어 저장하지 못했습니다. 다시 시도하세요")
+
+
+def _apply(session_id: str, op: str, build, undoable: bool = True) -> WorkSession:
+    """
+    Phase 67-D: 작업 하나를 세션 로그에 추가하고 인덱스 갱신
+
+    build(현재 세션) → 변경 목록. 반환 세션은 저장소와 공유되므로 수정하지 말 것.
+    """
+    applied = session_store.apply(session_id, op, build, undoable)
+    if applied is None:
+        raise _session_not_found(session_id)
+    session, record = applied
+    if record is not None:
+        session_index.put(session, changed_groups(record["changes"]))
+    return session
 
 
 def _calculate_stats(session: WorkSession) -> WorkSessionStats:
@@ -82,24 +174,20 @@ async def list_sessions(
         problem_doc_id: 문제 문서 ID 필터
     """
     try:
-        sessions: List[WorkSession] = []
-
-        if config.WORK_SESSIONS_DIR.exists():
-            for session_file in config.WORK_SESSIONS_DIR.glob("ws-*.json"):
-                try:
-                    data = load_json(session_file)
-                    session = WorkSession(**data)
+        # Phase 65-D: 인덱스에서 조회
+        if problem_doc_id:
+            candidates = session_index.find_by_document(problem_doc_id)
+        else:
+            candidates = session_index.list_sessions()
 
-                    # 필터 적용
-                    if status and session.status != status:
-                        continue
-                    if problem_doc_id and session.problemDocumentId != problem_doc_id:
-                        continue
-
-                    sessions.append(session)
-                except Exception as e:
-                    print(f"[Phase 32] 세션 로드 실패: {session_file} - {e}")
-                    continue
+        sessions: List[WorkSession] = []
+        for session in candidates:
+            # 필터 적용
+            if status and session.status != status:
+                continue
+            if problem_doc_id and session.problemDocumentId != problem_doc_id:
+                continue
+            sessions.append(session)
 
         # 최신순 정렬
         sessions.sort(key=lambda s: s.updatedAt, reverse=True)
@@ -150,7 +238,10 @@ async def get_session(session_id: str):
         session_id: 세션 ID
     """
     try:
-        session = _load_session(session_id)
+        # Phase 67-D: 읽기 전용 - 사본 없이 현재 상태 사용
+        session = session_store.load(session_id)
+        if session is None:
+            raise _session_not_found(session_id)
         stats = _calculate_stats(session)
 
         return WorkSessionDetailResponse(session=session, stats=stats)
@@ -171,9 +262,7 @@ async def update_session(session_id: str, request: WorkSessionUpdate):
         session_id: 세션 ID
         request: 업데이트 요청
     """
-    try:
-        session = _load_session(session_id)
-
+    def apply(session: WorkSession):
         # 업데이트 적용
         if request.name is not None:
             session.name = request.name
@@ -190,8 +279,10 @@ async def update_session(session_id: str, request: WorkSessionUpdate):
             session.lastProblemPage = request.lastProblemPage
         if request.lastSolutionPage is not None:
             session.lastSolutionPage = request.lastSolutionPage
+        return True, None
 
-        _save_session(session)
+    try:
+        session, _ = _update_session(session_id, apply)
         print(f"[Phase 48] 세션 업데이트: {session_id}")
 
         return session
@@ -212,11 +303,10 @@ async def delete_session(session_id: str):
         session_id: 세션 ID
     """
     try:
-        session_path = _get_session_path(session_id)
-        if not session_path.exists():
-            raise HTTPException(status_code=404, detail=f"세션 '{session_id}'을 찾을 수 없습니다")
-
-        session_path.unlink()
+        # Phase 67-D: 세션 파일 + 작업 로그 삭제
+        if not session_store.delete(session_id):
+            raise _session_not_found(session_id)
+        session_index.remove(session_id)
         print(f"[Phase 32] 세션 삭제: {session_id}")
 
         return {"message": f"세션 '{session_id}'이 삭제되었습니다"}
@@ -238,43 +328,40 @@ async def add_problem(session_id: str, request: AddProblemRequest):
     - 새 그룹: 추가
     - 기존 그룹: 정보 업데이트 (다른 페이지에서 같은 ID로 재등록 허용)
 
+    Phase 67-D: 작업 로그에 한 줄 추가 (되돌리기 가능)
+
     Args:
         session_id: 세션 ID
         request: 문제 추가 요청
     """
     try:
-        session = _load_session(session_id)
-
-        # Phase 43 + Phase 47: 중복 체크 → Upsert로 변경
-        # Phase 47: groupId + pageIndex 모두 일치해야 같은 문제로 판단
-        existing = next((
-            p for p in session.problems
-            if p.groupId == request.groupId and p.pageIndex == request.pageIndex
-        ), None)
-        if existing:
-            # 기존 문제 업데이트 (problemNumber, displayName)
-            existing.problemNumber = request.problemNumber
-            # Phase 45-Fix: 파싱 가능한 형식으로 기본값 변경
-            existing.displayName = request.displayName or f"{request.problemNumber}번"
-
-            _save_session(session)
-            print(f"[Phase 47] 문제 업데이트 (upsert): {session_id} - {request.groupId} @ page {request.pageIndex}")
-
-            return session
-
-        # 문제 추가
-        problem = ProblemReference(
-            groupId=request.groupId,
-            documentId=session.problemDocumentId,
-            pageIndex=request.pageIndex,
-            problemNumber=request.problemNumber,
-            # Phase 45-Fix: 파싱 가능한 형식으로 기본값 변경
-            displayName=request.displayName or f"{request.problemNumber}번"
-        )
-        session.problems.append(problem)
+        # Phase 45-Fix: 파싱 가능한 형식으로 기본값 변경
+        display_name = request.displayName or f"{request.problemNumber}번"
+
+        def build(session: WorkSession):
+            # Phase 43 + Phase 47: 중복 체크 → Upsert로 변경
+            # Phase 47: groupId + pageIndex 모두 일치해야 같은 문제로 판단
+            # Phase 67-E: 복합 키 색인으로 조회
+            existing = session.find_problem(request.groupId, request.pageIndex)
+            if existing:
+                # 기존 문제 업데이트 (problemNumber, displayName)
+                updated = existing.model_copy(update={
+                    "problemNumber": request.problemNumber,
+                    "displayName": display_name,
+                })
+                return [problem_change(existing, updated)]
+
+            problem = ProblemReference(
+                groupId=request.groupId,
+                documentId=session.problemDocumentId,
+                pageIndex=request.pageIndex,
+                problemNumber=request.problemNumber,
+                displayName=display_name
+            )
+            return [problem_change(None, problem)]
 
-        _save_session(session)
-        print(f"[Phase 32] 문제 추가: {session_id} - {request.problemNumber}")
+        session = _apply(session_id, "add_problem", build)
+        print(f"[Phase 67-D] 문제 추가 (upsert): {session_id} - {request.groupId} @ page {request.pageIndex}")
 
         return session
 
@@ -290,20 +377,25 @@ async def remove_problem(session_id: str, group_id: str):
     """
     Phase 54-B: 세션에서 문제 삭제 (groups.json + 이미지도 삭제)
 
+    Phase 67-D: 세션 변경은 작업 로그에 한 줄 추가.
+    groups.json 그룹과 내보낸 이미지는 복구할 수 없으므로 되돌리기 대상이 아님.
+
     Args:
         session_id: 세션 ID
         group_id: 그룹 ID
     """
     try:
-        session = _load_session(session_id)
+        session = session_store.load(session_id)
+        if session is None:
+            raise _session_not_found(session_id)
 
         # 1. 문제 찾기
-        problem = next((p for p in session.problems if p.groupId == group_id), None)
+        problem = session.find_problem(group_id)
         if not problem:
             raise HTTPException(status_code=404, detail=f"그룹 '{group_id}'를 찾을 수 없습니다")
 
         # 2. 연결된 해설 링크 찾기
-        link = next((l for l in session.links if l.problemGroupId == group_id), None)
+        link = session.get_link(group_id)
 
         # 3. groups.json에서 그룹 삭제
         deleted_from_disk = sync_manager.delete_group_from_disk(
@@ -327,11 +419,14 @@ async def remove_problem(session_id: str, group_id: str):
             group_id=group_id
         )
 
-        # 6. 세션에서 삭제
-        session.problems = [p for p in session.problems if p.groupId != group_id]
-        session.links = [l for l in session.links if l.problemGroupId != group_id]
+        # 6. 세션에서 삭제 (현재 상태 기준)
+        def build(current: WorkSession):
+            return (
+                [problem_change(p, None) for p in current.problems_for_group(group_id)]
+                + [link_change(l, None) for l in current.links_for_problem(group_id)]
+            )
 
-        _save_session(session)
+        session = _apply(session_id, "remove_problem", build, undoable=False)
 
         print(f"[Phase 54] 문제 삭제: {session_id} - {group_id}")
         print(f"  - groups.json: {deleted_from_disk}")
@@ -348,52 +443,61 @@ async def remove_problem(session_id: str, group_id: str):
 
 # === 연결 관리 ===
 
+def _sync_link_to_group(session: WorkSession, link: ProblemSolutionLink) -> None:
+    """Phase 37-D: 해설 groups.json에 링크 정보 동기화"""
+    problem = session.find_problem(link.problemGroupId)
+    if problem is None:
+        return
+    link_data = {
+        "linkedGroupId": link.problemGroupId,
+        "linkedDocumentId": session.problemDocumentId,
+        "linkedPageIndex": problem.pageIndex,
+        "linkedName": problem.displayName,
+        "linkType": "solution",
+        "linkedAt": link.linkedAt
+    }
+    sync_manager.sync_single_link_to_group(
+        solution_document_id=link.solutionDocumentId,
+        solution_group_id=link.solutionGroupId,
+        solution_page_index=link.solutionPageIndex,
+        link_data=link_data
+    )
+
+
 @router.post("/{session_id}/links", response_model=WorkSession)
 async def create_link(session_id: str, request: CreateLinkRequest):
     """
     문제-해설 연결 생성
 
+    Phase 67-D: 작업 로그에 한 줄 추가 (되돌리기 가능)
+
     Args:
         session_id: 세션 ID
         request: 연결 생성 요청
     """
     try:
-        session = _load_session(session_id)
-
-        # 문제 존재 확인
-        problem = next((p for p in session.problems if p.groupId == request.problemGroupId), None)
-        if not problem:
-            raise HTTPException(status_code=404, detail=f"문제 '{request.problemGroupId}'를 찾을 수 없습니다")
-
-        # 기존 연결 제거 (한 문제에 하나의 해설만 연결)
-        session.links = [l for l in session.links if l.problemGroupId != request.problemGroupId]
-
-        # 새 연결 추가
         link = ProblemSolutionLink(
             problemGroupId=request.problemGroupId,
             solutionGroupId=request.solutionGroupId,
             solutionDocumentId=request.solutionDocumentId,
             solutionPageIndex=request.solutionPageIndex
         )
-        session.links.append(link)
 
-        _save_session(session)
+        def build(session: WorkSession):
+            # 문제 존재 확인
+            if session.find_problem(request.problemGroupId) is None:
+                raise HTTPException(status_code=404, detail=f"문제 '{request.problemGroupId}'를 찾을 수 없습니다")
+
+            # 기존 연결 제거 (한 문제에 하나의 해설만 연결) 후 새 연결 추가
+            return (
+                [link_change(l, None) for l in session.links_for_problem(request.problemGroupId)]
+                + [link_change(None, link)]
+            )
+
+        session = _apply(session_id, "create_link", build)
 
         # Phase 37-D: groups.json에 링크 정보 동기화
-        link_data = {
-            "linkedGroupId": request.problemGroupId,
-            "linkedDocumentId": session.problemDocumentId,
-            "linkedPageIndex": problem.pageIndex,
-            "linkedName": problem.displayName,
-            "linkType": "solution",
-            "linkedAt": link.linkedAt
-        }
-        sync_manager.sync_single_link_to_group(
-            solution_document_id=request.solutionDocumentId,
-            solution_group_id=request.solutionGroupId,
-            solution_page_index=request.solutionPageIndex,
-            link_data=link_data
-        )
+        _sync_link_to_group(session, link)
         print(f"[Phase 37-D] 연결 생성 + 동기화: {request.problemGroupId} → {request.solutionGroupId}")
 
         return session
@@ -410,35 +514,31 @@ async def remove_link(session_id: str, problem_group_id: str):
     """
     문제-해설 연결 삭제
 
+    Phase 67-D: 작업 로그에 한 줄 추가 (되돌리기 가능)
+
     Args:
         session_id: 세션 ID
         problem_group_id: 문제 그룹 ID
     """
     try:
-        session = _load_session(session_id)
-
-        # 삭제할 링크 찾기 (groups.json 업데이트용)
-        link_to_remove = next(
-            (l for l in session.links if l.problemGroupId == problem_group_id),
-            None
-        )
+        removed: List[ProblemSolutionLink] = []
 
-        # 연결 삭제
-        original_count = len(session.links)
-        session.links = [l for l in session.links if l.problemGroupId != problem_group_id]
+        def build(session: WorkSession):
+            # 삭제할 링크 찾기 (groups.json 업데이트용)
+            removed.extend(session.links_for_problem(problem_group_id))
+            if not removed:
+                raise HTTPException(status_code=404, detail=f"연결을 찾을 수 없습니다")
+            return [link_change(l, None) for l in removed]
 
-        if len(session.links) == original_count:
-            raise HTTPException(status_code=404, detail=f"연결을 찾을 수 없습니다")
-
-        _save_session(session)
+        session = _apply(session_id, "remove_link", build)
 
         # Phase 37-D: groups.json에서 링크 정보 제거
-        if link_to_remove:
-            sync_manager.clear_link_from_group(
-                document_id=link_to_remove.solutionDocumentId,
-                group_id=link_to_remove.solutionGroupId,
-                page_index=link_to_remove.solutionPageIndex
-            )
+        link_to_remove = removed[0]
+        sync_manager.clear_link_from_group(
+            document_id=link_to_remove.solutionDocumentId,
+            group_id=link_to_remove.solutionGroupId,
+            page_index=link_to_remove.solutionPageIndex
+        )
         print(f"[Phase 37-D] 연결 삭제 + 동기화: {problem_group_id}")
 
         return session
@@ -450,7 +550,151 @@ async def remove_link(session_id: str, problem_group_id: str):
         raise HTTPException(status_code=500, detail=f"연결 삭제 실패: {str(e)}")
 
 
-# === 세션 초기화 ===
+# === Phase 68-A: 자동 매칭 ===
+
+@router.post("/{session_id}/auto-match", response_model=AutoMatchResponse)
+async def auto_match(session_id: str, request: Optional[AutoMatchRequest] = None):
+    """
+    Phase 68-A: 문제-해설 자동 매칭
+
+    연결되지 않은 문제마다 해설 후보를 신뢰도와 함께 반환한다.
+    apply=True면 minConfidence 이상 후보를 작업 하나("auto_match")로 연결하고
+    (undo로 한 번에 되돌리기), groups.json link는 해설 페이지당 한 번 저장한다.
+    기준 미만 후보(needsReview)는 검수자가 연결 생성 API로 확정한다.
+
+    Args:
+        session_id: 세션 ID
+        request: 적용 여부 / 신뢰도 기준
+    """
+    request = request or AutoMatchRequest()
+    try:
+        session = session_store.load(session_id)
+        if session is None:
+            raise _session_not_found(session_id)
+
+        suggestions = auto_matcher.suggest(session)
+        for suggestion in suggestions:
+            suggestion.needsReview = suggestion.confidence < request.minConfidence
+        accepted = [s for s in suggestions if not s.needsReview]
+
+        unlinked = sum(
+            1 for p in session.problems
+            if not p.isParent and not session.links_for_problem(p.groupId)
+        )
+        response = AutoMatchResponse(
+            suggestions=suggestions,
+            needsReview=len(suggestions) - len(accepted),
+            unmatched=max(unlinked - len({s.problemGroupId for s in suggestions}), 0),
+        )
+        if not (request.apply and accepted):
+            return response
+
+        def build(current: WorkSession):
+            # 후보 계산 이후 연결된 문제/해설은 건너뜀
+            linked = {l.problemGroupId for l in current.links}
+            used = {(l.solutionPageIndex, l.solutionGroupId) for l in current.links}
+            changes = []
+            for suggestion in accepted:
+                solution_key = (suggestion.solutionPageIndex, suggestion.solutionGroupId)
+                if (suggestion.problemGroupId in linked or solution_key in used
+                        or current.find_problem(suggestion.problemGroupId) is None):
+                    continue
+                linked.add(suggestion.problemGroupId)
+                used.add(solution_key)
+                changes.append(link_change(None, ProblemSolutionLink(
+                    problemGroupId=suggestion.problemGroupId,
+                    solutionGroupId=suggestion.solutionGroupId,
+                    solutionDocumentId=suggestion.solutionDocumentId,
+                    solutionPageIndex=suggestion.solutionPageIndex
+                )))
+            response.applied = len(changes)
+            return changes
+
+        session = _apply(session_id, "auto_match", build)
+
+        # groups.json link 동기화 (바뀐 해설 페이지만 잠금 후 저장)
+        if response.applied:
+            sync_manager.update_session(session_id, sync_manager.sync_links_to_groups)
+            session = session_store.load(session_id) or session
+
+        response.session = session
+        print(f"[Phase 68-A] 자동 매칭: {session_id} - 연결 {response.applied}, 검수 {response.needsReview}")
+        return response
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"[API 오류] 자동 매칭 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"자동 매칭 실패: {str(e)}")
+
+
+# === Phase 67-D: 작업 이력 ===
+
+@router.post("/{session_id}/undo", response_model=WorkSession)
+async def undo_operation(session_id: str):
+    """
+    가장 최근 작업 되돌리기 (문제 추가, 연결 생성/삭제)
+
+    세션 상태는 작업 로그의 변경을 거꾸로 적용하고,
+    연결 변경은 해설 groups.json의 link 정보도 함께 되돌린다.
+    문제 삭제는 groups.json/이미지를 복구할 수 없어 되돌리지 않는다 (409).
+
+    Args:
+        session_id: 세션 ID
+    """
+    try:
+        try:
+            undone = session_store.undo(session_id)
+        except ValueError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        if undone is None:
+            raise _session_not_found(session_id)
+
+        session, record = undone
+        session_index.put(session, changed_groups(record["changes"]))
+
+        # 해설 groups.json link 되돌리기 (제거 먼저, 복원은 나중에)
+        link_changes = [c for c in record["changes"] if c["kind"] == "link"]
+        for change in link_changes:
+            if change["after"] is None:
+                before = change["before"]
+                sync_manager.clear_link_from_group(
+                    document_id=before["solutionDocumentId"],
+                    group_id=before["solutionGroupId"],
+                    page_index=before["solutionPageIndex"]
+                )
+        for change in link_changes:
+            if change["after"] is not None:
+                _sync_link_to_group(session, ProblemSolutionLink(**change["after"]))
+
+        print(f"[Phase 67-D] 작업 되돌리기: {session_id} - #{record['target']}")
+        return session
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"[API 오류] 작업 되돌리기 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"작업 되돌리기 실패: {str(e)}")
+
+
+@router.get("/{session_id}/history")
+async def get_history(session_id: str, limit: int = 50):
+    """
+    최근 작업 이력 (최신순)
+
+    Args:
+        session_id: 세션 ID
+        limit: 최대 개수 (작업 로그에는 최근 SESSION_UNDO_DEPTH개 이상 보관)
+    """
+    history = session_store.history(session_id, max(limit, 0))
+    if history is None:
+        raise _session_not_found(session_id)
+    return {
+        "session_id": session_id,
+        "items": history,
+        "total": len(history),
+    }
+
 
 @router.post("/{session_id}/reset")
 async def reset_session(session_id: str):
@@ -467,13 +711,10 @@ async def reset_session(session_id: str):
         초기화 결과 및 업데이트된 세션
     """
     try:
-        session = _load_session(session_id)
-
-        # 세션 초기화
-        result = sync_manager.reset_session(session)
-
-        # 세션 저장
-        _save_session(session)
+        # 세션 초기화 + 저장
+        session, result = _update_session(
+            session_id, lambda session: (True, sync_manager.reset_session(session))
+        )
 
         print(f"[Phase 55] 세션 초기화: {session_id}")
         print(f"  - 문제 삭제: {result['problems_removed']}개")
@@ -506,8 +747,7 @@ async def sync_problems_from_groups(session_id: str):
     Args:
         session_id: 세션 ID
     """
-    try:
-        session = _load_session(session_id)
+    def apply(session: WorkSession):
         doc_dir = config.get_document_dir(session.problemDocumentId)
         groups_dir = doc_dir / "groups"
 
@@ -517,7 +757,7 @@ async def sync_problems_from_groups(session_id: str):
         if groups_dir.exists():
             for groups_file in sorted(groups_dir.glob("page_*_groups.json")):
                 page_index = int(groups_file.stem.split("_")[1])
-                data = load_json(groups_file)
+                data = groups_cache.read(groups_file)
 
                 for group in data.get("groups", []):
                     group_id = group.get("id")
@@ -552,9 +792,11 @@ async def sync_problems_from_groups(session_id: str):
 
         # 새 문제 추가
         session.problems.extend(new_problems)
+        return True, len(new_problems)
 
-        _save_session(session)
-        print(f"[Phase 32] 문제 동기화: {session_id} - {len(new_problems)}개 추가")
+    try:
+        session, added = _update_session(session_id, apply)
+        print(f"[Phase 32] 문제 동기화: {session_id} - {added}개 추가")
 
         return session
 
@@ -576,19 +818,8 @@ async def find_sessions_by_document(document_id: str):
         document_id: 문서 ID (문제 또는 해설)
     """
     try:
-        sessions: List[WorkSession] = []
-
-        if config.WORK_SESSIONS_DIR.exists():
-            for session_file in config.WORK_SESSIONS_DIR.glob("ws-*.json"):
-                try:
-                    data = load_json(session_file)
-                    session = WorkSession(**data)
-
-                    # 문제 또는 해설 문서와 일치하는 세션
-                    if session.problemDocumentId == document_id or session.solutionDocumentId == document_id:
-                        sessions.append(session)
-                except Exception:
-                    continue
+        # Phase 65-D: 문서 → 세션 역색인 (문제 또는 해설 문서와 일치하는 세션)
+        sessions = session_index.find_by_document(document_id)
 
         # 최신순 정렬
         sessions.sort(key=lambda s: s.updatedAt, reverse=True)
@@ -616,15 +847,14 @@ async def full_sync(session_id: str) -> Dict[str, Any]:
     Returns:
         동기화 결과 (성공 여부, 추가/삭제/업데이트 수)
     """
-    try:
-        session = _load_session(session_id)
-
+    def apply(session: WorkSession):
         # SyncManager로 양방향 동기화
         result = sync_manager.full_sync(session)
+        return result.success and result.state_changed, result
 
-        # 변경된 세션 저장
-        if result.success and (result.problems_added > 0 or result.problems_removed > 0):
-            _save_session(session)
+    try:
+        # 변경된 세션만 저장 (Phase 67-A: 문제 변경 또는 페이지별 동기화 버전 갱신)
+        session, result = _update_session(session_id, apply)
 
         print(f"[Phase 37-D] 완전 동기화: {session_id} - "
               f"추가 {result.problems_added}, 삭제 {result.problems_removed}, "
@@ -693,8 +923,7 @@ async def sync_parent_flags(session_id: str) -> Dict[str, Any]:
         updated: 업데이트된 문제 수
         session: 업데이트된 세션
     """
-    try:
-        session = _load_session(session_id)
+    def apply(session: WorkSession):
         doc_dir = config.get_document_dir(session.problemDocumentId)
         groups_dir = doc_dir / "groups"
 
@@ -708,7 +937,7 @@ async def sync_parent_flags(session_id: str) -> Dict[str, Any]:
             if not groups_file.exists():
                 continue
 
-            data = load_json(groups_file)
+            data = groups_cache.read(groups_file)
             for group in data.get("groups", []):
                 if group.get("id") != problem.groupId:
                     continue
@@ -721,10 +950,11 @@ async def sync_parent_flags(session_id: str) -> Dict[str, Any]:
                     print(f"[Phase 56-O] Updated isParent: {problem.groupId} -> {is_parent}")
 
                 break
+        return updated_count > 0, updated_count
 
-        # 변경사항 저장
+    try:
+        session, updated_count = _update_session(session_id, apply)
         if updated_count > 0:
-            _save_session(session)
             print(f"[Phase 56-O] isParent 동기화 완료: {session_id} - {updated_count}개 업데이트")
 
         return {
@@ -741,85 +971,107 @@ async def sync_parent_flags(session_id: str) -> Dict[str, Any]:
 
 
 @router.post("/{session_id}/validate-sync")
-async def validate_sync(session_id: str) -> Dict[str, Any]:
+async def validate_sync(session_id: str, dry_run: bool = False) -> Dict[str, Any]:
     """
     Phase 59-B: groups.json과 session.problems 일치 여부 검증 및 수정
 
     session.problems에 있지만 groups.json에 없는 "orphan" 문제를 찾아서 삭제
 
+    Phase 67-C: (문서, 페이지)별로 묶어 groups.json을 페이지당 한 번만 읽고
+    그룹 ID 집합으로 검증. 같은 그룹 ID가 다른 페이지에 있어도 그 문제는 유지.
+
+    Args:
+        session_id: 세션 ID
+        dry_run: True면 수정/저장하지 않고 제거 대상만 보고
+
     Returns:
-        status: "ok" (문제 없음) | "fixed" (수정됨)
+        status: "ok" (문제 없음) | "fixed" (수정됨) | "pending" (dry_run, 제거 대상 있음)
         issues_found: 발견된 문제 수
-        issues_fixed: 수정된 문제 수
+        issues_fixed: 수정된 문제 수 (dry_run이면 0)
+        links_removed: 제거된 (dry_run이면 제거될) 링크 수
         details: 상세 내용
     """
-    try:
-        session = _load_session(session_id)
-        issues = []
-        orphan_problem_ids = set()
+    def apply(session: WorkSession):
+        action = "would_remove" if dry_run else "will_remove"
 
-        # 각 문제에 대해 groups.json 존재 여부 확인
+        # (문서, 페이지)별 문제
+        problems_by_page: Dict[tuple, List[ProblemReference]] = {}
         for problem in session.problems:
-            doc_id = problem.documentId
-            page_idx = problem.pageIndex
-            group_id = problem.groupId
+            problems_by_page.setdefault((problem.documentId, problem.pageIndex), []).append(problem)
 
-            doc_dir = config.get_document_dir(doc_id)
-            groups_file = doc_dir / "groups" / f"page_{page_idx:04d}_groups.json"
+        issues = []
+        orphan_keys = set()
 
-            if not groups_file.exists():
-                issues.append({
-                    "type": "missing_groups_file",
-                    "problem": group_id,
-                    "page": page_idx,
-                    "documentId": doc_id,
-                    "action": "will_remove"
-                })
-                orphan_problem_ids.add(group_id)
-                continue
+        for (doc_id, page_idx), page_problems in problems_by_page.items():
+            groups_file = config.get_document_dir(doc_id) / "groups" / f"page_{page_idx:04d}_groups.json"
 
-            groups_data = load_json(groups_file)
-            group_exists = any(g.get("id") == group_id for g in groups_data.get("groups", []))
+            try:
+                groups_data = groups_cache.read(groups_file)
+            except OSError:
+                issue_type, group_ids = "missing_groups_file", set()
+            else:
+                issue_type = "orphan_problem"
+                group_ids = {g.get("id") for g in groups_data.get("groups", [])}
 
-            if not group_exists:
+            for problem in page_problems:
+                if problem.groupId in group_ids:
+                    continue
                 issues.append({
-                    "type": "orphan_problem",
-                    "problem": group_id,
+                    "type": issue_type,
+                    "problem": problem.groupId,
                     "page": page_idx,
                     "documentId": doc_id,
-                    "action": "will_remove"
+                    "action": action
                 })
-                orphan_problem_ids.add(group_id)
-
-        # 자동 수정: orphan problems 및 관련 links 제거
-        fixed_count = 0
-        if orphan_problem_ids:
-            original_problem_count = len(session.problems)
-            original_link_count = len(session.links)
-
-            # 문제 제거
-            session.problems = [
-                p for p in session.problems
-                if p.groupId not in orphan_problem_ids
-            ]
-
-            # 관련 링크 제거 (문제 또는 해설이 orphan인 경우)
-            session.links = [
-                l for l in session.links
-                if l.problemGroupId not in orphan_problem_ids
-            ]
-
-            fixed_count = original_problem_count - len(session.problems)
-            removed_links = original_link_count - len(session.links)
-
-            # 세션 저장
-            _save_session(session)
+                orphan_keys.add((doc_id, page_idx, problem.groupId))
+
+        # orphan problems 및 관련 links (남는 문제가 없는 그룹 ID를 가리키는 링크)
+        remaining_problems = [
+            p for p in session.problems
+            if (p.documentId, p.pageIndex, p.groupId) not in orphan_keys
+        ]
+        remaining_ids = {p.groupId for p in remaining_problems}
+        orphan_ids = {group_id for _, _, group_id in orphan_keys}
+        remaining_links = [
+            l for l in session.links
+            if l.problemGroupId not in orphan_ids or l.problemGroupId in remaining_ids
+        ]
+        fixed_count = len(session.problems) - len(remaining_problems)
+        removed_links = len(session.links) - len(remaining_links)
+
+        fixed = not dry_run and fixed_count > 0
+        if fixed:
+            session.problems = remaining_problems
+            session.links = remaining_links
+        return fixed, (issues, fixed_count, removed_links)
+
+    try:
+        if dry_run:
+            session = session_store.load(session_id)
+            if session is None:
+                raise _session_not_found(session_id)
+            # dry_run은 수정하지 않으므로 사본 없이 현재 상태로 검사
+            _, (issues, fixed_count, removed_links) = apply(session)
+            return {
+                "status": "pending" if issues else "ok",
+                "dry_run": True,
+                "issues_found": len(issues),
+                "issues_fixed": 0,
+                "links_removed": removed_links,
+                "details": issues
+            }
+
+        # 자동 수정 (조건부 저장)
+        _, (issues, fixed_count, removed_links) = _update_session(session_id, apply)
+        if fixed_count:
             print(f"[Phase 59-B] validate-sync: {session_id} - {fixed_count}개 orphan 문제, {removed_links}개 링크 제거")
 
         return {
             "status": "fixed" if fixed_count > 0 else "ok",
+            "dry_run": False,
             "issues_found": len(issues),
             "issues_fixed": fixed_count,
+            "links_removed": removed_links,
             "details": issues
         }
 
@@ -847,8 +1099,7 @@ async def refresh_display_names(session_id: str) -> Dict[str, Any]:
         updated: 업데이트된 문제 수
         session: 업데이트된 세션
     """
-    try:
-        session = _load_session(session_id)
+    def apply(session: WorkSession):
         doc_dir = config.get_document_dir(session.problemDocumentId)
         groups_dir = doc_dir / "groups"
 
@@ -879,7 +1130,7 @@ async def refresh_display_names(session_id: str) -> Dict[str, Any]:
             if not groups_file.exists():
                 continue
 
-            data = load_json(groups_file)
+            data = groups_cache.read(groups_file)
             for group in data.get("groups", []):
                 if group.get("id") != problem.groupId:
                     continue
@@ -910,10 +1161,11 @@ async def refresh_display_names(session_id: str) -> Dict[str, Any]:
                     updated_count += 1
 
                 break
+        return updated_count > 0, updated_count
 
-        # 변경사항 저장
+    try:
+        session, updated_count = _update_session(session_id, apply)
         if updated_count > 0:
-            _save_session(session)
             print(f"[Phase 46-A] displayName 새로고침 완료: {session_id} - {updated_count}개 업데이트")
 
         return {
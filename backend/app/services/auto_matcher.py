@@ -0,0 +1,323 @@
+"""
+Phase 68-A: 문제-해설 자동 매칭
+
+작업 세션의 연결되지 않은 문제와 해설 문서의 그룹을 한 번에 맞춰 연결 후보를 만든다.
+검수자는 신뢰도가 낮은 후보만 확인/거절하면 된다.
+
+단서:
+- 번호: 양쪽 groups.json의 problemInfo.problemNumber (정규화: "01번" → "1", "예제 02" → "예제2")
+- 순서: 해설은 문제와 같은 순서로 나온다 (페이지 순 단조성)
+- 배치: blocks/*.json의 블록 위치로 페이지 안 읽기 순서 (왼쪽 단 → 오른쪽 단, 위 → 아래)
+
+매칭:
+1. 문제/해설을 읽기 순서로 정렬하고 번호를 정수 코드로 변환 (numpy)
+2. 번호가 같은 (문제, 해설) 후보 쌍을 한 번에 생성 (정렬 + searchsorted)
+3. 두 순서가 모두 증가하는 가장 긴 후보 사슬 (LIS) → 번호 매칭
+4. 사슬 사이 빈 구간의 문제 수와 해설 수가 같고 번호가 비어 있으면 위치로 매칭
+
+신뢰도 (0~1):
+- 번호 매칭 0.5 + 해설 쪽 번호가 유일 0.25 + 앞/뒤 매칭과 바로 이웃 각 0.125
+- 위치 매칭 0.4
+"""
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import config
+from app.models.work_session import AutoMatchSuggestion, WorkSession
+from app.services.groups_cache import groups_cache
+from app.utils import extract_page_index, load_json_or_default
+
+
+NUMBER_CONFIDENCE = 0.5
+UNIQUE_BONUS = 0.25
+NEIGHBOR_BONUS = 0.125
+POSITION_CONFIDENCE = 0.4
+
+# 위치 매칭은 빈 구간이 이보다 크면 하지 않음 (번호 없는 그룹이 몰려 있으면 어긋날 가능성이 큼)
+MAX_POSITION_GAP = 3
+
+# 읽기 순서: 단 순위 (X/XP는 왼쪽 단에서 시작)
+_COLUMN_RANK = {"L": 0, "X": 0, "XP": 0, "R": 1}
+_NO_LAYOUT_RANK = 2
+
+_NUMBER_STRIP = re.compile(r"[\s.()\[\]번]")
+_LEADING_ZEROS = re.compile(r"(?<!\d)0+(?=\d)")
+
+OrderKey = Tuple[int, int, float, int]
+
+
+def normalize_number(value: Optional[str]) -> str:
+    """
+    문제 번호 정규화 (비교용)
+
+    Examples:
+        >>> normalize_number(" 01번 ")
+        '1'
+        >>> normalize_number("예제 02")
+        '예제2'
+    """
+    if not value:
+        return ""
+    return _LEADING_ZEROS.sub("", _NUMBER_STRIP.sub("", str(value))).lower()
+
+
+@dataclass
+class _Item:
+    """매칭 대상 그룹 하나 (문제 또는 해설)"""
+    group_id: str
+    page_index: int
+    number: str
+    order: OrderKey
+
+
+def _block_boxes(document_id: str, page_index: int) -> Tuple[Dict[Any, list], float]:
+    """블록 ID → bbox, 페이지 너비 (blocks 파일이 없으면 빈 dict)"""
+    blocks_file = config.get_document_dir(document_id) / "blocks" / f"page_{page_index:04d}_blocks.json"
+    data = load_json_or_default(blocks_file, {}) or {}
+    boxes = {b.get("block_id"): b.get("bbox") for b in data.get("blocks", []) if b.get("bbox")}
+    return boxes, float(data.get("width") or 0)
+
+
+def _reading_order(group: Dict[str, Any], page_index: int, position: int,
+                   boxes: Dict[Any, list], width: float) -> OrderKey:
+    """
+    페이지 안 읽기 순서 키 (페이지, 단, 위쪽 y, groups.json 순서)
+
+    블록 위치가 없는 그룹은 같은 페이지의 배치가 있는 그룹 뒤에 groups.json 순서로 둔다.
+    """
+    block_ids = group.get("block_ids") or []
+    segments = group.get("segments") or group.get("crossPageSegments")
+    if group.get("column") in ("X", "XP") and segments:
+        # 크로스 그룹은 첫 세그먼트 (왼쪽 단 / 첫 페이지) 위치
+        first = min(segments, key=lambda s: s.get("order", 0))
+        block_ids = first.get("block_ids") or block_ids
+
+    bboxes = [boxes[b] for b in block_ids if b in boxes]
+    if not bboxes:
+        return (page_index, _NO_LAYOUT_RANK, 0.0, position)
+
+    top = min(b[1] for b in bboxes)
+    rank = _COLUMN_RANK.get(group.get("column"))
+    if rank is None:
+        center = (min(b[0] for b in bboxes) + max(b[2] for b in bboxes)) / 2
+        rank = 0 if not width or center < width / 2 else 1
+    return (page_index, rank, float(top), position)
+
+
+class AutoMatcher:
+    """문제-해설 자동 매칭 (세션 단위)"""
+
+    def __init__(self):
+        self.config = config
+
+    def suggest(self, session: WorkSession) -> List[AutoMatchSuggestion]:
+        """
+        연결되지 않은 문제 → 해설 후보 (문제 읽기 순서)
+
+        이미 연결된 문제/해설과 모문제(isParent)는 제외한다.
+        세션은 읽기만 한다 (공유 객체를 넘겨도 됨).
+        """
+        if not session.solutionDocumentId:
+            return []
+
+        problems = self._problem_items(session)
+        used = {(l.solutionPageIndex, l.solutionGroupId) for l in session.links}
+        solutions = [
+            s for s in self._solution_items(session.solutionDocumentId)
+            if (s.page_index, s.group_id) not in used
+        ]
+        if not problems or not solutions:
+            return []
+
+        problems.sort(key=lambda item: item.order)
+        solutions.sort(key=lambda item: item.order)
+        pairs = match_items([p.number for p in problems], [s.number for s in solutions])
+
+        return [
+            AutoMatchSuggestion(
+                problemGroupId=problems[pi].group_id,
+                problemPageIndex=problems[pi].page_index,
+                problemNumber=problems[pi].number,
+                solutionGroupId=solutions[si].group_id,
+                solutionDocumentId=session.solutionDocumentId,
+                solutionPageIndex=solutions[si].page_index,
+                solutionNumber=solutions[si].number,
+                confidence=confidence,
+                reason=reason,
+            )
+            for pi, si, confidence, reason in pairs
+        ]
+
+    def _problem_items(self, session: WorkSession) -> List[_Item]:
+        """연결 대상 문제 (페이지별 groups/blocks 한 번씩 읽어 배치 확인)"""
+        linked = {l.problemGroupId for l in session.links}
+        by_page: Dict[int, list] = {}
+        for problem in session.problems:
+            if problem.isParent or problem.groupId in linked or problem.documentId != session.problemDocumentId:
+                continue
+            by_page.setdefault(problem.pageIndex, []).append(problem)
+
+        doc_dir = self.config.get_document_dir(session.problemDocumentId)
+        items = []
+        for page_index, page_problems in by_page.items():
+            groups_file = doc_dir / "groups" / f"page_{page_index:04d}_groups.json"
+            groups = groups_cache.read_or_default(groups_file, {"groups": []}).get("groups", [])
+            positions = {g.get("id"): (i, g) for i, g in enumerate(groups)}
+            boxes, width = _block_boxes(session.problemDocumentId, page_index)
+
+            for problem in page_problems:
+                position, group = positions.get(problem.groupId, (len(groups), {}))
+                items.append(_Item(
+                    group_id=problem.groupId,
+                    page_index=page_index,
+                    number=normalize_number(problem.problemNumber),
+                    order=_reading_order(group, page_index, position, boxes, width),
+                ))
+        return items
+
+    def _solution_items(self, document_id: str) -> List[_Item]:
+        """해설 문서의 모든 그룹 (모문제 제외)"""
+        groups_dir = self.config.get_document_dir(document_id) / "groups"
+        if not groups_dir.exists():
+            return []
+
+        items = []
+        for groups_file in groups_dir.glob("page_*_groups.json"):
+            page_index = extract_page_index(groups_file.name)
+            if page_index is None:
+                continue
+            groups = groups_cache.read_or_default(groups_file, {"groups": []}).get("groups", [])
+            if not groups:
+                continue
+            boxes, width = _block_boxes(document_id, page_index)
+
+            for position, group in enumerate(groups):
+                if not group.get("id") or group.get("isParent"):
+                    continue
+                items.append(_Item(
+                    group_id=group["id"],
+                    page_index=page_index,
+                    number=normalize_number((group.get("problemInfo") or {}).get("problemNumber")),
+                    order=_reading_order(group, page_index, position, boxes, width),
+                ))
+        return items
+
+
+def match_items(
+    problem_numbers: List[str],
+    solution_numbers: List[str],
+) -> List[Tuple[int, int, float, str]]:
+    """
+    읽기 순서로 정렬된 번호 목록 매칭
+
+    Args:
+        problem_numbers: 문제 번호 (정규화, 없으면 "")
+        solution_numbers: 해설 번호 (정규화, 없으면 "")
+
+    Returns:
+        (문제 위치, 해설 위치, 신뢰도, "number" | "position") - 문제 위치 순
+    """
+    n_problems = len(problem_numbers)
+    if not n_problems or not solution_numbers:
+        return []
+
+    # 번호 → 정수 코드 ("" = 번호 없음 → -1)
+    labels, codes = np.unique(np.array(problem_numbers + solution_numbers, dtype=object), return_inverse=True)
+    empty = np.flatnonzero(labels == "")
+    if empty.size:
+        codes = np.where(codes == empty[0], -1, codes)
+    p_codes, s_codes = codes[:n_problems], codes[n_problems:]
+
+    # 번호가 같은 후보 쌍: 해설 코드 정렬 후 문제별 [start, end) 구간
+    s_order = np.argsort(s_codes, kind="stable")
+    s_sorted = s_codes[s_order]
+    starts = np.searchsorted(s_sorted, p_codes, side="left")
+    counts = np.searchsorted(s_sorted, p_codes, side="right") - starts
+    counts[p_codes < 0] = 0
+
+    total = int(counts.sum())
+    if total:
+        pair_p = np.repeat(np.arange(n_problems), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_s = s_order[np.repeat(starts, counts) + offsets]
+        # 같은 문제의 후보는 해설 위치 내림차순 → 문제 하나에 해설 하나만 사슬에 들어감
+        order = np.lexsort((-pair_s, pair_p))
+        chain = _longest_chain(pair_p[order], pair_s[order])
+    else:
+        chain = []
+
+    results: List[Tuple[int, int, float, str]] = []
+    if chain:
+        chain_p = np.array([p for p, _ in chain])
+        chain_s = np.array([s for _, s in chain])
+        s_counts = np.bincount(s_codes[s_codes >= 0], minlength=len(labels))
+        unique = s_counts[p_codes[chain_p]] == 1
+
+        # 앞/뒤 매칭과 문제/해설 모두 바로 이웃
+        adjacent = (np.diff(chain_p) == 1) & (np.diff(chain_s) == 1)
+        prev_adjacent = np.concatenate(([False], adjacent))
+        next_adjacent = np.concatenate((adjacent, [False]))
+
+        confidence = (
+            NUMBER_CONFIDENCE
+            + UNIQUE_BONUS * unique
+            + NEIGHBOR_BONUS * (prev_adjacent.astype(int) + next_adjacent)
+        )
+        results.extend(
+            (int(p), int(s), float(c), "number")
+            for p, s, c in zip(chain_p, chain_s, confidence)
+        )
+
+    # 사슬 사이 빈 구간: 개수가 같고 한쪽 번호가 비어 있으면 위치로 매칭
+    bounds = [(-1, -1)] + chain + [(n_problems, len(solution_numbers))]
+    for (p0, s0), (p1, s1) in zip(bounds, bounds[1:]):
+        gap = p1 - p0 - 1
+        if gap <= 0 or gap > MAX_POSITION_GAP or gap != s1 - s0 - 1:
+            continue
+        for k in range(1, gap + 1):
+            pi, si = p0 + k, s0 + k
+            if p_codes[pi] >= 0 and s_codes[si] >= 0:
+                continue  # 번호가 서로 다름 - 후보로 내지 않음
+            results.append((pi, si, POSITION_CONFIDENCE, "position"))
+
+    results.sort()
+    return results
+
+
+def _longest_chain(pair_p: np.ndarray, pair_s: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    해설 위치가 순증가하는 가장 긴 부분 수열 (후보는 문제 오름차순, 해설 내림차순 정렬)
+
+    Returns:
+        [(문제 위치, 해설 위치)] - 두 위치 모두 증가
+    """
+    tails: List[int] = []       # 길이 k+1 사슬의 마지막 해설 위치 (최소)
+    tail_index: List[int] = []  # 그 후보 번호
+    previous = np.full(len(pair_s), -1)
+
+    for i, s in enumerate(pair_s.tolist()):
+        k = bisect_left(tails, s)
+        if k:
+            previous[i] = tail_index[k - 1]
+        if k == len(tails):
+            tails.append(s)
+            tail_index.append(i)
+        else:
+            tails[k] = s
+            tail_index[k] = i
+
+    chain = []
+    i = tail_index[-1] if tail_index else -1
+    while i >= 0:
+        chain.append((int(pair_p[i]), int(pair_s[i])))
+        i = previous[i]
+    chain.reverse()
+    return chain
+
+
+# 전역 인스턴스
+auto_matcher = AutoMatcher()
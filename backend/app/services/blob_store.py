@@ -0,0 +1,409 @@
+"""
+Phase 64-B: 내용 주소 기반 Blob 저장소 (PDF / 페이지 이미지 중복 제거)
+
+출판사가 같은 교재를 다른 파일명으로 배포하거나, 표지·답안지 양식처럼
+여러 문서에 같은 페이지가 반복되는 경우 동일한 바이트를 한 번만 저장한다.
+
+저장 구조:
+    DATASET_ROOT/blobs/<sha256 앞 2자리>/<sha256><확장자>   실제 데이터
+    DATASET_ROOT/blobs/source_index.json                     원본 PDF 해시 → document_id
+    DATASET_ROOT/blobs/pdf_refs.json                         원본 PDF를 쓰는 문서 목록
+                                                              (raw_pdfs/ 파일명별, 해시별)
+    documents/<id>/blobs.json                                 문서 파일 → 해시 매니페스트
+                                                              (원본 PDF는 raw_pdfs 항목)
+
+문서 디렉토리의 pages/, thumbs/ 파일과 raw_pdfs/의 PDF는 blob의 하드 링크로
+바꿔 두므로 기존 경로(pages/page_0000.webp 등)를 읽는 코드는 그대로 동작한다.
+blob의 링크 수가 1이면 (저장소만 참조) 더 이상 쓰는 문서가 없으므로 정리 대상.
+문서를 삭제할 때 다른 문서가 쓰지 않는 원본 PDF도 raw_pdfs/에서 지워 링크를 해제하고,
+원본 색인은 같은 PDF를 쓰는 남은 문서로 옮긴다 (없으면 제거).
+
+블록 분석 결과(blocks/)는 편집될 수 있으므로 링크하지 않고 복사한다.
+"""
+import hashlib
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from app.config import config
+from app.services.file_lock import file_lock, atomic_json_write, safe_json_read
+
+
+# 파일 해시 계산 청크 크기
+HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# 중복 제거 대상 (하드 링크) - 생성 후 수정되지 않는 렌더링 결과
+LINKED_ARTIFACT_DIRS = ('pages', 'thumbs')
+
+# 복제 시 복사만 하는 디렉토리 (편집 가능)
+COPIED_ARTIFACT_DIRS = ('blocks',)
+
+# 매니페스트의 원본 PDF 항목 (raw_pdfs/ 파일명 → 해시)
+RAW_PDF_KEY = 'raw_pdfs'
+
+MANIFEST_FILE = 'blobs.json'
+SOURCE_INDEX_FILE = 'source_index.json'
+PDF_REFS_FILE = 'pdf_refs.json'
+
+
+def file_sha256(path: Path) -> str:
+    """파일 SHA-256 (청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """dest를 src의 하드 링크로 원자적 교체 (링크 불가 시 복사)"""
+    temp_path = dest.with_name(f".{dest.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        os.link(src, temp_path)
+    except OSError:
+        shutil.copyfile(src, temp_path)
+    os.replace(temp_path, dest)
+
+
+class BlobStore:
+    """
+    Phase 64-B: 내용 주소 기반 저장소
+
+    데이터는 해시 경로에 한 번만 저장되고, 각 문서 파일은 그 하드 링크다.
+    하드 링크를 만들 수 없는 파일 시스템에서는 복사로 대체한다 (중복 제거만 안 됨).
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    # === Blob ===
+
+    def blob_path(self, digest: str, suffix: str = '') -> Path:
+        return self.root / digest[:2] / f"{digest}{suffix}"
+
+    def adopt(self, path: Path, digest: Optional[str] = None) -> str:
+        """
+        파일을 저장소에 등록
+
+        - 같은 내용의 blob이 있으면 path를 그 blob의 하드 링크로 교체 (중복 공간 해제)
+        - 없으면 path 자체를 blob으로 링크
+
+        Args:
+            path: 등록할 파일
+            digest: 이미 계산한 SHA-256 (None이면 계산)
+
+        Returns:
+            SHA-256
+        """
+        path = Path(path)
+        if digest is None:
+            digest = file_sha256(path)
+        blob = self.blob_path(digest, path.suffix.lower())
+        blob.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            os.link(path, blob)
+            return digest
+        except FileExistsError:
+            pass
+        except OSError:
+            # 하드 링크 미지원 - 중복 제거 없이 그대로 사용
+            return digest
+
+        try:
+            if not os.path.samefile(path, blob):
+                _link_or_copy(blob, path)
+        except OSError:
+            pass
+        return digest
+
+    def materialize(self, digest: str, suffix: str, dest: Path) -> bool:
+        """blob을 dest 경로에 연결 (없으면 False)"""
+        blob = self.blob_path(digest, suffix)
+        if not blob.exists():
+            return False
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(blob, dest)
+        return True
+
+    def collect(self, digests: Optional[Iterable[str]] = None) -> int:
+        """
+        참조가 없는 blob 삭제 (링크 수 1 = 저장소만 참조)
+
+        Args:
+            digests: 검사할 해시 목록 (None이면 전체)
+
+        Returns:
+            삭제한 blob 수
+        """
+        if digests is None:
+            candidates = [p for p in self.root.glob('??/*') if p.is_file()]
+        else:
+            candidates = []
+            for digest in set(digests):
+                candidates.extend(self.root.glob(f"{digest[:2]}/{digest}*"))
+
+        removed = 0
+        for blob in candidates:
+            try:
+                if os.stat(blob).st_nlink <= 1:
+                    blob.unlink()
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+    # === 문서 단위 ===
+
+    def dedup_document(self, doc_dir: Path) -> Dict[str, Dict[str, str]]:
+        """
+        문서의 렌더링 결과(pages/, thumbs/)를 저장소에 등록하고 매니페스트 갱신
+
+        이미 blob에 연결된 파일(링크 수 > 1이고 매니페스트에 있음)은 다시 해시하지 않는다.
+
+        Returns:
+            {'pages': {파일명: 해시}, 'thumbs': {...}}
+        """
+        doc_dir = Path(doc_dir)
+        manifest_path = doc_dir / MANIFEST_FILE
+
+        with file_lock(manifest_path):
+            manifest = safe_json_read(manifest_path, {}) or {}
+
+            for dir_name in LINKED_ARTIFACT_DIRS:
+                artifact_dir = doc_dir / dir_name
+                entries = manifest.setdefault(dir_name, {})
+                if not artifact_dir.exists():
+                    continue
+
+                for path in sorted(artifact_dir.iterdir()):
+                    if not path.is_file() or path.name.startswith('.'):
+                        continue
+                    known = entries.get(path.name)
+                    if known and os.stat(path).st_nlink > 1 and \
+                            self.blob_path(known, path.suffix.lower()).exists():
+                        continue
+                    entries[path.name] = self.adopt(path)
+
+            atomic_json_write(manifest_path, manifest)
+
+        return manifest
+
+    def clone_document(self, source_dir: Path, target_dir: Path) -> None:
+        """
+        같은 원본 PDF의 문서에서 파생 결과 전체를 재사용
+
+        - pages/, thumbs/: blob 하드 링크 (추가 공간 없음)
+        - blocks/: 복사 (문서별 편집 가능)
+        - blobs.json: 복사 (원본 PDF 항목 제외 - 새 문서의 PDF는 record_pdf로 기록)
+        """
+        source_dir = Path(source_dir)
+        target_dir = Path(target_dir)
+        manifest = self.dedup_document(source_dir)
+
+        for dir_name in LINKED_ARTIFACT_DIRS:
+            for name, digest in manifest.get(dir_name, {}).items():
+                dest = target_dir / dir_name / name
+                if not self.materialize(digest, Path(name).suffix.lower(), dest):
+                    # 정리된 blob - 원본 문서 파일에서 직접 연결
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    _link_or_copy(source_dir / dir_name / name, dest)
+
+        for dir_name in COPIED_ARTIFACT_DIRS:
+            src = source_dir / dir_name
+            if src.exists():
+                shutil.copytree(src, target_dir / dir_name, dirs_exist_ok=True)
+
+        atomic_json_write(
+            target_dir / MANIFEST_FILE,
+            {k: v for k, v in manifest.items() if k != RAW_PDF_KEY}
+        )
+
+    def record_pdf(self, doc_dir: Path, pdf_path: Path, digest: str) -> None:
+        """
+        문서의 원본 PDF(raw_pdfs/)를 매니페스트와 참조 목록에 기록
+        (문서 삭제 시 blob 정리 / 원본 색인 이전용)
+        """
+        doc_dir = Path(doc_dir)
+        name = Path(pdf_path).name
+        manifest_path = doc_dir / MANIFEST_FILE
+        with file_lock(manifest_path):
+            manifest = safe_json_read(manifest_path, {}) or {}
+            manifest[RAW_PDF_KEY] = {name: digest}
+            atomic_json_write(manifest_path, manifest)
+
+        with file_lock(self.pdf_refs_path):
+            refs = self._read_refs()
+            changed = False
+            for key, value in (('names', name), ('sources', digest)):
+                users = refs[key].setdefault(value, [])
+                if doc_dir.name not in users:
+                    users.append(doc_dir.name)
+                    changed = True
+            if changed:
+                atomic_json_write(self.pdf_refs_path, refs)
+
+    def reuse_document(self, source_sha256: str, target_id: str, pdf_path: Path) -> Optional[Dict]:
+        """
+        같은 원본 PDF로 처리가 끝난 문서가 있으면 렌더링/분석 없이 복제
+
+        Args:
+            source_sha256: 업로드된 PDF 해시
+            target_id: 새 문서 ID
+            pdf_path: 새 문서의 원본 PDF 경로
+
+        Returns:
+            새 문서 meta (재사용 불가 시 None - 원본 문서가 없음/처리 중/같은 ID)
+        """
+        source_id = self.find_source(source_sha256)
+        if source_id is None or source_id == target_id:
+            return None
+
+        source_dir = config.DOCUMENTS_DIR / source_id
+        target_dir = config.DOCUMENTS_DIR / target_id
+        source_meta = safe_json_read(source_dir / 'meta.json')
+        if not source_meta or source_meta.get('status') != 'ready' or target_dir.exists():
+            return None
+
+        target_dir.mkdir(parents=True)
+        try:
+            self.clone_document(source_dir, target_dir)
+        except OSError:
+            shutil.rmtree(target_dir, ignore_errors=True)
+            return None
+
+        meta = dict(source_meta)
+        meta.pop('metadata', None)
+        meta.update({
+            'document_id': target_id,
+            'created_at': time.time(),
+            'pdf_path': str(pdf_path),
+            'deduplicated_from': source_id,
+        })
+        atomic_json_write(target_dir / 'meta.json', meta)
+        return meta
+
+    def release_document(self, doc_dir: Path) -> List[str]:
+        """
+        문서가 참조하던 해시 목록 (문서 삭제 후 collect에 전달)
+
+        원본 PDF는 다른 문서가 같은 파일을 쓰지 않고 (참조 목록)
+        아직 기록한 blob의 링크이면 raw_pdfs/에서 삭제한다.
+        """
+        doc_dir = Path(doc_dir)
+        manifest = safe_json_read(doc_dir / MANIFEST_FILE, {}) or {}
+        digests = [
+            digest
+            for dir_name in LINKED_ARTIFACT_DIRS
+            for digest in manifest.get(dir_name, {}).values()
+        ]
+
+        raw_pdfs = manifest.get(RAW_PDF_KEY, {})
+        in_use = self._release_pdf_names(doc_dir.name, raw_pdfs) if raw_pdfs else set()
+        for name, digest in raw_pdfs.items():
+            digests.append(digest)
+            pdf_path = config.RAW_PDFS_DIR / name
+            if name in in_use:
+                continue
+            try:
+                if os.path.samefile(pdf_path, self.blob_path(digest, pdf_path.suffix.lower())):
+                    pdf_path.unlink()
+            except OSError:
+                pass
+
+        return digests
+
+    def _release_pdf_names(self, document_id: str, raw_pdfs: Dict[str, str]) -> set:
+        """참조 목록에서 문서의 raw_pdfs/ 파일명을 빼고, 다른 문서가 아직 쓰는 파일명 반환"""
+        with file_lock(self.pdf_refs_path):
+            refs = self._read_refs()
+            in_use = set()
+            for name in raw_pdfs:
+                users = [d for d in refs['names'].get(name, []) if d != document_id]
+                if users:
+                    refs['names'][name] = users
+                    in_use.add(name)
+                else:
+                    refs['names'].pop(name, None)
+            atomic_json_write(self.pdf_refs_path, refs)
+        return in_use
+
+    # === 원본 PDF 색인 ===
+
+    @property
+    def source_index_path(self) -> Path:
+        return self.root / SOURCE_INDEX_FILE
+
+    @property
+    def pdf_refs_path(self) -> Path:
+        return self.root / PDF_REFS_FILE
+
+    def _read_refs(self) -> Dict[str, Dict[str, List[str]]]:
+        """{'names': {raw_pdfs 파일명: [document_id]}, 'sources': {해시: [document_id]}}"""
+        refs = safe_json_read(self.pdf_refs_path, {}) or {}
+        refs.setdefault('names', {})
+        refs.setdefault('sources', {})
+        return refs
+
+    def register_source(self, source_sha256: str, document_id: str) -> None:
+        """원본 PDF 해시 → document_id 등록 (먼저 등록된 문서 유지)"""
+        with file_lock(self.source_index_path):
+            index = safe_json_read(self.source_index_path, {}) or {}
+            if index.get(source_sha256) == document_id:
+                return
+            if source_sha256 in index and \
+                    (config.DOCUMENTS_DIR / index[source_sha256]).exists():
+                return
+            index[source_sha256] = document_id
+            atomic_json_write(self.source_index_path, index)
+
+    def unregister_document(self, document_id: str) -> None:
+        """
+        삭제된 문서를 원본 색인에서 제거
+
+        같은 원본 PDF를 쓰는 문서(복제/재사용)가 남아 있으면 색인을 그 문서로 옮긴다
+        (다음 동일 업로드도 중복 처리 생략).
+        """
+        with file_lock(self.pdf_refs_path):
+            refs = self._read_refs()
+            survivors: Dict[str, List[str]] = {}
+            changed = False
+            for digest, users in list(refs['sources'].items()):
+                if document_id not in users:
+                    continue
+                changed = True
+                users = [d for d in users if d != document_id]
+                if users:
+                    refs['sources'][digest] = survivors[digest] = users
+                else:
+                    del refs['sources'][digest]
+            if changed:
+                atomic_json_write(self.pdf_refs_path, refs)
+
+        with file_lock(self.source_index_path):
+            index = safe_json_read(self.source_index_path, {}) or {}
+            remaining = {}
+            for digest, indexed in index.items():
+                if indexed != document_id:
+                    remaining[digest] = indexed
+                elif survivors.get(digest):
+                    remaining[digest] = survivors[digest][0]
+            if remaining != index:
+                atomic_json_write(self.source_index_path, remaining)
+
+    def find_source(self, source_sha256: str) -> Optional[str]:
+        """같은 원본 PDF로 만든 문서 ID (문서가 사라졌으면 None)"""
+        index = safe_json_read(self.source_index_path, {}) or {}
+        document_id = index.get(source_sha256)
+        if document_id and (config.DOCUMENTS_DIR / document_id / 'meta.json').exists():
+            return document_id
+        return None
+
+
+def get_blob_store() -> BlobStore:
+    """전역 설정(DATASET_ROOT) 기준 Blob 저장소"""
+    return BlobStore(config.DATASET_ROOT / 'blobs')
+
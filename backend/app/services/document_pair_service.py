@@ -5,12 +5,27 @@ Phase 22-L: 영구 페어링 시스템
 
 문제-해설 문서 페어를 관리하는 서비스입니다.
 JSON 파일로 데이터를 저장합니다.
+
+Phase 68-B: 색인 저장소 (스냅샷 + 카운터 로그)
+- 조회마다 document_pairs.json 전체를 읽고, 변경마다 잠금 없이 전체를 다시 썼다.
+  increment_matched_count는 매칭 확정마다 호출된다.
+- 메모리: 페어 ID → 페어, (문제 문서, 해설 문서) → 페어 ID, 문서 ID → 페어 ID 색인
+  조회는 스냅샷 stat과 카운터 로그 추가분만 확인 (다른 워커의 변경 반영)
+- 매칭 수 증가: document_pairs.counters 에 한 줄 추가 {"seq", "id", "inc"} (스냅샷 쓰기 없음)
+- 생성/수정/삭제: 스냅샷에 카운터를 합쳐 원자적으로 다시 쓰고 카운터 로그 삭제
+  스냅샷의 counterSeq 이하 로그 줄은 재생하지 않음 (스냅샷 교체 후 로그 삭제 전 중단 대비)
+- 카운터 로그가 COUNTER_COMPACT_EVERY줄 쌓이면 스냅샷에 합침
+- 쓰기는 스냅샷 파일 배타 잠금, 읽기는 공유 잠금 (file_lock - 워커 간에도 적용)
+- 스냅샷 형식: {"pairs": [...], "counterSeq": n} (기존 리스트 형식도 읽음)
 """
 
 import json
 import os
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from ..config import config
@@ -20,6 +35,42 @@ from ..models.document_pair import (
     UpdatePairRequest,
     PairStats
 )
+from .file_lock import atomic_json_write, file_lock
+
+
+# 카운터 로그를 스냅샷에 합치는 줄 수
+COUNTER_COMPACT_EVERY = 1000
+
+# (st_ino, st_mtime_ns, st_size)
+Signature = Tuple[int, int, int]
+
+
+def _signature(st: os.stat_result) -> Signature:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class _State:
+    """메모리에 올린 페어 목록과 색인"""
+    root: Path
+    snapshot: Optional[Signature] = None
+    pairs: Dict[str, dict] = field(default_factory=dict)
+    by_documents: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    by_document: Dict[str, List[str]] = field(default_factory=dict)
+    counter_seq: int = 0
+    log_ino: int = 0
+    log_offset: int = 0
+    log_lines: int = 0
+
+    def reindex(self) -> None:
+        self.by_documents = {}
+        self.by_document = {}
+        for pair_id, p in self.pairs.items():
+            problem_id, solution_id = p['problem_document_id'], p['solution_document_id']
+            self.by_documents.setdefault((problem_id, solution_id), pair_id)
+            self.by_document.setdefault(problem_id, []).append(pair_id)
+            if solution_id != problem_id:
+                self.by_document.setdefault(solution_id, []).append(pair_id)
 
 
 class DocumentPairService:
@@ -27,30 +78,25 @@ class DocumentPairService:
 
     def __init__(self):
         """서비스 초기화"""
-        # _system 디렉토리에 저장
-        self.system_dir = config.DATASET_ROOT / '_system'
-        self.pairs_file = self.system_dir / 'document_pairs.json'
-        self._ensure_file()
-
-    def _ensure_file(self):
-        """파일 및 디렉토리 생성"""
-        self.system_dir.mkdir(parents=True, exist_ok=True)
-        if not self.pairs_file.exists():
-            with open(self.pairs_file, 'w', encoding='utf-8') as f:
-                json.dump([], f)
-
-    def _load_pairs(self) -> List[dict]:
-        """페어 목록 로드"""
-        try:
-            with open(self.pairs_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
-
-    def _save_pairs(self, pairs: List[dict]):
-        """페어 목록 저장"""
-        with open(self.pairs_file, 'w', encoding='utf-8') as f:
-            json.dump(pairs, f, ensure_ascii=False, indent=2, default=str)
+        self._lock = threading.Lock()
+        self._state: Optional[_State] = None
+        self.loads = 0
+        self.counter_appends = 0
+        self.snapshots = 0
+
+    @property
+    def system_dir(self) -> Path:
+        """_system 디렉토리에 저장"""
+        return config.DATASET_ROOT / '_system'
+
+    @property
+    def pairs_file(self) -> Path:
+        return self.system_dir / 'document_pairs.json'
+
+    @property
+    def counters_file(self) -> Path:
+        """Phase 68-B: 매칭 수 증가 로그"""
+        return self.system_dir / 'document_pairs.counters'
 
     def create_pair(self, request: CreatePairRequest) -> DocumentPair:
         """
@@ -58,35 +104,34 @@ class DocumentPairService:
 
         이미 동일한 페어가 있으면 기존 페어를 반환합니다.
         """
-        pairs = self._load_pairs()
-
-        # 중복 체크 (양방향)
-        for p in pairs:
-            if (p['problem_document_id'] == request.problem_document_id and
-                p['solution_document_id'] == request.solution_document_id):
+        def mutate(state: _State) -> Tuple[dict, bool]:
+            # 중복 체크
+            pair_id = state.by_documents.get((request.problem_document_id, request.solution_document_id))
+            if pair_id is not None:
+                p = state.pairs[pair_id]
                 # 기존 페어가 archived 상태면 active로 변경
                 if p.get('status') == 'archived':
                     p['status'] = 'active'
-                    self._save_pairs(pairs)
-                return DocumentPair(**p)
-
-        # 새 페어 생성
-        pair_data = {
-            'id': str(uuid4())[:8],
-            'problem_document_id': request.problem_document_id,
-            'solution_document_id': request.solution_document_id,
-            'created_at': datetime.now().isoformat(),
-            'status': 'active',
-            'last_session_id': None,
-            'matched_count': 0,
-            'problem_document_name': request.problem_document_name,
-            'solution_document_name': request.solution_document_name
-        }
-
-        pairs.append(pair_data)
-        self._save_pairs(pairs)
-
-        return DocumentPair(**pair_data)
+                    return p, True
+                return p, False
+
+            # 새 페어 생성
+            pair_data = {
+                'id': str(uuid4())[:8],
+                'problem_document_id': request.problem_document_id,
+                'solution_document_id': request.solution_document_id,
+                'created_at': datetime.now().isoformat(),
+                'status': 'active',
+                'last_session_id': None,
+                'matched_count': 0,
+                'problem_document_name': request.problem_document_name,
+                'solution_document_name': request.solution_document_name
+            }
+            state.pairs[pair_data['id']] = pair_data
+            state.reindex()
+            return pair_data, True
+
+        return DocumentPair(**self._mutate(mutate))
 
     def list_pairs(self, status: Optional[str] = None) -> List[DocumentPair]:
         """
@@ -95,7 +140,7 @@ class DocumentPairService:
         Args:
             status: 필터링할 상태 (None이면 전체)
         """
-        pairs = self._load_pairs()
+        pairs = self._read(lambda state: list(state.pairs.values()))
 
         if status:
             pairs = [p for p in pairs if p.get('status', 'active') == status]
@@ -104,11 +149,8 @@ class DocumentPairService:
 
     def get_pair(self, pair_id: str) -> Optional[DocumentPair]:
         """페어 조회"""
-        pairs = self._load_pairs()
-        for p in pairs:
-            if p['id'] == pair_id:
-                return DocumentPair(**p)
-        return None
+        p = self._read(lambda state: state.pairs.get(pair_id))
+        return DocumentPair(**p) if p is not None else None
 
     def get_pair_by_documents(
         self,
@@ -116,12 +158,12 @@ class DocumentPairService:
         solution_doc_id: str
     ) -> Optional[DocumentPair]:
         """문서 ID로 페어 조회"""
-        pairs = self._load_pairs()
-        for p in pairs:
-            if (p['problem_document_id'] == problem_doc_id and
-                p['solution_document_id'] == solution_doc_id):
-                return DocumentPair(**p)
-        return None
+        def find(state: _State) -> Optional[dict]:
+            pair_id = state.by_documents.get((problem_doc_id, solution_doc_id))
+            return state.pairs[pair_id] if pair_id is not None else None
+
+        p = self._read(find)
+        return DocumentPair(**p) if p is not None else None
 
     def get_pairs_for_document(self, document_id: str) -> List[DocumentPair]:
         """
@@ -130,28 +172,25 @@ class DocumentPairService:
         Args:
             document_id: 문서 ID (문제 또는 해설)
         """
-        pairs = self._load_pairs()
-        result = []
-        for p in pairs:
-            if (p['problem_document_id'] == document_id or
-                p['solution_document_id'] == document_id):
-                result.append(DocumentPair(**p))
-        return result
+        pairs = self._read(lambda state: [state.pairs[i] for i in state.by_document.get(document_id, ())])
+        return [DocumentPair(**p) for p in pairs]
 
     def update_pair(self, pair_id: str, request: UpdatePairRequest) -> Optional[DocumentPair]:
         """페어 업데이트"""
-        pairs = self._load_pairs()
-        for i, p in enumerate(pairs):
-            if p['id'] == pair_id:
-                if request.status is not None:
-                    pairs[i]['status'] = request.status
-                if request.last_session_id is not None:
-                    pairs[i]['last_session_id'] = request.last_session_id
-                if request.matched_count is not None:
-                    pairs[i]['matched_count'] = request.matched_count
-                self._save_pairs(pairs)
-                return DocumentPair(**pairs[i])
-        return None
+        def mutate(state: _State) -> Tuple[Optional[dict], bool]:
+            p = state.pairs.get(pair_id)
+            if p is None:
+                return None, False
+            if request.status is not None:
+                p['status'] = request.status
+            if request.last_session_id is not None:
+                p['last_session_id'] = request.last_session_id
+            if request.matched_count is not None:
+                p['matched_count'] = request.matched_count
+            return p, True
+
+        p = self._mutate(mutate)
+        return DocumentPair(**p) if p is not None else None
 
     def delete_pair(self, pair_id: str, hard_delete: bool = False) -> bool:
         """
@@ -161,30 +200,46 @@ class DocumentPairService:
             pair_id: 페어 ID
             hard_delete: True면 완전 삭제, False면 archived로 변경
         """
-        pairs = self._load_pairs()
-        for i, p in enumerate(pairs):
-            if p['id'] == pair_id:
-                if hard_delete:
-                    pairs.pop(i)
-                else:
-                    pairs[i]['status'] = 'archived'
-                self._save_pairs(pairs)
-                return True
-        return False
+        def mutate(state: _State) -> Tuple[bool, bool]:
+            if pair_id not in state.pairs:
+                return False, False
+            if hard_delete:
+                del state.pairs[pair_id]
+                state.reindex()
+            else:
+                state.pairs[pair_id]['status'] = 'archived'
+            return True, True
+
+        return self._mutate(mutate)
 
     def increment_matched_count(self, pair_id: str, increment: int = 1) -> Optional[DocumentPair]:
-        """매칭 수 증가"""
-        pairs = self._load_pairs()
-        for i, p in enumerate(pairs):
-            if p['id'] == pair_id:
-                pairs[i]['matched_count'] = p.get('matched_count', 0) + increment
-                self._save_pairs(pairs)
-                return DocumentPair(**pairs[i])
-        return None
+        """
+        매칭 수 증가
+
+        Phase 68-B: 카운터 로그에 한 줄 추가 (스냅샷은 다시 쓰지 않음)
+        """
+        with self._lock, file_lock(self.pairs_file):
+            state = self._current()
+            p = state.pairs.get(pair_id)
+            if p is None:
+                return None
+
+            record = {'seq': state.counter_seq + 1, 'id': pair_id, 'inc': increment}
+            try:
+                self._append_counter(state, record)
+                p['matched_count'] = p.get('matched_count', 0) + increment
+                state.counter_seq = record['seq']
+
+                if state.log_lines >= COUNTER_COMPACT_EVERY:
+                    self._write_snapshot(state)
+            except Exception:
+                self._state = None
+                raise
+            return DocumentPair(**p)
 
     def get_stats(self) -> PairStats:
         """페어 통계 조회"""
-        pairs = self._load_pairs()
+        pairs = self._read(lambda state: list(state.pairs.values()))
 
         active_pairs = [p for p in pairs if p.get('status', 'active') == 'active']
         total_matched = sum(p.get('matched_count', 0) for p in active_pairs)
@@ -195,6 +250,150 @@ class DocumentPairService:
             total_matched=total_matched
         )
 
+    def invalidate(self) -> None:
+        """Phase 68-B: 메모리 상태 버리기 (다음 조회 때 파일에서 다시 읽음)"""
+        with self._lock:
+            self._state = None
+
+    def stats(self) -> Dict[str, int]:
+        """Phase 68-B: 저장소 통계"""
+        return {
+            'pairs': len(self._state.pairs) if self._state else 0,
+            'loads': self.loads,
+            'counter_appends': self.counter_appends,
+            'snapshots': self.snapshots,
+        }
+
+    # === 내부 ===
+
+    def _read(self, query: Callable[[_State], Any]) -> Any:
+        """공유 잠금 안에서 현재 상태 조회 (반환 dict는 복사본)"""
+        with self._lock, file_lock(self.pairs_file, shared=True):
+            result = query(self._current())
+        if isinstance(result, dict):
+            return dict(result)
+        if isinstance(result, list):
+            return [dict(p) for p in result]
+        return result
+
+    def _mutate(self, mutate: Callable[[_State], Tuple[Any, bool]]) -> Any:
+        """배타 잠금 안에서 변경 → 바뀌었으면 스냅샷 기록 (카운터 로그 합침)"""
+        with self._lock, file_lock(self.pairs_file):
+            state = self._current()
+            try:
+                result, changed = mutate(state)
+                if changed:
+                    self._write_snapshot(state)
+            except Exception:
+                self._state = None  # 기록하지 못한 변경은 버리고 다음 조회 때 다시 읽음
+                raise
+            return dict(result) if isinstance(result, dict) else result
+
+    def _current(self) -> _State:
+        """디스크와 맞춘 현재 상태 (잠금 보유 상태에서 호출)"""
+        state = self._state
+        if state is None or state.root != self.system_dir:
+            state = self._state = _State(root=self.system_dir)
+
+        try:
+            snapshot = _signature(os.stat(self.pairs_file))
+        except OSError:
+            snapshot = None
+
+        if snapshot != state.snapshot or snapshot is None:
+            self._load(state, snapshot)
+        self._tail(state)
+        return state
+
+    def _load(self, state: _State, snapshot: Optional[Signature]) -> None:
+        data: Any = []
+        if snapshot is not None:
+            try:
+                with open(self.pairs_file, 'r', encoding='utf-8') as f:
+                    snapshot = _signature(os.fstat(f.fileno()))
+                    data = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                data = []
+            self.loads += 1
+
+        # 기존 형식: 페어 리스트
+        if isinstance(data, list):
+            data = {'pairs': data, 'counterSeq': 0}
+
+        state.snapshot = snapshot
+        state.pairs = {p['id']: p for p in data.get('pairs', [])}
+        state.counter_seq = data.get('counterSeq', 0)
+        state.log_ino = state.log_offset = state.log_lines = 0
+        state.reindex()
+
+    def _tail(self, state: _State) -> None:
+        """카운터 로그에서 마지막으로 읽은 위치 이후의 완결된 줄만 반영"""
+        try:
+            f = open(self.counters_file, 'rb')
+        except FileNotFoundError:
+            state.log_ino = state.log_offset = state.log_lines = 0
+            return
+
+        with f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != state.log_ino:
+                # 새로 만들어진 로그 - 처음부터 (seq로 중복 반영 방지)
+                state.log_ino, state.log_offset, state.log_lines = st.st_ino, 0, 0
+            if st.st_size <= state.log_offset:
+                return
+            f.seek(state.log_offset)
+            data = f.read(st.st_size - state.log_offset)
+
+        end = data.rfind(b'\n')
+        if end < 0:
+            return  # 기록 중인 줄
+        for line in data[:end + 1].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                print(f"[Phase 68-B] 카운터 로그 줄 건너뜀: {e}")
+                continue
+            state.log_lines += 1
+            if record['seq'] <= state.counter_seq:
+                continue
+            p = state.pairs.get(record['id'])
+            if p is not None:
+                p['matched_count'] = p.get('matched_count', 0) + record['inc']
+            state.counter_seq = record['seq']
+        state.log_offset += end + 1
+
+    def _append_counter(self, state: _State, record: dict) -> None:
+        line = (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+        self.system_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.counters_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            st = os.fstat(fd)
+            offset = state.log_offset if st.st_ino == state.log_ino else 0
+            if st.st_size != offset:
+                os.ftruncate(fd, offset)  # 끊긴 마지막 줄 제거
+            os.lseek(fd, offset, os.SEEK_SET)
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        state.log_ino, state.log_offset = st.st_ino, offset + len(line)
+        state.log_lines += 1
+        self.counter_appends += 1
+
+    def _write_snapshot(self, state: _State) -> None:
+        """카운터를 합친 스냅샷 기록 후 카운터 로그 삭제"""
+        written = atomic_json_write(self.pairs_file, {
+            'pairs': list(state.pairs.values()),
+            'counterSeq': state.counter_seq,
+        })
+        self.counters_file.unlink(missing_ok=True)
+        state.snapshot = _signature(written)
+        state.log_ino = state.log_offset = state.log_lines = 0
+        self.snapshots += 1
+
 
 # 싱글톤 서비스 인스턴스
 document_pair_service = DocumentPairService()
@@ -2,8 +2,25 @@
 시험지 관련 서비스
 
 Phase E-1: PDF 내보내기
+Phase 66-A: 백그라운드 렌더링 + 결과 캐시
+Phase 66-B: 스트리밍 응답 (open_pdf_stream)
+Phase 66-C: 변형 일괄 ZIP 스트리밍 (stream_pdfs_zip)
 """
 
 from .pdf_exporter import ExamPdfExporter
+from .render_service import (
+    ExamRenderService,
+    exam_render_service,
+    open_pdf_stream,
+    shutdown_render_pool,
+    stream_pdfs_zip,
+)
 
-__all__ = ["ExamPdfExporter"]
+__all__ = [
+    "ExamPdfExporter",
+    "ExamRenderService",
+    "exam_render_service",
+    "open_pdf_stream",
+    "shutdown_render_pool",
+    "stream_pdfs_zip",
+]
@@ -2,12 +2,19 @@
 시험지 PDF 내보내기 서비스
 
 Phase E-1: 시험지를 PDF로 내보내기
+
+Phase 66-A:
+- 폰트 등록은 프로세스당 한 번
+- image_cache가 있으면 문제 이미지를 출력 크기(DPI)로 줄인 사본을 삽입
+- Problem.content는 ProblemContent 모델이므로 속성으로 접근
+
+Phase 66-B: export_to_file - 메모리 버퍼 대신 파일(경로/파일 객체)에 바로 기록
 """
 
 import io
 import os
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import BinaryIO, List, Optional, Tuple, Union
 from datetime import datetime
 
 from reportlab.lib import colors
@@ -33,6 +40,37 @@ from ...models.exam_paper import ExamPaper, ExamPaperSettings
 from ...models.problem import Problem
 
 
+def problem_image_path(problem: Problem, dataset_root: Path) -> Optional[Path]:
+    """
+    문제 이미지 경로 (API URL / 상대 경로 → dataset_root 기준 경로)
+
+    Phase 66-A: 렌더링 캐시 키 계산에서도 사용 (내보내기 객체 없이)
+    """
+    if not problem.content or not problem.content.imageUrl:
+        return None
+
+    image_url = problem.content.imageUrl
+
+    # API URL 형식 처리
+    if image_url.startswith("/api/documents/"):
+        # /api/documents/{doc_id}/problems/image?image_path=...
+        try:
+            import urllib.parse
+            parsed = urllib.parse.urlparse(image_url)
+            query = urllib.parse.parse_qs(parsed.query)
+            if "image_path" in query:
+                rel_path = query["image_path"][0]
+                return Path(dataset_root) / rel_path
+        except Exception:
+            pass
+
+    # 상대 경로 처리
+    if not image_url.startswith("http"):
+        return Path(dataset_root) / image_url.lstrip("/")
+
+    return None
+
+
 class ExamPdfExporter:
     """시험지 PDF 내보내기"""
 
@@ -50,9 +88,20 @@ class ExamPdfExporter:
         "large": {"title": 24, "subtitle": 16, "body": 13, "problem_num": 14},
     }
 
-    def __init__(self, dataset_root: str):
+    # Phase 66-A: 프로세스당 한 번만 폰트 등록
+    _fonts_registered = False
+
+    def __init__(self, dataset_root: str, image_cache=None):
+        """
+        Args:
+            dataset_root: 데이터셋 루트 (문제 이미지 상대 경로 기준)
+            image_cache: Phase 66-A - prepare(원본 경로, 너비, 높이) → 삽입할 이미지 경로 (None이면 원본 삽입)
+        """
         self.dataset_root = Path(dataset_root)
-        self._register_fonts()
+        self.image_cache = image_cache
+        if not ExamPdfExporter._fonts_registered:
+            self._register_fonts()
+            ExamPdfExporter._fonts_registered = True
 
     def _register_fonts(self):
         """한글 폰트 등록"""
@@ -233,29 +282,7 @@ class ExamPdfExporter:
 
     def _get_problem_image_path(self, problem: Problem) -> Optional[Path]:
         """문제 이미지 경로 반환"""
-        if not problem.content or not problem.content.get("imageUrl"):
-            return None
-
-        image_url = problem.content["imageUrl"]
-
-        # API URL 형식 처리
-        if image_url.startswith("/api/documents/"):
-            # /api/documents/{doc_id}/problems/image?image_path=...
-            try:
-                import urllib.parse
-                parsed = urllib.parse.urlparse(image_url)
-                query = urllib.parse.parse_qs(parsed.query)
-                if "image_path" in query:
-                    rel_path = query["image_path"][0]
-                    return self.dataset_root / rel_path
-            except Exception:
-                pass
-
-        # 상대 경로 처리
-        if not image_url.startswith("http"):
-            return self.dataset_root / image_url.lstrip("/")
-
-        return None
+        return problem_image_path(problem, self.dataset_root)
 
     def _build_problem(
         self,
@@ -281,10 +308,10 @@ class ExamPdfExporter:
         if problem:
             if is_answer_key:
                 # 정답지 모드
-                answer = problem.answer or problem.content.get("answer", "(정답 미입력)")
+                answer = problem.content.answer or "(정답 미입력)"
                 elements.append(Paragraph(f"<b>정답:</b> {answer}", styles["answer"]))
 
-                solution = problem.solution or problem.content.get("solution")
+                solution = problem.content.solution
                 if solution:
                     elements.append(Spacer(1, 2 * mm))
                     elements.append(Paragraph(f"<b>해설:</b> {solution}", styles["body"]))
@@ -306,13 +333,18 @@ class ExamPdfExporter:
                             img.drawHeight = max_height
                             img.drawWidth = max_height * aspect
 
+                        # Phase 66-A: 출력 크기에 맞게 줄인 사본 삽입
+                        if self.image_cache is not None:
+                            prepared = self.image_cache.prepare(image_path, img.drawWidth, img.drawHeight)
+                            img = Image(str(prepared), width=img.drawWidth, height=img.drawHeight)
+
                         elements.append(Spacer(1, 2 * mm))
                         elements.append(img)
                     except Exception as e:
                         elements.append(Paragraph(f"[이미지 로드 실패]", styles["body"]))
                 else:
                     # 텍스트 콘텐츠
-                    text = problem.content.get("text", "")
+                    text = problem.content.ocrText or ""
                     if text:
                         elements.append(Paragraph(text, styles["body"]))
 
@@ -353,11 +385,34 @@ class ExamPdfExporter:
             PDF 파일 바이트
         """
         buffer = io.BytesIO()
+        self.export_to_file(exam, problems_map, buffer, include_answer_key)
+        return buffer.getvalue()
+
+    def export_to_file(
+        self,
+        exam: ExamPaper,
+        problems_map: dict[str, Problem],
+        out: Union[str, Path, BinaryIO],
+        include_answer_key: bool = False,
+    ) -> None:
+        """
+        Phase 66-B: 시험지를 PDF 파일로 내보내기
+
+        결과 전체를 bytes로 한 번 더 복사하지 않도록 출력 파일에 바로 기록한다.
+
+        Args:
+            exam: 시험지 데이터
+            problems_map: 문제 ID → Problem 매핑
+            out: 출력 경로 또는 바이너리 파일 객체
+            include_answer_key: 정답지 포함 여부
+        """
+        if isinstance(out, Path):
+            out = str(out)
 
         # 페이지 설정
         page_size = self._get_page_size(exam.settings)
         doc = SimpleDocTemplate(
-            buffer,
+            out,
             pagesize=page_size,
             leftMargin=20 * mm,
             rightMargin=20 * mm,
@@ -444,6 +499,3 @@ class ExamPdfExporter:
 
         # PDF 생성
         doc.build(elements)
-
-        buffer.seek(0)
-        return buffer.read()
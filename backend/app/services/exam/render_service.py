@@ -0,0 +1,535 @@
+"""
+Phase 66-A: 시험지 PDF 렌더링 서비스 (백그라운드 + 결과 캐시)
+
+/api/exams/{id}/export/pdf 는 요청마다 ExamPdfExporter를 새로 만들어 폰트를 다시 등록하고,
+비동기 핸들러 안에서 문서 전체를 동기로 조판했으며, 원본 해상도 PNG를 그대로 넣어 PDF가 커졌다.
+
+- 렌더링은 프로세스 풀에서 실행 (이벤트 루프 차단 없음)
+  워커 프로세스마다 ExamPdfExporter 하나를 계속 사용 (폰트 등록 한 번)
+- 문제 이미지는 출력 크기 × EXAM_PDF_IMAGE_DPI 픽셀로 줄인 사본을 삽입
+  색이 없는 이미지(대부분의 문제 캡처)는 회색조로 저장 → PDF에 RGB 3채널 대신 1채널로 들어감
+  키: (이미지 SHA-256, 출력 픽셀 크기) → 같은 문제를 쓰는 다른 시험지도 재사용
+- 결과 PDF 캐시 키: 시험지 내용 + 설정 + 문제 버전(내용, updatedAt, 이미지 stat) + 정답지 여부
+  → 같은 시험지를 다시 내려받으면 렌더링 없이 파일 반환
+- 같은 키를 동시에 요청하면 렌더링은 한 번만 수행
+- 위치: DATASET_ROOT/exam_render_cache/ (pdf/, images/) - 용량 기반 LRU (mtime = 최근 사용)
+  정리는 렌더링(캐시 미스) 후 추정 용량이 한도를 넘었을 때만 스레드 풀에서 디렉토리 순회
+
+Phase 66-B: 스트리밍 응답
+- 워커는 PDF를 게시할 임시 파일에 바로 기록 (전체 PDF bytes를 메모리에 두지 않음)
+- 응답은 캐시 파일을 STREAM_CHUNK_SIZE 단위로 읽어 전송 (open_pdf_stream)
+
+Phase 66-C: 변형 일괄 생성
+- 변형들을 동시에 프로세스 풀에 제출 (문제 이미지 축소본은 워커의 이미지 캐시에서 공유)
+- 끝나는 대로 ZIP 항목으로 스트리밍 (stream_pdfs_zip) - PDF는 이미 압축되어 있으므로 ZIP_STORED
+"""
+import asyncio
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterator, List, Optional, Tuple
+
+from PIL import Image as PILImage
+from PIL import ImageChops
+from starlette.concurrency import run_in_threadpool
+
+from ...config import config
+from ...models.exam_paper import ExamPaper
+from ...models.problem import Problem
+from .pdf_exporter import ExamPdfExporter, problem_image_path
+
+
+# 렌더링 결과 형식 버전 (조판 코드가 바뀌어 기존 PDF를 버려야 하면 올림)
+RENDER_FORMAT_VERSION = 1
+
+# 캐시 키에서 제외하는 시험지 필드 (PDF 내용에 영향 없음 → 같은 구성의 변형/복제본은 결과 공유)
+_KEY_EXCLUDED_EXAM_FIELDS = {'id', 'name', 'description', 'createdAt', 'updatedAt', 'status'}
+
+# 게시되지 못한 임시 파일 정리 기준 (초)
+STALE_TEMP_SECONDS = 3600
+
+PDF_DIR = 'pdf'
+IMAGES_DIR = 'images'
+
+# 이미지 해시 계산 청크 크기
+HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# 렌더링 이 횟수마다 추정 용량과 관계없이 캐시 디렉토리 확인
+# (워커가 만든 이미지 축소본 크기는 추정에 들어가지 않음)
+EVICT_CHECK_EVERY = 32
+
+# Phase 66-B: 응답 스트리밍 청크 크기
+STREAM_CHUNK_SIZE = 256 * 1024  # 256KB
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) - 없으면 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _is_colorless(img: PILImage.Image) -> bool:
+    """RGB 이미지의 세 채널이 모두 같은지 (회색조로 저장해도 손실 없음)"""
+    if img.mode != 'RGB':
+        return False
+    r, g, b = img.split()
+    return ImageChops.difference(r, g).getbbox() is None and ImageChops.difference(g, b).getbbox() is None
+
+
+def _publish(temp_path: Path, dest: Path) -> None:
+    """임시 파일 게시 (실패 시 임시 파일 정리)"""
+    try:
+        os.replace(temp_path, dest)
+    except OSError:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+class ExamImageCache:
+    """
+    Phase 66-A: 문제 이미지 축소 사본 캐시
+
+    ExamPdfExporter의 image_cache로 사용.
+    원본이 출력 픽셀 크기보다 작으면 확대하지 않으며,
+    줄일 필요도 없고 회색조로 바꿀 수도 없으면 원본을 그대로 사용.
+    """
+
+    def __init__(self, cache_dir: Path, dpi: int):
+        self.cache_dir = Path(cache_dir)
+        self.dpi = dpi
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+        # 통계
+        self.hits = 0
+        self.created = 0
+        self.originals = 0
+
+    def target_size(self, draw_width: float, draw_height: float) -> Tuple[int, int]:
+        """출력 크기(pt) → 픽셀 크기"""
+        return (
+            max(1, math.ceil(draw_width / 72 * self.dpi)),
+            max(1, math.ceil(draw_height / 72 * self.dpi)),
+        )
+
+    def digest(self, path: Path) -> str:
+        """이미지 SHA-256 (같은 프로세스에서는 stat이 같으면 다시 읽지 않음)"""
+        st = os.stat(path)
+        memo_key = (str(path), st.st_mtime_ns, st.st_size)
+        digest = self._digests.get(memo_key)
+        if digest is None:
+            h = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    h.update(chunk)
+            digest = h.hexdigest()
+            self._digests[memo_key] = digest
+        return digest
+
+    def prepare(self, path: Path, draw_width: float, draw_height: float) -> Path:
+        """
+        출력 크기에 맞춘 이미지 경로
+
+        Args:
+            path: 원본 이미지
+            draw_width, draw_height: PDF에 그릴 크기 (pt)
+
+        Returns:
+            축소/회색조 사본 경로 (바꿀 것이 없으면 원본 경로)
+        """
+        path = Path(path)
+        width, height = self.target_size(draw_width, draw_height)
+
+        with PILImage.open(path) as src:
+            shrink = src.width > width or src.height > height
+            gray = _is_colorless(src)
+            if not shrink and not gray:
+                self.originals += 1
+                return path
+            if not shrink:
+                width, height = src.size
+
+            digest = self.digest(path)
+            dest = self.cache_dir / digest[:2] / f"{digest}_{width}x{height}.png"
+            if dest.exists():
+                try:
+                    os.utime(dest)
+                except OSError:
+                    pass
+                self.hits += 1
+                return dest
+
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = dest.with_name(f".{dest.name}.{uuid.uuid4().hex[:8]}.tmp")
+            prepared = src.convert('L') if gray else src
+            if shrink:
+                prepared = prepared.resize((width, height), PILImage.LANCZOS)
+            prepared.save(temp_path, format='PNG')
+
+        _publish(temp_path, dest)
+        self.created += 1
+        return dest
+
+
+# === 워커 프로세스 ===
+
+_worker_exporter: Optional[ExamPdfExporter] = None
+_worker_exporter_key: Optional[Tuple[str, str, int]] = None
+
+
+def get_exporter(dataset_root: str, cache_dir: str, dpi: int) -> ExamPdfExporter:
+    """프로세스별 ExamPdfExporter (설정이 같으면 계속 재사용)"""
+    global _worker_exporter, _worker_exporter_key
+
+    key = (str(dataset_root), str(cache_dir), dpi)
+    if _worker_exporter is None or _worker_exporter_key != key:
+        image_cache = ExamImageCache(Path(cache_dir) / IMAGES_DIR, dpi)
+        _worker_exporter = ExamPdfExporter(dataset_root, image_cache=image_cache)
+        _worker_exporter_key = key
+    return _worker_exporter
+
+
+def render_exam_to_file(exam: ExamPaper, problems_map: Dict[str, Problem],
+                        include_answer_key: bool, out_path: str,
+                        dataset_root: str, cache_dir: str, dpi: int) -> int:
+    """
+    시험지 PDF를 렌더링해 out_path에 게시 (프로세스 풀에서 실행)
+
+    Phase 66-B: 게시할 임시 파일에 바로 기록
+
+    Returns:
+        PDF 크기 (바이트)
+    """
+    exporter = get_exporter(dataset_root, cache_dir, dpi)
+
+    dest = Path(out_path)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = dest.with_name(f".{dest.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(temp_path, 'wb') as f:
+            exporter.export_to_file(exam, problems_map, f, include_answer_key)
+            size = f.tell()
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+    _publish(temp_path, dest)
+    return size
+
+
+def open_pdf_stream(path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Tuple[Iterator[bytes], int]:
+    """
+    Phase 66-B: 렌더링된 PDF 스트리밍 (StreamingResponse용)
+
+    파일을 먼저 열어 두므로 전송 중 캐시 정리로 삭제되어도 끝까지 전송된다.
+
+    Returns:
+        (청크 이터레이터, 파일 크기)
+    """
+    f = open(path, 'rb')
+    size = os.fstat(f.fileno()).st_size
+
+    def iterator() -> Iterator[bytes]:
+        with f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                yield chunk
+
+    return iterator(), size
+
+
+class _ChunkSink:
+    """
+    zipfile 출력 버퍼 (탐색 불가 스트림)
+
+    tell/seek이 없으므로 zipfile은 data descriptor 방식으로 기록하고,
+    호출자는 항목을 쓰는 중간중간 take()로 쌓인 바이트를 꺼내 전송한다.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_pdfs_zip(entries: List[Tuple[str, Awaitable[Path]]],
+                          chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Phase 66-C: 렌더링된 PDF들을 ZIP으로 스트리밍
+
+    항목 순서대로 렌더링 완료를 기다리며, 먼저 끝난 앞쪽 항목은 바로 전송한다.
+    응답이 시작된 뒤 실패한 항목은 "<이름>.error.txt"로 대신 기록한다.
+
+    Args:
+        entries: (ZIP 안 파일명, 렌더링 결과 경로 awaitable) 목록
+                 - 동시에 렌더링하려면 미리 Task로 만들어 전달
+    """
+    sink = _ChunkSink()
+    zf = zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_STORED)
+
+    try:
+        for arcname, pending in entries:
+            try:
+                path = await pending
+                f = open(path, 'rb')
+            except Exception as e:
+                zf.writestr(f"{arcname}.error.txt", f"PDF 생성 실패: {e}")
+                yield sink.take()
+                continue
+
+            with f, zf.open(arcname, 'w') as dest:
+                while True:
+                    chunk = await asyncio.to_thread(f.read, chunk_size)
+                    if not chunk:
+                        break
+                    dest.write(chunk)
+                    data = sink.take()
+                    if data:
+                        yield data
+            yield sink.take()
+
+        zf.close()
+        yield sink.take()
+    finally:
+        # 클라이언트가 끊은 경우 남은 대기 취소 (워커 렌더링은 계속되어 캐시에 남음)
+        for _, pending in entries:
+            if isinstance(pending, asyncio.Future) and not pending.done():
+                pending.cancel()
+
+
+# === 프로세스 풀 ===
+
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_workers() -> int:
+    """워커 프로세스 수 (EXAM_RENDER_WORKERS 환경 변수, 기본: CPU 수, 최대 2)"""
+    env_value = os.getenv('EXAM_RENDER_WORKERS')
+    if env_value:
+        return max(1, int(env_value))
+    return max(1, min(2, os.cpu_count() or 1))
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """시험지 렌더링용 프로세스 풀 (최초 사용 시 생성)"""
+    global _render_pool
+
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(max_workers=get_render_workers())
+        return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """프로세스 풀 종료 (서버 종료 시)"""
+    global _render_pool
+
+    with _render_pool_lock:
+        if _render_pool is not None:
+            _render_pool.shutdown(wait=False, cancel_futures=True)
+            _render_pool = None
+
+
+# === 렌더링 서비스 ===
+
+class ExamRenderService:
+    """
+    Phase 66-A: 시험지 PDF 렌더링 + 결과 캐시
+
+    Usage:
+        pdf_path = await exam_render_service.render(exam, problems_map, include_answer_key)
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # 정리 판단용 추정 용량 (마지막 정리 후 총 용량 + 이후 렌더링한 PDF 크기, 모르면 None)
+        self._estimated_bytes: Optional[int] = None
+        self._renders_since_evict = 0
+        self._evicting = False
+
+        # 통계
+        self.hits = 0
+        self.renders = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        return config.DATASET_ROOT / 'exam_render_cache'
+
+    def render_key(self, exam: ExamPaper, problems_map: Dict[str, Problem],
+                   include_answer_key: bool) -> str:
+        """
+        결과 캐시 키
+
+        시험지(ID/이름/설명/타임스탬프/상태 제외 - PDF에 찍히지 않음) + 문제별 (내용, updatedAt, 이미지 stat)
+        + 정답지 여부 + 이미지 DPI + 형식 버전
+        """
+        problems = []
+        for section in exam.sections:
+            for item in section.problems:
+                problem = problems_map.get(item.problemId)
+                if problem is None:
+                    problems.append([item.problemId, None])
+                    continue
+                image_path = problem_image_path(problem, config.DATASET_ROOT)
+                problems.append([
+                    problem.id,
+                    problem.content.model_dump(mode='json'),
+                    problem.updatedAt.isoformat(),
+                    _file_signature(image_path) if image_path else None,
+                ])
+
+        payload = {
+            'version': RENDER_FORMAT_VERSION,
+            'dpi': config.EXAM_PDF_IMAGE_DPI,
+            'answer_key': include_answer_key,
+            'exam': exam.model_dump(mode='json', exclude=_KEY_EXCLUDED_EXAM_FIELDS),
+            'problems': problems,
+        }
+        raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def pdf_path(self, key: str) -> Path:
+        return self.cache_dir / PDF_DIR / f"{key}.pdf"
+
+    async def render(self, exam: ExamPaper, problems_map: Dict[str, Problem],
+                     include_answer_key: bool = False) -> Path:
+        """
+        렌더링된 PDF 경로 (캐시에 있으면 바로 반환)
+
+        Raises:
+            렌더링 오류 (워커 프로세스의 예외)
+        """
+        key = self.render_key(exam, problems_map, include_answer_key)
+        path = self.pdf_path(key)
+
+        if path.exists():
+            try:
+                os.utime(path)  # LRU: 최근 사용 시각 갱신
+            except OSError:
+                pass
+            self.hits += 1
+            return path
+
+        future = self._inflight.get(key)
+        owner = future is None
+        if owner:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                get_render_pool(), render_exam_to_file,
+                exam, problems_map, include_answer_key, str(path),
+                str(config.DATASET_ROOT), str(self.cache_dir), config.EXAM_PDF_IMAGE_DPI,
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self.renders += 1
+
+        # 먼저 요청한 클라이언트가 끊어도 렌더링은 계속 (같은 키를 기다리는 요청 보호)
+        await asyncio.shield(future)
+        if owner:
+            await self._maybe_evict(future.result())
+        return path
+
+    async def _maybe_evict(self, size: int) -> None:
+        """렌더링 후 정리 (추정 용량이 한도를 넘었거나 EVICT_CHECK_EVERY번째 렌더링일 때만)"""
+        self._renders_since_evict += 1
+        if self._estimated_bytes is not None:
+            self._estimated_bytes += size
+            if (self._estimated_bytes <= config.EXAM_RENDER_CACHE_MAX_BYTES
+                    and self._renders_since_evict < EVICT_CHECK_EVERY):
+                return
+        if self._evicting:
+            return  # 다른 요청이 정리 중
+
+        self._evicting = True
+        try:
+            await run_in_threadpool(self.evict)
+        finally:
+            self._evicting = False
+
+    def _entries(self):
+        """(mtime, 크기, 경로) 목록 - 임시 파일은 제외 (오래된 것은 정리)"""
+        entries = []
+        now = time.time()
+
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                file_path = os.path.join(root, name)
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    continue
+                if name.startswith('.'):
+                    if now - st.st_mtime > STALE_TEMP_SECONDS:
+                        try:
+                            os.unlink(file_path)
+                        except OSError:
+                            pass
+                    continue
+                entries.append((st.st_mtime, st.st_size, file_path))
+
+        return entries
+
+    def evict(self) -> int:
+        """
+        총 용량이 EXAM_RENDER_CACHE_MAX_BYTES를 넘으면 오래 사용하지 않은 파일부터 삭제
+
+        Returns:
+            삭제한 파일 수
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        for _, size, file_path in sorted(entries):
+            if total <= config.EXAM_RENDER_CACHE_MAX_BYTES:
+                break
+            try:
+                os.unlink(file_path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        self._estimated_bytes = total
+        self._renders_since_evict = 0
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태 (파일 수, 총 용량, 적중/렌더링 수)"""
+        entries = self._entries()
+        return {
+            'files': len(entries),
+            'total_bytes': sum(size for _, size, _ in entries),
+            'max_bytes': config.EXAM_RENDER_CACHE_MAX_BYTES,
+            'hits': self.hits,
+            'renders': self.renders,
+        }
+
+
+# 전역 인스턴스
+exam_render_service = ExamRenderService()
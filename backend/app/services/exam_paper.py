@@ -2,9 +2,11 @@
 시험지(ExamPaper) 서비스
 
 Phase 21+ D-1: 시험지 비즈니스 로직
+Phase 66-C: 변형 생성 (build_variant)
 """
 
 import json
+import random
 import uuid
 from pathlib import Path
 from datetime import datetime
@@ -21,6 +23,7 @@ from ..models.exam_paper import (
     ExamPaperSettings,
     ExamPaperListResponse,
     AddProblemToExam,
+    ExamVariantSpec,
 )
 from ..config import config
 
@@ -430,6 +433,43 @@ class ExamPaperService:
         self._save(new_exam)
         return new_exam
 
+    # ========== 변형 (Phase 66-C) ==========
+
+    def build_variant(self, exam: ExamPaper, spec: ExamVariantSpec, index: int) -> ExamPaper:
+        """
+        문제/섹션 순서를 섞은 변형 시험지 생성 (저장하지 않음)
+
+        duplicate + reorder_problems를 변형마다 호출하지 않고 메모리에서 만든다.
+        시드가 같으면 항상 같은 순서 → 같은 요청은 렌더링 캐시를 그대로 사용.
+
+        Args:
+            exam: 원본 시험지
+            spec: 변형 설정
+            index: 요청 안 변형 순번 (0부터, 시드 기본값)
+        """
+        rng = random.Random(spec.seed if spec.seed is not None else index)
+        sections = [section.model_copy(deep=True) for section in exam.sections]
+
+        # 섹션 순서
+        if spec.sectionOrder:
+            rank = {section_id: i for i, section_id in enumerate(spec.sectionOrder)}
+            sections.sort(key=lambda s: rank.get(s.id, len(rank)))
+        elif spec.shuffleSections:
+            rng.shuffle(sections)
+
+        for section_order, section in enumerate(sections, start=1):
+            section.order = section_order
+            if spec.shuffleProblems:
+                rng.shuffle(section.problems)
+            for problem_order, item in enumerate(section.problems, start=1):
+                item.order = problem_order
+
+        return exam.model_copy(update={
+            'id': f"{exam.id}-v{index + 1}",
+            'name': spec.name or f"{exam.name}_{index + 1:02d}",
+            'sections': sections,
+        })
+
 
 # ========== 의존성 주입 ==========
 
@@ -4,35 +4,247 @@ Phase 18-A: 파일 잠금 유틸리티
 Windows/Linux 호환 파일 잠금 구현
 - 스레드 안전한 파일 접근
 - 원자적 JSON 파일 쓰기
+
+Phase 65-B: 프로세스 간 잠금 (uvicorn --workers N)
+- fcntl.flock 권고 잠금으로 워커 프로세스 사이에서도 index.json / groups.json 보호
+- 공유(shared) / 배타(exclusive) 모드
+- 잠금은 경로별: 잠금 객체는 사용 중인 동안만 유지, 잠금 파일 fd도 보유 중에만 열어 둠
+  (서로 다른 경로는 서로 기다리지 않음)
+- 대기 시간 통계는 경로 crc32 % FILE_LOCK_STRIPES 버킷으로 집계 (get_lock_stats)
+- fcntl이 없는 환경(Windows)은 기존처럼 프로세스 내 잠금만 사용
+
+Phase 65-C: 그룹 커밋 쓰기 (atomic_json_write / atomic_json_write_many)
+- 여러 호출자의 쓰기를 한 번의 플러시 주기로 묶고, 디렉토리 fsync도 한 번
 """
 import os
+import sys
 import json
+import time
+import uuid
+import zlib
+import hashlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Optional
 from contextlib import contextmanager
 import threading
 
-
-# 프로세스 내 락 (스레드 안전)
-_locks: dict[str, threading.Lock] = {}
-_locks_lock = threading.Lock()
-
-
-def get_lock(path: str) -> threading.Lock:
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# 통계 버킷 수 (잠금 자체는 경로별, 대기 통계만 버킷으로 묶어 크기 고정)
+LOCK_STRIPES = int(os.getenv('FILE_LOCK_STRIPES', '64'))
+
+# OS 잠금 재시도 간격 (초) - 지수 증가, 최대값까지
+_POLL_INITIAL = 0.001
+_POLL_MAX = 0.05
+
+# 잠금 파일 디렉토리 (None이면 DATASET_ROOT/.locks)
+_LOCK_DIR_ENV = 'FILE_LOCK_DIR'
+
+
+def _lock_dir() -> Path:
+    """잠금 파일 디렉토리 (모든 워커가 같은 경로를 사용해야 함)"""
+    lock_dir = os.getenv(_LOCK_DIR_ENV)
+    if lock_dir:
+        return Path(lock_dir)
+    from app.config import config
+    return config.DATASET_ROOT / '.locks'
+
+
+def _lock_file(path: str) -> Path:
+    """절대 경로 → 잠금 파일 (워커마다 같은 이름이 나오도록 sha1 사용)"""
+    return _lock_dir() / f"{hashlib.sha1(path.encode('utf-8')).hexdigest()}.lock"
+
+
+def stripe_index(path: str) -> int:
+    """경로 → 통계 버킷 번호 (프로세스마다 같은 값이 나오도록 crc32 사용)"""
+    return zlib.crc32(os.path.abspath(path).encode('utf-8')) % LOCK_STRIPES
+
+
+class _LockStats:
+    """Phase 65-B: 통계 버킷 하나 (획득 수, 경합 수, 시간 초과 수, 대기 시간)"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self._mutex = threading.Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.last_path: Optional[str] = None
+
+    def record(self, path: str, acquired: bool, waited: float) -> None:
+        with self._mutex:
+            if acquired:
+                self.acquisitions += 1
+                self.last_path = path
+            else:
+                self.timeouts += 1
+            if waited > 0.001:
+                self.contended += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """잠금 대기 통계 (획득 수, 경합 수, 시간 초과 수, 대기 시간 합계/최대, 마지막 획득 경로)"""
+        return {
+            'stripe': self.index,
+            'acquisitions': self.acquisitions,
+            'contended': self.contended,
+            'timeouts': self.timeouts,
+            'wait_total_ms': round(self.wait_total * 1000, 3),
+            'wait_max_ms': round(self.wait_max * 1000, 3),
+            'last_path': self.last_path,
+        }
+
+
+class _PathLock:
     """
-    경로별 Lock 객체 반환
+    Phase 65-B: 경로 하나의 잠금
 
-    동일한 파일 경로에 대해 같은 Lock 객체를 반환하여
-    여러 스레드가 동시에 접근하지 못하도록 함
+    1. 프로세스 내: 공유/배타 잠금 (배타 대기자가 있으면 새 공유 요청도 대기 → 쓰기 기아 방지)
+    2. 프로세스 간: 경로의 잠금 파일에 flock (같은 프로세스의 공유 보유자들은 하나의 flock 공유)
     """
-    with _locks_lock:
-        if path not in _locks:
-            _locks[path] = threading.Lock()
-        return _locks[path]
+
+    def __init__(self, path: str):
+        self.path = path
+        self.users = 0  # 대기 + 보유 중인 호출 수 (_locks_mutex로 보호, 0이 되면 등록 해제)
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+        # OS 잠금 (flock) - 보유자가 있는 동안만 fd를 열어 둠
+        self._os_mutex = threading.Lock()
+        self._os_holders = 0
+        self._fd: Optional[int] = None
+
+    # === 프로세스 내 ===
+
+    def _acquire_local(self, shared: bool, deadline: float) -> bool:
+        with self._cond:
+            if shared:
+                while self._writer or self._writers_waiting:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._cond.wait(remaining):
+                        if self._writer or self._writers_waiting:
+                            return False
+                self._readers += 1
+            else:
+                self._writers_waiting += 1
+                try:
+                    while self._writer or self._readers:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not self._cond.wait(remaining):
+                            if self._writer or self._readers:
+                                return False
+                finally:
+                    self._writers_waiting -= 1
+                self._writer = True
+            return True
+
+    def _release_local(self, shared: bool) -> None:
+        with self._cond:
+            if shared:
+                self._readers -= 1
+            else:
+                self._writer = False
+            self._cond.notify_all()
+
+    # === 프로세스 간 ===
+
+    def _acquire_os(self, shared: bool, deadline: float) -> bool:
+        if fcntl is None:
+            return True
+
+        remaining = deadline - time.monotonic()
+        if not self._os_mutex.acquire(timeout=max(remaining, 0)):
+            return False
+        try:
+            if self._os_holders == 0:
+                lock_path = _lock_file(self.path)
+                lock_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+                mode = (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB
+                delay = _POLL_INITIAL
+                while True:
+                    try:
+                        fcntl.flock(fd, mode)
+                        break
+                    except BlockingIOError:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            os.close(fd)
+                            return False
+                        time.sleep(min(delay, remaining))
+                        delay = min(delay * 2, _POLL_MAX)
+                self._fd = fd
+            self._os_holders += 1
+            return True
+        finally:
+            self._os_mutex.release()
+
+    def _release_os(self) -> None:
+        if fcntl is None:
+            return
+        with self._os_mutex:
+            self._os_holders -= 1
+            if self._os_holders == 0 and self._fd is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+                os.close(self._fd)
+                self._fd = None
+
+    # === 공개 ===
+
+    def acquire(self, shared: bool, timeout: float) -> bool:
+        start = time.monotonic()
+        deadline = start + timeout
+
+        acquired = self._acquire_local(shared, deadline)
+        if acquired and not self._acquire_os(shared, deadline):
+            self._release_local(shared)
+            acquired = False
+
+        _stats[stripe_index(self.path)].record(self.path, acquired, time.monotonic() - start)
+        return acquired
+
+    def release(self, shared: bool) -> None:
+        self._release_os()
+        self._release_local(shared)
+
+
+_stats = [_LockStats(i) for i in range(LOCK_STRIPES)]
+
+# 사용 중인 경로별 잠금 (대기/보유자가 없어지면 제거 → 딕셔너리가 끝없이 커지지 않음)
+_locks: Dict[str, _PathLock] = {}
+_locks_mutex = threading.Lock()
+
+# 스레드별 보유 중인 경로 (재진입 처리용)
+_held = threading.local()
+
+
+def _checkout(path: str) -> _PathLock:
+    with _locks_mutex:
+        lock = _locks.get(path)
+        if lock is None:
+            lock = _locks[path] = _PathLock(path)
+        lock.users += 1
+        return lock
+
+
+def _checkin(lock: _PathLock) -> None:
+    with _locks_mutex:
+        lock.users -= 1
+        if lock.users == 0:
+            del _locks[lock.path]
 
 
 @contextmanager
-def file_lock(file_path: Path, timeout: float = 30.0):
+def file_lock(file_path: Path, timeout: float = 30.0, shared: bool = False):
     """
     파일 잠금 컨텍스트 매니저
 
@@ -43,26 +255,324 @@ def file_lock(file_path: Path, timeout: float = 30.0):
             data['new_key'] = 'value'
             atomic_json_write(index_path, data)
 
+    Phase 65-B: 다른 워커 프로세스와도 배타적 (fcntl.flock)
+    같은 경로를 이미 잡고 있는 스레드가 다시 요청하면 재진입으로 처리한다.
+    공유 → 배타 승격은 하지 않는다: 공유로 잡은 경로에 배타 요청이 중첩되면
+    배타 보장 없이 진행하지 않고 RuntimeError.
+
     Args:
         file_path: 잠금할 파일 경로
         timeout: 잠금 획득 대기 시간 (초)
+        shared: True면 공유 잠금 (여러 읽기 동시 허용, 배타 잠금과는 배타)
 
     Raises:
         TimeoutError: 지정된 시간 내 잠금 획득 실패
+        RuntimeError: 공유로 보유 중인 경로에 배타 잠금 요청
     """
-    lock = get_lock(str(file_path))
-    acquired = lock.acquire(timeout=timeout)
+    path = os.path.abspath(str(file_path))
+
+    held = getattr(_held, 'paths', None)
+    if held is None:
+        held = _held.paths = {}
+
+    # 경로 → [중첩 횟수, 공유 여부]
+    hold = held.get(path)
+    if hold is not None:
+        if hold[1] and not shared:
+            raise RuntimeError(f"공유 잠금 보유 중 배타 잠금 요청: {file_path}")
+        hold[0] += 1
+        try:
+            yield
+        finally:
+            hold[0] -= 1
+        return
+
+    lock = _checkout(path)
+    try:
+        if not lock.acquire(shared, timeout):
+            raise TimeoutError(f"파일 잠금 획득 실패: {file_path}")
+
+        held[path] = [1, shared]
+        try:
+            yield
+        finally:
+            del held[path]
+            lock.release(shared)
+    finally:
+        _checkin(lock)
 
-    if not acquired:
-        raise TimeoutError(f"파일 잠금 획득 실패: {file_path}")
 
+def get_lock_stats(top: int = 10) -> Dict[str, Any]:
+    """
+    Phase 65-B: 잠금 대기 통계
+
+    Args:
+        top: 대기 시간이 긴 통계 버킷 상위 개수
+
+    Returns:
+        전체 합계 + 대기 시간 상위 버킷
+    """
+    stripes = [bucket.stats() for bucket in _stats]
+    busiest = sorted(
+        (s for s in stripes if s['acquisitions'] or s['timeouts']),
+        key=lambda s: s['wait_total_ms'],
+        reverse=True
+    )
+    return {
+        'process_locking': fcntl is not None,
+        'stripes': LOCK_STRIPES,
+        'acquisitions': sum(s['acquisitions'] for s in stripes),
+        'contended': sum(s['contended'] for s in stripes),
+        'timeouts': sum(s['timeouts'] for s in stripes),
+        'wait_total_ms': round(sum(s['wait_total_ms'] for s in stripes), 3),
+        'wait_max_ms': max((s['wait_max_ms'] for s in stripes), default=0.0),
+        'busiest': busiest[:top],
+    }
+
+
+# === Phase 65-C: 그룹 커밋 쓰기 ===
+
+# 이 개수 이상 모인 배치는 파일별 fdatasync 대신 파일 시스템 동기화(syncfs) 한 번으로 처리
+# syncfs는 다른 프로세스가 쓴 데이터(업로드, 렌더링 PDF 등)까지 내리므로 작은 배치에는 손해
+# (파일별 fdatasync 64개 ≈ 5ms, 다른 더티 데이터 64MB가 있을 때 syncfs ≈ 34ms)
+GROUP_COMMIT_SYNCFS_MIN = int(os.getenv('GROUP_COMMIT_SYNCFS_MIN', '64'))
+
+# 새로 만든 임시 파일은 데이터 + 크기만 내리면 됨 (Windows 등 fdatasync가 없으면 fsync)
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+
+def _load_syncfs():
+    """
+    Linux syncfs(2) 래퍼 (없으면 None → 파일별 fdatasync)
+
+    syncfs는 fd가 속한 파일 시스템의 더티 데이터를 한 번에 디스크로 내린다.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
     try:
-        yield
-    finally:
-        lock.release()
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        c_syncfs = libc.syncfs
+    except (OSError, AttributeError):
+        return None
+    c_syncfs.argtypes = [ctypes.c_int]
+    c_syncfs.restype = ctypes.c_int
+
+    def syncfs(fd: int) -> None:
+        if c_syncfs(fd) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    return syncfs
 
 
-def atomic_json_write(file_path: Path, data: Any) -> None:
+class _PendingWrite:
+    """대기 중인 원자적 쓰기 하나 (직렬화는 호출자 스레드에서 미리 수행)"""
+
+    __slots__ = ('path', 'payload', 'temp_path', 'fd', 'stat', 'error', 'done')
+
+    def __init__(self, path: Path, payload: bytes):
+        self.path = path
+        self.payload = payload
+        self.temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        self.fd: Optional[int] = None
+        self.stat: Optional[os.stat_result] = None
+        self.error: Optional[BaseException] = None
+        self.done = threading.Event()
+
+
+class GroupCommitWriter:
+    """
+    Phase 65-C: 원자적 JSON 쓰기 그룹 커밋
+
+    여러 호출자(스레드)의 쓰기를 한 번의 플러시 주기로 묶는다.
+    먼저 도착한 호출자가 리더가 되어 대기열에 모인 배치 하나만 플러시하고,
+    그 사이 도착한 호출자 중 하나가 다음 배치의 리더가 된다 (리더의 지연은 배치 하나로 제한).
+    나머지는 완료 신호만 기다린다.
+
+    플러시 주기:
+        1. 모든 임시 파일 기록
+        2. 데이터 동기화 - 배치가 크면 파일 시스템별 syncfs 한 번, 아니면 임시 파일별 fdatasync
+        3. 순서대로 os.replace (같은 경로는 마지막 쓰기가 남음)
+        4. 디렉토리별 fsync 한 번 (교체 자체의 내구성)
+        5. 대기자 전원 응답
+
+    기존과 같이 대상 파일은 항상 "fsync가 끝난 데이터"를 가리키며,
+    호출이 반환되면 교체까지 디스크에 기록된 상태다.
+    """
+
+    def __init__(self, syncfs_min: int = GROUP_COMMIT_SYNCFS_MIN):
+        self.syncfs_min = syncfs_min
+        self._syncfs = _load_syncfs()
+        self._cond = threading.Condition(threading.Lock())
+        self._queue: list = []
+        self._flushing = False
+
+        # 통계
+        self.batches = 0
+        self.writes = 0
+        self.max_batch = 0
+
+    def write(self, file_path: Path, data: Any) -> os.stat_result:
+        """원자적 쓰기 하나 (완료될 때까지 대기)"""
+        return self.write_many([(file_path, data)])[0]
+
+    def write_many(self, items) -> list:
+        """
+        여러 파일을 한 배치로 원자적 쓰기
+
+        Args:
+            items: (경로, 데이터) 목록 - 이 순서대로 교체됨
+
+        Returns:
+            파일별 stat 목록
+
+        Raises:
+            직렬화 오류 (아무것도 쓰지 않음) / 첫 번째 쓰기 오류
+        """
+        pending = [
+            _PendingWrite(
+                Path(path),
+                json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+            )
+            for path, data in items
+        ]
+        if not pending:
+            return []
+
+        # 진행 중인 플러시가 끝나면 아직 완료되지 않은 대기자 중 하나가 리더
+        with self._cond:
+            self._queue.extend(pending)
+            while self._flushing and not pending[0].done.is_set():
+                self._cond.wait()
+            leader = not pending[0].done.is_set()
+            if leader:
+                self._flushing = True
+
+        if leader:
+            self._lead()
+
+        for item in pending:
+            item.done.wait()
+        for item in pending:
+            if item.error is not None:
+                raise item.error
+        return [item.stat for item in pending]
+
+    def stats(self) -> Dict[str, Any]:
+        """플러시 통계 (배치 수, 쓰기 수, 최대 배치 크기)"""
+        return {
+            'batches': self.batches,
+            'writes': self.writes,
+            'max_batch': self.max_batch,
+            'syncfs': self._syncfs is not None,
+        }
+
+    def _lead(self) -> None:
+        """대기열에 모인 배치 하나를 플러시 (리더 스레드) 후 리더 자리를 넘김"""
+        with self._cond:
+            batch = self._queue
+            self._queue = []
+        error = None
+        try:
+            self._flush(batch)
+        except Exception as e:
+            error = e
+        except BaseException:
+            # KeyboardInterrupt / SystemExit는 삼키지 않음 - 대기자에게는 중단으로 알리고 전파
+            error = RuntimeError("그룹 커밋 플러시 중단")
+            raise
+        finally:
+            for item in batch:
+                if error is not None and item.error is None and item.stat is None:
+                    item.error = error
+                if item.fd is not None:
+                    os.close(item.fd)
+                    item.fd = None
+                if item.stat is None:
+                    try:
+                        item.temp_path.unlink()
+                    except OSError:
+                        pass
+                item.done.set()
+            with self._cond:
+                self._flushing = False
+                self._cond.notify_all()
+
+    def _flush(self, batch: list) -> None:
+        # 1. 임시 파일 기록
+        for item in batch:
+            try:
+                item.path.parent.mkdir(parents=True, exist_ok=True)
+                item.fd = os.open(
+                    str(item.temp_path),
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+                    0o644
+                )
+                view = memoryview(item.payload)
+                while view:
+                    view = view[os.write(item.fd, view):]
+            except OSError as e:
+                item.error = e
+
+        live = [item for item in batch if item.error is None]
+        if not live:
+            return
+
+        # 2. 데이터 동기화
+        if self._syncfs is not None and len(live) >= self.syncfs_min:
+            # 파일 시스템(장치)별 한 번
+            devices = {}
+            for item in live:
+                devices.setdefault(os.fstat(item.fd).st_dev, item.fd)
+            for fd in devices.values():
+                self._syncfs(fd)
+        else:
+            for item in live:
+                try:
+                    _fdatasync(item.fd)
+                except OSError as e:
+                    item.error = e
+
+        # 3. 교체
+        dirs: Dict[str, list] = {}
+        for item in live:
+            if item.error is not None:
+                continue
+            try:
+                stat = os.fstat(item.fd)
+                os.close(item.fd)
+                item.fd = None
+                os.replace(item.temp_path, item.path)
+                item.stat = stat
+                dirs.setdefault(str(item.path.parent), []).append(item)
+            except OSError as e:
+                item.error = e
+
+        # 4. 디렉토리 fsync (Windows는 디렉토리를 열 수 없으므로 생략)
+        if os.name != 'nt':
+            for dir_path, replaced in dirs.items():
+                try:
+                    dir_fd = os.open(dir_path, os.O_RDONLY)
+                    try:
+                        os.fsync(dir_fd)
+                    finally:
+                        os.close(dir_fd)
+                except OSError as e:
+                    for item in replaced:
+                        item.error = e
+
+        self.batches += 1
+        self.writes += len(batch)
+        self.max_batch = max(self.max_batch, len(batch))
+
+
+# 전역 인스턴스
+group_commit_writer = GroupCommitWriter()
+
+
+def atomic_json_write(file_path: Path, data: Any) -> os.stat_result:
     """
     원자적 JSON 파일 쓰기
 
@@ -71,38 +581,35 @@ def atomic_json_write(file_path: Path, data: Any) -> None:
 
     이 방식은 쓰기 도중 실패해도 원본 파일이 손상되지 않음
 
+    Phase 65-C: 동시에 들어온 다른 쓰기와 한 번의 플러시 주기로 묶어 처리 (GroupCommitWriter)
+
     Args:
         file_path: 저장할 파일 경로
         data: JSON 직렬화 가능한 데이터
 
+    Returns:
+        기록한 파일의 stat (Phase 65-A: 교체 전 임시 파일 기준이라 다른 쓰기와 섞이지 않음)
+
     Raises:
         Exception: 파일 쓰기 실패 시
     """
-    # Path 타입 보장
-    file_path = Path(file_path)
-    temp_path = file_path.with_suffix('.tmp')
+    return group_commit_writer.write(file_path, data)
 
-    try:
-        # 부모 디렉토리 생성
-        file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 임시 파일에 쓰기
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            f.flush()
-            os.fsync(f.fileno())  # 디스크에 확실히 쓰기
+def atomic_json_write_many(items) -> list:
+    """
+    Phase 65-C: 여러 JSON 파일을 한 배치로 원자적 쓰기
 
-        # 원자적 교체 (Windows에서도 os.replace 사용 가능)
-        os.replace(temp_path, file_path)
+    일괄 저장에서 파일마다 fsync를 기다리지 않도록 한 번의 플러시 주기로 처리한다.
+    items 순서대로 교체되며, 오류가 나면 교체된 파일은 호출자가 정리한다.
 
-    except Exception:
-        # 실패 시 임시 파일 정리
-        if temp_path.exists():
-            try:
-                temp_path.unlink()
-            except Exception:
-                pass  # 정리 실패는 무시
-        raise
+    Args:
+        items: (경로, 데이터) 목록
+
+    Returns:
+        파일별 stat 목록
+    """
+    return group_commit_writer.write_many(items)
 
 
 def safe_json_read(file_path: Path, default: Any = None) -> Any:
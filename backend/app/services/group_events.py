@@ -0,0 +1,203 @@
+"""
+Phase 67-B: 그룹 변경 이벤트 버스
+
+groups/*.json 과 WorkSession.problems, 해설 link, problems/*.json 내보내기 사이의 일관성을
+sync-problems / full-sync / validate-sync / sync-parent-flags / refresh-display-names 같은
+폴링성 API가 파일을 다시 훑어서 맞추고 있었다.
+
+- 그룹 저장/수정/삭제 지점에서 publish() → 구독자(세션 동기화, 내보내기 메타 갱신)가
+  바뀐 문서/페이지만 백그라운드에서 처리
+- 배치: 워커 스레드가 GROUP_EVENTS_BATCH_MS 동안 모은 이벤트를 한 번에 전달,
+  같은 (문서, 페이지) 이벤트는 하나로 합침 (연속 라벨링 → 페이지당 한 번)
+- 백프레셔: 대기 중인 페이지가 GROUP_EVENTS_MAX_PENDING을 넘으면 그 문서의 페이지 이벤트를
+  문서 전체 이벤트 하나로 합침 → 메모리는 (페이지 상한 + 문서 수)로 제한되고
+  publish()는 요청 처리(이벤트 루프)를 막지 않음
+- 구독자 예외는 기록만 하고 다른 구독자/다음 배치는 계속 처리
+
+이벤트는 프로세스 안에서만 전달된다. 다른 워커의 변경은 기존 동기화 API가
+(Phase 67-A 증분 동기화로) 바뀐 페이지만 다시 맞춘다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.config import config
+
+
+@dataclass(frozen=True)
+class GroupChange:
+    """그룹 변경 이벤트"""
+    document_id: str
+    page_index: Optional[int]  # None: 문서 전체
+    kind: str = "saved"  # "saved" | "updated" | "deleted" | "cleared"
+    group_ids: Tuple[str, ...] = ()  # 비어 있으면 페이지 전체
+
+
+Subscriber = Callable[[List[GroupChange]], None]
+
+
+def _merge(old: GroupChange, new: GroupChange) -> GroupChange:
+    """대기 중인 이벤트(old)에 새 이벤트 합치기 (범위는 old 기준 - 문서 전체면 그대로)"""
+    kind = new.kind if new.kind == old.kind else "saved"
+    if old.page_index == new.page_index and old.group_ids and new.group_ids:
+        group_ids = tuple(dict.fromkeys(old.group_ids + new.group_ids))
+    else:
+        group_ids = ()
+    return GroupChange(old.document_id, old.page_index, kind, group_ids)
+
+
+class GroupEventBus:
+    """
+    Phase 67-B: 그룹 변경 이벤트 버스
+
+    Usage:
+        group_events.subscribe("session_sync", handler)   # handler(List[GroupChange])
+        group_events.publish(document_id, page_index, "updated", [group_id])
+        group_events.flush()                               # 대기 중인 이벤트 처리 완료까지 대기
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending: "OrderedDict[Tuple[str, Optional[int]], GroupChange]" = OrderedDict()
+        self._subscribers: Dict[str, Subscriber] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._busy = False
+        self._stopping = False
+
+        # 통계
+        self.published = 0
+        self.coalesced = 0
+        self.collapsed = 0
+        self.batches = 0
+        self.errors = 0
+
+    def subscribe(self, name: str, handler: Subscriber) -> None:
+        """구독자 등록 (같은 이름이면 교체)"""
+        with self._cond:
+            self._subscribers[name] = handler
+
+    def unsubscribe(self, name: str) -> None:
+        with self._cond:
+            self._subscribers.pop(name, None)
+
+    def publish(
+        self,
+        document_id: str,
+        page_index: Optional[int] = None,
+        kind: str = "saved",
+        group_ids: Tuple[str, ...] = ()
+    ) -> None:
+        """
+        변경 알림 (대기하지 않음)
+
+        Args:
+            document_id: 문서 ID
+            page_index: 페이지 인덱스 (None: 문서 전체)
+            kind: "saved" | "updated" | "deleted" | "cleared"
+            group_ids: 바뀐 그룹 ID (비어 있으면 페이지 전체)
+        """
+        change = GroupChange(document_id, page_index, kind, tuple(group_ids))
+        with self._cond:
+            self.published += 1
+            self._enqueue(change)
+            self._ensure_worker()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 이벤트가 모두 전달될 때까지 대기 (시간 초과 시 False)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """남은 이벤트 처리 후 워커 종료 (서버 종료 시)"""
+        with self._cond:
+            thread = self._thread
+            self._stopping = True
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+        with self._cond:
+            self._thread = None
+            self._stopping = False
+
+    def stats(self) -> Dict[str, int]:
+        """이벤트 통계"""
+        with self._cond:
+            return {
+                'pending': len(self._pending),
+                'published': self.published,
+                'coalesced': self.coalesced,
+                'collapsed': self.collapsed,
+                'batches': self.batches,
+                'errors': self.errors,
+            }
+
+    # === 내부 ===
+
+    def _enqueue(self, change: GroupChange) -> None:
+        document_key = (change.document_id, None)
+        if document_key in self._pending:
+            # 문서 전체 이벤트가 이미 대기 중
+            self._pending[document_key] = _merge(self._pending[document_key], change)
+            self.coalesced += 1
+            return
+
+        key = (change.document_id, change.page_index)
+        existing = self._pending.get(key)
+        if existing is not None:
+            self._pending[key] = _merge(existing, change)
+            self.coalesced += 1
+            return
+
+        if change.page_index is not None and len(self._pending) >= config.GROUP_EVENTS_MAX_PENDING:
+            # 과부하: 이 문서의 페이지 이벤트들을 문서 전체 이벤트 하나로
+            for pending_key in [k for k in self._pending if k[0] == change.document_id]:
+                del self._pending[pending_key]
+            self._pending[document_key] = GroupChange(change.document_id, None)
+            self.collapsed += 1
+            return
+
+        self._pending[key] = change
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="group-events", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._stopping)
+                if not self._pending:
+                    return
+                stopping = self._stopping
+
+            # 배치 대기: 이어지는 저장을 모아서 한 번에 처리
+            if not stopping and config.GROUP_EVENTS_BATCH_MS > 0:
+                time.sleep(config.GROUP_EVENTS_BATCH_MS / 1000)
+
+            with self._cond:
+                batch = list(self._pending.values())
+                self._pending.clear()
+                subscribers = list(self._subscribers.items())
+                self._busy = True
+                self.batches += 1
+
+            try:
+                for name, handler in subscribers:
+                    try:
+                        handler(batch)
+                    except Exception as e:
+                        with self._cond:
+                            self.errors += 1
+                        print(f"[GroupEvents] {name} 처리 실패: {e}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+# 전역 인스턴스
+group_events = GroupEventBus()
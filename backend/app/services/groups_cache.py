@@ -0,0 +1,135 @@
+"""
+Phase 65-A: groups.json 메모리 캐시 (Write-Through)
+
+export / blocks / work_sessions 라우터와 SyncManager는 요청마다
+documents/<id>/groups/page_XXXX_groups.json 을 다시 읽고 파싱한다.
+수백 페이지 문서에서 full_sync / validate_sync를 반복하면 같은 파일을 계속 다시 파싱하게 된다.
+
+- 파싱 결과를 경로별로 보관하고 (inode, mtime_ns, size)로 검증
+  → 다른 프로세스/도구가 파일을 바꿔도 stat이 달라지므로 다시 읽음
+- 읽기는 파일 잠금을 잡지 않음: 쓰기는 모두 임시 파일 + os.replace 이므로
+  열어 둔 파일(inode)의 내용은 바뀌지 않고, 같은 fd의 fstat으로 검증 값을 얻음
+- save()는 디스크와 캐시를 함께 갱신 (기록한 임시 파일의 stat을 그대로 사용)
+- 최대 파일 수 기준 LRU
+
+read()가 돌려주는 객체는 캐시와 공유되므로 수정하지 말 것.
+수정 후 저장하는 경로는 load_for_update()로 사본을 받는다.
+"""
+import copy
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import config
+from app.services.file_lock import atomic_json_write
+
+
+# (st_dev, st_ino, st_mtime_ns, st_size)
+Signature = Tuple[int, int, int, int]
+
+
+def _signature(st: os.stat_result) -> Signature:
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class JsonFileCache:
+    """
+    Phase 65-A: stat 검증 기반 JSON 파일 캐시
+
+    Usage:
+        data = groups_cache.read(groups_file)                 # 읽기 전용 (공유 객체)
+        data = groups_cache.load_for_update(groups_file, {})  # 수정용 사본
+        groups_cache.save(groups_file, data)                  # 디스크 + 캐시
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Signature, Any]]" = OrderedDict()
+        self._lock = threading.Lock()  # 캐시 딕셔너리 보호용 (파일 잠금 아님)
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, path: Path) -> Any:
+        """
+        JSON 읽기 (캐시 적중 시 파싱 생략)
+
+        Raises:
+            FileNotFoundError / OSError: 파일 없음
+            json.JSONDecodeError: JSON 손상 (load_json과 동일)
+        """
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            self.invalidate(path)
+            raise
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == _signature(st):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        with open(key, 'r', encoding='utf-8') as f:
+            signature = _signature(os.fstat(f.fileno()))
+            data = json.load(f)
+
+        self._store(key, signature, data)
+        return data
+
+    def read_or_default(self, path: Path, default: Any = None) -> Any:
+        """파일이 없거나 손상된 경우 default 반환 (safe_json_read와 동일)"""
+        try:
+            return self.read(path)
+        except (OSError, ValueError):
+            return default
+
+    def load_for_update(self, path: Path, default: Any = None) -> Any:
+        """수정 후 save()할 사본 (없거나 손상되면 default)"""
+        return copy.deepcopy(self.read_or_default(path, default))
+
+    def save(self, path: Path, data: Any) -> os.stat_result:
+        """
+        원자적 쓰기 + 캐시 갱신 (Write-Through)
+
+        호출자가 이후 data를 수정해도 캐시에 영향이 없도록 사본을 보관한다.
+
+        Returns:
+            기록한 파일의 stat (Phase 67-A: 동기화 버전 기록용)
+        """
+        written = atomic_json_write(path, data)
+        self._store(str(path), _signature(written), copy.deepcopy(data))
+        return written
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """경로 하나 (None이면 전체) 캐시 제거"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 상태 (항목 수, 적중/미스)"""
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def _store(self, key: str, signature: Signature, data: Any) -> None:
+        with self._lock:
+            self._entries[key] = (signature, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# 전역 인스턴스
+groups_cache = JsonFileCache(max_entries=config.GROUPS_CACHE_MAX_FILES)
@@ -0,0 +1,397 @@
+"""
+Phase 63-D: 한글 파일 일괄 가져오기 (Batch Import)
+
+- 여러 HML/HWPX 파일 (또는 ZIP 묶음)을 프로세스 풀에서 병렬 파싱
+- 파일별 결과를 완료 순서대로 전달 (NDJSON / SSE 스트리밍용)
+- 이미지 저장까지 워커에서 처리 (지연 이미지 핸들은 프로세스 경계를 넘지 않음)
+
+Phase 63-I: 파싱 결과 캐시 (parse_file_cached) - 같은 파일은 다시 파싱하지 않음
+"""
+import asyncio
+import json
+import os
+import threading
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from app.config import config
+from .parser_base import HangulParserBase
+from .hml_parser import HMLParser
+from .hwpx_parser import HWPXParser
+from .parse_cache import ParseResultCache, cache_key, file_sha256
+
+
+SUPPORTED_EXTENSIONS = ('.hml', '.hwpx')
+
+# 한 번에 가져올 수 있는 최대 파일 수 (ZIP 내부 파일 포함)
+MAX_BATCH_FILES = 500
+
+# 업로드/ZIP 복사 청크 크기
+COPY_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+def create_parser(file_path: str) -> HangulParserBase:
+    """
+    확장자에 맞는 파서 생성
+
+    Phase 20-C: HMLParser는 latex_converter=None (기본 싱글톤 hwp_to_latex 사용)
+
+    Raises:
+        ValueError: 지원하지 않는 확장자
+    """
+    file_ext = Path(file_path).suffix.lower()
+    if file_ext == '.hml':
+        return HMLParser(file_path)
+    if file_ext == '.hwpx':
+        return HWPXParser(file_path)
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {file_ext}")
+
+
+def parse_file_to_dict(file_path: str, images_dir: str) -> Dict[str, Any]:
+    """
+    파일 파싱 + 이미지 저장 후 응답용 딕셔너리 반환
+
+    단일 파싱(/parse)과 일괄 가져오기 워커가 함께 사용합니다.
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 유지해야 합니다.
+
+    Args:
+        file_path: 파싱할 HML/HWPX 파일 경로
+        images_dir: 추출 이미지를 저장할 디렉토리
+
+    Returns:
+        ParseResult.to_dict() (+ image_urls, session_id)
+    """
+    result = create_parser(file_path).parse()
+
+    # Phase 21: 이미지 저장
+    images_data = result.detected_metadata.get('images', {})
+    if images_data:
+        temp_images_dir = Path(images_dir)
+        temp_images_dir.mkdir(parents=True, exist_ok=True)
+
+        # 세션 ID 생성 (이미지 그룹화용)
+        session_id = str(uuid.uuid4())[:8]
+
+        image_urls = {}
+        for bin_id, img_info in images_data.items():
+            img_format = img_info.get('format', 'bin')
+            img_filename = f"{session_id}_{bin_id}.{img_format}"
+            img_path = temp_images_dir / img_filename
+
+            # Phase 63-B: 지연 핸들 → 청크 단위 디코딩/압축 해제하며 디스크로 스트리밍
+            try:
+                img_info['handle'].save(img_path)
+            except ValueError:
+                # 손상된 Base64 데이터는 건너뜀
+                img_path.unlink(missing_ok=True)
+                continue
+
+            image_urls[bin_id] = f"/api/hangul/images/{img_filename}"
+
+        result.detected_metadata['image_urls'] = image_urls
+        result.detected_metadata['session_id'] = session_id
+
+        # 바이너리 핸들은 응답에서 제외
+        del result.detected_metadata['images']
+
+    return result.to_dict()
+
+
+def parse_file_cached(file_path: str, images_dir: str,
+                      cache_dir: Optional[str] = None,
+                      file_hash: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Phase 63-I: 파싱 결과 캐시를 거치는 parse_file_to_dict
+
+    캐시에 같은 파일(SHA-256)의 결과가 있으면 파싱 없이 반환하고,
+    없으면 파싱 후 성공한 결과를 캐시에 저장합니다.
+    프로세스 풀에서도 실행되므로 캐시 위치는 인자로 받습니다.
+
+    Args:
+        file_path: 파싱할 HML/HWPX 파일 경로
+        images_dir: 추출 이미지를 저장할 디렉토리
+        cache_dir: 캐시 디렉토리 (None이면 캐시 사용 안 함)
+        file_hash: 업로드 중 계산한 SHA-256 (None이면 파일에서 계산)
+    """
+    if cache_dir is None:
+        return parse_file_to_dict(file_path, images_dir)
+
+    path = Path(file_path)
+    cache = ParseResultCache(Path(cache_dir), config.PARSE_CACHE_MAX_BYTES)
+    key = cache_key(file_hash or file_sha256(path), path.suffix)
+
+    cached = cache.get(key, Path(images_dir), path.name)
+    if cached is not None:
+        return cached
+
+    result = parse_file_to_dict(file_path, images_dir)
+    cache.put(key, result, Path(images_dir))
+    return result
+
+
+# === 입력 파일 준비 ===
+
+@dataclass
+class ImportItem:
+    """일괄 가져오기 대상 파일"""
+    index: int
+    filename: str                 # 표시용 이름 (ZIP 내부 파일은 "묶음.zip/파일.hml")
+    path: Optional[Path] = None   # 파싱할 파일 경로 (오류 항목은 None)
+    error: Optional[str] = None   # 준비 단계 오류
+
+
+def _safe_name(name: str) -> str:
+    """경로 구분자를 제거한 파일명 (경로 탐색 방지)"""
+    return Path(name.replace('\\', '/')).name
+
+
+def _copy_limited(src, dst, limit: int) -> int:
+    """
+    청크 단위 복사 (limit 바이트를 넘으면 중단)
+
+    Raises:
+        ValueError: 압축 해제 결과가 limit 초과 (헤더의 크기 정보가 틀린 경우 포함)
+    """
+    written = 0
+    while True:
+        chunk = src.read(COPY_CHUNK_SIZE)
+        if not chunk:
+            return written
+        written += len(chunk)
+        if written > limit:
+            raise ValueError(f"압축 해제 크기가 한도를 넘었습니다 (최대 {limit // (1024 * 1024)}MB)")
+        dst.write(chunk)
+
+
+def expand_zip(zip_path: Path, work_dir: Path, display_name: str,
+               start_index: int, max_items: int) -> List[ImportItem]:
+    """
+    ZIP 묶음에서 HML/HWPX 파일만 꺼내 작업 디렉토리에 복사
+
+    디렉토리 구조는 무시하고 파일명만 사용합니다 (Zip Slip 방지).
+    내부 파일 크기 합이 커도 청크 단위로 복사하므로 메모리 사용량은 일정합니다.
+    압축 해제 크기는 파일당 MAX_ZIP_MEMBER_SIZE, 묶음 전체 MAX_ZIP_TOTAL_SIZE로 제한합니다
+    (압축 폭탄 방지) - 넘는 파일은 오류 항목, 전체 한도를 넘으면 나머지는 건너뜁니다.
+
+    Args:
+        zip_path: 업로드된 ZIP 파일
+        work_dir: 작업 디렉토리
+        display_name: 업로드 파일명 (결과 표시용)
+        start_index: 첫 항목 인덱스
+        max_items: 최대 항목 수
+
+    Returns:
+        ImportItem 목록 (ZIP 자체가 손상되면 오류 항목 1개)
+    """
+    items: List[ImportItem] = []
+    total = 0
+
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                member_name = _safe_name(info.filename)
+                if Path(member_name).suffix.lower() not in SUPPORTED_EXTENSIONS:
+                    continue
+                if len(items) >= max_items:
+                    break
+
+                index = start_index + len(items)
+                filename = f"{display_name}/{member_name}"
+                remaining = config.MAX_ZIP_TOTAL_SIZE - total
+                if info.file_size > config.MAX_ZIP_MEMBER_SIZE:
+                    items.append(ImportItem(
+                        index=index,
+                        filename=filename,
+                        error=f"파일이 너무 큽니다 (최대 {config.MAX_ZIP_MEMBER_SIZE // (1024 * 1024)}MB)",
+                    ))
+                    continue
+                if info.file_size > remaining:
+                    items.append(ImportItem(
+                        index=index,
+                        filename=filename,
+                        error=(
+                            f"ZIP 압축 해제 크기 합이 너무 큽니다 "
+                            f"(최대 {config.MAX_ZIP_TOTAL_SIZE // (1024 * 1024)}MB) - 나머지 파일 건너뜀"
+                        ),
+                    ))
+                    break
+
+                dest_dir = work_dir / str(index)
+                dest_dir.mkdir(parents=True, exist_ok=True)
+                dest_path = dest_dir / member_name
+
+                try:
+                    with zf.open(info) as src, open(dest_path, 'wb') as dst:
+                        total += _copy_limited(src, dst, min(config.MAX_ZIP_MEMBER_SIZE, remaining))
+                except ValueError as e:
+                    dest_path.unlink(missing_ok=True)
+                    items.append(ImportItem(index=index, filename=filename, error=str(e)))
+                    break
+
+                items.append(ImportItem(
+                    index=index,
+                    filename=filename,
+                    path=dest_path,
+                ))
+    except zipfile.BadZipFile as e:
+        return [ImportItem(
+            index=start_index,
+            filename=display_name,
+            error=f"ZIP 파일 오류: {str(e)}",
+        )]
+
+    return items
+
+
+# === 프로세스 풀 ===
+
+_import_pool: Optional[ProcessPoolExecutor] = None
+_import_pool_lock = threading.Lock()
+
+
+def get_import_workers() -> int:
+    """워커 프로세스 수 (HANGUL_IMPORT_WORKERS 환경 변수, 기본: CPU 수, 최대 4)"""
+    env_value = os.getenv('HANGUL_IMPORT_WORKERS')
+    if env_value:
+        return max(1, int(env_value))
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def get_import_pool() -> ProcessPoolExecutor:
+    """일괄 가져오기용 프로세스 풀 (최초 사용 시 생성)"""
+    global _import_pool
+
+    with _import_pool_lock:
+        if _import_pool is None:
+            _import_pool = ProcessPoolExecutor(max_workers=get_import_workers())
+        return _import_pool
+
+
+def shutdown_import_pool() -> None:
+    """프로세스 풀 종료 (서버 종료 시)"""
+    global _import_pool
+
+    with _import_pool_lock:
+        if _import_pool is not None:
+            _import_pool.shutdown(wait=False, cancel_futures=True)
+            _import_pool = None
+
+
+# === 결과 스트리밍 ===
+
+SaveCallback = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+async def iter_import_results(
+    items: List[ImportItem],
+    images_dir: Path,
+    on_success: Optional[SaveCallback] = None,
+    cache_dir: Optional[Path] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    파일별 파싱 결과를 완료 순서대로 반환하고 마지막에 요약을 반환
+
+    Args:
+        items: 가져올 파일 목록
+        images_dir: 추출 이미지 저장 디렉토리
+        on_success: 파싱 성공 시 호출 (저장 결과 딕셔너리 반환, 예외 시 저장 실패로 기록)
+        cache_dir: 파싱 결과 캐시 디렉토리 (Phase 63-I, None이면 캐시 사용 안 함)
+
+    Yields:
+        {'type': 'file', ...} 레코드들, 마지막에 {'type': 'summary', ...}
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_import_pool()
+
+    succeeded = 0
+    failed = 0
+    saved_count = 0
+
+    pending: Dict[asyncio.Future, ImportItem] = {}
+    try:
+        for item in items:
+            if item.error:
+                failed += 1
+                yield _file_record(item, error=item.error)
+                continue
+            future = loop.run_in_executor(
+                pool, parse_file_cached, str(item.path), str(images_dir),
+                str(cache_dir) if cache_dir is not None else None
+            )
+            pending[future] = item
+
+        while pending:
+            done, _ = await asyncio.wait(
+                pending.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                item = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    failed += 1
+                    yield _file_record(item, error=f"파싱 오류: {str(e)}")
+                    continue
+
+                if not result.get('success'):
+                    failed += 1
+                    errors = result.get('errors') or ['파싱 실패']
+                    yield _file_record(item, result=result, error=errors[0])
+                    continue
+
+                succeeded += 1
+                record = _file_record(item, result=result)
+
+                if on_success is not None and result.get('problems'):
+                    try:
+                        record['saved'] = await on_success(result)
+                        saved_count += record['saved'].get('saved_count', 0)
+                    except Exception as e:
+                        record['saved'] = {
+                            'success': False,
+                            'saved_count': 0,
+                            'message': f"저장 오류: {str(e)}",
+                        }
+
+                yield record
+
+        yield {
+            'type': 'summary',
+            'total': len(items),
+            'succeeded': succeeded,
+            'failed': failed,
+            'saved_count': saved_count,
+        }
+    finally:
+        # 클라이언트 연결 종료 등으로 중단되면 대기 중인 작업 취소
+        for future in pending:
+            future.cancel()
+
+
+def _file_record(item: ImportItem, result: Optional[Dict[str, Any]] = None,
+                 error: Optional[str] = None) -> Dict[str, Any]:
+    """파일별 결과 레코드"""
+    return {
+        'type': 'file',
+        'index': item.index,
+        'filename': item.filename,
+        'success': error is None,
+        'error': error,
+        'result': result,
+    }
+
+
+def format_ndjson(record: Dict[str, Any]) -> str:
+    """NDJSON 한 줄"""
+    return json.dumps(record, ensure_ascii=False) + '\n'
+
+
+def format_sse(record: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 (event: file | summary)"""
+    return f"event: {record['type']}\ndata: {json.dumps(record, ensure_ascii=False)}\n\n"
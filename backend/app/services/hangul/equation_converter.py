@@ -2,8 +2,11 @@
 Phase 17-B: Hancom 수식 스크립트 → LaTeX 변환기
 
 Hancom Equation Script를 LaTeX 형식으로 변환합니다.
+
+Phase 63-E: LaTeX/Unicode 동시 변환 + 스크립트별 LRU 캐시 (hancom_convert)
 """
 import re
+from functools import lru_cache
 from typing import Tuple, List
 
 
@@ -273,3 +276,13 @@ def hancom_to_latex(script: str) -> str:
 def hancom_to_unicode(script: str) -> str:
     """Hancom 스크립트를 Unicode로 변환하는 헬퍼 함수"""
     return converter.to_unicode(script)
+
+
+@lru_cache(maxsize=4096)
+def hancom_convert(script: str) -> Tuple[str, str]:
+    """
+    Phase 63-E: Hancom 스크립트를 (LaTeX, Unicode)로 한 번에 변환
+
+    같은 스크립트는 캐시된 결과를 반환합니다.
+    """
+    return converter.convert(script), converter.to_unicode(script)
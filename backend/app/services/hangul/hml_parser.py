@@ -3,6 +3,9 @@ Phase 16-2: HML 파서 (순수 XML 형식)
 Phase 19: HWP 수식 문법 → 텍스트 변환 지원
 Phase 19-B: ENDNOTE(미주) 기반 문제 추출
 Phase 20-C: 의존성 주입 지원
+Phase 63-A: iterparse 기반 단일 패스 스캔 (대용량 HML 메모리/속도 개선)
+Phase 63-B: BINDATA 지연 로딩 핸들 (청크 단위 디코딩/저장)
+Phase 63-H: 수식 일괄 변환 (고유 수식 수집 → convert_equation_batch)
 
 HML 파일 구조:
 <HWPML Version="2.8">
@@ -22,24 +25,155 @@ HML 파일 구조:
 </HWPML>
 """
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional, TYPE_CHECKING
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, Iterator, BinaryIO, ClassVar, TYPE_CHECKING
 from pathlib import Path
 import base64
+import io
+import mmap
 import zlib
 import re
 
 from .parser_base import HangulParserBase, ParseResult, ParsedProblem
 from .problem_extractor import ProblemExtractor
-from .hwp_latex_converter import hwp_to_latex
+from .hwp_latex_converter import hwp_to_latex, convert_equation_batch
 
 # Phase 20-C: 타입 힌트용 import (런타임에는 로드하지 않음)
 if TYPE_CHECKING:
     from .interfaces import ILatexConverter
 
 
+# Phase 63-H: clean_hwp_equation 규칙 사전 컴파일
+# (패턴, 치환, 리터럴) - 현재 텍스트에 리터럴이 없으면 매칭될 수 없으므로 건너뜀.
+# 규칙 순서는 기존 re.sub 호출 순서와 동일하게 유지한다.
+_CASES_PATTERN = re.compile(r'\{cases\{([^}]*(?:\{[^}]*\}[^}]*)*)\}\}')
+
+_CLEAN_RULES = tuple(
+    (re.compile(pattern), repl, literal)
+    for pattern, repl, literal in (
+        # rm/it/bf 명령어 제거 (글꼴 지시자)
+        # "rm 1" → "1", "rm ABC" → "ABC"
+        (r'\brm\s+', '', 'rm'),
+        (r'\bit\s+', '', 'it'),
+        (r'\bbf\s+', '', 'bf'),
+
+        # LEFT/RIGHT 괄호 → 실제 괄호
+        (r'\bLEFT\s*\(', '(', 'LEFT'),
+        (r'\bRIGHT\s*\)', ')', 'RIGHT'),
+        (r'\bLEFT\s*\[', '[', 'LEFT'),
+        (r'\bRIGHT\s*\]', ']', 'RIGHT'),
+        (r'\bLEFT\s*\|', '|', 'LEFT'),
+        (r'\bRIGHT\s*\|', '|', 'RIGHT'),
+        (r'\bLEFT\s*\{', '{', 'LEFT'),
+        (r'\bRIGHT\s*\}', '}', 'RIGHT'),
+
+        # Phase 20-H: 수학 기호 변환 (look-ahead 사용하여 숫자 뒤에도 매칭)
+        # (?![a-zA-Z]): 뒤에 영문자가 아니면 매칭 (숫자, 공백, 연산자 OK)
+        (r'\bLEQ(?![a-zA-Z])', '≤', 'LEQ'),
+        (r'\bleq(?![a-zA-Z])', '≤', 'leq'),
+        (r'\bGEQ(?![a-zA-Z])', '≥', 'GEQ'),
+        (r'\bgeq(?![a-zA-Z])', '≥', 'geq'),
+        (r'\bNEQ(?![a-zA-Z])', '≠', 'NEQ'),
+        (r'\bneq(?![a-zA-Z])', '≠', 'neq'),
+        (r'\bpm(?![a-zA-Z])', '±', 'pm'),
+        (r'\btimes(?![a-zA-Z])', '×', 'times'),
+        (r'\bdiv(?![a-zA-Z])', '÷', 'div'),
+        (r'\binfty(?![a-zA-Z])', '∞', 'infty'),
+
+        # Phase 19-F Step 2: 각도 기호 (DEG → °)
+        (r'\bDEG\b', '°', 'DEG'),
+        (r'\bANGLE\b', '∠', 'ANGLE'),
+        (r'\bangle\b', '∠', 'angle'),
+
+        # Phase 19-G: 장식 기호 복합 패턴 먼저 처리
+        # overline{{rm{AB}} it } → (AB)
+        (r'\boverline\s*\{\{rm\{([^}]*)\}\}\s*it\s*\}', r'(\1)', 'overline'),
+        (r'\boverline\s*\{\{rm\{([^}]*)\}\}\}', r'(\1)', 'overline'),
+        (r'\boverline\s*\{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}', r'(\1)', 'overline'),
+        # bar 복합 패턴
+        (r'\bbar\s*\{\{rm\{([^}]*)\}\}\s*it\s*\}', r'\1', 'bar'),
+        (r'\bbar\s*\{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}', r'\1', 'bar'),
+
+        # Phase 19-G: 장식 기호 변환 (plain text용)
+        # overline{AB} → (AB) 또는 AB̅
+        (r'\boverline\s*\{([^}]*)\}', r'(\1)', 'overline'),
+        (r'\bbar\s*\{([^}]*)\}', r'\1', 'bar'),
+        (r'\bhat\s*\{([^}]*)\}', r'\1', 'hat'),
+        (r'\bvec\s*\{([^}]*)\}', r'\1', 'vec'),
+        (r'\bdot\s*\{([^}]*)\}', r'\1', 'dot'),
+        (r'\btilde\s*\{([^}]*)\}', r'\1', 'tilde'),
+        (r'\bunderline\s*\{([^}]*)\}', r'\1', 'underline'),
+
+        # Phase 20-H: 중괄호 없는 장식 기호 패턴 추가
+        # overlineAB → (AB), barx → x, etc.
+        (r'\boverline([A-Za-z0-9]+)', r'(\1)', 'overline'),
+        (r'\bunderline([A-Za-z0-9]+)', r'\1', 'underline'),
+        (r'\bbar([A-Za-z0-9]+)', r'\1', 'bar'),
+        (r'\bhat([A-Za-z0-9]+)', r'\1', 'hat'),
+        (r'\bvec([A-Za-z0-9]+)', r'\1', 'vec'),
+        (r'\bdot([A-Za-z0-9]+)', r'\1', 'dot'),
+        (r'\btilde([A-Za-z0-9]+)', r'\1', 'tilde'),
+
+        # Phase 19-G: 중괄호 rm 패턴 처리
+        # {{rm{AB}} it } → AB
+        (r'\{\{rm\{([^}]*)\}\}\s*it\s*\}', r'\1', '{rm{'),
+        # {rm{AB}} → AB
+        (r'\{rm\{([^}]*)\}\}', r'\1', '{rm{'),
+        # {rm{AB} it } → AB (패턴 수정: 공백 위치 명확화)
+        (r'\{rm\{([^}]*)\}\s+it\s*\}', r'\1', '{rm{'),
+        (r'\{rm\{([^}]*)\}it\s*\}', r'\1', '{rm{'),
+        # { rm AB it } → AB
+        (r'\{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}', r'\1', 'rm'),
+        # {rm{AB}} it 제거 (it가 외부에 있는 경우)
+        (r'\{rm\{([^}]*)\}\}\s*it\b', r'\1', '{rm{'),
+        # {rm{AB} } → AB (it가 이미 제거된 경우 - 공백만 남음)
+        (r'\{rm\{([^}]*)\}\s+\}', r'\1', '{rm{'),
+        # {{rm{AB}} } → AB (it가 이미 제거된 경우)
+        (r'\{\{rm\{([^}]*)\}\}\s*\}', r'\1', '{rm{'),
+
+        # 그리스 문자
+        (r'\balpha\b', 'α', 'alpha'),
+        (r'\bbeta\b', 'β', 'beta'),
+        (r'\bgamma\b', 'γ', 'gamma'),
+        (r'\bdelta\b', 'δ', 'delta'),
+        (r'\btheta\b', 'θ', 'theta'),
+        (r'\bpi\b', 'π', 'pi'),
+        (r'\bomega\b', 'ω', 'omega'),
+
+        # 분수: {a} over {b} → a/b (간단화)
+        (r'\{([^}]+)\}\s*over\s*\{([^}]+)\}', r'(\1)/(\2)', 'over'),
+        (r'(\S+)\s*over\s*(\S+)', r'\1/\2', 'over'),
+
+        # 제곱근: sqrt{a} → √a, sqrt a → √a
+        (r'\bsqrt\s*\{([^}]+)\}', r'√(\1)', 'sqrt'),
+        (r'\bsqrt\s+(\S+)', r'√\1', 'sqrt'),
+    )
+)
+
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+# ENDNOTE 정답 표시
+_ENDNOTE_ANSWER = re.compile(r'\[정답\]\s*(.+)')
+
+# Phase 63-H: 정리 결과 캐시 크기 (스캔/렌더링/정답 추출에서 같은 수식 반복 정리)
+CLEAN_CACHE_SIZE = 8192
+
+
+def _convert_cases_to_text(match) -> str:
+    """Phase 19-F: {cases{A#B#C}} → { A / B / C }"""
+    content = match.group(1)
+    rows = content.split('#')
+    formatted_rows = ' / '.join(row.strip() for row in rows)
+    return f'{{ {formatted_rows} }}'
+
+
+@lru_cache(maxsize=CLEAN_CACHE_SIZE)
 def clean_hwp_equation(equation: str) -> str:
     """
     Phase 19: HWP 수식 명령어를 읽기 쉬운 텍스트로 변환
+    Phase 63-H: 사전 컴파일 규칙 + 리터럴 사전 필터 + 결과 캐시
 
     HWP 수식 문법:
     - rm: Roman (로만체) - 숫자, 상수
@@ -59,127 +193,170 @@ def clean_hwp_equation(equation: str) -> str:
     text = equation
 
     # Phase 19-F Step 1: cases 구조 변환 (plain text)
-    # {cases{A#B#C}} → { A / B / C }
-    def convert_cases_to_text(match):
-        content = match.group(1)
-        rows = content.split('#')
-        formatted_rows = ' / '.join(row.strip() for row in rows)
-        return f'{{ {formatted_rows} }}'
-
     # 중첩 cases 처리를 위해 반복 적용
-    for _ in range(3):
-        prev_text = text
-        text = re.sub(r'\{cases\{([^}]*(?:\{[^}]*\}[^}]*)*)\}\}',
-                      convert_cases_to_text, text)
-        if prev_text == text:
-            break
-
-    # rm/it/bf 명령어 제거 (글꼴 지시자)
-    # "rm 1" → "1", "rm ABC" → "ABC"
-    text = re.sub(r'\brm\s+', '', text)
-    text = re.sub(r'\bit\s+', '', text)
-    text = re.sub(r'\bbf\s+', '', text)
-
-    # LEFT/RIGHT 괄호 → 실제 괄호
-    text = re.sub(r'\bLEFT\s*\(', '(', text)
-    text = re.sub(r'\bRIGHT\s*\)', ')', text)
-    text = re.sub(r'\bLEFT\s*\[', '[', text)
-    text = re.sub(r'\bRIGHT\s*\]', ']', text)
-    text = re.sub(r'\bLEFT\s*\|', '|', text)
-    text = re.sub(r'\bRIGHT\s*\|', '|', text)
-    text = re.sub(r'\bLEFT\s*\{', '{', text)
-    text = re.sub(r'\bRIGHT\s*\}', '}', text)
-
-    # Phase 20-H: 수학 기호 변환 (look-ahead 사용하여 숫자 뒤에도 매칭)
-    # (?![a-zA-Z]): 뒤에 영문자가 아니면 매칭 (숫자, 공백, 연산자 OK)
-    text = re.sub(r'\bLEQ(?![a-zA-Z])', '≤', text)
-    text = re.sub(r'\bleq(?![a-zA-Z])', '≤', text)
-    text = re.sub(r'\bGEQ(?![a-zA-Z])', '≥', text)
-    text = re.sub(r'\bgeq(?![a-zA-Z])', '≥', text)
-    text = re.sub(r'\bNEQ(?![a-zA-Z])', '≠', text)
-    text = re.sub(r'\bneq(?![a-zA-Z])', '≠', text)
-    text = re.sub(r'\bpm(?![a-zA-Z])', '±', text)
-    text = re.sub(r'\btimes(?![a-zA-Z])', '×', text)
-    text = re.sub(r'\bdiv(?![a-zA-Z])', '÷', text)
-    text = re.sub(r'\binfty(?![a-zA-Z])', '∞', text)
-
-    # Phase 19-F Step 2: 각도 기호 (DEG → °)
-    text = re.sub(r'\bDEG\b', '°', text)
-    text = re.sub(r'\bANGLE\b', '∠', text)
-    text = re.sub(r'\bangle\b', '∠', text)
-
-    # Phase 19-G: 장식 기호 복합 패턴 먼저 처리
-    # overline{{rm{AB}} it } → (AB)
-    text = re.sub(r'\boverline\s*\{\{rm\{([^}]*)\}\}\s*it\s*\}', r'(\1)', text)
-    text = re.sub(r'\boverline\s*\{\{rm\{([^}]*)\}\}\}', r'(\1)', text)
-    text = re.sub(r'\boverline\s*\{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}', r'(\1)', text)
-    # bar 복합 패턴
-    text = re.sub(r'\bbar\s*\{\{rm\{([^}]*)\}\}\s*it\s*\}', r'\1', text)
-    text = re.sub(r'\bbar\s*\{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}', r'\1', text)
-
-    # Phase 19-G: 장식 기호 변환 (plain text용)
-    # overline{AB} → (AB) 또는 AB̅
-    text = re.sub(r'\boverline\s*\{([^}]*)\}', r'(\1)', text)
-    text = re.sub(r'\bbar\s*\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\bhat\s*\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\bvec\s*\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\bdot\s*\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\btilde\s*\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\bunderline\s*\{([^}]*)\}', r'\1', text)
-
-    # Phase 20-H: 중괄호 없는 장식 기호 패턴 추가
-    # overlineAB → (AB), barx → x, etc.
-    text = re.sub(r'\boverline([A-Za-z0-9]+)', r'(\1)', text)
-    text = re.sub(r'\bunderline([A-Za-z0-9]+)', r'\1', text)
-    text = re.sub(r'\bbar([A-Za-z0-9]+)', r'\1', text)
-    text = re.sub(r'\bhat([A-Za-z0-9]+)', r'\1', text)
-    text = re.sub(r'\bvec([A-Za-z0-9]+)', r'\1', text)
-    text = re.sub(r'\bdot([A-Za-z0-9]+)', r'\1', text)
-    text = re.sub(r'\btilde([A-Za-z0-9]+)', r'\1', text)
-
-    # Phase 19-G: 중괄호 rm 패턴 처리
-    # {{rm{AB}} it } → AB
-    text = re.sub(r'\{\{rm\{([^}]*)\}\}\s*it\s*\}', r'\1', text)
-    # {rm{AB}} → AB
-    text = re.sub(r'\{rm\{([^}]*)\}\}', r'\1', text)
-    # {rm{AB} it } → AB (패턴 수정: 공백 위치 명확화)
-    text = re.sub(r'\{rm\{([^}]*)\}\s+it\s*\}', r'\1', text)
-    text = re.sub(r'\{rm\{([^}]*)\}it\s*\}', r'\1', text)
-    # { rm AB it } → AB
-    text = re.sub(r'\{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}', r'\1', text)
-    # {rm{AB}} it 제거 (it가 외부에 있는 경우)
-    text = re.sub(r'\{rm\{([^}]*)\}\}\s*it\b', r'\1', text)
-    # {rm{AB} } → AB (it가 이미 제거된 경우 - 공백만 남음)
-    text = re.sub(r'\{rm\{([^}]*)\}\s+\}', r'\1', text)
-    # {{rm{AB}} } → AB (it가 이미 제거된 경우)
-    text = re.sub(r'\{\{rm\{([^}]*)\}\}\s*\}', r'\1', text)
-
-    # 그리스 문자
-    text = re.sub(r'\balpha\b', 'α', text)
-    text = re.sub(r'\bbeta\b', 'β', text)
-    text = re.sub(r'\bgamma\b', 'γ', text)
-    text = re.sub(r'\bdelta\b', 'δ', text)
-    text = re.sub(r'\btheta\b', 'θ', text)
-    text = re.sub(r'\bpi\b', 'π', text)
-    text = re.sub(r'\bomega\b', 'ω', text)
-
-    # 분수: {a} over {b} → a/b (간단화)
-    text = re.sub(r'\{([^}]+)\}\s*over\s*\{([^}]+)\}', r'(\1)/(\2)', text)
-    text = re.sub(r'(\S+)\s*over\s*(\S+)', r'\1/\2', text)
-
-    # 제곱근: sqrt{a} → √a, sqrt a → √a
-    text = re.sub(r'\bsqrt\s*\{([^}]+)\}', r'√(\1)', text)
-    text = re.sub(r'\bsqrt\s+(\S+)', r'√\1', text)
+    if '{cases{' in text:
+        for _ in range(3):
+            prev_text = text
+            text = _CASES_PATTERN.sub(_convert_cases_to_text, text)
+            if prev_text == text:
+                break
+
+    for pattern, repl, literal in _CLEAN_RULES:
+        if literal in text:
+            text = pattern.sub(repl, text)
 
     # 백틱 제거
     text = text.replace('`', '')
 
     # 여러 공백 → 하나로
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RUN.sub(' ', text)
 
     return text.strip()
 
 
+# Phase 63-B: BINDATA 여는 태그 (네임스페이스 접두사 허용)
+_BINDATA_OPEN_TAG = re.compile(rb'<(?:[\w.-]+:)?BINDATA\b([^>]*)>')
+_BINDATA_ID_ATTR = re.compile(rb'\bId\s*=\s*["\']([^"\']*)["\']')
+_NON_BASE64 = re.compile(rb'[^A-Za-z0-9+/=]')
+
+
+@dataclass
+class BinDataHandle:
+    """
+    Phase 63-B: HML BINDATA 지연 로딩 핸들
+
+    파싱 시에는 Base64 본문의 파일 내 위치와 압축 여부만 기록하고,
+    실제 디코딩/압축 해제는 read() 또는 save() 호출 시 청크 단위로 수행.
+    원본 파일 위치를 쓸 수 없는 경우(엔티티 포함 등)에만 inline_text 보관.
+    """
+    file_path: Path
+    offset: int = 0                       # Base64 본문 시작 바이트 오프셋
+    length: int = 0                       # Base64 본문 바이트 길이
+    compressed: bool = False              # Compress="true"
+    inline_text: Optional[str] = None
+
+    CHUNK_SIZE: ClassVar[int] = 64 * 1024
+
+    def read(self) -> bytes:
+        """전체 이미지 데이터를 메모리로 디코딩"""
+        buffer = io.BytesIO()
+        self._stream_to(buffer)
+        return buffer.getvalue()
+
+    def save(self, dest_path: Path) -> int:
+        """
+        이미지 데이터를 디스크로 스트리밍 저장
+
+        Returns:
+            int: 저장된 바이트 수
+
+        Raises:
+            ValueError: Base64 데이터가 손상된 경우
+        """
+        with open(dest_path, 'wb') as f:
+            return self._stream_to(f)
+
+    def _stream_to(self, fp: BinaryIO) -> int:
+        """압축 해제 방식을 순서대로 시도 (raw deflate → zlib → 원본)"""
+        modes = (-15, zlib.MAX_WBITS, None) if self.compressed else (None,)
+        for wbits in modes:
+            fp.seek(0)
+            fp.truncate()
+            try:
+                return self._write_decoded(fp, wbits)
+            except zlib.error:
+                continue  # 압축 해제 실패 시 다음 방식 (최종: 원본 유지)
+        return 0
+
+    def _write_decoded(self, fp: BinaryIO, wbits: Optional[int]) -> int:
+        decompressor = zlib.decompressobj(wbits) if wbits is not None else None
+        written = 0
+
+        for raw in self._iter_raw_chunks():
+            if decompressor is None:
+                fp.write(raw)
+                written += len(raw)
+                continue
+
+            # 출력도 CHUNK_SIZE 단위로 제한 (고압축 BMP 대비)
+            data = raw
+            while data and not decompressor.eof:
+                out = decompressor.decompress(data, self.CHUNK_SIZE)
+                fp.write(out)
+                written += len(out)
+                data = decompressor.unconsumed_tail
+
+        if decompressor is not None:
+            out = decompressor.flush()
+            fp.write(out)
+            written += len(out)
+            if not decompressor.eof:
+                raise zlib.error('incomplete or truncated stream')
+
+        return written
+
+    def _iter_raw_chunks(self) -> Iterator[bytes]:
+        """Base64 본문을 4바이트 단위로 정렬하여 청크별 디코딩"""
+        pending = b''
+        for chunk in self._iter_base64_chunks():
+            pending += _NON_BASE64.sub(b'', chunk)
+            cut = len(pending) - len(pending) % 4
+            if cut:
+                yield base64.b64decode(pending[:cut])
+                pending = pending[cut:]
+        if pending:
+            yield base64.b64decode(pending)  # 패딩 오류 시 binascii.Error
+
+    def _iter_base64_chunks(self) -> Iterator[bytes]:
+        if self.inline_text is not None:
+            for i in range(0, len(self.inline_text), self.CHUNK_SIZE):
+                yield self.inline_text[i:i + self.CHUNK_SIZE].encode('ascii', 'ignore')
+            return
+
+        with open(self.file_path, 'rb') as f:
+            f.seek(self.offset)
+            remaining = self.length
+            while remaining > 0:
+                chunk = f.read(min(self.CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+def locate_bindata_spans(file_path: Path) -> List[Tuple[bytes, int, int]]:
+    """
+    Phase 63-B: 원본 파일에서 BINDATA 본문 위치 수집 (문서 순서)
+
+    Base64 본문에는 '<'가 없으므로 여는 태그 뒤 첫 '<'까지를 본문으로 본다.
+
+    Returns:
+        List[Tuple[bytes, int, int]]: [(Id, 본문 오프셋, 본문 길이), ...]
+        엔티티(&)가 포함된 본문은 길이 -1 (원본 위치 사용 불가)
+    """
+    spans = []
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return spans  # 빈 파일
+
+        with mm:
+            for match in _BINDATA_OPEN_TAG.finditer(mm):
+                id_match = _BINDATA_ID_ATTR.search(match.group(1))
+                bin_id = id_match.group(1) if id_match else b''
+                start = match.end()
+                if match.group(1).rstrip().endswith(b'/'):
+                    spans.append((bin_id, start, 0))
+                    continue
+                end = mm.find(b'<', start)
+                if end < 0:
+                    end = len(mm)
+                has_entity = mm.find(b'&', start, end) >= 0
+                spans.append((bin_id, start, -1 if has_entity else end - start))
+    return spans
+
+
 class HMLParser(HangulParserBase):
     """HML (순수 XML) 파일 파서
 
@@ -212,6 +389,19 @@ class HMLParser(HangulParserBase):
         # Phase 20-C: 의존성 주입 지원
         self._latex_converter = latex_converter
 
+        # Phase 63-A: 단일 패스 스캔 결과
+        self._scanned = False
+        self._paragraphs: List[str] = []                      # extract_text 결과
+        self._body_tokens: List[List[Tuple[str, str]]] = []   # 본문 P별 토큰 (ENDNOTE 내부 제외)
+        self._endnote_texts: List[str] = []                   # ENDNOTE 텍스트 (문서 순서)
+        self._autonum_positions: List[Dict] = []              # AUTONUM(Endnote) 위치 (문서 순서)
+        self._picture_locations: List[Dict] = []              # PICTURE 위치
+        self._images: Dict[str, Dict] = {}
+        self._raw_metadata: Dict[str, str] = {}
+
+        # Phase 63-H: 일괄 변환된 수식 LaTeX (원본 → LaTeX)
+        self._latex_cache: Dict[str, str] = {}
+
     def _convert_to_latex(self, hwp_eq: str) -> str:
         """Phase 20-C: HWP 수식을 LaTeX로 변환 (DI 지원)
 
@@ -221,12 +411,29 @@ class HMLParser(HangulParserBase):
         Returns:
             LaTeX 형식 문자열
         """
+        # Phase 63-H: 일괄 변환 결과 우선 사용
+        latex = self._latex_cache.get(hwp_eq)
+        if latex is not None:
+            return latex
+
         if self._latex_converter is not None:
             return self._latex_converter.convert(hwp_eq)
         else:
             # 기본 싱글톤 사용
             return hwp_to_latex(hwp_eq)
 
+    def _convert_equations(self, equations: Iterator[str]) -> None:
+        """
+        Phase 63-H: 수식 일괄 변환 후 _latex_cache에 보관
+
+        고유 수식만 한 번씩 변환하며, 수식이 많은 문서는 프로세스 풀로 분산된다.
+        주입된 변환기가 있으면 그 변환기의 convert_batch를 사용.
+        """
+        pending = (eq for eq in equations if eq not in self._latex_cache)
+        self._latex_cache.update(
+            convert_equation_batch(pending, self._latex_converter)
+        )
+
     def parse(self) -> ParseResult:
         """HML 파일 파싱"""
         result = ParseResult(
@@ -235,9 +442,8 @@ class HMLParser(HangulParserBase):
         )
 
         try:
-            # 1. XML 파싱
-            self.tree = ET.parse(self.file_path)
-            self.root = self.tree.getroot()
+            # 1. XML 단일 패스 스캔 (Phase 63-A)
+            self._scan_document()
 
             # 2. 텍스트 추출
             paragraphs = self.extract_text()
@@ -249,7 +455,7 @@ class HMLParser(HangulParserBase):
             result.detected_metadata = self._extract_metadata()
 
             # Phase 19-B: ENDNOTE 기반 추출 우선 시도
-            endnotes = list(self.root.iter('ENDNOTE'))
+            endnotes = self._endnote_texts
             if len(endnotes) >= 3:
                 # ENDNOTE가 3개 이상이면 미주 기반 추출 사용
                 result.problems = self._extract_by_endnote(endnotes, paragraphs)
@@ -281,30 +487,196 @@ class HMLParser(HangulParserBase):
 
         return result
 
-    def extract_text(self) -> List[str]:
+    # =========================================================================
+    # Phase 63-A: iterparse 기반 단일 패스 스캔
+    # =========================================================================
+
+    def _scan_document(self) -> None:
         """
-        HML에서 문단 텍스트 추출
+        Phase 63-A: 문서 전체를 iterparse 한 번으로 스캔
 
-        Returns:
-            List[str]: 문단 단위 텍스트 리스트
+        한 번의 순회로 다음을 모두 수집:
+        - 문단 텍스트 (extract_text)
+        - 본문 P 토큰 / AUTONUM 위치 / PICTURE 위치
+        - ENDNOTE 텍스트
+        - BINITEM 메타데이터, BINDATA 이미지
+        - DOCSUMMARY 메타데이터
+
+        최상위 문단과 BINDATA는 처리 직후 clear() 하므로
+        전체 트리를 메모리에 유지하지 않는다.
         """
-        paragraphs = []
+        if self._scanned:
+            return
 
-        if self.root is None:
-            return paragraphs
+        binitem_map = {}
+        raw_images = []
+        # Phase 63-B: BINDATA 본문 위치 (iterparse 순서와 동일)
+        bindata_spans = locate_bindata_spans(self.file_path)
+        bindata_index = 0
+        endnote_slots: List[str] = []    # 시작 태그 순서(= 기존 iter 순서) 유지용
+        open_endnotes: List[int] = []
+        meta_slots: List[List] = []      # [key, text]
+        open_meta: Dict[int, List] = {}
+        para_depth = 0
+        endnote_depth = 0
+        # 최상위 문단은 tail이 확정되는 다음 이벤트에서 처리
+        pending = None
+
+        for event, elem in ET.iterparse(str(self.file_path), events=('start', 'end')):
+            if pending is not None:
+                self._consume_paragraph(*pending)
+                pending = None
+
+            tag = elem.tag
+
+            if event == 'start':
+                if self.root is None:
+                    self.root = elem
+                if tag.endswith('P'):
+                    para_depth += 1
+                if tag == 'ENDNOTE':
+                    endnote_depth += 1
+                    open_endnotes.append(len(endnote_slots))
+                    endnote_slots.append('')
+                elif tag == 'BINITEM' or tag.endswith('}BINITEM'):
+                    bin_id = elem.get('BinData') or elem.get('Id')
+                    if bin_id:
+                        binitem_map[bin_id] = elem.get('Format', 'bin')
+
+                meta_key = self._metadata_key(tag)
+                if meta_key:
+                    slot = [meta_key, None]
+                    meta_slots.append(slot)
+                    open_meta[id(elem)] = slot
+                continue
+
+            # event == 'end'
+            slot = open_meta.pop(id(elem), None)
+            if slot is not None:
+                slot[1] = elem.text
 
-        # <P> 태그 (문단) 찾기 - 네임스페이스 없이 시도
-        for p_elem in self.root.iter():
-            if p_elem.tag.endswith('P') or p_elem.tag == 'P':
-                para_text = self._get_paragraph_text(p_elem)
+            if tag == 'ENDNOTE':
+                endnote_depth -= 1
+                endnote_slots[open_endnotes.pop()] = ''.join(elem.itertext()).strip()
+            elif tag == 'BINDATA' or tag.endswith('}BINDATA'):
+                bin_id = elem.get('Id')
+                span = bindata_spans[bindata_index] if bindata_index < len(bindata_spans) else None
+                bindata_index += 1
+                if bin_id and elem.text:
+                    raw_images.append((bin_id, self._make_bindata_handle(elem, span)))
+                if para_depth == 0:
+                    elem.clear()
+
+            if tag.endswith('P'):
+                para_depth -= 1
+                if para_depth == 0:
+                    pending = (elem, endnote_depth > 0)
+
+        if pending is not None:
+            self._consume_paragraph(*pending)
+
+        self._endnote_texts = endnote_slots
+        self._images = {
+            bin_id: {'handle': handle, 'format': binitem_map.get(bin_id, 'bin')}
+            for bin_id, handle in raw_images
+        }
+        for key, text in meta_slots:
+            if text:
+                self._raw_metadata[key] = text.strip()
+
+        # 만약 빈 결과면, 남아있는 트리에서 모든 텍스트 요소 수집
+        if not self._paragraphs:
+            self._paragraphs = self._extract_all_text()
+
+        self._scanned = True
+
+    def _consume_paragraph(self, p_elem, in_endnote: bool) -> None:
+        """
+        Phase 63-A: 최상위 문단 서브트리 처리 후 해제
+
+        서브트리 내 모든 문단(중첩 포함)을 문서 순서대로 수집한다.
+        ENDNOTE 내부 P는 extract_text에는 포함되지만 본문 P 목록에서는 제외.
+        """
+        stack = [(p_elem, in_endnote)]
+        while stack:
+            elem, inside_endnote = stack.pop()
+            tag = elem.tag
+
+            if tag.endswith('P'):
+                para_text = self._get_paragraph_text(elem)
                 if para_text.strip():
-                    paragraphs.append(para_text.strip())
+                    self._paragraphs.append(para_text.strip())
+                if tag == 'P' and not inside_endnote:
+                    self._collect_body_paragraph(elem)
 
-        # 만약 빈 결과면, 모든 텍스트 요소 수집
-        if not paragraphs:
-            paragraphs = self._extract_all_text()
+            child_in_endnote = inside_endnote or tag == 'ENDNOTE'
+            stack.extend((child, child_in_endnote) for child in reversed(elem))
 
-        return paragraphs
+        p_elem.clear()
+
+    def _collect_body_paragraph(self, p_elem) -> None:
+        """Phase 63-A: 본문 P 태그의 토큰, AUTONUM, PICTURE 위치 수집"""
+        p_idx = len(self._body_tokens)
+        self._body_tokens.append(self._get_paragraph_tokens(p_elem))
+
+        for autonum in p_elem.iter('AUTONUM'):
+            if autonum.get('NumberType') == 'Endnote':
+                self._autonum_positions.append({
+                    'number': int(autonum.get('Number', 0)),
+                    'p_index': p_idx
+                })
+
+        # Phase 21-B: PICTURE → BinItem ID
+        for picture in p_elem.iter('PICTURE'):
+            # IMAGECT에서 BinItem ID 찾기
+            for imagect in picture.iter('IMAGECT'):
+                bin_item_id = imagect.get('BinItem')
+                if bin_item_id:
+                    self._picture_locations.append({
+                        'bin_id': bin_item_id,
+                        'p_index': p_idx
+                    })
+                    break  # 하나의 PICTURE당 하나의 이미지
+
+            # IMAGE 태그도 확인 (다른 HML 버전)
+            for image in picture.iter('IMAGE'):
+                bin_item_id = image.get('BinItem') or image.get('BinData')
+                if bin_item_id:
+                    self._picture_locations.append({
+                        'bin_id': bin_item_id,
+                        'p_index': p_idx
+                    })
+                    break
+
+    @staticmethod
+    def _iter_with_parent(root) -> Iterator[Tuple[ET.Element, Optional[ET.Element]]]:
+        """Phase 63-A: (요소, 부모) 전위 순회 - 부모 탐색 재순회 방지"""
+        stack = [(root, None)]
+        while stack:
+            elem, parent = stack.pop()
+            yield elem, parent
+            stack.extend((child, elem) for child in reversed(elem))
+
+    @staticmethod
+    def _metadata_key(tag: str) -> Optional[str]:
+        """DOCSUMMARY 메타데이터 태그 → 키"""
+        if 'TITLE' in tag:
+            return 'title'
+        elif 'AUTHOR' in tag:
+            return 'author'
+        elif 'SUBJECT' in tag:
+            return 'subject'
+        return None
+
+    def extract_text(self) -> List[str]:
+        """
+        HML에서 문단 텍스트 추출
+
+        Returns:
+            List[str]: 문단 단위 텍스트 리스트
+        """
+        self._scan_document()
+        return self._paragraphs
 
     def _get_paragraph_text(self, p_elem) -> str:
         """
@@ -313,38 +685,27 @@ class HMLParser(HangulParserBase):
         Phase 19: EQUATION 태그의 HWP 수식을 정리된 텍스트로 변환
         """
         texts = []
-        # 이미 처리된 EQUATION 요소 추적 (중복 방지)
-        processed_equations = set()
 
-        for elem in p_elem.iter():
+        for elem, parent in self._iter_with_parent(p_elem):
             # Phase 19: EQUATION 태그 특별 처리
-            if elem.tag.endswith('EQUATION') or elem.tag == 'EQUATION':
-                elem_id = id(elem)
-                if elem_id not in processed_equations:
-                    processed_equations.add(elem_id)
-                    # 수식 텍스트 추출 및 정리
-                    eq_text = ''.join(elem.itertext())
-                    if eq_text.strip():
-                        cleaned = clean_hwp_equation(eq_text)
-                        texts.append(cleaned)
+            if elem.tag.endswith('EQUATION'):
+                # 수식 텍스트 추출 및 정리
+                eq_text = ''.join(elem.itertext())
+                if eq_text.strip():
+                    cleaned = clean_hwp_equation(eq_text)
+                    texts.append(cleaned)
                 continue  # EQUATION 내부 요소는 건너뛰기
 
             # EQUATION 내부 요소인 경우 건너뛰기
-            parent = None
-            for ancestor in p_elem.iter():
-                if elem in list(ancestor):
-                    parent = ancestor
-                    break
-            if parent is not None:
-                if parent.tag.endswith('EQUATION') or parent.tag == 'EQUATION':
-                    continue
+            if parent is not None and parent.tag.endswith('EQUATION'):
+                continue
 
             # TEXT 태그
-            if elem.tag.endswith('TEXT') or elem.tag == 'TEXT':
+            if elem.tag.endswith('TEXT'):
                 if elem.text:
                     texts.append(elem.text)
             # CHAR 태그 (개별 문자)
-            elif elem.tag.endswith('CHAR') or elem.tag == 'CHAR':
+            elif elem.tag.endswith('CHAR'):
                 if elem.text:
                     texts.append(elem.text)
             # 직접 텍스트
@@ -355,70 +716,75 @@ class HMLParser(HangulParserBase):
 
         return ''.join(texts)
 
-    def _get_paragraph_text_with_latex(self, p_elem) -> tuple:
+    def _get_paragraph_tokens(self, p_elem) -> List[Tuple[str, str]]:
         """
-        Phase 19-C: 문단에서 텍스트와 LaTeX 버전 모두 추출
+        Phase 63-A: 문단을 ('text', 문자열) / ('eq', HWP 수식) 토큰으로 축약
 
-        Returns:
-            tuple: (plain_text, latex_text, hwp_equations, latex_equations)
+        요소 트리를 해제한 뒤에도 _render_paragraph로
+        텍스트/LaTeX 버전을 다시 만들 수 있도록 최소 정보만 보관.
         """
-        plain_parts = []
-        latex_parts = []
-        hwp_equations = []
-        latex_equations = []
-        processed_equations = set()
+        tokens = []
 
-        for elem in p_elem.iter():
+        for elem, parent in self._iter_with_parent(p_elem):
             # EQUATION 태그 처리
-            if elem.tag.endswith('EQUATION') or elem.tag == 'EQUATION':
-                elem_id = id(elem)
-                if elem_id not in processed_equations:
-                    processed_equations.add(elem_id)
-                    eq_text = ''.join(elem.itertext()).strip()
-                    if eq_text:
-                        # 원본 HWP 수식 저장
-                        hwp_equations.append(eq_text)
-
-                        # 일반 텍스트 버전
-                        # Phase 19-E: 수식 뒤 공백 추가 (선택지 숫자 병합 방지)
-                        cleaned = clean_hwp_equation(eq_text)
-                        plain_parts.append(cleaned + ' ')
-
-                        # LaTeX 버전 (수식을 $...$ 로 감싸기)
-                        # Phase 20-C: DI 지원
-                        latex_eq = self._convert_to_latex(eq_text)
-                        latex_equations.append(latex_eq)
-                        latex_parts.append(f'${latex_eq}$')
+            if elem.tag.endswith('EQUATION'):
+                eq_text = ''.join(elem.itertext()).strip()
+                if eq_text:
+                    tokens.append(('eq', eq_text))
                 continue
 
             # EQUATION 내부 요소 건너뛰기
-            parent = None
-            for ancestor in p_elem.iter():
-                if elem in list(ancestor):
-                    parent = ancestor
-                    break
-            if parent is not None:
-                if parent.tag.endswith('EQUATION') or parent.tag == 'EQUATION':
-                    continue
+            if parent is not None and parent.tag.endswith('EQUATION'):
+                continue
 
             # TEXT/CHAR 태그
             text_content = None
-            if elem.tag.endswith('TEXT') or elem.tag == 'TEXT':
+            if elem.tag.endswith('TEXT'):
                 text_content = elem.text
-            elif elem.tag.endswith('CHAR') or elem.tag == 'CHAR':
+            elif elem.tag.endswith('CHAR'):
                 text_content = elem.text
             elif elem.text and elem.tag not in ['P', 'PARA']:
                 if not elem.tag.isupper():
                     text_content = elem.text
 
             if text_content:
-                plain_parts.append(text_content)
-                latex_parts.append(text_content)
+                tokens.append(('text', text_content))
 
             # Phase 19-E: tail 텍스트 처리 (선택지 기호 ②③ 등이 TAB.tail에 있음)
             if elem.tail:
-                plain_parts.append(elem.tail)
-                latex_parts.append(elem.tail)
+                tokens.append(('text', elem.tail))
+
+        return tokens
+
+    def _render_paragraph(self, tokens: List[Tuple[str, str]]) -> tuple:
+        """
+        Phase 19-C: 문단에서 텍스트와 LaTeX 버전 모두 추출
+
+        Returns:
+            tuple: (plain_text, latex_text, hwp_equations, latex_equations)
+        """
+        plain_parts = []
+        latex_parts = []
+        hwp_equations = []
+        latex_equations = []
+
+        for kind, value in tokens:
+            if kind == 'eq':
+                # 원본 HWP 수식 저장
+                hwp_equations.append(value)
+
+                # 일반 텍스트 버전
+                # Phase 19-E: 수식 뒤 공백 추가 (선택지 숫자 병합 방지)
+                plain_parts.append(clean_hwp_equation(value) + ' ')
+
+                # LaTeX 버전 (수식을 $...$ 로 감싸기)
+                # Phase 20-C: DI 지원
+                latex_eq = self._convert_to_latex(value)
+                latex_equations.append(latex_eq)
+                latex_parts.append(f'${latex_eq}$')
+            else:
+                plain_parts.append(value)
+                latex_parts.append(value)
 
         return (
             ''.join(plain_parts),
@@ -432,6 +798,9 @@ class HMLParser(HangulParserBase):
         paragraphs = []
         current_para = []
 
+        if self.root is None:
+            return paragraphs
+
         def extract_recursive(elem):
             # 텍스트 추출
             if elem.text:
@@ -471,75 +840,46 @@ class HMLParser(HangulParserBase):
         - BINITEM: HEAD/MAPPINGTABLE/BINDATALIST에 메타데이터
         - BINDATA: TAIL/BINDATASTORAGE에 실제 데이터 (Base64, zlib 압축)
 
+        Phase 63-A: 단일 패스 스캔 중에 수집됨
+        Phase 63-B: 데이터는 지연 로딩 핸들로 반환 (handle.read() / handle.save())
+        - 원본 파일이 남아있는 동안에만 디코딩 가능
+
         Returns:
-            Dict[str, Dict]: 이미지 ID -> {'data': bytes, 'format': str}
+            Dict[str, Dict]: 이미지 ID -> {'handle': BinDataHandle, 'format': str}
         """
-        images = {}
+        self._scan_document()
+        return self._images
 
-        if self.root is None:
-            return images
+    def _make_bindata_handle(self, elem, span: Optional[Tuple[bytes, int, int]]) -> BinDataHandle:
+        """
+        Phase 63-B: BINDATA 요소 → 지연 로딩 핸들
 
-        # 1. BINITEM에서 메타데이터 수집 (ID -> Format)
-        binitem_map = {}
-        for elem in self.root.iter():
-            if elem.tag == 'BINITEM' or elem.tag.endswith('}BINITEM'):
-                bin_id = elem.get('BinData') or elem.get('Id')
-                fmt = elem.get('Format', 'bin')
-                if bin_id:
-                    binitem_map[bin_id] = fmt
-
-        # 2. BINDATA에서 실제 데이터 추출
-        for elem in self.root.iter():
-            if elem.tag == 'BINDATA' or elem.tag.endswith('}BINDATA'):
-                bin_id = elem.get('Id')
-                if not bin_id or not elem.text:
-                    continue
+        원본 파일 위치가 확인되면 오프셋만 기록하고,
+        그렇지 않으면 (Id 불일치, 엔티티 포함 등) Base64 텍스트를 보관.
+        """
+        compressed = elem.get('Compress', 'false').lower() == 'true'
+        bin_id = elem.get('Id')
+
+        if span is not None and span[0] == bin_id.encode('utf-8') and span[2] > 0:
+            return BinDataHandle(
+                file_path=self.file_path,
+                offset=span[1],
+                length=span[2],
+                compressed=compressed
+            )
 
-                try:
-                    # Base64 디코딩 (줄바꿈/공백 제거)
-                    data_text = elem.text.strip().replace('\n', '').replace('\r', '').replace(' ', '')
-                    raw_data = base64.b64decode(data_text)
-
-                    # 압축 해제 (Compress="true"인 경우)
-                    compress = elem.get('Compress', 'false').lower()
-                    if compress == 'true':
-                        try:
-                            # zlib raw deflate (wbits=-15)
-                            raw_data = zlib.decompress(raw_data, -15)
-                        except zlib.error:
-                            # 기본 zlib 해제 시도
-                            try:
-                                raw_data = zlib.decompress(raw_data)
-                            except zlib.error:
-                                pass  # 압축 해제 실패 시 원본 유지
-
-                    # 메타데이터와 결합
-                    fmt = binitem_map.get(bin_id, 'bin')
-                    images[bin_id] = {
-                        'data': raw_data,
-                        'format': fmt
-                    }
-
-                except Exception:
-                    pass
-
-        return images
+        return BinDataHandle(
+            file_path=self.file_path,
+            compressed=compressed,
+            inline_text=elem.text
+        )
 
     def _extract_metadata(self) -> Dict[str, str]:
         """문서 메타데이터 추출"""
-        metadata = {}
-
-        if self.root is None:
-            return metadata
+        self._scan_document()
 
-        # DOCSUMMARY에서 제목 등 추출
-        for elem in self.root.iter():
-            if 'TITLE' in elem.tag and elem.text:
-                metadata['title'] = elem.text.strip()
-            elif 'AUTHOR' in elem.tag and elem.text:
-                metadata['author'] = elem.text.strip()
-            elif 'SUBJECT' in elem.tag and elem.text:
-                metadata['subject'] = elem.text.strip()
+        # DOCSUMMARY에서 제목 등 (스캔 중 수집)
+        metadata = dict(self._raw_metadata)
 
         # 파일명에서 추가 정보 추출
         metadata.update(self._extract_from_filename())
@@ -593,14 +933,14 @@ class HMLParser(HangulParserBase):
 
     def _extract_by_endnote(
         self,
-        endnotes: List,
+        endnotes: List[str],
         paragraphs: List[str]
     ) -> List[ParsedProblem]:
         """
         Phase 19-B: ENDNOTE 기반 문제 추출
 
         Args:
-            endnotes: ENDNOTE 태그 리스트
+            endnotes: ENDNOTE 텍스트 리스트 (Phase 63-A: 스캔 중 수집)
             paragraphs: 추출된 텍스트 문단들
 
         Returns:
@@ -608,6 +948,9 @@ class HMLParser(HangulParserBase):
         """
         problems = []
 
+        # Phase 63-H: 정답/문제 본문 수식을 먼저 모아 일괄 변환
+        self._convert_equations(self._iter_endnote_equations(endnotes))
+
         # 1. ENDNOTE에서 정답 추출
         answers = self._extract_answers_from_endnotes(endnotes)
 
@@ -642,7 +985,7 @@ class HMLParser(HangulParserBase):
 
         return problems
 
-    def _extract_answers_from_endnotes(self, endnotes: List) -> List[Dict[str, str]]:
+    def _extract_answers_from_endnotes(self, endnotes: List[str]) -> List[Dict[str, str]]:
         """
         Phase 19-C: ENDNOTE 태그에서 정답 추출 (텍스트 + LaTeX)
 
@@ -651,11 +994,9 @@ class HMLParser(HangulParserBase):
         """
         answers = []
 
-        for note in endnotes:
-            note_text = ''.join(note.itertext()).strip()
-
+        for note_text in endnotes:
             # [정답] 패턴 찾기
-            ans_match = re.search(r'\[정답\]\s*(.+)', note_text)
+            ans_match = _ENDNOTE_ANSWER.search(note_text)
 
             if ans_match:
                 raw_answer = ans_match.group(1).strip()
@@ -724,44 +1065,35 @@ class HMLParser(HangulParserBase):
         # 기타 텍스트
         return 'text'
 
-    def _find_problem_contents_by_autonum(self) -> List[Dict]:
+    def _iter_endnote_equations(self, endnotes: List[str]) -> Iterator[str]:
         """
-        Phase 19-C: AUTONUM 위치 기반 문제 본문 추출 (텍스트 + LaTeX)
+        Phase 63-H: 미주 기반 추출에서 LaTeX로 변환할 수식 수집
 
-        Returns:
-            List[Dict]: 문제별 {'text': ..., 'latex': ..., 'equations': ..., 'equations_latex': ...}
+        ENDNOTE 정답 원문과, 문제 본문 범위(_iter_problem_windows)의
+        EQUATION 토큰을 문서 순서대로 반환 (중복 포함).
         """
-        if self.root is None:
-            return []
+        for note_text in endnotes:
+            ans_match = _ENDNOTE_ANSWER.search(note_text)
+            if ans_match:
+                yield ans_match.group(1).strip()
 
-        # 1. AUTONUM(Endnote) 위치 수집
-        # Phase 19-D: ENDNOTE 내 P 태그 제외 (본문 P 태그만 사용)
-        autonum_positions = []
-
-        # ENDNOTE 내 P 태그들을 먼저 수집 (제외 대상)
-        endnote_p_elements = set()
-        for endnote in self.root.iter('ENDNOTE'):
-            for p in endnote.iter('P'):
-                endnote_p_elements.add(p)
-
-        # ENDNOTE P 태그를 제외한 본문 P 태그만 수집
-        all_p_elements = [p for p in self.root.iter('P') if p not in endnote_p_elements]
-
-        for p_idx, p_elem in enumerate(all_p_elements):
-            for autonum in p_elem.iter('AUTONUM'):
-                if autonum.get('NumberType') == 'Endnote':
-                    num = int(autonum.get('Number', 0))
-                    autonum_positions.append({
-                        'number': num,
-                        'p_index': p_idx,
-                        'p_elem': p_elem
-                    })
+        visited = set()
+        for _, window in self._iter_problem_windows(self._get_autonum_positions()):
+            for p_idx in window:
+                if p_idx in visited:
+                    continue
+                visited.add(p_idx)
+                for kind, value in self._body_tokens[p_idx]:
+                    if kind == 'eq':
+                        yield value
 
-        # 번호순 정렬
-        autonum_positions.sort(key=lambda x: x['number'])
+    def _iter_problem_windows(self, autonum_positions: List[Dict]) -> Iterator[Tuple[Dict, range]]:
+        """
+        Phase 63-H: 문제별 본문 P 인덱스 범위
 
-        # 2. 각 문제의 본문 범위 결정
-        problem_contents = []
+        Phase 19-E: 문제 시작 3개 전부터 최대 20개 (다음 문제 시작 전까지)
+        """
+        body_count = len(self._body_tokens)
 
         for i, pos in enumerate(autonum_positions):
             # 현재 문제의 P 태그 인덱스
@@ -771,8 +1103,26 @@ class HMLParser(HangulParserBase):
             if i + 1 < len(autonum_positions):
                 end_idx = autonum_positions[i + 1]['p_index']
             else:
-                end_idx = len(all_p_elements)
+                end_idx = body_count
 
+            yield pos, range(max(0, start_idx - 3), min(end_idx, start_idx + 20))
+
+    def _find_problem_contents_by_autonum(self) -> List[Dict]:
+        """
+        Phase 19-C: AUTONUM 위치 기반 문제 본문 추출 (텍스트 + LaTeX)
+
+        Returns:
+            List[Dict]: 문제별 {'text': ..., 'latex': ..., 'equations': ..., 'equations_latex': ...}
+        """
+        # 1. AUTONUM(Endnote) 위치 (Phase 63-A: 스캔 중 수집, 번호순 정렬)
+        # Phase 19-D: ENDNOTE 내 P 태그 제외 (본문 P 태그만 사용)
+        autonum_positions = self._get_autonum_positions()
+        rendered = {}  # p_idx -> 렌더링 결과 (문제 범위가 겹치므로 재사용)
+
+        # 2. 각 문제의 본문 범위 결정 (Phase 63-H: _iter_problem_windows)
+        problem_contents = []
+
+        for _, window in self._iter_problem_windows(autonum_positions):
             # Phase 19-C: 텍스트와 LaTeX 모두 추출
             plain_parts = []
             latex_parts = []
@@ -782,10 +1132,11 @@ class HMLParser(HangulParserBase):
             seen_equations = set()
 
             # Phase 19-E: 범위 확장 (10 → 20) - 선택지 P 태그 포함
-            for p_idx in range(max(0, start_idx - 3), min(end_idx, start_idx + 20)):
+            for p_idx in window:
                 # 문제 시작 전후 일부 P 태그만 사용
-                plain_text, latex_text, hwp_eqs, latex_eqs = \
-                    self._get_paragraph_text_with_latex(all_p_elements[p_idx])
+                if p_idx not in rendered:
+                    rendered[p_idx] = self._render_paragraph(self._body_tokens[p_idx])
+                plain_text, latex_text, hwp_eqs, latex_eqs = rendered[p_idx]
                 if plain_text.strip():
                     plain_parts.append(plain_text.strip())
                     latex_parts.append(latex_text.strip())
@@ -1068,44 +1419,9 @@ class HMLParser(HangulParserBase):
         Returns:
             List[Dict]: [{'bin_id': '1', 'p_index': 42}, ...]
         """
-        if self.root is None:
-            return []
-
-        picture_locations = []
-
-        # ENDNOTE 내 P 태그들 제외
-        endnote_p_elements = set()
-        for endnote in self.root.iter('ENDNOTE'):
-            for p in endnote.iter('P'):
-                endnote_p_elements.add(p)
-
-        # 본문 P 태그만 수집 (인덱스와 함께)
-        all_p_elements = [p for p in self.root.iter('P') if p not in endnote_p_elements]
-
-        # 각 P 태그에서 PICTURE 찾기
-        for p_idx, p_elem in enumerate(all_p_elements):
-            for picture in p_elem.iter('PICTURE'):
-                # IMAGECT에서 BinItem ID 찾기
-                for imagect in picture.iter('IMAGECT'):
-                    bin_item_id = imagect.get('BinItem')
-                    if bin_item_id:
-                        picture_locations.append({
-                            'bin_id': bin_item_id,
-                            'p_index': p_idx
-                        })
-                        break  # 하나의 PICTURE당 하나의 이미지
-
-                # IMAGE 태그도 확인 (다른 HML 버전)
-                for image in picture.iter('IMAGE'):
-                    bin_item_id = image.get('BinItem') or image.get('BinData')
-                    if bin_item_id:
-                        picture_locations.append({
-                            'bin_id': bin_item_id,
-                            'p_index': p_idx
-                        })
-                        break
-
-        return picture_locations
+        # Phase 63-A: 단일 패스 스캔 중 수집 (본문 P 순서)
+        self._scan_document()
+        return list(self._picture_locations)
 
     def _get_autonum_positions(self) -> List[Dict]:
         """
@@ -1114,26 +1430,9 @@ class HMLParser(HangulParserBase):
         Returns:
             List[Dict]: [{'number': 1, 'p_index': 10}, ...]
         """
-        if self.root is None:
-            return []
-
-        # ENDNOTE 내 P 태그들 제외
-        endnote_p_elements = set()
-        for endnote in self.root.iter('ENDNOTE'):
-            for p in endnote.iter('P'):
-                endnote_p_elements.add(p)
-
-        all_p_elements = [p for p in self.root.iter('P') if p not in endnote_p_elements]
-
-        autonum_positions = []
-        for p_idx, p_elem in enumerate(all_p_elements):
-            for autonum in p_elem.iter('AUTONUM'):
-                if autonum.get('NumberType') == 'Endnote':
-                    num = int(autonum.get('Number', 0))
-                    autonum_positions.append({
-                        'number': num,
-                        'p_index': p_idx
-                    })
+        # Phase 63-A: 단일 패스 스캔 중 수집
+        self._scan_document()
+        autonum_positions = list(self._autonum_positions)
 
         # 번호순 정렬
         autonum_positions.sort(key=lambda x: x['number'])
@@ -1151,7 +1450,7 @@ class HMLParser(HangulParserBase):
 
         Args:
             problems: 파싱된 문제 리스트 (수정됨)
-            images: 추출된 이미지 Dict[bin_id -> {'data': bytes, 'format': str}]
+            images: 추출된 이미지 Dict[bin_id -> {'handle': BinDataHandle, 'format': str}]
         """
         if not problems or not images:
             return
@@ -1168,6 +1467,12 @@ class HMLParser(HangulParserBase):
         if not autonum_positions:
             return
 
+        # Phase 63-G: 문제 경계를 한 번만 정리 → PICTURE별 이진 탐색
+        boundaries = self._sorted_boundaries(autonum_positions)
+
+        # 문제별 이미 추가된 이미지 ID (list 검색 대신 집합으로 중복 확인)
+        assigned: Dict[int, set] = {}
+
         # 3. 각 PICTURE를 문제에 매핑
         for pic_loc in picture_locations:
             bin_id = pic_loc['bin_id']
@@ -1178,25 +1483,49 @@ class HMLParser(HangulParserBase):
                 continue
 
             # 해당 P 인덱스가 어느 문제 범위에 속하는지 찾기
-            problem_num = self._find_problem_for_position(pic_p_index, autonum_positions)
+            problem_num = self._find_problem_for_position(
+                pic_p_index, autonum_positions, boundaries
+            )
 
             if problem_num is not None and 1 <= problem_num <= len(problems):
                 problem = problems[problem_num - 1]
+                seen = assigned.get(problem_num)
+                if seen is None:
+                    seen = assigned[problem_num] = set(problem.content_images)
                 # 이미지 ID 추가 (중복 방지)
-                if bin_id not in problem.content_images:
+                if bin_id not in seen:
+                    seen.add(bin_id)
                     problem.content_images.append(bin_id)
 
+    @staticmethod
+    def _sorted_boundaries(autonum_positions: List[Dict]) -> Optional[List[int]]:
+        """
+        Phase 63-G: 문제 시작 P 인덱스 목록 (번호순으로 정렬된 경우만)
+
+        Returns:
+            P 인덱스가 번호순으로 단조 증가하면 그 목록, 아니면 None
+        """
+        boundaries = [pos['p_index'] for pos in autonum_positions]
+        for prev, cur in zip(boundaries, boundaries[1:]):
+            if cur < prev:
+                return None
+        return boundaries
+
     def _find_problem_for_position(
         self,
         p_index: int,
-        autonum_positions: List[Dict]
+        autonum_positions: List[Dict],
+        boundaries: Optional[List[int]] = None
     ) -> Optional[int]:
         """
         Phase 21-B: P 태그 인덱스가 어느 문제에 속하는지 찾기
 
+        Phase 63-G: 경계가 정렬되어 있으면 이진 탐색 (O(log n))
+
         Args:
             p_index: P 태그 인덱스
             autonum_positions: AUTONUM 위치 리스트
+            boundaries: _sorted_boundaries() 결과 (여러 번 호출 시 재사용)
 
         Returns:
             문제 번호 (1부터 시작) 또는 None
@@ -1204,7 +1533,18 @@ class HMLParser(HangulParserBase):
         if not autonum_positions:
             return None
 
-        # 각 문제의 시작 P 인덱스 확인
+        if boundaries is None:
+            boundaries = self._sorted_boundaries(autonum_positions)
+
+        if boundaries is not None:
+            # 문제 i의 범위: [시작 - 5, 다음 문제 시작)
+            # 범위가 겹치면 앞 문제가 우선이므로, p_index보다 큰 첫 시작 직전 문제가 후보
+            i = max(bisect_right(boundaries, p_index) - 1, 0)
+            if boundaries[i] - 5 <= p_index:
+                return autonum_positions[i]['number']
+            return None
+
+        # 경계가 정렬되지 않은 경우: 각 문제의 시작 P 인덱스 순차 확인
         for i, pos in enumerate(autonum_positions):
             start_idx = pos['p_index']
 
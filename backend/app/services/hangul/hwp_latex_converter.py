@@ -12,8 +12,22 @@ HWP 수식 문법:
 - sqrt: 제곱근 → \sqrt{}
 - leq/LEQ: ≤ → \leq
 - geq/GEQ: ≥ → \geq
+
+Phase 63-C: 변환 성능 개선
+- 명령어 매핑을 단일 정규식(alternation) 1회 스캔으로 처리
+- 모든 패턴 클래스 로드 시 1회 컴파일, 해당 키워드가 없는 단계는 건너뜀
+- 인스턴스별 LRU 캐시 (동일 수식 반복 변환 방지)
+- 개발 환경 mtime 확인 주기 제한
+
+Phase 63-H: 수식 일괄 변환 API
+- convert_equation_batch: 중복 제거 후 {원본: LaTeX} 매핑 반환
+- 고유 수식이 많으면 프로세스 풀로 청크 분산 (기본 변환기 사용 시)
+- 주입된 ILatexConverter는 convert_batch로 위임
 """
+import hashlib
 import re
+import time
+from functools import lru_cache
 from typing import Optional, List, Tuple
 
 
@@ -221,10 +235,23 @@ class HwpLatexConverter:
         'NABLA': r'\nabla',
     }
 
+    # Phase 63-C: 변환 결과 LRU 캐시 크기
+    CACHE_SIZE = 4096
+
+    # Phase 19-G: 장식 기호 목록
+    DECORATIONS = [
+        'overline', 'underline',  # 긴 장식
+        'bar', 'hat', 'vec', 'dot', 'ddot', 'tilde',
+        'check', 'acute', 'grave', 'breve', 'widehat', 'widetilde'
+    ]
+
     def __init__(self):
         # 정규식 패턴 미리 컴파일
         self._compile_patterns()
 
+        # Phase 63-C: 인스턴스별 LRU 캐시 (인스턴스 재생성 시 함께 폐기)
+        self._cached_convert = lru_cache(maxsize=self.CACHE_SIZE)(self._convert_uncached)
+
     def _compile_patterns(self):
         """자주 사용하는 패턴 미리 컴파일"""
         # rm 패턴: rm 뒤의 영문자/숫자 (Phase 20-P-2: 대소문자 무시)
@@ -239,6 +266,96 @@ class HwpLatexConverter:
         # Phase 20-P-2: 대소문자 무시 추가
         self.rm_negative_pattern = re.compile(r'\brm\s+-\s*(\d+)', re.IGNORECASE)
 
+        cls = type(self)
+        if '_command_pattern' not in cls.__dict__:
+            cls._compile_class_patterns()
+
+    @classmethod
+    def _compile_class_patterns(cls):
+        """
+        Phase 63-C: 클래스 공용 패턴 1회 컴파일
+
+        명령어 매핑은 긴 명령어 우선 alternation 하나로 결합.
+        각 명령어는 단어 경계에서 시작해 영문자 연속 구간 전체와 일치해야 하므로
+        (?![a-zA-Z]), 기존 명령어별 순차 치환과 결과가 동일하다.
+        """
+        sorted_commands = sorted(cls.COMMAND_MAP, key=len, reverse=True)
+        cls._command_pattern = re.compile(
+            r'(?<!\\)\b(' + '|'.join(re.escape(c) for c in sorted_commands) + r')(?![a-zA-Z])'
+        )
+
+        cls._cases_pattern = re.compile(r'\{cases\{([^}]*(?:\{[^}]*\}[^}]*)*)\}\}')
+
+        # 장식 기호별 (패턴, 치환) 목록 - 적용 순서 유지
+        cls._decoration_rules = []
+        for deco in cls.DECORATIONS:
+            mathrm = rf'\\{deco}{{\\mathrm{{\1}}}}'
+            cls._decoration_rules.append((deco, [
+                # 1. deco{{rm{ABC}} it } → \deco{\mathrm{ABC}}
+                # Phase 20-K: (?<!\\) 추가 - 이미 변환된 \deco 재매칭 방지
+                (re.compile(rf'(?<!\\)\b{deco}\s*\{{\{{rm\{{([^}}]*)\}}\}}\s*it\s*\}}'), mathrm),
+                # 2. deco{{rm{ABC}}} → \deco{\mathrm{ABC}}
+                (re.compile(rf'(?<!\\)\b{deco}\s*\{{\{{rm\{{([^}}]*)\}}\}}\}}'), mathrm),
+                # 3. deco{{ rm ABC it }} → \deco{\mathrm{ABC}}
+                (re.compile(rf'(?<!\\)\b{deco}\s*\{{\{{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}}\}}'), mathrm),
+                # 4. deco{ rm ABC it } → \deco{\mathrm{ABC}}
+                (re.compile(rf'(?<!\\)\b{deco}\s*\{{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}}'), mathrm),
+                # 단순 패턴: deco{...} → \deco{...}
+                # Phase 20-I: (?<!\\) 추가 - 이미 변환된 \deco 재매칭 방지
+                (re.compile(rf'(?<!\\)\b{deco}\s*\{{'), rf'\\{deco}{{'),
+                # Phase 20-H: 중괄호 없음 패턴 - decoABC → \deco{ABC}
+                (re.compile(rf'(?<!\\)\b{deco}([A-Za-z0-9]+)'), rf'\\{deco}{{\1}}'),
+            ]))
+
+        cls._bracket_rules = [
+            # LEFT ( → \left(
+            (re.compile(r'\bLEFT\s*\(\s*'), r'\\left( '),
+            (re.compile(r'\bRIGHT\s*\)\s*'), r' \\right)'),
+            # LEFT [ → \left[
+            (re.compile(r'\bLEFT\s*\[\s*'), r'\\left[ '),
+            (re.compile(r'\bRIGHT\s*\]\s*'), r' \\right]'),
+            # LEFT | → \left|  (절댓값)
+            (re.compile(r'\bLEFT\s*\|\s*'), r'\\left| '),
+            (re.compile(r'\bRIGHT\s*\|\s*'), r' \\right|'),
+            # LEFT { → \left\{
+            (re.compile(r'\bLEFT\s*\{\s*'), r'\\left\\{ '),
+            (re.compile(r'\bRIGHT\s*\}\s*'), r' \\right\\}'),
+            # 바닥/천장 함수
+            (re.compile(r'\bLEFT\s*⌊\s*'), r'\\left\\lfloor '),
+            (re.compile(r'\bRIGHT\s*⌋\s*'), r' \\right\\rfloor'),
+            (re.compile(r'\bLEFT\s*⌈\s*'), r'\\left\\lceil '),
+            (re.compile(r'\bRIGHT\s*⌉\s*'), r' \\right\\rceil'),
+        ]
+
+        cls._sqrt_pattern = re.compile(r'\bsqrt\s*\{', re.IGNORECASE)
+        # SUP/sup, SUB/sub 는 순차 치환 결과 유지를 위해 분리
+        cls._script_rules = [
+            (re.compile(r'\bSUP\s*'), '^'),
+            (re.compile(r'\bsup\s*'), '^'),
+            (re.compile(r'\bSUB\s*'), '_'),
+            (re.compile(r'\bsub\s*'), '_'),
+        ]
+
+        cls._font_brace_rules = [
+            # 1. {{rm{ABC}} it } → \mathrm{ABC} (이중 중괄호 + it 지시자)
+            re.compile(r'\{\{rm\{([^}]*)\}\}\s*it\s*\}'),
+            # 2. {rm{ABC}} → \mathrm{ABC} (단순 중괄호)
+            re.compile(r'\{rm\{([^}]*)\}\}'),
+            # 3. {rm{ABC} it } → \mathrm{ABC} (공백 포함)
+            re.compile(r'\{rm\{([^}]*)\}\s*it\s*\}'),
+            # 4. { rm ABC it } → \mathrm{ABC} (중괄호 안에 rm 공백 패턴)
+            re.compile(r'\{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}'),
+        ]
+        cls._rmbold_pattern = re.compile(r'\brmbold\s+([A-Za-z0-9]+)', re.IGNORECASE)
+        cls._it_word_pattern = re.compile(r'\bit\b')
+
+        cls._whitespace_pattern = re.compile(r'\s+')
+        cls._backslash_run_pattern = re.compile(r'\\{3,}')
+        cls._operator_pattern = re.compile(r'\s*([+=<>])\s*')
+        cls._minus_pattern = re.compile(r'(\S)\s*-\s*(\S)')
+        cls._brace_open_space_pattern = re.compile(r'\{\s+')
+        cls._brace_close_space_pattern = re.compile(r'\s+\}')
+
     def _find_balanced_braces(self, text: str, start: int) -> Tuple[int, int]:
         """
         Phase 20-O: 균형 잡힌 중괄호 쌍 찾기
@@ -275,6 +392,8 @@ class HwpLatexConverter:
         """
         HWP 수식을 LaTeX로 변환
 
+        Phase 63-C: 동일 수식은 LRU 캐시에서 반환
+
         Args:
             hwp_eq: HWP 수식 문자열
 
@@ -284,6 +403,20 @@ class HwpLatexConverter:
         if not hwp_eq or not hwp_eq.strip():
             return ""
 
+        return self._cached_convert(hwp_eq)
+
+    def cache_info(self) -> dict:
+        """Phase 63-C: 변환 캐시 통계"""
+        info = self._cached_convert.cache_info()
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'max_size': info.maxsize,
+        }
+
+    def _convert_uncached(self, hwp_eq: str) -> str:
+        """HWP 수식을 LaTeX로 변환 (캐시 없이 실제 변환)"""
         text = hwp_eq
 
         # 1. 전처리
@@ -331,13 +464,16 @@ class HwpLatexConverter:
             latex_rows = ' \\\\ '.join(row.strip() for row in rows)
             return f'\\begin{{cases}}{latex_rows}\\end{{cases}}'
 
+        if 'cases' not in text:
+            return text
+
         # 패턴: {cases{...}} - 중첩 중괄호 허용
-        pattern = r'\{cases\{([^}]*(?:\{[^}]*\}[^}]*)*)\}\}'
+        pattern = self._cases_pattern
 
         # 중첩 cases 처리를 위해 반복 적용
         for _ in range(3):
             prev = text
-            text = re.sub(pattern, replace_cases, text)
+            text = pattern.sub(replace_cases, text)
             if prev == text:
                 break
 
@@ -356,61 +492,13 @@ class HwpLatexConverter:
         tilde{x} → \\tilde{x}
         underline{x} → \\underline{x}
         """
-        # 장식 기호 목록
-        decorations = [
-            'overline', 'underline',  # 긴 장식
-            'bar', 'hat', 'vec', 'dot', 'ddot', 'tilde',
-            'check', 'acute', 'grave', 'breve', 'widehat', 'widetilde'
-        ]
-
-        for deco in decorations:
-            # === 복합 패턴 먼저 처리 (deco 안에 rm 패턴) ===
-
-            # 1. deco{{rm{ABC}} it } → \deco{\mathrm{ABC}}
-            # Phase 20-K: (?<!\\) 추가 - 이미 변환된 \deco 재매칭 방지
-            text = re.sub(
-                rf'(?<!\\)\b{deco}\s*\{{\{{rm\{{([^}}]*)\}}\}}\s*it\s*\}}',
-                rf'\\{deco}{{\\mathrm{{\1}}}}',
-                text
-            )
-
-            # 2. deco{{rm{ABC}}} → \deco{\mathrm{ABC}}
-            # Phase 20-K: (?<!\\) 추가 - 이미 변환된 \deco 재매칭 방지
-            text = re.sub(
-                rf'(?<!\\)\b{deco}\s*\{{\{{rm\{{([^}}]*)\}}\}}\}}',
-                rf'\\{deco}{{\\mathrm{{\1}}}}',
-                text
-            )
-
-            # 3. deco{{ rm ABC it }} → \deco{\mathrm{ABC}}
-            # Phase 20-K: (?<!\\) 추가 - 이미 변환된 \deco 재매칭 방지
-            text = re.sub(
-                rf'(?<!\\)\b{deco}\s*\{{\{{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}}\}}',
-                rf'\\{deco}{{\\mathrm{{\1}}}}',
-                text
-            )
-
-            # 4. deco{ rm ABC it } → \deco{\mathrm{ABC}}
-            # Phase 20-K: (?<!\\) 추가 - 이미 변환된 \deco 재매칭 방지
-            text = re.sub(
-                rf'(?<!\\)\b{deco}\s*\{{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}}',
-                rf'\\{deco}{{\\mathrm{{\1}}}}',
-                text
-            )
-
-            # === 단순 패턴: 중괄호 있음 ===
-            # deco{...} → \deco{...}
-            # Phase 20-I: (?<!\\) 추가 - 이미 변환된 \deco 재매칭 방지
-            pattern = rf'(?<!\\)\b{deco}\s*\{{'
-            replacement = rf'\\{deco}{{'
-            text = re.sub(pattern, replacement, text)
-
-            # === Phase 20-H: 중괄호 없음 패턴 추가 ===
-            # decoABC → \deco{ABC}
-            # 단, 이미 \deco로 변환된 것은 제외 (negative lookbehind)
-            pattern_no_brace = rf'(?<!\\)\b{deco}([A-Za-z0-9]+)'
-            replacement_no_brace = rf'\\{deco}{{\1}}'
-            text = re.sub(pattern_no_brace, replacement_no_brace, text)
+        # Phase 63-C: 장식 기호 이름이 없으면 해당 규칙 전체를 건너뜀
+        # (복합 패턴 → 단순 패턴 → 중괄호 없음 패턴 순서는 기존과 동일)
+        for deco, rules in self._decoration_rules:
+            if deco not in text:
+                continue
+            for pattern, replacement in rules:
+                text = pattern.sub(replacement, text)
 
         return text
 
@@ -423,33 +511,18 @@ class HwpLatexConverter:
         text = text.replace('~', ' ')
 
         # 여러 공백 정리
-        text = re.sub(r'\s+', ' ', text)
+        text = self._whitespace_pattern.sub(' ', text)
 
         return text.strip()
 
     def _convert_brackets(self, text: str) -> str:
         """LEFT/RIGHT 괄호 변환"""
-        # LEFT ( → \left(
-        text = re.sub(r'\bLEFT\s*\(\s*', r'\\left( ', text)
-        text = re.sub(r'\bRIGHT\s*\)\s*', r' \\right)', text)
-
-        # LEFT [ → \left[
-        text = re.sub(r'\bLEFT\s*\[\s*', r'\\left[ ', text)
-        text = re.sub(r'\bRIGHT\s*\]\s*', r' \\right]', text)
+        if 'LEFT' not in text and 'RIGHT' not in text:
+            return text
 
-        # LEFT | → \left|  (절댓값)
-        text = re.sub(r'\bLEFT\s*\|\s*', r'\\left| ', text)
-        text = re.sub(r'\bRIGHT\s*\|\s*', r' \\right|', text)
-
-        # LEFT { → \left\{
-        text = re.sub(r'\bLEFT\s*\{\s*', r'\\left\\{ ', text)
-        text = re.sub(r'\bRIGHT\s*\}\s*', r' \\right\\}', text)
-
-        # 바닥/천장 함수
-        text = re.sub(r'\bLEFT\s*⌊\s*', r'\\left\\lfloor ', text)
-        text = re.sub(r'\bRIGHT\s*⌋\s*', r' \\right\\rfloor', text)
-        text = re.sub(r'\bLEFT\s*⌈\s*', r'\\left\\lceil ', text)
-        text = re.sub(r'\bRIGHT\s*⌉\s*', r' \\right\\rceil', text)
+        # LEFT ( / [ / | / { / ⌊ / ⌈ → \left..., RIGHT ... → \right...
+        for pattern, replacement in self._bracket_rules:
+            text = pattern.sub(replacement, text)
 
         return text
 
@@ -554,21 +627,14 @@ class HwpLatexConverter:
 
     def _convert_sqrt(self, text: str) -> str:
         """제곱근 변환: sqrt{x} → \\sqrt{x}"""
-        # sqrt{...}
-        text = re.sub(r'\bsqrt\s*\{', r'\\sqrt{', text, flags=re.IGNORECASE)
-        # SQRT{...}
-        text = re.sub(r'\bSQRT\s*\{', r'\\sqrt{', text)
-        return text
+        # sqrt{...}, SQRT{...} (대소문자 무시)
+        return self._sqrt_pattern.sub(r'\\sqrt{', text)
 
     def _convert_scripts(self, text: str) -> str:
         """위첨자/아래첨자 처리"""
-        # SUP → ^
-        text = re.sub(r'\bSUP\s*', '^', text)
-        text = re.sub(r'\bsup\s*', '^', text)
-
-        # SUB → _
-        text = re.sub(r'\bSUB\s*', '_', text)
-        text = re.sub(r'\bsub\s*', '_', text)
+        # SUP → ^, SUB → _
+        for pattern, replacement in self._script_rules:
+            text = pattern.sub(replacement, text)
 
         return text
 
@@ -581,38 +647,10 @@ class HwpLatexConverter:
         bold X → \\mathbf{X}
         """
         # === Phase 19-G: 중괄호 패턴 먼저 처리 ===
-
-        # 1. {{rm{ABC}} it } → \mathrm{ABC}
-        # (이중 중괄호 + it 지시자)
-        text = re.sub(
-            r'\{\{rm\{([^}]*)\}\}\s*it\s*\}',
-            r'\\mathrm{\1}',
-            text
-        )
-
-        # 2. {rm{ABC}} → \mathrm{ABC}
-        # (단순 중괄호)
-        text = re.sub(
-            r'\{rm\{([^}]*)\}\}',
-            r'\\mathrm{\1}',
-            text
-        )
-
-        # 3. {rm{ABC} it } → \mathrm{ABC}
-        # (공백 포함)
-        text = re.sub(
-            r'\{rm\{([^}]*)\}\s*it\s*\}',
-            r'\\mathrm{\1}',
-            text
-        )
-
-        # 4. { rm ABC it } → \mathrm{ABC}
-        # (중괄호 안에 rm 공백 패턴)
-        text = re.sub(
-            r'\{\s*rm\s+([A-Za-z0-9]+)\s*it\s*\}',
-            r'\\mathrm{\1}',
-            text
-        )
+        # {{rm{ABC}} it }, {rm{ABC}}, {rm{ABC} it }, { rm ABC it } → \mathrm{ABC}
+        if 'rm' in text:
+            for pattern in self._font_brace_rules:
+                text = pattern.sub(r'\\mathrm{\1}', text)
 
         # === Phase 20-P: rm 음수 패턴 먼저 처리 ===
         # rm - 2 → -2, rm -3 → -3 (음수는 mathrm 없이 그대로)
@@ -635,7 +673,7 @@ class HwpLatexConverter:
                 return f'\\mathbf{{\\mathrm{{{content}}}}}'
             return ''
 
-        text = re.sub(r'\brmbold\s+([A-Za-z0-9]+)', replace_rmbold, text, flags=re.IGNORECASE)
+        text = self._rmbold_pattern.sub(replace_rmbold, text)
 
         # bold 처리
         def replace_bold(match):
@@ -648,7 +686,7 @@ class HwpLatexConverter:
 
         # it 제거 (수식에서 기본이 이탤릭)
         text = self.it_pattern.sub('', text)
-        text = re.sub(r'\bit\b', '', text)
+        text = self._it_word_pattern.sub('', text)
 
         return text
 
@@ -660,42 +698,29 @@ class HwpLatexConverter:
         - geq0 → \\geq 0
         - leq5 → \\leq 5
         """
-        # 긴 명령어 먼저 처리 (subseteq > subset 순서)
-        sorted_commands = sorted(
-            self.COMMAND_MAP.items(),
-            key=lambda x: len(x[0]),
-            reverse=True
-        )
-
-        for hwp_cmd, latex_cmd in sorted_commands:
-            # Phase 20-I: 이중 변환 버그 수정
-            # (?<!\\): 백슬래시 뒤에서는 매칭 안함 (이미 변환된 \geq 내의 geq 재매칭 방지)
-            # \b: 앞에 word boundary
-            # (?![a-zA-Z]): 뒤에 영문자가 아니면 매칭 (숫자, 공백, 연산자 OK)
-            pattern = r'(?<!\\)\b' + re.escape(hwp_cmd) + r'(?![a-zA-Z])'
-            # re.sub에서 백슬래시 이스케이프 필요
-            escaped_latex = latex_cmd.replace('\\', '\\\\')
-            text = re.sub(pattern, escaped_latex, text)
-
-        return text
+        # Phase 63-C: 긴 명령어 우선 alternation 1회 스캔 (subseteq > subset 순서)
+        # Phase 20-I: (?<!\\): 이미 변환된 \geq 내의 geq 재매칭 방지
+        # (?![a-zA-Z]): 뒤에 영문자가 아니면 매칭 (숫자, 공백, 연산자 OK)
+        command_map = self.COMMAND_MAP
+        return self._command_pattern.sub(lambda m: command_map[m.group(1)], text)
 
     def _postprocess(self, text: str) -> str:
         """후처리: 정리 및 최적화"""
         # 이중 백슬래시 정리 (\\\ → \\)
-        text = re.sub(r'\\{3,}', r'\\\\', text)
+        text = self._backslash_run_pattern.sub(r'\\\\', text)
 
         # 불필요한 공백 정리
-        text = re.sub(r'\s+', ' ', text)
+        text = self._whitespace_pattern.sub(' ', text)
 
         # 연산자 주변 공백 정리
         # Phase 20-P: 음수 보존 (-숫자는 그대로 유지)
         # 단, -가 숫자 앞에 붙어있는 경우 (음수)는 제외
-        text = re.sub(r'\s*([+=<>])\s*', r' \1 ', text)  # +, =, <, > 만 처리
-        text = re.sub(r'(\S)\s*-\s*(\S)', r'\1 - \2', text)  # - 주변 공백 (양쪽에 문자가 있을 때만)
+        text = self._operator_pattern.sub(r' \1 ', text)  # +, =, <, > 만 처리
+        text = self._minus_pattern.sub(r'\1 - \2', text)  # - 주변 공백 (양쪽에 문자가 있을 때만)
 
         # 중괄호 내부 공백 정리
-        text = re.sub(r'\{\s+', '{', text)
-        text = re.sub(r'\s+\}', '}', text)
+        text = self._brace_open_space_pattern.sub('{', text)
+        text = self._brace_close_space_pattern.sub('}', text)
 
         # 수식 앞뒤 공백 제거
         text = text.strip()
@@ -708,15 +733,48 @@ class HwpLatexConverter:
 # =============================================================================
 # 개발 환경: 파일 변경 시 자동으로 새 인스턴스 생성
 # 프로덕션: 싱글톤 유지 (성능 최적화)
+# Phase 63-C: 개발 환경 mtime 확인은 MTIME_CHECK_INTERVAL 초에 한 번만
 # =============================================================================
 
 import os as _os
-from typing import Optional as _Optional
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional as _Optional, Dict, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .interfaces import ILatexConverter
 
 # 싱글톤 관리 변수
 _converter: _Optional[HwpLatexConverter] = None
 _converter_file_mtime: float = 0
 
+# Phase 63-C: mtime 확인 주기 제한 (초)
+MTIME_CHECK_INTERVAL = 2.0
+_observed_file_mtime: float = 0
+_last_mtime_check: float = float('-inf')
+
+
+def _current_file_mtime() -> float:
+    """
+    Phase 63-C: 현재 파일 mtime (MTIME_CHECK_INTERVAL 동안 캐시)
+
+    Returns:
+        float: 마지막으로 확인한 파일 mtime (확인 실패 시 0)
+    """
+    global _observed_file_mtime, _last_mtime_check
+
+    now = time.monotonic()
+    if now - _last_mtime_check >= MTIME_CHECK_INTERVAL:
+        _last_mtime_check = now
+        try:
+            _observed_file_mtime = _os.path.getmtime(__file__)
+        except OSError:
+            _observed_file_mtime = 0
+
+    return _observed_file_mtime
+
 
 def _should_recreate_converter() -> bool:
     """
@@ -736,13 +794,10 @@ def _should_recreate_converter() -> bool:
     if app_env in ('prod', 'production'):
         return False
 
-    # 개발 환경: 파일 변경 시 재생성
-    try:
-        current_mtime = _os.path.getmtime(__file__)
-        if current_mtime != _converter_file_mtime:
-            return True
-    except OSError:
-        pass
+    # 개발 환경: 파일 변경 시 재생성 (Phase 63-C: 주기적으로만 stat)
+    current_mtime = _current_file_mtime()
+    if current_mtime and current_mtime != _converter_file_mtime:
+        return True
 
     return False
 
@@ -758,10 +813,7 @@ def _get_converter() -> HwpLatexConverter:
 
     if _should_recreate_converter():
         _converter = HwpLatexConverter()
-        try:
-            _converter_file_mtime = _os.path.getmtime(__file__)
-        except OSError:
-            _converter_file_mtime = 0
+        _converter_file_mtime = _current_file_mtime()
 
     return _converter
 
@@ -774,6 +826,8 @@ def hwp_to_latex(hwp_eq: str) -> str:
     - 개발 환경: 파일 변경 시 자동으로 새 인스턴스 사용
     - 프로덕션: 싱글톤 유지 (성능 최적화)
 
+    Phase 63-C: 인스턴스 LRU 캐시 사용 (동일 수식 재변환 없음)
+
     Args:
         hwp_eq: HWP 수식 문자열
 
@@ -797,13 +851,120 @@ def convert_equation_list(equations: List[str]) -> List[Tuple[str, str]]:
     """
     여러 수식을 일괄 변환
 
+    Phase 63-H: convert_equation_batch로 중복 제거 후 변환
+
     Args:
         equations: HWP 수식 문자열 리스트
 
     Returns:
         List[(원본, LaTeX)] 튜플 리스트
     """
-    return [(eq, hwp_to_latex(eq)) for eq in equations]
+    latex_map = convert_equation_batch(equations)
+    return [(eq, latex_map[eq]) for eq in equations]
+
+
+# =============================================================================
+# Phase 63-H: 수식 일괄 변환 (중복 제거 + 프로세스 풀 분산)
+# =============================================================================
+
+# 고유 수식이 이 개수 이상일 때만 프로세스 풀 사용 (작은 문서는 풀 오버헤드가 더 큼)
+BATCH_POOL_THRESHOLD = 2000
+# 워커 1회 작업 단위 (수식 개수)
+BATCH_CHUNK_SIZE = 500
+
+_batch_pool: _Optional[ProcessPoolExecutor] = None
+_batch_pool_lock = threading.Lock()
+
+
+def get_equation_workers() -> int:
+    """수식 변환 워커 수 (HANGUL_EQUATION_WORKERS 환경 변수, 기본: CPU 수, 최대 4)"""
+    env_value = _os.getenv('HANGUL_EQUATION_WORKERS')
+    if env_value:
+        return max(1, int(env_value))
+    return max(1, min(4, _os.cpu_count() or 1))
+
+
+def _get_batch_pool() -> ProcessPoolExecutor:
+    """수식 변환용 프로세스 풀 (최초 사용 시 생성)"""
+    global _batch_pool
+
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            _batch_pool = ProcessPoolExecutor(max_workers=get_equation_workers())
+        return _batch_pool
+
+
+def shutdown_equation_pool() -> None:
+    """수식 변환 프로세스 풀 종료 (서버 종료 시)"""
+    global _batch_pool
+
+    with _batch_pool_lock:
+        if _batch_pool is not None:
+            _batch_pool.shutdown(wait=False, cancel_futures=True)
+            _batch_pool = None
+
+
+def _convert_chunk(equations: List[str]) -> List[str]:
+    """워커 프로세스에서 실행: 청크 단위 변환 (워커별 싱글톤/캐시 사용)"""
+    return [hwp_to_latex(eq) for eq in equations]
+
+
+def _should_use_pool(unique_count: int) -> bool:
+    """
+    프로세스 풀 사용 여부
+
+    일괄 가져오기 워커처럼 이미 자식 프로세스 안에서 파싱 중이면
+    풀을 중첩 생성하지 않고 현재 프로세스에서 변환한다.
+    """
+    if unique_count < BATCH_POOL_THRESHOLD:
+        return False
+    if get_equation_workers() < 2:
+        return False
+    return multiprocessing.parent_process() is None
+
+
+def convert_equation_batch(
+    equations: Iterable[str],
+    converter: _Optional["ILatexConverter"] = None
+) -> Dict[str, str]:
+    """
+    Phase 63-H: 여러 수식을 중복 제거 후 일괄 변환
+
+    Args:
+        equations: HWP 수식 문자열 (중복 허용)
+        converter: 주입된 LaTeX 변환기 (None이면 기본 싱글톤 사용)
+
+    Returns:
+        Dict[원본, LaTeX] - 입력 순서대로 고유 수식만 포함
+    """
+    unique = list(dict.fromkeys(equations))
+    if not unique:
+        return {}
+
+    # 주입된 변환기: convert_batch 위임 (없으면 convert 반복)
+    if converter is not None:
+        convert_batch = getattr(converter, 'convert_batch', None)
+        if convert_batch is not None:
+            results = convert_batch(unique)
+        else:
+            results = [converter.convert(eq) for eq in unique]
+        return dict(zip(unique, results))
+
+    if _should_use_pool(len(unique)):
+        chunks = [
+            unique[i:i + BATCH_CHUNK_SIZE]
+            for i in range(0, len(unique), BATCH_CHUNK_SIZE)
+        ]
+        try:
+            results = []
+            for chunk_result in _get_batch_pool().map(_convert_chunk, chunks):
+                results.extend(chunk_result)
+            return dict(zip(unique, results))
+        except (BrokenProcessPool, OSError):
+            # 풀 사용 불가 (워커 비정상 종료 등) → 현재 프로세스에서 변환
+            shutdown_equation_pool()
+
+    return {eq: hwp_to_latex(eq) for eq in unique}
 
 
 def get_converter_instance() -> HwpLatexConverter:
@@ -816,19 +977,45 @@ def get_converter_instance() -> HwpLatexConverter:
     return _get_converter()
 
 
+@lru_cache(maxsize=32)
+def source_digest(path: str, mtime: float) -> str:
+    """
+    Phase 63-I: 소스 파일 내용 해시 (앞 12자리)
+
+    mtime을 캐시 키에 포함하므로 파일이 바뀌면 다시 계산한다.
+    """
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def get_converter_version() -> str:
+    """
+    Phase 63-I: 변환기 버전 (이 모듈 소스 내용 해시)
+
+    프로세스/인스턴스와 무관하게 같은 코드면 같은 값이므로
+    파싱 결과 캐시 키 등에 사용한다.
+    """
+    return source_digest(__file__, _os.path.getmtime(__file__))
+
+
 def get_converter_info() -> dict:
     """
     컨버터 상태 정보 반환 (디버깅용)
 
+    Phase 63-I: version 추가 (get_converter_version)
+
     Returns:
         dict: 컨버터 상태 정보
     """
     global _converter, _converter_file_mtime
 
     return {
+        'version': get_converter_version(),
         'instance_exists': _converter is not None,
         'instance_id': id(_converter) if _converter else None,
         'file_mtime': _converter_file_mtime,
         'current_file_mtime': _os.path.getmtime(__file__) if _os.path.exists(__file__) else None,
         'app_env': _os.getenv('APP_ENV', '(not set)'),
+        'mtime_check_interval': MTIME_CHECK_INTERVAL,
+        'cache': _converter.cache_info() if _converter else None,
     }
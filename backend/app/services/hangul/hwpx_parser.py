@@ -15,19 +15,43 @@ HWPX 파일 구조:
 Phase 17 추가:
 - 수식(equation) 추출 지원
 - Hancom Script → LaTeX 변환
+
+Phase 63-E 최적화:
+- 임시 디렉토리 압축 해제 없이 ZIP 멤버를 직접 읽음
+- section*.xml을 iterparse로 스트리밍 (문단 처리 후 서브트리 해제)
+- 수식은 스크립트별 1회만 변환 (LaTeX/Unicode 동시, LRU 캐시)
+- 전체 텍스트 결합 후 재분할 대신 문단 단위로 분할 지점 탐색
 """
 import zipfile
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional, Union
+from fnmatch import fnmatchcase
+from typing import List, Dict, Optional, Union, Iterator, Tuple
 from pathlib import Path
-import tempfile
-import shutil
 import re
-import os
 
 from .parser_base import HangulParserBase, ParseResult, ParsedProblem
 from .problem_extractor import ProblemExtractor
-from .equation_converter import hancom_to_latex, hancom_to_unicode
+from .equation_converter import hancom_convert
+
+
+# HWPX 문단 네임스페이스
+HP_NS = '{http://www.hancom.co.kr/hwpml/2011/paragraph}'
+
+# 문제 시작 패턴 (문단 분할 지점)
+PROBLEM_START_PATTERNS = [
+    r'(?=\d+\.\s)',          # 1. 2. 3.
+    r'(?=\d+\)\s)',          # 1) 2) 3)
+    r'(?=\[\d+\]\s)',        # [1] [2] [3]
+    r'(?=\d+-\d+\s)',        # 01-1, 01-2
+    r'(?=정답\s)',            # 정답
+    r'(?=\[정답\])',          # [정답]
+]
+
+# Phase 63-E: 결합된 분할 패턴 (모듈 로드 시 1회 컴파일)
+_SPLIT_PATTERN = re.compile('|'.join(PROBLEM_START_PATTERNS))
+
+# 아직 완성되지 않은 분할 패턴이 걸칠 수 있는 문자 (문단 경계 재탐색 범위 계산용)
+_PARTIAL_MATCH_CHARS = frozenset('0123456789.-)[]정답')
 
 
 class HWPXParser(HangulParserBase):
@@ -35,8 +59,10 @@ class HWPXParser(HangulParserBase):
 
     def __init__(self, file_path: str):
         super().__init__(file_path)
-        self.temp_dir = None
+        self.zip_file: Optional[zipfile.ZipFile] = None
         self.extractor = ProblemExtractor()
+        # Phase 63-E: 수식 변환 결과 [(LaTeX, Unicode)] - 본문에는 Unicode 사용
+        self.equations: List[Tuple[str, str]] = []
 
     def parse(self) -> ParseResult:
         """HWPX 파일 파싱"""
@@ -46,22 +72,17 @@ class HWPXParser(HangulParserBase):
         )
 
         try:
-            # 1. ZIP 압축 해제
-            self.temp_dir = tempfile.mkdtemp(prefix='hwpx_')
-
-            with zipfile.ZipFile(self.file_path, 'r') as zf:
-                zf.extractall(self.temp_dir)
+            # 1. ZIP 열기 (Phase 63-E: 압축 해제 없이 멤버 직접 읽기)
+            self.zip_file = zipfile.ZipFile(self.file_path, 'r')
 
             # 2. 텍스트 추출
             paragraphs = self.extract_text()
 
-            # 3. 이미지 추출
-            images = self.extract_images()
-
-            # 4. 메타데이터 추출
+            # 3. 메타데이터 추출
+            # (이미지는 결과에 포함되지 않으므로 extract_images()는 필요 시 별도 호출)
             result.detected_metadata = self._extract_metadata()
 
-            # 5. 문제 단위 분리
+            # 4. 문제 단위 분리
             result.problems = self.extractor.extract_problems(paragraphs)
 
             result.success = True
@@ -73,12 +94,21 @@ class HWPXParser(HangulParserBase):
             result.success = False
             result.errors.append(f"파싱 오류: {str(e)}")
         finally:
-            # 임시 디렉토리 정리
-            if self.temp_dir and os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
+            if self.zip_file is not None:
+                self.zip_file.close()
+                self.zip_file = None
 
         return result
 
+    def _section_members(self) -> List[str]:
+        """Contents/section*.xml 멤버 이름 (이름순)"""
+        return sorted(
+            name for name in self.zip_file.namelist()
+            if name.startswith('Contents/')
+            and '/' not in name[len('Contents/'):]
+            and fnmatchcase(name[len('Contents/'):], 'section*.xml')
+        )
+
     def extract_text(self) -> List[str]:
         """
         HWPX에서 문단 텍스트 추출
@@ -88,94 +118,119 @@ class HWPXParser(HangulParserBase):
         """
         paragraphs = []
 
-        if not self.temp_dir:
-            return paragraphs
-
-        # Contents 폴더에서 section*.xml 파일 찾기
-        contents_dir = Path(self.temp_dir) / 'Contents'
-
-        if not contents_dir.exists():
+        if self.zip_file is None:
             return paragraphs
 
         # section 파일들 순차 처리
-        section_files = sorted(contents_dir.glob('section*.xml'))
-
-        for section_file in section_files:
-            section_paragraphs = self._parse_section_file(section_file)
+        for member in self._section_members():
+            section_paragraphs = []
+            try:
+                section_paragraphs.extend(self._iter_section_paragraphs(member))
+            except ET.ParseError as e:
+                # 파싱 오류가 난 섹션은 통째로 제외
+                print(f"섹션 파싱 오류: {e}")
+                continue
             paragraphs.extend(section_paragraphs)
 
         return paragraphs
 
-    def _parse_section_file(self, section_path: Path) -> List[str]:
-        """섹션 XML 파일 파싱 (Phase 17: 수식 포함)"""
-        paragraphs = []
+    def _iter_section_paragraphs(self, member: str) -> Iterator[str]:
+        """
+        섹션 XML을 스트리밍하며 분할된 문단을 순서대로 반환 (Phase 63-E)
 
-        try:
-            tree = ET.parse(section_path)
-            root = tree.getroot()
-
-            # 네임스페이스 정의
-            ns = {'hp': 'http://www.hancom.co.kr/hwpml/2011/paragraph'}
-
-            # 문단(p) 요소 찾기
-            para_tag = '{http://www.hancom.co.kr/hwpml/2011/paragraph}p'
-            t_tag = '{http://www.hancom.co.kr/hwpml/2011/paragraph}t'
-            eq_tag = '{http://www.hancom.co.kr/hwpml/2011/paragraph}equation'
-            script_tag = '{http://www.hancom.co.kr/hwpml/2011/paragraph}script'
-
-            content_items = []
-
-            for para in root.iter(para_tag):
-                para_content = []
-
-                # 문단 내의 모든 요소를 순서대로 처리
-                for elem in para.iter():
-                    tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-
-                    if tag == 't' and elem.text:
-                        text = elem.text.strip()
-                        if text:
-                            para_content.append(text)
-
-                    elif tag == 'equation':
-                        # 수식 요소에서 script 추출
-                        script_elem = elem.find(f'.//{script_tag}')
-                        if script_elem is not None and script_elem.text:
-                            script = script_elem.text.strip()
-                            # LaTeX로 변환하여 저장
-                            latex = hancom_to_latex(script)
-                            unicode_text = hancom_to_unicode(script)
-                            # Unicode 버전을 텍스트에 포함
-                            para_content.append(unicode_text)
-
-                if para_content:
-                    content_items.append(' '.join(para_content))
-
-            # 문단들을 결합
-            if content_items:
-                full_text = ' '.join(content_items)
-                paragraphs = self._split_into_paragraphs(full_text)
-
-        except ET.ParseError as e:
-            print(f"섹션 파싱 오류: {e}")
+        문단(p)의 내용을 공백으로 이어 붙인 섹션 전체 텍스트를
+        문제 시작 패턴으로 분할한 결과와 동일합니다.
+        마지막 분할 지점 이후의 텍스트만 버퍼에 남겨 두고,
+        새 문단이 붙을 때 그 경계 근처부터만 분할 지점을 다시 찾습니다.
+        """
+        buffer = ''
+        first_item = True
+
+        for item in self._iter_section_items(member):
+            if first_item:
+                scan_from = 0
+                buffer = item
+                first_item = False
+            else:
+                # 경계 직전의 미완성 패턴 (예: "12." + " ...")이 완성될 수 있으므로
+                # 버퍼 끝의 후보 문자 구간부터 다시 탐색
+                scan_from = len(buffer)
+                while scan_from > 0 and buffer[scan_from - 1] in _PARTIAL_MATCH_CHARS:
+                    scan_from -= 1
+                buffer = f"{buffer} {item}"
+
+            cut = 0
+            for match in _SPLIT_PATTERN.finditer(buffer, scan_from):
+                position = match.start()
+                if position > cut:
+                    segment = buffer[cut:position].strip()
+                    if segment:
+                        yield segment
+                    cut = position
+            if cut:
+                buffer = buffer[cut:]
+
+        segment = buffer.strip()
+        if segment:
+            yield segment
+
+    def _iter_section_items(self, member: str) -> Iterator[str]:
+        """
+        섹션 XML의 문단(p)별 텍스트를 문서 순서대로 반환 (Phase 17: 수식 포함)
 
-        return paragraphs
+        중첩 문단(표 안의 문단 등)은 기존과 같이 바깥 문단과 별도로 한 번 더 반환합니다.
+        가장 바깥 문단이 끝나면 처리 후 서브트리를 해제합니다.
+        """
+        para_tag = f'{HP_NS}p'
+        para_depth = 0
+
+        with self.zip_file.open(member) as section_stream:
+            for event, elem in ET.iterparse(section_stream, events=('start', 'end')):
+                if elem.tag != para_tag:
+                    continue
+                if event == 'start':
+                    para_depth += 1
+                    continue
+
+                para_depth -= 1
+                if para_depth:
+                    continue
+
+                # 가장 바깥 문단: 서브트리의 모든 문단을 문서 순서대로 처리
+                for para in elem.iter(para_tag):
+                    content = self._get_paragraph_content(para)
+                    if content:
+                        yield content
+                elem.clear()
+
+    def _get_paragraph_content(self, para: ET.Element) -> str:
+        """문단 내의 모든 요소를 순서대로 처리하여 텍스트 생성"""
+        script_tag = f'{HP_NS}script'
+        para_content = []
+
+        for elem in para.iter():
+            tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+
+            if tag == 't' and elem.text:
+                text = elem.text.strip()
+                if text:
+                    para_content.append(text)
+
+            elif tag == 'equation':
+                # 수식 요소에서 script 추출
+                script_elem = elem.find(f'.//{script_tag}')
+                if script_elem is not None and script_elem.text:
+                    script = script_elem.text.strip()
+                    # Phase 63-E: LaTeX/Unicode 1회 변환 (캐시), Unicode 버전을 텍스트에 포함
+                    latex, unicode_text = hancom_convert(script)
+                    self.equations.append((latex, unicode_text))
+                    para_content.append(unicode_text)
+
+        return ' '.join(para_content)
 
     def _split_into_paragraphs(self, full_text: str) -> List[str]:
         """전체 텍스트를 문단으로 분할"""
-        # 문제 시작 패턴
-        problem_patterns = [
-            r'(?=\d+\.\s)',          # 1. 2. 3.
-            r'(?=\d+\)\s)',          # 1) 2) 3)
-            r'(?=\[\d+\]\s)',        # [1] [2] [3]
-            r'(?=\d+-\d+\s)',        # 01-1, 01-2
-            r'(?=정답\s)',            # 정답
-            r'(?=\[정답\])',          # [정답]
-        ]
-
-        # 결합된 패턴으로 분할
-        combined_pattern = '|'.join(problem_patterns)
-        segments = re.split(combined_pattern, full_text)
+        segments = _SPLIT_PATTERN.split(full_text)
 
         # 빈 세그먼트 제거 및 정리
         paragraphs = [s.strip() for s in segments if s and s.strip()]
@@ -191,23 +246,21 @@ class HWPXParser(HangulParserBase):
         """
         images = {}
 
-        if not self.temp_dir:
-            return images
-
-        # BinData 폴더 확인
-        bindata_dir = Path(self.temp_dir) / 'BinData'
-
-        if not bindata_dir.exists():
+        if self.zip_file is None:
             return images
 
-        # 이미지 파일 읽기
+        # 이미지 파일 읽기 (BinData 폴더 바로 아래)
         image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'}
 
-        for file_path in bindata_dir.iterdir():
-            if file_path.suffix.lower() in image_extensions:
+        for name in self.zip_file.namelist():
+            if not name.startswith('BinData/'):
+                continue
+            member_name = name[len('BinData/'):]
+            if not member_name or '/' in member_name:
+                continue
+            if Path(member_name).suffix.lower() in image_extensions:
                 try:
-                    with open(file_path, 'rb') as f:
-                        images[file_path.name] = f.read()
+                    images[member_name] = self.zip_file.read(name)
                 except Exception:
                     pass
 
@@ -217,15 +270,14 @@ class HWPXParser(HangulParserBase):
         """문서 메타데이터 추출"""
         metadata = {}
 
-        if not self.temp_dir:
+        if self.zip_file is None:
             return metadata
 
         # header.xml에서 메타데이터 추출 시도
-        header_path = Path(self.temp_dir) / 'Contents' / 'header.xml'
-
-        if header_path.exists():
+        if 'Contents/header.xml' in self.zip_file.NameToInfo:
             try:
-                tree = ET.parse(header_path)
+                with self.zip_file.open('Contents/header.xml') as header_stream:
+                    tree = ET.parse(header_stream)
                 root = tree.getroot()
 
                 # 제목 등 메타데이터 추출
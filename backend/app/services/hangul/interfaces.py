@@ -6,7 +6,7 @@ HWP 수식 변환 서비스의 추상 인터페이스 정의
 - 의존성 역전 원칙(DIP) 적용
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 
 class ILatexConverter(ABC):
@@ -44,6 +44,20 @@ class ILatexConverter(ABC):
         """
         pass
 
+    def convert_batch(self, equations: List[str]) -> List[str]:
+        """Phase 63-H: 여러 수식을 한 번에 변환
+
+        기본 구현은 convert를 순서대로 호출한다.
+        일괄 처리가 유리한 구현체는 재정의할 수 있다.
+
+        Args:
+            equations: HWP 수식 문자열 리스트 (중복 제거된 상태로 전달됨)
+
+        Returns:
+            입력과 같은 순서의 LaTeX 문자열 리스트
+        """
+        return [self.convert(eq) for eq in equations]
+
 
 class IEquationCleaner(ABC):
     """수식 정리기 인터페이스
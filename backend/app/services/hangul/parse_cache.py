@@ -0,0 +1,262 @@
+"""
+Phase 63-I: 한글 파싱 결과 캐시 (내용 주소 기반)
+
+같은 HML/HWPX 파일을 다시 업로드하면 XML 파싱, LaTeX 변환, 이미지 추출을
+다시 하지 않고 디스크에 저장된 결과를 돌려준다.
+
+- 키: 업로드 파일 SHA-256 + 확장자 + 변환기 버전 (get_converter_info()['version'])
+      + 파서 소스 버전 (파서 코드가 바뀌면 이전 결과는 자동으로 무효)
+- 위치: DATASET_ROOT/hangul_parse_cache/<key>/ (result.json + images/)
+- 용량 기반 LRU: 항목 디렉토리 mtime을 최근 사용 시각으로 사용
+- 항목은 임시 디렉토리에 만든 뒤 rename으로 게시하므로
+  여러 워커 프로세스가 동시에 읽고 써도 반쯤 쓰인 항목은 보이지 않음
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .hwp_latex_converter import get_converter_info, source_digest
+
+
+# 캐시 항목 형식 버전 (result.json 구조가 바뀌면 올림)
+CACHE_FORMAT_VERSION = 1
+
+# 파일 해시 계산 청크 크기
+HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# 게시되지 못한 임시 항목 정리 기준 (초)
+STALE_TEMP_SECONDS = 3600
+
+RESULT_FILE = 'result.json'
+IMAGES_DIR = 'images'
+
+# 결과에 영향을 주는 파서 모듈 (변환기 버전과 함께 키에 포함)
+_PARSER_SOURCES = (
+    'hml_parser.py',
+    'hwpx_parser.py',
+    'problem_extractor.py',
+    'equation_converter.py',
+    'parser_base.py',
+)
+
+
+def file_sha256(file_path: Path) -> str:
+    """파일 SHA-256 (청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parser_version() -> str:
+    """변환기 버전 + 파서 소스 버전"""
+    module_dir = Path(__file__).parent
+    digests = [get_converter_info()['version']]
+    for name in _PARSER_SOURCES:
+        path = module_dir / name
+        digests.append(source_digest(str(path), path.stat().st_mtime))
+    return hashlib.sha256(':'.join(digests).encode()).hexdigest()[:16]
+
+
+def cache_key(file_hash: str, file_ext: str) -> str:
+    """캐시 키 (파일 해시 + 확장자 + 버전)"""
+    raw = f"{CACHE_FORMAT_VERSION}:{file_ext.lower()}:{parser_version()}:{file_hash}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """하드 링크 (같은 파일 시스템) 또는 복사"""
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+class ParseResultCache:
+    """
+    Phase 63-I: 디스크 기반 파싱 결과 캐시
+
+    result.json에는 ParseResult.to_dict() 결과를 저장하되
+    세션별 값(image_urls, session_id, 문제 id)은 빼고 이미지 파일 목록만 남긴다.
+    조회 시 새 세션 ID로 이미지를 images_dir에 연결하고 문제 id를 새로 발급한다.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def get(self, key: str, images_dir: Path, file_name: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시 조회
+
+        Args:
+            key: cache_key() 결과
+            images_dir: 이미지를 연결할 임시 이미지 디렉토리
+            file_name: 이번 업로드 파일명 (결과의 file_name 대체)
+
+        Returns:
+            parse_file_to_dict와 같은 형식의 결과, 없으면 None
+        """
+        entry_dir = self._entry_dir(key)
+        try:
+            with open(entry_dir / RESULT_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        result = cached['result']
+        result['file_name'] = file_name
+        for problem in result.get('problems', []):
+            problem['id'] = str(uuid.uuid4())
+
+        image_files = cached.get('image_files') or {}
+        if image_files:
+            images_dir = Path(images_dir)
+            images_dir.mkdir(parents=True, exist_ok=True)
+            session_id = str(uuid.uuid4())[:8]
+
+            image_urls = {}
+            try:
+                for bin_id, cached_name in image_files.items():
+                    img_filename = f"{session_id}_{cached_name}"
+                    _link_or_copy(entry_dir / IMAGES_DIR / cached_name, images_dir / img_filename)
+                    image_urls[bin_id] = f"/api/hangul/images/{img_filename}"
+            except OSError:
+                # 정리 중인 항목 등 - 캐시 미스로 처리
+                return None
+
+            result['detected_metadata']['image_urls'] = image_urls
+            result['detected_metadata']['session_id'] = session_id
+
+        # LRU: 최근 사용 시각 갱신
+        try:
+            os.utime(entry_dir)
+        except OSError:
+            pass
+
+        result['detected_metadata']['cache_hit'] = True
+        return result
+
+    def put(self, key: str, result: Dict[str, Any], images_dir: Path) -> None:
+        """
+        파싱 결과 저장 (성공한 결과만)
+
+        Args:
+            key: cache_key() 결과
+            result: parse_file_to_dict 결과
+            images_dir: result의 image_urls 파일이 있는 디렉토리
+        """
+        if not result.get('success'):
+            return
+
+        entry_dir = self._entry_dir(key)
+        if entry_dir.exists():
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_dir = self.cache_dir / f".tmp-{uuid.uuid4().hex}"
+
+        try:
+            cached_result = json.loads(json.dumps(result, ensure_ascii=False))
+            metadata = cached_result.get('detected_metadata', {})
+            image_urls = metadata.pop('image_urls', None) or {}
+            session_id = metadata.pop('session_id', None)
+            metadata.pop('cache_hit', None)
+
+            (temp_dir / IMAGES_DIR).mkdir(parents=True)
+            image_files = {}
+            for bin_id, url in image_urls.items():
+                img_filename = url.rsplit('/', 1)[-1]
+                cached_name = img_filename[len(session_id) + 1:] if session_id else img_filename
+                _link_or_copy(Path(images_dir) / img_filename, temp_dir / IMAGES_DIR / cached_name)
+                image_files[bin_id] = cached_name
+
+            with open(temp_dir / RESULT_FILE, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {'result': cached_result, 'image_files': image_files},
+                    f, ensure_ascii=False
+                )
+
+            # 게시 (다른 워커가 먼저 게시했으면 그쪽 유지)
+            os.rename(temp_dir, entry_dir)
+        except OSError:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return
+
+        self.evict()
+
+    def _entries(self):
+        """(mtime, 크기, 경로) 목록 - 임시 항목은 제외 (오래된 것은 정리)"""
+        entries = []
+        now = time.time()
+
+        try:
+            dir_entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return entries
+
+        for entry in dir_entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+
+            if entry.name.startswith('.'):
+                if now - mtime > STALE_TEMP_SECONDS:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                continue
+
+            size = 0
+            for root, _, files in os.walk(entry.path):
+                for name in files:
+                    try:
+                        size += os.stat(os.path.join(root, name)).st_size
+                    except OSError:
+                        pass
+            entries.append((mtime, size, entry.path))
+
+        return entries
+
+    def evict(self) -> int:
+        """
+        총 용량이 max_bytes를 넘으면 오래 사용하지 않은 항목부터 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            removed += 1
+
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태 (항목 수, 총 용량)"""
+        entries = self._entries()
+        return {
+            'entries': len(entries),
+            'total_bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -1,6 +1,10 @@
 """
 Phase 16-4: 문제/정답/해설 분리 알고리즘
 Phase 19: [출제의도] 패턴 및 내신 시험지 형식 지원
+Phase 63-F: 패턴 사전 컴파일 + 단일 스캔 분류
+- 문제 번호 패턴: 이름 그룹 alternation 1개로 매칭 (목록 순서 우선순위 유지)
+- 문서 패턴 감지: 리터럴 태그는 str.count, 나머지는 리터럴로 시작하는 패턴으로 1회씩 탐색
+- 정답/해설/배점: 필수 리터럴이 없는 문단은 정규식 없이 건너뜀
 """
 import re
 from typing import List, Optional, Tuple
@@ -105,25 +109,24 @@ class ProblemExtractor:
             'section': 섹션 분리 (문제들 / 정답들)
             'default': 기본 패턴
         """
+        # Phase 63-F: 태그 집계 (_count_document_tags)
+        counts = self._count_document_tags(full_text)
+
         # Phase 19: [출제의도] 형식 감지
-        purpose_count = len(re.findall(r'\[출제의도\]', full_text))
-        if purpose_count > 3:
+        if counts['purpose'] > 3:
             return 'purpose'
 
         # [정답] 태그 인라인 여부
-        inline_count = len(re.findall(r'\[정답\]', full_text))
+        inline_count = counts['inline']
 
         # [X.XX점] 배점 태그 수
-        points_count = len(re.findall(r'\[\d+\.?\d*점\]', full_text))
+        points_count = counts['points']
 
         # 문제 번호 패턴 존재 여부 (1. 또는 1) 또는 문제 1 등)
-        has_problem_numbers = bool(re.search(r'(?:^|\n)\s*\d+[\.\)]\s', full_text))
+        has_problem_numbers = counts['problem_number']
 
         # 섹션 분리 여부
-        has_section = bool(re.search(
-            r'(정답\s*(및|과)?\s*해설|빠른\s*정답|정답표)',
-            full_text
-        ))
+        has_section = counts['section']
 
         if has_section:
             return 'section'
@@ -135,6 +138,34 @@ class ProblemExtractor:
         else:
             return 'default'
 
+    def _count_document_tags(self, full_text: str) -> dict:
+        """
+        Phase 63-F: 문서 패턴 감지용 태그 집계
+
+        - 고정 문자열 태그는 str.count
+        - 존재 여부만 필요한 패턴은 첫 매칭에서 중단
+        - 필수 리터럴이 없으면 정규식 생략
+
+        (태그 이름 그룹을 하나의 alternation으로 묶어 finditer 하는 방식은
+         공통 접두어가 없어 CPython re에서 오히려 수 배 느렸음)
+
+        Returns:
+            dict: purpose/inline/points 개수, problem_number/section 존재 여부
+        """
+        has_section = False
+        if '정답' in full_text:
+            has_section = _SECTION_RE.search(full_text) is not None
+            if not has_section and '빠른' in full_text:
+                has_section = _QUICK_ANSWER_RE.search(full_text) is not None
+
+        return {
+            'purpose': full_text.count('[출제의도]'),
+            'inline': full_text.count('[정답]'),
+            'points': len(_POINTS_TAG_RE.findall(full_text)) if '점]' in full_text else 0,
+            'problem_number': _PROBLEM_NUMBER_RE.search(full_text) is not None,
+            'section': has_section,
+        }
+
     def _extract_purpose_pattern(self, paragraphs: List[str]) -> List[ParsedProblem]:
         """
         Phase 19: [출제의도] 형식 추출 (내신 시험지)
@@ -150,7 +181,7 @@ class ProblemExtractor:
 
         # [출제의도] 기준으로 분할
         # 첫 번째 [출제의도] 전의 내용은 헤더로 무시
-        purpose_splits = re.split(r'\[출제의도\]', full_text)
+        purpose_splits = _PURPOSE_TAG_RE.split(full_text)
 
         problem_number = 0
         for i, segment in enumerate(purpose_splits):
@@ -168,20 +199,20 @@ class ProblemExtractor:
             problem = ParsedProblem(number=str(problem_number))
 
             # 정답 추출
-            ans_match = re.search(r'\[정답\]\s*([①②③④⑤]|\d)', segment)
+            ans_match = _INLINE_ANSWER_RE.search(segment)
             if ans_match:
                 problem.answer = ans_match.group(1)
                 problem.answer_type = self._detect_answer_type(problem.answer)
 
             # 배점 추출
-            points_match = re.search(r'\[(\d+\.?\d*)점\]', segment)
+            points_match = _POINTS_VALUE_RE.search(segment)
             if points_match:
                 problem.points = float(points_match.group(1))
 
             # 내용 추출 (정답, 배점 태그 제거)
             content = segment
             content = re.sub(r'\[정답\]\s*[①②③④⑤\d]', '', content)
-            content = re.sub(r'\[\d+\.?\d*점\]', '', content)
+            content = _POINTS_TAG_RE.sub('', content)
             content = content.strip()
 
             # [출제의도] 태그를 문제 내용 앞에 다시 추가
@@ -208,9 +239,8 @@ class ProblemExtractor:
 
         # [X.XX점] 기준으로 분할
         # 각 세그먼트가 하나의 문제
-        points_pattern = r'\[\d+\.?\d*점\]'
-        segments = re.split(points_pattern, full_text)
-        points_matches = re.findall(points_pattern, full_text)
+        segments = _POINTS_TAG_RE.split(full_text)
+        points_matches = _POINTS_TAG_RE.findall(full_text)
 
         problem_number = 0
         for i, segment in enumerate(segments):
@@ -233,7 +263,7 @@ class ProblemExtractor:
             problem = ParsedProblem(number=str(problem_number))
 
             # 정답 추출
-            ans_match = re.search(r'\[정답\]\s*([①②③④⑤]|\d)', segment)
+            ans_match = _INLINE_ANSWER_RE.search(segment)
             if ans_match:
                 problem.answer = ans_match.group(1)
                 problem.answer_type = self._detect_answer_type(problem.answer)
@@ -241,7 +271,7 @@ class ProblemExtractor:
             # 배점 추출 (이전 매치에서)
             if i < len(points_matches):
                 points_text = points_matches[i]
-                points_value = re.search(r'\[(\d+\.?\d*)점\]', points_text)
+                points_value = _POINTS_VALUE_RE.search(points_text)
                 if points_value:
                     problem.points = float(points_value.group(1))
 
@@ -252,15 +282,12 @@ class ProblemExtractor:
 
             # 문제 텍스트 중 질문 부분만 추출 시도
             # 보통 "~의 값은?" 또는 "~을 구하시오" 등으로 끝남
-            question_match = re.search(
-                r'([^①②③④⑤]+(?:은\?|는\?|시오\.?|하라\.?|가\?|을\?|를\?))',
-                content
-            )
+            question_match = _QUESTION_END_RE.search(content)
             if question_match:
                 problem.content_text = question_match.group(1).strip()
             else:
                 # 보기 이전까지만 추출
-                choice_start = re.search(r'[①②③④⑤]', content)
+                choice_start = _CHOICE_RE.search(content)
                 if choice_start:
                     problem.content_text = content[:choice_start.start()].strip()
                 else:
@@ -301,17 +328,15 @@ class ProblemExtractor:
                 continue
 
             # 배점 감지
-            points_match = re.search(self.POINTS_PATTERN, para)
+            points_match = _POINTS_RE.search(para) if '점]' in para else None
             if points_match and current_problem:
                 current_problem.points = float(points_match.group(1))
                 continue
 
             # 해설 감지
-            for pattern in self.EXPLANATION_PATTERNS:
-                exp_match = re.search(pattern, para, re.DOTALL)
-                if exp_match and current_problem:
-                    current_problem.explanation = exp_match.group(1).strip()
-                    break
+            explanation = self._match_explanation(para)
+            if explanation is not None and current_problem:
+                current_problem.explanation = explanation
 
             # 현재 문제에 내용 추가
             if current_problem and not ans_match:
@@ -328,16 +353,10 @@ class ProblemExtractor:
         """섹션 분리 패턴 추출 (문제부/정답부 분리)"""
         full_text = '\n'.join(paragraphs)
 
-        # 정답 섹션 찾기
-        section_markers = [
-            r'정답\s*(및|과)?\s*해설',
-            r'빠른\s*정답',
-            r'정답표',
-        ]
-
+        # 정답 섹션 찾기 (_SECTION_MARKER_RES 순서대로)
         split_pos = None
-        for marker in section_markers:
-            match = re.search(marker, full_text)
+        for marker in _SECTION_MARKER_RES:
+            match = marker.search(full_text)
             if match:
                 split_pos = match.start()
                 break
@@ -348,7 +367,7 @@ class ProblemExtractor:
 
             # Phase 19: 정답 섹션이 실제로 정답을 포함하는지 확인
             # 정답 섹션에 "1. ②" 같은 패턴이 있어야 유효
-            has_answer_list = bool(re.search(r'\d+\.\s*[①②③④⑤]', answer_text))
+            has_answer_list = bool(_ANSWER_LIST_RE.search(answer_text))
 
             if has_answer_list:
                 # 문제부 파싱
@@ -364,8 +383,8 @@ class ProblemExtractor:
                 # 문제부에서 인라인 정답/배점 기반으로 추출
                 # [정답]과 [X.XX점] 태그가 있는지 확인
                 problem_paragraphs = problem_text.split('\n')
-                inline_count = len(re.findall(r'\[정답\]', problem_text))
-                points_count = len(re.findall(r'\[\d+\.?\d*점\]', problem_text))
+                inline_count = problem_text.count('[정답]')
+                points_count = len(_POINTS_TAG_RE.findall(problem_text))
 
                 if inline_count > 5 and points_count > 5:
                     # 배점 기반 추출 사용
@@ -440,8 +459,7 @@ class ProblemExtractor:
         """정답 섹션에서 각 문제에 정답 매칭"""
         # 번호-정답 쌍 추출
         # 예: 1. ② 2. ④ 3. 15
-        answer_pattern = r'(\d+)\.\s*([①②③④⑤]|\d+|.+?)(?=\s*\d+\.|$)'
-        matches = re.findall(answer_pattern, answer_text)
+        matches = _SECTION_ANSWER_PAIR_RE.findall(answer_text)
 
         answer_map = {m[0]: m[1].strip() for m in matches}
 
@@ -451,27 +469,45 @@ class ProblemExtractor:
                 problem.answer_type = self._detect_answer_type(problem.answer)
 
     def _match_problem_start(self, text: str) -> Optional[PatternMatch]:
-        """문제 시작 패턴 매칭"""
-        for pattern, pattern_type in self.PROBLEM_PATTERNS:
-            match = re.match(pattern, text.strip())
-            if match:
-                # 서브 문제 (01-1 등) 처리
-                if pattern_type == 'sub':
-                    value = f"{match.group(1)}-{match.group(2)}"
-                else:
-                    value = match.group(1)
+        """
+        문제 시작 패턴 매칭
 
-                return PatternMatch(
-                    pattern_type=pattern_type,
-                    match=match,
-                    value=value
-                )
-        return None
+        Phase 63-F: PROBLEM_PATTERNS 전체를 alternation 1회로 매칭
+        (목록 앞쪽 패턴 우선 - 기존 순차 매칭과 동일)
+        """
+        match = _PROBLEM_START_RE.match(text.strip())
+        if not match:
+            return None
+
+        pattern_type = match.lastgroup
+        group_index, group_count = _PROBLEM_START_GROUPS[pattern_type]
+
+        # 서브 문제 (01-1 등) 처리
+        if pattern_type == 'sub':
+            value = f"{match.group(group_index + 1)}-{match.group(group_index + 2)}"
+        elif group_count:
+            value = match.group(group_index + 1)
+        else:
+            # 번호 그룹이 없는 패턴 ([출제의도])
+            value = ''
+
+        return PatternMatch(
+            pattern_type=pattern_type,
+            match=match,
+            value=value
+        )
 
     def _match_answer(self, text: str) -> Optional[PatternMatch]:
-        """정답 패턴 매칭"""
-        for pattern, pattern_type in self.ANSWER_PATTERNS:
-            match = re.search(pattern, text)
+        """
+        정답 패턴 매칭
+
+        Phase 63-F: 모든 정답 패턴에 '정답'이 포함되므로 없으면 바로 건너뜀
+        """
+        if '정답' not in text:
+            return None
+
+        for pattern, pattern_type in _ANSWER_RES:
+            match = pattern.search(text)
             if match:
                 return PatternMatch(
                     pattern_type=pattern_type,
@@ -491,11 +527,24 @@ class ProblemExtractor:
             problem.answer_type = self._detect_answer_type(problem.answer)
 
             # 해설도 추출 시도
-            for pattern in self.EXPLANATION_PATTERNS:
-                exp_match = re.search(pattern, problem.content_text, re.DOTALL)
-                if exp_match:
-                    problem.explanation = exp_match.group(1).strip()
-                    break
+            explanation = self._match_explanation(problem.content_text)
+            if explanation is not None:
+                problem.explanation = explanation
+
+    def _match_explanation(self, text: str) -> Optional[str]:
+        """
+        해설 패턴 매칭 (첫 번째로 매칭되는 패턴의 내용)
+
+        Phase 63-F: 모든 해설 패턴에 '해설' 또는 '풀이'가 포함되므로 없으면 바로 건너뜀
+        """
+        if '해설' not in text and '풀이' not in text:
+            return None
+
+        for pattern in _EXPLANATION_RES:
+            exp_match = pattern.search(text)
+            if exp_match:
+                return exp_match.group(1).strip()
+        return None
 
     def _detect_answer_type(self, answer: str) -> str:
         """정답 유형 판별"""
@@ -511,7 +560,7 @@ class ProblemExtractor:
             return 'choice'
 
         # 숫자 값
-        if re.match(r'^-?\d+\.?\d*$', answer):
+        if _NUMERIC_ANSWER_RE.match(answer):
             return 'value'
 
         # 수식 (LaTeX 형태)
@@ -520,3 +569,66 @@ class ProblemExtractor:
 
         # 기본: 값
         return 'value'
+
+
+def _compile_problem_start(patterns: List[Tuple[str, str]]) -> Tuple[re.Pattern, dict]:
+    """
+    Phase 63-F: 문제 번호 패턴들을 이름 그룹 alternation 하나로 컴파일
+
+    모든 패턴이 ^로 고정되어 있으므로 alternation의 앞선 분기 우선 규칙이
+    목록 순서대로 하나씩 시도하는 것과 같은 결과를 냅니다.
+
+    Returns:
+        (컴파일된 패턴, 유형별 (외부 그룹 번호, 내부 그룹 수))
+    """
+    branches = []
+    for pattern, pattern_type in patterns:
+        branches.append(f'(?P<{pattern_type}>{pattern})')
+    compiled = re.compile('|'.join(branches))
+
+    group_info = {}
+    for pattern, pattern_type in patterns:
+        group_info[pattern_type] = (
+            compiled.groupindex[pattern_type],
+            re.compile(pattern).groups,
+        )
+    return compiled, group_info
+
+
+_PROBLEM_START_RE, _PROBLEM_START_GROUPS = _compile_problem_start(
+    ProblemExtractor.PROBLEM_PATTERNS
+)
+
+_ANSWER_RES = [
+    (re.compile(pattern), pattern_type)
+    for pattern, pattern_type in ProblemExtractor.ANSWER_PATTERNS
+]
+
+_EXPLANATION_RES = [
+    re.compile(pattern, re.DOTALL)
+    for pattern in ProblemExtractor.EXPLANATION_PATTERNS
+]
+
+_POINTS_RE = re.compile(ProblemExtractor.POINTS_PATTERN)
+
+# 문서 패턴 감지 (_count_document_tags)
+_PROBLEM_NUMBER_RE = re.compile(r'(?:^|\n)\s*\d+[\.\)]\s')
+# 정답\s*(및|과)?\s*해설 | 정답표 → 공통 접두어 '정답'으로 묶어 빠른 탐색
+_SECTION_RE = re.compile(r'정답(?:표|\s*(?:및|과)?\s*해설)')
+_QUICK_ANSWER_RE = re.compile(r'빠른\s*정답')
+
+# Phase 19 추출기들이 반복 사용하는 패턴
+_PURPOSE_TAG_RE = re.compile(r'\[출제의도\]')
+_INLINE_ANSWER_RE = re.compile(r'\[정답\]\s*([①②③④⑤]|\d)')
+_POINTS_TAG_RE = re.compile(r'\[\d+\.?\d*점\]')
+_POINTS_VALUE_RE = re.compile(r'\[(\d+\.?\d*)점\]')
+_SECTION_MARKER_RES = [
+    re.compile(r'정답\s*(및|과)?\s*해설'),
+    re.compile(r'빠른\s*정답'),
+    re.compile(r'정답표'),
+]
+_ANSWER_LIST_RE = re.compile(r'\d+\.\s*[①②③④⑤]')
+_SECTION_ANSWER_PAIR_RE = re.compile(r'(\d+)\.\s*([①②③④⑤]|\d+|.+?)(?=\s*\d+\.|$)')
+_QUESTION_END_RE = re.compile(r'([^①②③④⑤]+(?:은\?|는\?|시오\.?|하라\.?|가\?|을\?|를\?))')
+_CHOICE_RE = re.compile(r'[①②③④⑤]')
+_NUMERIC_ANSWER_RE = re.compile(r'^-?\d+\.?\d*$')
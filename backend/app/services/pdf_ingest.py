@@ -0,0 +1,178 @@
+"""
+Phase 64-A: PDF 스트리밍 업로드 (Streaming Ingest)
+
+업로드 파일을 UPLOADS_DIR에 복사했다가 RAW_PDFS_DIR로 옮기지 않고,
+청크를 받는 즉시 최종 디렉토리의 임시 파일(.part.pdf)에 기록한다.
+
+- 같은 청크로 SHA-256 계산 (내용 기반 중복 제거용)
+- PDF 헤더(%PDF-)는 앞 1KB가 도착하는 즉시 검사 → 잘못된 파일은 전송 도중 거부
+- 마지막 1KB만 유지하며 startxref / %%EOF 확인 (잘린 업로드 감지)
+- 검증(PyMuPDF 열기 등)이 끝난 뒤 publish()로 최종 파일명에 게시
+  (부분 파일이나 잘못된 파일이 같은 이름의 기존 PDF를 덮어쓰지 않음)
+"""
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from fastapi import UploadFile
+
+
+# 업로드 읽기 청크 크기
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# PDF 헤더는 파일 앞 1KB 안에 있어야 함 (PDF 1.7 사양 허용 범위)
+PDF_HEADER = b'%PDF-'
+HEADER_SEARCH_BYTES = 1024
+
+# startxref / %%EOF는 파일 끝 1KB 안에 있어야 함
+TRAILER_SEARCH_BYTES = 1024
+
+
+class PDFIngestError(Exception):
+    """업로드 거부 사유 (status_code: HTTP 응답 코드)"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class IngestedPDF:
+    """
+    스트리밍 업로드 결과
+
+    path는 publish() 전까지 최종 디렉토리 안의 임시 파일(.part.pdf)을 가리킨다.
+    같은 파일 시스템 안의 rename이므로 게시할 때 추가 복사는 없다.
+    """
+    path: Path
+    dest_path: Path
+    sha256: str
+    size: int
+    trailer_ok: bool  # 끝부분에 startxref + %%EOF 존재 (False면 PyMuPDF 복구에 맡김)
+
+    def publish(self) -> Path:
+        """최종 경로로 게시 (같은 이름의 기존 파일은 교체)"""
+        if self.path != self.dest_path:
+            os.replace(self.path, self.dest_path)
+            self.path = self.dest_path
+        return self.path
+
+    def discard(self) -> None:
+        """게시 전 임시 파일 삭제"""
+        if self.path != self.dest_path:
+            self.path.unlink(missing_ok=True)
+
+
+def safe_pdf_filename(filename: Optional[str]) -> str:
+    """경로 구분자를 제거한 PDF 파일명 (경로 탐색 방지)"""
+    name = Path((filename or '').replace('\\', '/')).name
+    if not name.lower().endswith('.pdf'):
+        raise PDFIngestError("PDF 파일만 업로드 가능합니다")
+    return name
+
+
+class StreamingPDFWriter:
+    """
+    청크 단위 PDF 기록기
+
+    write()로 받은 순서대로 기록하면서 크기 제한, 해시, 헤더/트레일러를 확인한다.
+    IngestedPDF.publish() 전에는 최종 경로에 아무것도 생기지 않는다.
+    """
+
+    def __init__(self, dest_path: Path, max_size: int):
+        self.dest_path = Path(dest_path)
+        self.max_size = max_size
+        self.temp_path = self.dest_path.with_name(
+            f".{self.dest_path.stem}.{uuid.uuid4().hex[:8]}.part.pdf"
+        )
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._head = b''
+        self._header_ok = False
+        self._tail = b''
+        self._file = open(self.temp_path, 'wb')
+
+    def write(self, chunk: bytes) -> None:
+        """
+        청크 기록
+
+        Raises:
+            PDFIngestError: 크기 초과 (413) / PDF 헤더 없음 (400)
+        """
+        if not chunk:
+            return
+
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            raise PDFIngestError(
+                f"파일 크기가 너무 큽니다 (최대 {self.max_size / 1024 / 1024}MB)",
+                status_code=413
+            )
+
+        if not self._header_ok:
+            self._head = (self._head + chunk)[:HEADER_SEARCH_BYTES]
+            if PDF_HEADER in self._head:
+                self._header_ok = True
+                self._head = b''
+            elif len(self._head) >= HEADER_SEARCH_BYTES:
+                raise PDFIngestError("PDF 형식이 아닙니다 (헤더 없음)")
+
+        self._tail = (self._tail + chunk)[-TRAILER_SEARCH_BYTES:]
+        self._digest.update(chunk)
+        self._file.write(chunk)
+
+    def finish(self) -> IngestedPDF:
+        """
+        기록 완료 (게시는 IngestedPDF.publish)
+
+        Raises:
+            PDFIngestError: 빈 파일 / PDF 헤더 없음 (400)
+        """
+        self._file.close()
+
+        if self.size == 0:
+            raise PDFIngestError("빈 파일입니다")
+        if not self._header_ok:
+            raise PDFIngestError("PDF 형식이 아닙니다 (헤더 없음)")
+
+        return IngestedPDF(
+            path=self.temp_path,
+            dest_path=self.dest_path,
+            sha256=self._digest.hexdigest(),
+            size=self.size,
+            trailer_ok=b'startxref' in self._tail and b'%%EOF' in self._tail,
+        )
+
+    def abort(self) -> None:
+        """실패 시 임시 파일 삭제"""
+        if not self._file.closed:
+            self._file.close()
+        self.temp_path.unlink(missing_ok=True)
+
+
+async def ingest_upload(file: UploadFile, dest_path: Path, max_size: int) -> IngestedPDF:
+    """
+    업로드 파일을 dest_path 옆 임시 파일에 스트리밍 저장 (검증 후 publish)
+
+    Args:
+        file: 업로드 파일
+        dest_path: 최종 PDF 경로 (예: RAW_PDFS_DIR / 파일명)
+        max_size: 최대 크기 (바이트)
+
+    Raises:
+        PDFIngestError: 검증 실패 (임시 파일은 삭제됨)
+    """
+    writer = StreamingPDFWriter(dest_path, max_size)
+    try:
+        while True:
+            chunk = await file.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            writer.write(chunk)
+        return writer.finish()
+    except BaseException:
+        writer.abort()
+        raise
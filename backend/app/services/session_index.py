@@ -0,0 +1,340 @@
+"""
+Phase 65-D: 작업 세션 메모리 인덱스
+
+세션 목록 / 문서별 세션 찾기 / 문제별 해설 연결 조회가 모두
+WORK_SESSIONS_DIR/ws-*.json 을 전부 읽고 파싱했다.
+문제은행 화면은 문제 타일마다 해설 연결을 조회하므로 요청 하나가 O(세션 × 링크)가 된다.
+
+- 세션을 한 번 파싱해 메모리에 보관하고 두 가지 역색인을 유지
+    문서 ID → 세션 ID (문제/해설 문서 모두)
+    (문제 문서 ID, problemGroupId) → 세션별 연결
+- 같은 프로세스의 저장(_save_session)은 put()으로 즉시 반영
+- 다른 워커의 저장은 디렉토리 stat으로 감지: 세션 저장은 임시 파일 + os.replace 이므로
+  저장할 때마다 디렉토리 mtime이 바뀐다. 바뀐 경우에만 파일별 stat을 비교해
+  달라진 세션만 다시 파싱한다.
+
+Phase 67-D: 세션 내용은 session_store(스냅샷 + 작업 로그)에서 가져옴
+- 세션 버전 = (스냅샷 stat, 로그 (ino, 크기)) - 작업 추가는 디렉토리 mtime을 바꾸지 않으므로
+  디렉토리가 그대로면 변경 기록 파일(.changes)의 새 줄에 있는 세션의 로그만 stat한다
+  (기록 파일이 교체됐거나 처음 읽을 때만 알고 있는 세션 전체 확인)
+- 저장소와 같은 WorkSession 객체를 공유 (사본 없음)
+
+반환하는 WorkSession 객체는 인덱스와 공유되므로 수정하지 말 것.
+수정 후 저장하는 경로는 session_store.load_for_update()로 사본을 받는다.
+"""
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config import config
+from app.models.work_session import ProblemReference, ProblemSolutionLink, WorkSession
+from app.services.session_store import Signature, Version, session_store
+
+# 이 시간 안에 바뀐 디렉토리는 같은 mtime으로 또 바뀔 수 있으므로 다음 조회 때 다시 확인
+_RACY_NS = 2_000_000_000
+
+LinkEntry = Tuple[ProblemSolutionLink, Optional[ProblemReference]]
+
+
+def _signature(st: os.stat_result) -> Signature:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _documents(session: WorkSession) -> Tuple[str, Optional[str]]:
+    return (session.problemDocumentId, session.solutionDocumentId)
+
+
+def _log_signature(session_id: str) -> Tuple[int, int]:
+    try:
+        st = os.stat(config.get_work_session_log_path(session_id))
+    except OSError:
+        return (0, 0)
+    return (st.st_ino, st.st_size)
+
+
+class WorkSessionIndex:
+    """
+    Phase 65-D: 작업 세션 인덱스
+
+    Usage:
+        session_index.list_sessions()
+        session_index.find_by_document(document_id)
+        session_index.get_solution_link(document_id, group_id)
+        session_index.put(session)                 # session_store 저장/작업 직후
+        session_index.remove(session_id)           # 삭제 직후
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._root: Optional[Path] = None
+        self._dir_signature: Optional[Tuple[int, int]] = None
+        self._changes: Optional[Tuple[int, int]] = None  # 변경 기록 파일 (ino, 읽은 위치)
+
+        self._sessions: Dict[str, Tuple[Version, WorkSession]] = {}
+        self._by_document: Dict[str, Set[str]] = {}
+        self._links: Dict[Tuple[str, str], Dict[str, LinkEntry]] = {}
+
+        # 통계
+        self.scans = 0
+        self.parsed = 0
+
+    # === 조회 ===
+
+    def get(self, session_id: str) -> Optional[WorkSession]:
+        """세션 하나 (없으면 None)"""
+        with self._lock:
+            self._refresh()
+            entry = self._sessions.get(session_id)
+            return entry[1] if entry else None
+
+    def list_sessions(self) -> List[WorkSession]:
+        """모든 세션 (정렬 안 됨)"""
+        with self._lock:
+            self._refresh()
+            return [session for _, session in self._sessions.values()]
+
+    def find_by_document(self, document_id: str) -> List[WorkSession]:
+        """문제 또는 해설 문서가 document_id인 세션"""
+        with self._lock:
+            self._refresh()
+            return [
+                self._sessions[session_id][1]
+                for session_id in self._by_document.get(document_id, ())
+            ]
+
+    def get_solution_link(self, document_id: str, group_id: str) -> Optional[ProblemSolutionLink]:
+        """문제에 연결된 해설 (여러 세션에 있으면 가장 최근 연결)"""
+        with self._lock:
+            self._refresh()
+            entries = self._links.get((document_id, group_id))
+            if not entries:
+                return None
+            return max((link for link, _ in entries.values()), key=lambda link: link.linkedAt)
+
+    def linked_solutions(self) -> Dict[str, dict]:
+        """
+        모든 문제-해설 연결 (matching /linked-solutions 형식)
+
+        세션의 problems에 있는 문제만 포함하며, 키는 "documentId|pageIndex|groupId"
+        """
+        with self._lock:
+            self._refresh()
+            result: Dict[str, dict] = {}
+            for entries in self._links.values():
+                for session_id, (link, problem) in entries.items():
+                    if problem is None:
+                        continue
+                    key = f"{problem.documentId}|{problem.pageIndex}|{problem.groupId}"
+                    if key not in result or link.linkedAt > result[key]["matchedAt"]:
+                        result[key] = {
+                            "solutionDocumentId": link.solutionDocumentId,
+                            "solutionPageIndex": link.solutionPageIndex,
+                            "solutionGroupId": link.solutionGroupId,
+                            "sessionId": session_id,
+                            "matchedAt": link.linkedAt,
+                            "problemNumber": problem.problemNumber,
+                        }
+            return result
+
+    # === 갱신 ===
+
+    def put(self, session: WorkSession, group_ids: Optional[Iterable[str]] = None) -> None:
+        """
+        저장한 세션 반영
+
+        Args:
+            session: session_store가 반환한 세션 (공유 객체 그대로 보관)
+            group_ids: Phase 67-E - 바뀐 문제 그룹 ID (작업 로그 한 건) - 주어지면 그 연결만 다시 색인
+        """
+        version = session_store.version(session.sessionId) or ((-1, -1, -1), (-1, -1))
+        with self._lock:
+            if self._root != config.WORK_SESSIONS_DIR:
+                return  # 아직 스캔 전 - 첫 조회 때 파일에서 읽음
+            entry = self._sessions.get(session.sessionId)
+            if group_ids is None or entry is None or _documents(entry[1]) != _documents(session):
+                self._index(session, version)
+                return
+
+            self._sessions[session.sessionId] = (version, session)
+            for group_id in group_ids:
+                self._index_group(session, group_id)
+
+    def remove(self, session_id: str) -> None:
+        """삭제한 세션 제거"""
+        with self._lock:
+            self._unindex(session_id)
+
+    def invalidate(self) -> None:
+        """전체 인덱스 초기화 (다음 조회 때 다시 스캔)"""
+        with self._lock:
+            self._reset(None)
+
+    def stats(self) -> Dict[str, int]:
+        """인덱스 상태"""
+        return {
+            'sessions': len(self._sessions),
+            'documents': len(self._by_document),
+            'links': sum(len(entries) for entries in self._links.values()),
+            'scans': self.scans,
+            'parsed': self.parsed,
+        }
+
+    # === 내부 ===
+
+    def _reset(self, root: Optional[Path]) -> None:
+        self._root = root
+        self._dir_signature = None
+        self._changes = None
+        self._sessions.clear()
+        self._by_document.clear()
+        self._links.clear()
+
+    def _refresh(self) -> None:
+        """디렉토리가 바뀐 경우에만 파일별 stat 비교 (잠금 보유 상태에서 호출)"""
+        root = config.WORK_SESSIONS_DIR
+        if self._root != root:
+            self._reset(root)
+
+        try:
+            dir_stat = os.stat(root)
+        except OSError:
+            self._reset(root)
+            return
+
+        # 로그 stat보다 먼저 읽음 - 이후 추가된 작업은 다음 조회 때 새 줄로 보임
+        changed = self._read_changes()
+
+        dir_signature = (dir_stat.st_ino, dir_stat.st_mtime_ns)
+        if dir_signature == self._dir_signature:
+            # Phase 67-D: 파일 목록은 그대로 - 작업 로그가 추가된 세션만 확인
+            targets = list(self._sessions) if changed is None else changed
+            for session_id in targets:
+                entry = self._sessions.get(session_id)
+                if entry is not None and _log_signature(session_id) != entry[0][1]:
+                    self._reload(session_id)
+            return
+
+        self.scans += 1
+        seen = set()
+        for session_file in root.glob("ws-*.json"):
+            session_id = session_file.stem
+            try:
+                version = (_signature(os.stat(session_file)), _log_signature(session_id))
+            except OSError:
+                continue
+            seen.add(session_id)
+
+            entry = self._sessions.get(session_id)
+            if entry is not None and entry[0] == version:
+                continue
+            self._reload(session_id)
+
+        for session_id in [sid for sid in self._sessions if sid not in seen]:
+            self._unindex(session_id)
+
+        # 방금 바뀐 디렉토리는 같은 mtime으로 다시 바뀔 수 있으므로 신뢰하지 않음
+        if time.time_ns() - dir_stat.st_mtime_ns > _RACY_NS:
+            self._dir_signature = dir_signature
+        else:
+            self._dir_signature = None
+
+    def _read_changes(self) -> Optional[Set[str]]:
+        """
+        변경 기록 파일에서 마지막으로 읽은 위치 이후의 세션 ID
+
+        Returns:
+            세션 ID 집합, 처음 읽거나 파일이 교체됐으면 None (알고 있는 세션 전체 확인)
+        """
+        try:
+            f = open(config.get_work_session_changes_path(), 'rb')
+        except FileNotFoundError:
+            # 파일이 없으면 작업 로그도 없음 (처음 만들 때 디렉토리 mtime이 바뀜)
+            known = self._changes == (0, 0)
+            self._changes = (0, 0)
+            return set() if known else None
+
+        with f:
+            st = os.fstat(f.fileno())
+            if self._changes is None or self._changes[0] != st.st_ino or st.st_size < self._changes[1]:
+                self._changes = (st.st_ino, st.st_size)
+                return None
+            offset = self._changes[1]
+            if st.st_size == offset:
+                return set()
+            f.seek(offset)
+            data = f.read(st.st_size - offset)
+
+        end = data.rfind(b'\n')
+        if end < 0:
+            return set()  # 기록 중인 줄
+        self._changes = (st.st_ino, offset + end + 1)
+        return {line.decode('utf-8', 'replace') for line in data[:end].split(b'\n') if line}
+
+    def _reload(self, session_id: str) -> None:
+        """session_store에서 현재 세션을 가져와 다시 색인"""
+        try:
+            session = session_store.load(session_id)
+        except Exception as e:
+            print(f"[Phase 65-D] 세션 로드 실패: {session_id} - {e}")
+            session = None
+        if session is None:
+            self._unindex(session_id)
+            return
+        self.parsed += 1
+        self._index(session, session_store.version(session_id))
+
+    def _index(self, session: WorkSession, version: Version) -> None:
+        self._unindex(session.sessionId)
+        session_id = session.sessionId
+        self._sessions[session_id] = (version, session)
+
+        for document_id in _documents(session):
+            if document_id:
+                self._by_document.setdefault(document_id, set()).add(session_id)
+
+        problems_by_group: Dict[str, ProblemReference] = {}
+        for problem in session.problems:
+            problems_by_group.setdefault(problem.groupId, problem)
+        for link in session.links:
+            key = (session.problemDocumentId, link.problemGroupId)
+            self._links.setdefault(key, {})[session_id] = (link, problems_by_group.get(link.problemGroupId))
+
+    def _index_group(self, session: WorkSession, group_id: str) -> None:
+        """Phase 67-E: 문제 그룹 하나의 연결 항목만 다시 색인 (세션 키 색인 사용)"""
+        key = (session.problemDocumentId, group_id)
+        links = session.links_for_problem(group_id)
+        if links:
+            self._links.setdefault(key, {})[session.sessionId] = (links[-1], session.find_problem(group_id))
+            return
+        entries = self._links.get(key)
+        if entries is not None:
+            entries.pop(session.sessionId, None)
+            if not entries:
+                del self._links[key]
+
+    def _unindex(self, session_id: str) -> None:
+        entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return
+        session = entry[1]
+
+        for document_id in (session.problemDocumentId, session.solutionDocumentId):
+            ids = self._by_document.get(document_id)
+            if ids is not None:
+                ids.discard(session_id)
+                if not ids:
+                    del self._by_document[document_id]
+
+        for link in session.links:
+            key = (session.problemDocumentId, link.problemGroupId)
+            entries = self._links.get(key)
+            if entries is not None:
+                entries.pop(session_id, None)
+                if not entries:
+                    del self._links[key]
+
+
+# 전역 인스턴스
+session_index = WorkSessionIndex()
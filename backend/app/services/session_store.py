@@ -0,0 +1,556 @@
+"""
+Phase 67-D: 작업 세션 저장소 (스냅샷 + 작업 로그)
+
+문제 추가/삭제, 연결 생성/삭제마다 세션 JSON 전체를 파싱 → 수정 → 다시 직렬화해 기록했다.
+매칭 중인 세션은 링크가 수천 개라 클릭 한 번이 수백 KB 읽기/쓰기가 된다.
+
+- 스냅샷: 기존 세션 파일 (ws-<id>.json), 마지막으로 반영한 작업 번호(opSeq) 포함
+- 작업 로그: ws-<id>.oplog 에 작업 하나당 JSON 한 줄 추가 (fsync)
+    {"seq": 12, "op": "create_link", "at": ..., "undoable": true, "changes": [...]}
+    changes는 문제/연결 항목 단위 변경 (before → after) - 되돌리기는 before/after를 바꿔 적용
+- 메모리: 세션별로 스냅샷 + 로그를 재생한 현재 상태를 보관하고,
+  로그는 마지막으로 읽은 위치 이후만 읽음 (다른 워커가 추가한 작업)
+- 압축: 스냅샷 이후 작업이 SESSION_SNAPSHOT_EVERY개 쌓이면 스냅샷을 새로 쓰고
+  로그는 되돌리기용 최근 SESSION_UNDO_DEPTH개만 남김 (opSeq 이하 작업은 재생하지 않음)
+- 쓰기는 세션 파일 배타 잠금, 읽기는 공유 잠금 → 워커 사이에서도 작업 순서 보장
+  (잠금은 세션별 - 워커 사이도 프로세스 안도 다른 세션의 작업은 서로 기다리지 않음)
+- 로그를 추가하면 WORK_SESSIONS_DIR/.changes 에 세션 ID 한 줄을 덧붙임
+  (다른 워커의 session_index가 모든 세션 로그를 stat하지 않고 바뀐 세션만 확인)
+- 마지막 줄이 끊긴 로그(기록 중 중단)는 읽을 때 무시하고 다음 쓰기에서 잘라냄
+
+반환하는 WorkSession은 저장소와 session_index가 공유하므로 수정하지 말 것.
+수정 후 save()하는 경로는 load_for_update()로 사본을 받는다.
+"""
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from app.config import config
+from app.models.work_session import ProblemReference, ProblemSolutionLink, WorkSession, problem_key
+from app.services.file_lock import atomic_json_write, file_lock
+
+
+# (st_ino, st_mtime_ns, st_size)
+Signature = Tuple[int, int, int]
+
+# (스냅샷 signature, (로그 ino, 로그에서 읽은 위치)) - 디스크 상태 비교용
+Version = Tuple[Signature, Tuple[int, int]]
+
+Change = Dict[str, Any]
+
+# 변경 기록 파일이 이 크기를 넘으면 빈 파일로 교체 (읽는 쪽은 교체를 감지하면 전체 확인)
+CHANGES_ROTATE_BYTES = 1 << 20
+
+_MODELS = {"problem": ProblemReference, "link": ProblemSolutionLink}
+_FIELDS = {"problem": "problems", "link": "links"}
+
+
+def _signature(st: os.stat_result) -> Signature:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _now_ms() -> int:
+    return int(datetime.now().timestamp() * 1000)
+
+
+def _dump(item: Optional[BaseModel]) -> Optional[dict]:
+    return item.model_dump() if item is not None else None
+
+
+def _note_change(session_id: str) -> None:
+    """
+    변경 기록 파일에 세션 ID 한 줄 추가
+
+    O_APPEND 한 번의 짧은 쓰기라 워커 사이 잠금 없이 줄이 섞이지 않는다.
+    알림 용도라 fsync하지 않음 (재시작한 워커는 어차피 전체를 다시 읽음).
+    """
+    path = config.get_work_session_changes_path()
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, f"{session_id}\n".encode('utf-8'))
+            size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+        if size > CHANGES_ROTATE_BYTES:
+            temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+            temp_path.write_bytes(b'')
+            os.replace(temp_path, path)
+    except OSError as e:
+        # 작업은 이미 로그에 기록됨 - 다른 워커는 디렉토리가 바뀔 때 반영
+        print(f"[Phase 67-D] 변경 기록 실패: {session_id} - {e}")
+
+
+def problem_change(before: Optional[ProblemReference], after: Optional[ProblemReference]) -> Change:
+    """문제 항목 변경 (before=None: 추가, after=None: 삭제) - (groupId, pageIndex) 기준"""
+    return {"kind": "problem", "before": _dump(before), "after": _dump(after)}
+
+
+def link_change(before: Optional[ProblemSolutionLink], after: Optional[ProblemSolutionLink]) -> Change:
+    """연결 항목 변경 (before=None: 추가, after=None: 삭제) - problemGroupId 기준"""
+    return {"kind": "link", "before": _dump(before), "after": _dump(after)}
+
+
+def changed_groups(changes: List[Change]) -> Set[str]:
+    """Phase 67-E: 변경 목록이 건드린 문제 그룹 ID (세션 인덱스 부분 갱신용)"""
+    groups = set()
+    for change in changes:
+        field = "groupId" if change["kind"] == "problem" else "problemGroupId"
+        for item in (change.get("before"), change.get("after")):
+            if item is not None:
+                groups.add(item[field])
+    return groups
+
+
+def _position(items: list, item: Any) -> Optional[int]:
+    for i, other in enumerate(items):
+        if other is item:
+            return i
+    return None
+
+
+def apply_changes(session: WorkSession, changes: List[Change], seq: int, at: int) -> WorkSession:
+    """
+    변경 목록 적용 → 새 세션 (기존 세션과 리스트는 건드리지 않음)
+
+    바뀌는 리스트만 얕은 복사하고 나머지 항목 객체는 공유한다.
+    각 변경의 "index"에 적용 위치를 기록 (되돌리기 시 원래 위치에 다시 넣기 위함).
+    Phase 67-E: 대상 항목은 세션 키 색인으로 찾고, 색인도 함께 갱신해 새 세션에 넘김
+    """
+    lists: Dict[str, list] = {}
+    problems, links = session.problems, session.links
+    lookup = session.lookup().copy(problems, links)
+
+    for change in changes:
+        kind = change["kind"]
+        name = _FIELDS[kind]
+        items = lists.get(name)
+        if items is None:
+            items = lists[name] = list(getattr(session, name))
+            if kind == "problem":
+                lookup.problems = items
+            else:
+                lookup.links = items
+
+        before, after = change.get("before"), change.get("after")
+        target = before if before is not None else after
+        if kind == "problem":
+            current = lookup.problem_by_key.get(problem_key(target["pageIndex"], target["groupId"]))
+            remove, add = lookup.remove_problem, lookup.add_problem
+        else:
+            matches = lookup.links_by_problem.get(target["problemGroupId"])
+            current = matches[0] if matches else None
+            remove, add = lookup.remove_link, lookup.add_link
+
+        position = _position(items, current) if current is not None else None
+        if position is not None:
+            remove(current)
+
+        if after is None:
+            if position is not None:
+                del items[position]
+                change["index"] = position
+        else:
+            model = _MODELS[kind](**after)
+            if position is not None:
+                items[position] = model
+            else:
+                position = min(change.get("index", len(items)), len(items))
+                items.insert(position, model)
+            add(model)
+            change["index"] = position
+
+    updated = session.model_copy(update={**lists, "opSeq": seq, "updatedAt": at})
+    updated._lookup = lookup
+    return updated
+
+
+def invert_changes(changes: List[Change]) -> List[Change]:
+    """되돌리기 변경 목록 (역순, before/after 교환)"""
+    return [
+        {"kind": c["kind"], "before": c.get("after"), "after": c.get("before"), "index": c.get("index", 0)}
+        for c in reversed(changes)
+    ]
+
+
+@dataclass
+class _Entry:
+    """세션 하나의 현재 상태"""
+    session: WorkSession
+    snapshot: Signature
+    log_ino: int = 0
+    log_offset: int = 0
+    seq: int = 0
+    since_snapshot: int = 0
+    records: List[dict] = field(default_factory=list)  # 로그에 남아 있는 작업 (되돌리기 이력)
+
+    @property
+    def version(self) -> Version:
+        return (self.snapshot, (self.log_ino, self.log_offset))
+
+
+class WorkSessionStore:
+    """
+    Phase 67-D: 작업 세션 저장소
+
+    Usage:
+        session = session_store.load(session_id)                     # 공유 객체 (읽기 전용)
+        session, record = session_store.apply(session_id, "create_link", build)
+        session, record = session_store.undo(session_id)
+        copy, version = session_store.load_for_update(session_id)   # 일괄 수정용 사본
+        session_store.save(copy, expected=version)                   # 스냅샷 저장
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()  # _root, _entries, _session_locks
+        self._session_locks: Dict[str, threading.RLock] = {}
+        self._root: Optional[Path] = None
+        self._entries: Dict[str, _Entry] = {}
+
+        # 통계
+        self.loads = 0
+        self.replayed = 0
+        self.appends = 0
+        self.snapshots = 0
+
+    # === 조회 ===
+
+    def load(self, session_id: str) -> Optional[WorkSession]:
+        """현재 세션 (공유 객체 - 수정 금지, 없으면 None)"""
+        with self._locked(session_id, shared=True):
+            entry = self._current(session_id)
+            return entry.session if entry else None
+
+    def load_for_update(self, session_id: str) -> Optional[Tuple[WorkSession, Version]]:
+        """수정용 사본과 그 시점의 버전 (save의 expected로 전달)"""
+        with self._locked(session_id, shared=True):
+            entry = self._current(session_id)
+            if entry is None:
+                return None
+            return entry.session.model_copy(deep=True), entry.version
+
+    def version(self, session_id: str) -> Optional[Version]:
+        """마지막으로 확인한 디스크 버전 (파일 확인 없음)"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            return entry.version if entry else None
+
+    def history(self, session_id: str, limit: int = 50) -> Optional[List[dict]]:
+        """최근 작업 (최신순, 되돌려진 작업은 undone=True)"""
+        with self._locked(session_id, shared=True):
+            entry = self._current(session_id)
+            if entry is None:
+                return None
+            undone = self._undone(entry)
+            return [
+                {
+                    "seq": record["seq"],
+                    "op": record["op"],
+                    "at": record["at"],
+                    "undoable": record.get("undoable", False),
+                    "undone": record["seq"] in undone,
+                    "target": record.get("target"),
+                    "changes": record["changes"],
+                }
+                for record in reversed(entry.records[-limit:] if limit > 0 else [])
+            ]
+
+    # === 변경 ===
+
+    def apply(
+        self,
+        session_id: str,
+        op: str,
+        build: Callable[[WorkSession], List[Change]],
+        undoable: bool = True
+    ) -> Optional[Tuple[WorkSession, Optional[dict]]]:
+        """
+        작업 하나를 로그에 추가
+
+        Args:
+            session_id: 세션 ID
+            op: 작업 이름 (이력 표시용)
+            build: 현재 세션 → 변경 목록 (세션 잠금 안에서 호출, 예외는 그대로 전달)
+            undoable: 되돌리기 허용 여부
+
+        Returns:
+            (새 세션, 기록한 작업) - 변경이 없으면 작업은 None, 세션이 없으면 None
+        """
+        with self._locked(session_id):
+            entry = self._current(session_id)
+            if entry is None:
+                return None
+            changes = build(entry.session)
+            if not changes:
+                return entry.session, None
+            record = self._append(entry, {"op": op, "undoable": undoable, "changes": changes})
+            return entry.session, record
+
+    def undo(self, session_id: str) -> Optional[Tuple[WorkSession, dict]]:
+        """
+        되돌리지 않은 가장 최근 작업을 되돌림 (되돌리기 작업도 로그에 추가)
+
+        세션 상태만 되돌린다. 디스크 부수 효과(groups.json link 등)는 호출자가 처리.
+
+        Raises:
+            ValueError: 되돌릴 작업이 없거나 되돌릴 수 없는 작업
+        """
+        with self._locked(session_id):
+            entry = self._current(session_id)
+            if entry is None:
+                return None
+
+            undone = self._undone(entry)
+            target = next(
+                (r for r in reversed(entry.records) if r["op"] != "undo" and r["seq"] not in undone),
+                None
+            )
+            if target is None:
+                raise ValueError("되돌릴 작업이 없습니다")
+            if not target.get("undoable", False):
+                raise ValueError(f"되돌릴 수 없는 작업입니다: {target['op']}")
+
+            record = self._append(entry, {
+                "op": "undo",
+                "target": target["seq"],
+                "undoable": False,
+                "changes": invert_changes(target["changes"]),
+            })
+            return entry.session, record
+
+    def save(self, session: WorkSession, expected: Optional[Version] = None) -> Optional[WorkSession]:
+        """
+        스냅샷 저장 (세션 생성, 여러 항목을 한 번에 바꾸는 일괄 수정)
+
+        Args:
+            session: 저장할 세션 (사본을 보관 - 호출자는 계속 사용 가능)
+            expected: load_for_update 시점의 버전 - 그 사이 다른 저장/작업이 있으면 저장하지 않음
+
+        Returns:
+            저장된 세션 (공유 객체), expected가 맞지 않으면 None
+        """
+        with self._locked(session.sessionId):
+            entry = self._current(session.sessionId)
+            if expected is not None and (entry is None or entry.version != expected):
+                return None
+
+            session.opSeq = entry.seq if entry else 0
+            stored = session.model_copy(deep=True)
+            self._write_snapshot(session.sessionId, stored, entry)
+            return stored
+
+    def delete(self, session_id: str) -> bool:
+        """세션 파일과 로그 삭제 (없으면 False)"""
+        path = config.get_work_session_path(session_id)
+        with self._locked(session_id):
+            with self._lock:
+                self._entries.pop(session_id, None)
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                return False
+            config.get_work_session_log_path(session_id).unlink(missing_ok=True)
+            return True
+
+    def invalidate(self) -> None:
+        """메모리 상태 초기화 (다음 조회 때 파일에서 다시 읽음)"""
+        with self._lock:
+            self._entries.clear()
+            self._root = None
+
+    def stats(self) -> Dict[str, int]:
+        """저장소 통계"""
+        return {
+            'sessions': len(self._entries),
+            'loads': self.loads,
+            'replayed': self.replayed,
+            'appends': self.appends,
+            'snapshots': self.snapshots,
+        }
+
+    # === 내부 (세션 잠금 보유 상태에서 호출) ===
+
+    @contextmanager
+    def _locked(self, session_id: str, shared: bool = False):
+        """
+        세션 잠금: 워커 사이는 세션 파일 경로의 잠금 (경로별 flock - 다른 세션과 공유하지 않음),
+        프로세스 안은 세션별 RLock (세션 수만큼만 생성, 삭제하지 않음)
+        """
+        with self._lock:
+            lock = self._session_locks.get(session_id)
+            if lock is None:
+                lock = self._session_locks[session_id] = threading.RLock()
+        with file_lock(config.get_work_session_path(session_id), shared=shared), lock:
+            yield
+
+    def _current(self, session_id: str) -> Optional[_Entry]:
+        """디스크와 맞춘 현재 상태 (스냅샷이 바뀌었으면 다시 읽고, 아니면 로그 추가분만 재생)"""
+        with self._lock:
+            if self._root != config.WORK_SESSIONS_DIR:
+                self._entries.clear()
+                self._root = config.WORK_SESSIONS_DIR
+            entry = self._entries.get(session_id)
+
+        path = config.get_work_session_path(session_id)
+        try:
+            snapshot = _signature(os.stat(path))
+        except OSError:
+            with self._lock:
+                self._entries.pop(session_id, None)
+            return None
+
+        if entry is None or entry.snapshot != snapshot:
+            entry = self._read(session_id, path)
+            if entry is None:
+                return None
+            with self._lock:
+                self._entries[session_id] = entry
+        else:
+            self._tail(entry, config.get_work_session_log_path(session_id))
+        return entry
+
+    def _read(self, session_id: str, path: Path) -> Optional[_Entry]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshot = _signature(os.fstat(f.fileno()))
+                session = WorkSession(**json.load(f))
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(session_id, None)
+            return None
+        self.loads += 1
+
+        entry = _Entry(session=session, snapshot=snapshot, seq=session.opSeq)
+        self._tail(entry, config.get_work_session_log_path(session_id))
+        return entry
+
+    def _tail(self, entry: _Entry, log_path: Path) -> None:
+        """로그에서 마지막으로 읽은 위치 이후의 완결된 줄만 재생"""
+        try:
+            f = open(log_path, 'rb')
+        except FileNotFoundError:
+            entry.log_ino, entry.log_offset = 0, 0
+            return
+
+        with f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != entry.log_ino:
+                # 새로 만들어졌거나 압축으로 교체된 로그 - 처음부터 (seq로 중복 적용 방지)
+                entry.log_ino, entry.log_offset = st.st_ino, 0
+                entry.records = []
+            if st.st_size <= entry.log_offset:
+                return
+            f.seek(entry.log_offset)
+            data = f.read(st.st_size - entry.log_offset)
+
+        end = data.rfind(b'\n')
+        if end < 0:
+            return  # 기록 중인 줄
+        for line in data[:end + 1].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                print(f"[Phase 67-D] 작업 로그 줄 건너뜀: {log_path} - {e}")
+                continue
+            entry.records.append(record)
+            if record["seq"] > entry.seq:
+                entry.session = apply_changes(entry.session, record["changes"], record["seq"], record["at"])
+                entry.seq = record["seq"]
+                entry.since_snapshot += 1
+                self.replayed += 1
+        entry.log_offset += end + 1
+
+    def _append(self, entry: _Entry, record: dict) -> dict:
+        """작업 적용 + 로그 한 줄 추가 (스냅샷 주기가 되면 압축)"""
+        session_id = entry.session.sessionId
+        record = {"seq": entry.seq + 1, "op": record["op"], "at": _now_ms(), **record}
+        session = apply_changes(entry.session, record["changes"], record["seq"], record["at"])
+        line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+        log_path = config.get_work_session_log_path(session_id)
+        fd = os.open(log_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            st = os.fstat(fd)
+            offset = entry.log_offset if st.st_ino == entry.log_ino else 0
+            if st.st_size != offset:
+                os.ftruncate(fd, offset)  # 끊긴 마지막 줄 제거
+            os.lseek(fd, offset, os.SEEK_SET)
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        _note_change(session_id)
+
+        entry.session = session
+        entry.log_ino, entry.log_offset = st.st_ino, offset + len(line)
+        entry.seq = record["seq"]
+        entry.since_snapshot += 1
+        entry.records.append(record)
+        self.appends += 1
+
+        if entry.since_snapshot >= config.SESSION_SNAPSHOT_EVERY:
+            self._write_snapshot(session_id, entry.session, entry)
+        return record
+
+    def _write_snapshot(self, session_id: str, session: WorkSession, entry: Optional[_Entry]) -> None:
+        """스냅샷 기록 후 로그를 되돌리기 이력만 남기고 정리"""
+        path = config.get_work_session_path(session_id)
+        log_path = config.get_work_session_log_path(session_id)
+        written = atomic_json_write(path, session.model_dump())
+        self.snapshots += 1
+
+        records = entry.records if entry else []
+        depth = max(config.SESSION_UNDO_DEPTH, 0)
+        keep = records[-depth:] if depth else []
+        log_ino, log_offset = (entry.log_ino, entry.log_offset) if entry else (0, 0)
+
+        if entry is None:
+            log_path.unlink(missing_ok=True)  # 같은 ID로 남은 로그가 있으면 버림
+        elif len(keep) < len(records):
+            log_ino, log_offset = self._rewrite_log(log_path, keep)
+
+        stored = _Entry(
+            session=session,
+            snapshot=_signature(written),
+            log_ino=log_ino,
+            log_offset=log_offset,
+            seq=session.opSeq,
+            records=list(keep),
+        )
+        with self._lock:
+            self._entries[session_id] = stored
+
+    def _rewrite_log(self, log_path: Path, records: List[dict]) -> Tuple[int, int]:
+        if not records:
+            log_path.unlink(missing_ok=True)
+            return 0, 0
+        payload = b''.join(
+            (json.dumps(r, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+            for r in records
+        )
+        temp_path = log_path.with_name(f".{log_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+            ino = os.fstat(f.fileno()).st_ino
+        os.replace(temp_path, log_path)
+        return ino, len(payload)
+
+    @staticmethod
+    def _undone(entry: _Entry) -> set:
+        return {r["target"] for r in entry.records if r["op"] == "undo"}
+
+
+# 전역 인스턴스
+session_store = WorkSessionStore()
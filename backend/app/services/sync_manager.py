@@ -8,9 +8,28 @@ groups.json ↔ WorkSession 양방향 동기화
 - session.links: 연결 정보의 원본 (Single Source of Truth)
 - session.problems: groups.json의 캐시
 - groups.json.link: session.links의 캐시
+
+Phase 65-A: groups.json 읽기는 groups_cache 사용 (잠금 없음, stat 검증),
+            쓰기는 file_lock 안에서 groups_cache.save (디스크 + 캐시 동시 갱신)
+
+Phase 67-A: 증분 동기화
+- 세션(syncState)에 페이지별 (mtime, size, 내용 해시) 기록
+- 라벨링 후 동기화는 stat만 확인하고 바뀐 페이지만 파싱/적용
+  (400페이지 문서에서 매번 전체 파싱 + 복합 키 재구성 → 바뀐 페이지 하나)
+
+Phase 67-B: 그룹 변경 이벤트(group_events) 구독
+- 세션 동기화: 바뀐 문서를 쓰는 세션만 full_sync 후 저장 (apply_group_changes)
+- 내보내기 메타: 바뀐 페이지의 problems/*.json problem_info 갱신 (refresh_exported_problems)
+
+Phase 67-D: 세션 로드/저장은 session_store (스냅샷 + 작업 로그)
 """
+import hashlib
+import json
+import os
+import time
+from collections import defaultdict
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -18,13 +37,85 @@ from app.config import config
 from app.models.work_session import (
     WorkSession,
     ProblemReference,
-    ProblemSolutionLink
-)
-from app.services.file_lock import (
-    file_lock,
-    atomic_json_write,
-    safe_json_read
+    PageSyncVersion,
+    SessionSyncState,
 )
+from app.services.file_lock import atomic_json_write, file_lock
+from app.services.group_events import GroupChange, group_events
+from app.services.groups_cache import groups_cache
+from app.services.session_index import session_index
+from app.services.session_store import session_store
+from app.utils import load_json
+
+
+# 방금 수정된 파일은 같은 mtime 안에서 다시 바뀔 수 있으므로
+# (mtime 해상도) 다음 동기화 때 내용 해시로 한 번 더 확인
+_RACY_NS = 2_000_000_000
+
+# Phase 67-B: 이벤트 동기화 중 세션이 다른 요청으로 바뀌었을 때 재시도 횟수
+_SESSION_UPDATE_RETRIES = 3
+
+
+def _scan_group_pages(groups_dir: Path) -> Dict[int, Tuple[str, os.stat_result]]:
+    """페이지 인덱스 → (groups 파일 경로, stat) (page_0001_groups.json → 1)"""
+    pages = {}
+    with os.scandir(groups_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith("page_") and name.endswith("_groups.json")):
+                continue
+            try:
+                page_index = int(name.split("_")[1])
+                pages[page_index] = (entry.path, entry.stat())
+            except (IndexError, ValueError, OSError):
+                continue
+    return dict(sorted(pages.items()))
+
+
+def _digest(value: Any) -> str:
+    """동기화 대상 내용 해시"""
+    raw = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _page_version(st: os.stat_result, digest: str, count: int) -> PageSyncVersion:
+    """현재 파일 버전 (방금 수정된 파일은 mtime을 기록하지 않음)"""
+    racy = time.time_ns() - st.st_mtime_ns < _RACY_NS
+    return PageSyncVersion(
+        mtimeNs=0 if racy else st.st_mtime_ns,
+        size=st.st_size,
+        hash=digest,
+        count=count
+    )
+
+
+def _same_file(version: PageSyncVersion, st: os.stat_result) -> bool:
+    return version.mtimeNs != 0 and version.mtimeNs == st.st_mtime_ns and version.size == st.st_size
+
+
+def _needs_link(group: Dict[str, Any], values: Dict[str, Dict[str, Any]]) -> bool:
+    value = values.get(group.get("id"))
+    return value is not None and group.get("link") != value
+
+
+def _display_name(problem_info: Dict[str, Any], page_index: int) -> str:
+    """
+    표시 이름 (Phase 56-K: Frontend와 동일한 형식 - 책이름_p페이지_번호번)
+
+    problemInfo.displayName이 있으면 그대로, 책 이름도 없으면 빈 문자열
+    """
+    display_name = problem_info.get("displayName", "")
+    if display_name:
+        return display_name
+
+    problem_number = problem_info.get("problemNumber", "")
+    book_name = problem_info.get("bookName", "")
+    page = problem_info.get("page", page_index + 1)
+    if book_name and page:
+        return f"{book_name}_p{page}_{problem_number}번"
+    if book_name:
+        return f"{book_name}_{problem_number}번"
+    return ""
 
 
 @dataclass
@@ -37,6 +128,9 @@ class SyncResult:
     links_synced: int = 0
     conflicts: List[Dict[str, Any]] = field(default_factory=list)
     error: Optional[str] = None
+    # Phase 67-A: 다시 파싱한 페이지 수, 세션 저장 필요 여부 (문제/동기화 버전 변경)
+    pages_parsed: int = 0
+    state_changed: bool = False
 
     @classmethod
     def merge(cls, *results: 'SyncResult') -> 'SyncResult':
@@ -48,7 +142,9 @@ class SyncResult:
             problems_updated=sum(r.problems_updated for r in results),
             links_synced=sum(r.links_synced for r in results),
             conflicts=[c for r in results for c in (r.conflicts or [])],
-            error="; ".join(r.error for r in results if r.error)
+            error="; ".join(r.error for r in results if r.error),
+            pages_parsed=sum(r.pages_parsed for r in results),
+            state_changed=any(r.state_changed for r in results)
         )
 
 
@@ -64,10 +160,15 @@ class SyncManager:
         """
         groups.json → session.problems 동기화
 
-        1. 문서의 모든 groups.json 스캔
-        2. 신규 그룹 → session.problems에 추가
-        3. 삭제된 그룹 → session.problems에서 제거
-        4. 변경된 그룹 → session.problems 업데이트
+        Phase 67-A: 증분 동기화
+        1. groups 디렉토리의 페이지 파일 stat만 수집 (파싱 없음)
+        2. syncState.problemPages의 (mtime, size)와 같은 페이지는 건너뜀
+        3. 바뀐 페이지만 파싱 → 동기화 대상 필드 해시가 같으면 버전만 갱신
+        4. 내용이 바뀐 페이지만 델타 적용 (신규 추가 / 변경 업데이트 / 삭제)
+        5. 파일이 없어진 페이지의 문제는 제거
+
+        세션에서 다른 경로로 문제가 추가/삭제되어 페이지의 문제 수가
+        기록과 다르면 그 페이지는 다시 동기화한다.
         """
         try:
             doc_dir = self.config.get_document_dir(session.problemDocumentId)
@@ -76,143 +177,161 @@ class SyncManager:
             if not groups_dir.exists():
                 return SyncResult(success=True)
 
-            # 1. groups.json에서 모든 그룹 수집
-            # Phase 47: 복합 키 사용으로 페이지간 그룹 ID 충돌 방지
-            # 키: "{pageIndex}:{groupId}" (예: "10:L1", "18:L1")
-            all_groups: Dict[str, Dict] = {}
+            state = session.syncState
+            state_changed = False
+            if state.problemDocumentId != session.problemDocumentId:
+                state.problemDocumentId = session.problemDocumentId
+                state.problemPages = {}
+                state_changed = True
 
-            for groups_file in sorted(groups_dir.glob("page_*_groups.json")):
-                # 페이지 인덱스 추출 (page_0001_groups.json → 1)
-                try:
-                    page_index = int(groups_file.stem.split("_")[1])
-                except (IndexError, ValueError):
-                    continue
+            pages = _scan_group_pages(groups_dir)
 
-                with file_lock(groups_file):
-                    data = safe_json_read(groups_file, {"groups": []})
+            # 페이지별 세션 문제 (Phase 47: 페이지간 그룹 ID 충돌 방지 → 페이지 단위로 비교)
+            problems_by_page: Dict[int, List[ProblemReference]] = defaultdict(list)
+            for problem in session.problems:
+                problems_by_page[problem.pageIndex].append(problem)
+
+            added: List[ProblemReference] = []
+            removed_keys: Set[Tuple[int, str]] = set()
+            updated_count = 0
+            pages_parsed = 0
+
+            # 파일이 없어진 페이지
+            for page_index in list(state.problemPages):
+                if page_index not in pages:
+                    del state.problemPages[page_index]
+                    state_changed = True
+            for page_index, page_problems in problems_by_page.items():
+                if page_index not in pages:
+                    removed_keys.update((page_index, p.groupId) for p in page_problems)
+
+            for page_index, (groups_file, st) in pages.items():
+                page_problems = problems_by_page.get(page_index, [])
+                version = state.problemPages.get(page_index)
+                if (version is not None and version.count == len(page_problems)
+                        and _same_file(version, st)):
+                    continue
 
+                # Phase 65-A: 읽기 전용 - 잠금 없이 캐시에서 조회
+                data = groups_cache.read_or_default(groups_file, {"groups": []})
+                groups = {}
                 for group in data.get("groups", []):
                     group_id = group.get("id")
                     if group_id:
-                        # Phase 47: 복합 키로 저장하여 덮어쓰기 방지
-                        composite_key = f"{page_index}:{group_id}"
-                        all_groups[composite_key] = {
-                            "group": group,
-                            "groupId": group_id,  # 원본 ID 보존
-                            "pageIndex": page_index,
-                            "documentId": session.problemDocumentId
-                        }
-
-            # 2. 기존 problems와 비교 (Phase 47: 복합 키 사용)
-            # 기존 problems를 복합 키로 변환: "{pageIndex}:{groupId}"
-            existing_composite_ids = {
-                f"{p.pageIndex}:{p.groupId}" for p in session.problems
-            }
-            new_composite_ids = set(all_groups.keys())
+                        groups[group_id] = group
+                pages_parsed += 1
 
-            added_count = 0
-            removed_count = 0
-            updated_count = 0
+                digest = _digest([
+                    [group_id, group.get("problemInfo", {}), group.get("isParent", False)]
+                    for group_id, group in groups.items()
+                ])
 
-            # 3. 신규 그룹 추가 (Phase 47: 복합 키로 비교)
-            for composite_key in (new_composite_ids - existing_composite_ids):
-                group_data = all_groups[composite_key]
-                group = group_data["group"]
-                original_group_id = group_data["groupId"]  # 원본 ID
-                problem_info = group.get("problemInfo", {})
-
-                # displayName 생성
-                # Phase 56-K: Frontend와 동일한 형식 사용 (책이름_p페이지_번호번)
-                problem_number = problem_info.get("problemNumber", "")
-                book_name = problem_info.get("bookName", "")
-                page = problem_info.get("page", group_data["pageIndex"] + 1)
-                display_name = problem_info.get("displayName", "")
-
-                if not display_name:
-                    if book_name and page:
-                        display_name = f"{book_name}_p{page}_{problem_number}번"
-                    elif book_name:
-                        display_name = f"{book_name}_{problem_number}번"
-                    else:
-                        display_name = f"#{original_group_id[:8]}"
-
-                # Phase 56-M: 모문제 여부 동기화
-                is_parent = group.get("isParent", False)
-
-                session.problems.append(ProblemReference(
-                    groupId=original_group_id,  # 원본 ID 사용
-                    documentId=group_data["documentId"],
-                    pageIndex=group_data["pageIndex"],
-                    problemNumber=problem_number or "",
-                    displayName=display_name,
-                    isParent=is_parent,  # Phase 56-M
-                    createdAt=int(datetime.now().timestamp() * 1000)
-                ))
-                added_count += 1
-
-            # 4. 기존 그룹 업데이트 (문항 정보 변경 시) - Phase 47: 복합 키로 조회
-            for problem in session.problems:
-                composite_key = f"{problem.pageIndex}:{problem.groupId}"
-                if composite_key in all_groups:
-                    group_data = all_groups[composite_key]
-                    group = group_data["group"]
-                    problem_info = group.get("problemInfo", {})
+                if version is None or version.hash != digest or version.count != len(page_problems):
+                    updated_count += self._apply_page_delta(
+                        session, page_index, groups, page_problems, added, removed_keys
+                    )
+
+                new_version = _page_version(st, digest, len(groups))
+                if new_version != version:
+                    state.problemPages[page_index] = new_version
+                    state_changed = True
 
-                    new_number = problem_info.get("problemNumber", "")
-                    new_display = problem_info.get("displayName", "")
-
-                    # Phase 56-K: Frontend와 동일한 형식 사용
-                    if not new_display:
-                        book_name = problem_info.get("bookName", "")
-                        page = problem_info.get("page", group_data["pageIndex"] + 1)
-                        if book_name and page:
-                            new_display = f"{book_name}_p{page}_{new_number}번"
-                        elif book_name:
-                            new_display = f"{book_name}_{new_number}번"
-
-                    if new_number and new_number != problem.problemNumber:
-                        problem.problemNumber = new_number
-                        updated_count += 1
-                    if new_display and new_display != problem.displayName:
-                        problem.displayName = new_display
-
-                    # Phase 56-M: 모문제 여부 업데이트
-                    new_is_parent = group.get("isParent", False)
-                    if new_is_parent != problem.isParent:
-                        problem.isParent = new_is_parent
-
-            # 5. 삭제된 그룹 제거 (Phase 47: 복합 키로 비교)
-            original_count = len(session.problems)
-            session.problems = [
-                p for p in session.problems
-                if f"{p.pageIndex}:{p.groupId}" in new_composite_ids
-            ]
-            removed_count = original_count - len(session.problems)
+            removed_count = 0
+            if removed_keys:
+                original_count = len(session.problems)
+                session.problems = [
+                    p for p in session.problems
+                    if (p.pageIndex, p.groupId) not in removed_keys
+                ]
+                removed_count = original_count - len(session.problems)
+            session.problems.extend(added)
 
             return SyncResult(
                 success=True,
-                problems_added=added_count,
+                problems_added=len(added),
                 problems_removed=removed_count,
-                problems_updated=updated_count
+                problems_updated=updated_count,
+                pages_parsed=pages_parsed,
+                state_changed=state_changed or bool(added or removed_count or updated_count)
             )
 
         except Exception as e:
             return SyncResult(success=False, error=str(e))
 
+    def _apply_page_delta(
+        self,
+        session: WorkSession,
+        page_index: int,
+        groups: Dict[str, Dict],
+        page_problems: List[ProblemReference],
+        added: List[ProblemReference],
+        removed_keys: Set[Tuple[int, str]]
+    ) -> int:
+        """
+        Phase 67-A: 한 페이지의 groups → session.problems 델타
+
+        신규 그룹은 added에, 삭제된 그룹은 removed_keys에 모으고
+        기존 문제는 제자리에서 갱신한다.
+
+        Returns:
+            문항 번호가 바뀐 문제 수
+        """
+        updated_count = 0
+        existing_ids = set()
+
+        for problem in page_problems:
+            existing_ids.add(problem.groupId)
+            group = groups.get(problem.groupId)
+            if group is None:
+                removed_keys.add((page_index, problem.groupId))
+                continue
+
+            problem_info = group.get("problemInfo", {})
+            new_number = problem_info.get("problemNumber", "")
+            new_display = _display_name(problem_info, page_index)
+
+            if new_number and new_number != problem.problemNumber:
+                problem.problemNumber = new_number
+                updated_count += 1
+            if new_display and new_display != problem.displayName:
+                problem.displayName = new_display
+
+            # Phase 56-M: 모문제 여부 업데이트
+            new_is_parent = group.get("isParent", False)
+            if new_is_parent != problem.isParent:
+                problem.isParent = new_is_parent
+
+        for group_id, group in groups.items():
+            if group_id in existing_ids:
+                continue
+            problem_info = group.get("problemInfo", {})
+
+            added.append(ProblemReference(
+                groupId=group_id,
+                documentId=session.problemDocumentId,
+                pageIndex=page_index,
+                problemNumber=problem_info.get("problemNumber", "") or "",
+                displayName=_display_name(problem_info, page_index) or f"#{group_id[:8]}",
+                isParent=group.get("isParent", False),  # Phase 56-M
+                createdAt=int(datetime.now().timestamp() * 1000)
+            ))
+
+        return updated_count
+
     def sync_links_to_groups(self, session: WorkSession) -> SyncResult:
         """
         session.links → groups.json.link 동기화
 
-        1. session.links 순회
-        2. 해당 그룹의 groups.json 찾기
-        3. link 필드 업데이트
+        1. session.links를 해설 페이지별로 묶어 기록할 link 값 생성
+        2. Phase 67-A: link 값 해시와 파일 (mtime, size)가 지난 동기화와 같으면 건너뜀
+        3. 나머지 페이지만 잠금 후 link 필드 갱신 (값이 다른 그룹이 있을 때만 저장)
+
+        links_synced: 이번에 groups.json에 새로 기록한 링크 수
         """
         try:
             if not session.solutionDocumentId:
                 return SyncResult(success=True)
 
-            synced_count = 0
-
             # 해설 문서의 groups 디렉토리
             solution_dir = self.config.get_document_dir(session.solutionDocumentId)
             groups_dir = solution_dir / "groups"
@@ -220,54 +339,78 @@ class SyncManager:
             if not groups_dir.exists():
                 return SyncResult(success=True)
 
-            # 링크를 페이지별로 그룹화
-            links_by_page: Dict[int, List[ProblemSolutionLink]] = {}
+            state = session.syncState
+            state_changed = False
+            if state.solutionDocumentId != session.solutionDocumentId:
+                state.solutionDocumentId = session.solutionDocumentId
+                state.linkPages = {}
+                state_changed = True
+
+            # 링크를 페이지별로 그룹화 → 해설 그룹 ID별 link 값
+            # (문제 정보는 세션 키 색인 - 같은 그룹 ID가 여러 개면 첫 번째)
+            link_values: Dict[int, Dict[str, Dict[str, Any]]] = defaultdict(dict)
             for link in session.links:
-                page = link.solutionPageIndex
-                if page not in links_by_page:
-                    links_by_page[page] = []
-                links_by_page[page].append(link)
+                problem_ref = session.find_problem(link.problemGroupId)
+                link_values[link.solutionPageIndex][link.solutionGroupId] = {
+                    "linkedGroupId": link.problemGroupId,
+                    "linkedDocumentId": session.problemDocumentId,
+                    "linkedPageIndex": problem_ref.pageIndex if problem_ref else 0,
+                    "linkedName": problem_ref.displayName if problem_ref else "",
+                    "linkType": "solution",
+                    "linkedAt": link.linkedAt
+                }
+
+            for page_index in list(state.linkPages):
+                if page_index not in link_values:
+                    del state.linkPages[page_index]
+                    state_changed = True
+
+            synced_count = 0
+            pages_parsed = 0
 
             # 각 페이지의 groups.json 업데이트
-            for page_index, links in links_by_page.items():
+            for page_index, values in link_values.items():
                 groups_file = groups_dir / f"page_{page_index:04d}_groups.json"
+                try:
+                    st = os.stat(groups_file)
+                except OSError:
+                    if state.linkPages.pop(page_index, None) is not None:
+                        state_changed = True
+                    continue
 
-                if not groups_file.exists():
+                digest = _digest(values)
+                version = state.linkPages.get(page_index)
+                if version is not None and version.hash == digest and _same_file(version, st):
                     continue
 
-                with file_lock(groups_file):
-                    data = safe_json_read(groups_file, {"groups": []})
-
-                    # 링크 정보를 그룹에 추가
-                    link_map = {l.solutionGroupId: l for l in links}
-                    modified = False
-
-                    for group in data.get("groups", []):
-                        group_id = group.get("id")
-                        if group_id in link_map:
-                            link = link_map[group_id]
-
-                            # 문제 그룹 정보 조회
-                            problem_ref = next(
-                                (p for p in session.problems if p.groupId == link.problemGroupId),
-                                None
-                            )
-
-                            group["link"] = {
-                                "linkedGroupId": link.problemGroupId,
-                                "linkedDocumentId": session.problemDocumentId,
-                                "linkedPageIndex": problem_ref.pageIndex if problem_ref else 0,
-                                "linkedName": problem_ref.displayName if problem_ref else "",
-                                "linkType": "solution",
-                                "linkedAt": link.linkedAt
-                            }
-                            modified = True
-                            synced_count += 1
-
-                    if modified:
-                        atomic_json_write(groups_file, data)
-
-            return SyncResult(success=True, links_synced=synced_count)
+                # 이미 같은 link가 기록되어 있으면 잠금/쓰기 없이 버전만 갱신
+                pages_parsed += 1
+                current = groups_cache.read_or_default(groups_file, {"groups": []})
+                if any(_needs_link(group, values) for group in current.get("groups", [])):
+                    with file_lock(groups_file):
+                        data = groups_cache.load_for_update(groups_file, {"groups": []})
+
+                        modified = False
+                        for group in data.get("groups", []):
+                            if _needs_link(group, values):
+                                group["link"] = values[group["id"]]
+                                modified = True
+                                synced_count += 1
+
+                        if modified:
+                            st = groups_cache.save(groups_file, data)
+                        else:
+                            st = os.stat(groups_file)
+
+                state.linkPages[page_index] = _page_version(st, digest, len(values))
+                state_changed = True
+
+            return SyncResult(
+                success=True,
+                links_synced=synced_count,
+                pages_parsed=pages_parsed,
+                state_changed=state_changed
+            )
 
         except Exception as e:
             return SyncResult(success=False, error=str(e))
@@ -278,6 +421,96 @@ class SyncManager:
         result2 = self.sync_links_to_groups(session)
         return SyncResult.merge(result1, result2)
 
+    # === Phase 67-B: 그룹 변경 이벤트 구독 ===
+
+    def apply_group_changes(self, changes: List[GroupChange]) -> None:
+        """
+        그룹 변경 → 관련 세션 동기화 (문제 목록 + 해설 link)
+
+        문서를 문제/해설로 쓰는 세션만 session_index로 찾아 full_sync.
+        Phase 67-A 증분 동기화이므로 바뀐 페이지만 다시 파싱된다.
+        """
+        session_ids = set()
+        for document_id in {change.document_id for change in changes}:
+            session_ids.update(s.sessionId for s in session_index.find_by_document(document_id))
+
+        for session_id in sorted(session_ids):
+            result = self.update_session(session_id, self.full_sync)
+            if result is not None and not result.success:
+                print(f"[SyncManager] 세션 동기화 실패: {session_id} - {result.error}")
+
+    def update_session(
+        self,
+        session_id: str,
+        apply: Callable[[WorkSession], SyncResult]
+    ) -> Optional[SyncResult]:
+        """
+        세션 로드 → apply → 바뀌었으면 저장 (Phase 67-B)
+
+        요청 처리 중인 라우터의 저장을 덮어쓰지 않도록, 로드 시점과 세션 버전이 같을 때만
+        저장하고 다르면 다시 로드해 재적용한다.
+        Phase 67-D: session_store의 조건부 스냅샷 저장 (그 사이 추가된 작업 로그도 버전에 포함)
+
+        Returns:
+            apply 결과 (세션이 없으면 None)
+        """
+        for _ in range(_SESSION_UPDATE_RETRIES):
+            loaded = session_store.load_for_update(session_id)
+            if loaded is None:
+                return None
+            session, version = loaded
+
+            result = apply(session)
+            if not (result.success and result.state_changed):
+                return result
+
+            session.updatedAt = int(datetime.now().timestamp() * 1000)
+            stored = session_store.save(session, expected=version)
+            if stored is None:
+                continue  # 그 사이 저장/작업 추가 (또는 삭제)
+
+            session_index.put(stored)
+            return result
+
+        return SyncResult(success=False, error="세션이 계속 변경되어 동기화를 건너뜀")
+
+    def refresh_exported_problems(self, changes: List[GroupChange]) -> None:
+        """
+        그룹 변경 → 내보낸 문제 메타데이터(problems/*.json)의 problem_info 갱신
+
+        바뀐 페이지의 그룹별 메타 파일만 확인 (이미지는 다시 만들지 않음).
+        삭제 이벤트는 건너뜀 - 내보낸 파일 삭제는 remove_problem의 명시적 경로가 담당.
+        """
+        for change in changes:
+            if change.kind in ("deleted", "cleared"):
+                continue
+
+            groups_dir = self.config.get_document_dir(change.document_id) / "groups"
+            if change.page_index is None:
+                if not groups_dir.exists():
+                    continue
+                pages = sorted(_scan_group_pages(groups_dir))
+            else:
+                pages = [change.page_index]
+
+            problems_dir = self.config.get_document_dir(change.document_id) / "problems"
+            for page_index in pages:
+                groups_file = groups_dir / f"page_{page_index:04d}_groups.json"
+                data = groups_cache.read_or_default(groups_file, {"groups": []})
+                for group in data.get("groups", []):
+                    group_id = group.get("id")
+                    if not group_id or (change.group_ids and group_id not in change.group_ids):
+                        continue
+                    meta_path = problems_dir / f"{change.document_id}_p{page_index:04d}_{group_id}.json"
+                    try:
+                        meta = load_json(meta_path)
+                    except (OSError, ValueError):
+                        continue
+                    problem_info = group.get("problemInfo", {})
+                    if meta.get("problem_info") != problem_info:
+                        meta["problem_info"] = problem_info
+                        atomic_json_write(meta_path, meta)
+
     def sync_single_link_to_group(
         self,
         solution_document_id: str,
@@ -307,7 +540,7 @@ class SyncManager:
                 return False
 
             with file_lock(groups_file):
-                data = safe_json_read(groups_file, {"groups": []})
+                data = groups_cache.load_for_update(groups_file, {"groups": []})
 
                 found = False
                 for group in data.get("groups", []):
@@ -317,7 +550,7 @@ class SyncManager:
                         break
 
                 if found:
-                    atomic_json_write(groups_file, data)
+                    groups_cache.save(groups_file, data)
 
             return found
 
@@ -352,7 +585,7 @@ class SyncManager:
                 return False
 
             with file_lock(groups_file):
-                data = safe_json_read(groups_file, {"groups": []})
+                data = groups_cache.load_for_update(groups_file, {"groups": []})
 
                 found = False
                 for group in data.get("groups", []):
@@ -363,7 +596,7 @@ class SyncManager:
                         break
 
                 if found:
-                    atomic_json_write(groups_file, data)
+                    groups_cache.save(groups_file, data)
 
             return found
 
@@ -398,7 +631,7 @@ class SyncManager:
                 return False
 
             with file_lock(groups_file):
-                data = safe_json_read(groups_file, {"groups": []})
+                data = groups_cache.load_for_update(groups_file, {"groups": []})
                 original_count = len(data.get("groups", []))
 
                 # 그룹 필터링 (삭제)
@@ -409,7 +642,8 @@ class SyncManager:
 
                 # 변경이 있으면 저장
                 if len(data["groups"]) < original_count:
-                    atomic_json_write(groups_file, data)
+                    groups_cache.save(groups_file, data)
+                    group_events.publish(document_id, page_index, "deleted", (group_id,))
                     print(f"[SyncManager] Group deleted from disk: {group_id}")
                     return True
 
@@ -485,14 +719,17 @@ class SyncManager:
 
             for groups_file in groups_dir.glob("page_*_groups.json"):
                 with file_lock(groups_file):
-                    data = safe_json_read(groups_file, {"groups": []})
+                    data = groups_cache.load_for_update(groups_file, {"groups": []})
                     groups_removed += len(data.get("groups", []))
 
                     # 그룹 배열 비우기
                     data["groups"] = []
-                    atomic_json_write(groups_file, data)
+                    groups_cache.save(groups_file, data)
                     files_cleaned += 1
 
+            # Phase 67-B: 같은 문서를 쓰는 다른 세션도 동기화
+            group_events.publish(document_id, None, "cleared")
+
             print(f"[SyncManager] Cleaned {files_cleaned} files, {groups_removed} groups from {document_id}")
             return {"files_cleaned": files_cleaned, "groups_removed": groups_removed}
 
@@ -527,9 +764,10 @@ class SyncManager:
             cleanup_result = self.cleanup_all_groups(session.solutionDocumentId)
             result["groups_removed"] += cleanup_result["groups_removed"]
 
-        # 3. 세션 데이터 초기화
+        # 3. 세션 데이터 초기화 (Phase 67-A: 동기화 버전 포함)
         session.problems = []
         session.links = []
+        session.syncState = SessionSyncState()
 
         print(f"[SyncManager] Session reset: {result}")
         return result
@@ -551,7 +789,7 @@ class SyncManager:
             groups_count = 0
             if groups_dir.exists():
                 for groups_file in groups_dir.glob("page_*_groups.json"):
-                    data = safe_json_read(groups_file, {"groups": []})
+                    data = groups_cache.read_or_default(groups_file, {"groups": []})
                     groups_count += len(data.get("groups", []))
 
             session_count = len(session.problems)
@@ -580,3 +818,7 @@ class SyncManager:
 
 # 전역 인스턴스
 sync_manager = SyncManager()
+
+# Phase 67-B: 그룹 변경 이벤트 구독
+group_events.subscribe("session_sync", sync_manager.apply_group_changes)
+group_events.subscribe("export_meta", sync_manager.refresh_exported_problems)
@@ -3,6 +3,7 @@
 
 PDF 업로드 후 나머지 페이지를 백그라운드에서 처리
 Phase 14-1: 점진적 변환 지원 (이미지 변환 + 블록 분석)
+Phase 64-B: 완료 시 렌더링 결과 중복 제거 (blob 저장소)
 """
 from typing import Dict, Optional
 from dataclasses import dataclass, field
@@ -16,6 +17,7 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
 from pdf_pipeline import PDFPipeline
+from app.services.blob_store import get_blob_store
 
 
 @dataclass
@@ -166,6 +168,9 @@ class BackgroundTaskQueue:
             # PDF 캐시 정리
             pipeline.pdf_processor.close_pdf_cache(pdf_path)
 
+            # Phase 64-B: 백그라운드에서 만든 페이지/썸네일도 blob 저장소에 등록
+            get_blob_store().dedup_document(pipeline.config.get_document_dir(task.document_id))
+
             print(f"[TaskQueue] 점진적 작업 완료: {task_id}")
 
         except Exception as e:
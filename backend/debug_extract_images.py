@@ -102,7 +102,7 @@ print(f"images_data truthy: {bool(images_data)}")
 print()
 
 for bin_id, img_info in images_data.items():
-    print(f"  Image {bin_id}: data_len={len(img_info.get('data', b''))}, format={img_info.get('format')}")
+    print(f"  Image {bin_id}: data_len={len(img_info['handle'].read())}, format={img_info.get('format')}")
 print()
 
 print(f"image_count from metadata: {result.detected_metadata.get('image_count') if result.detected_metadata else None}")
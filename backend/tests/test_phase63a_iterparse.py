@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 63-A: iterparse 기반 단일 패스 HML 스캔 테스트
+
+테스트 항목:
+1. 문단/ENDNOTE/AUTONUM/PICTURE/BINDATA 단일 패스 수집
+2. ENDNOTE 내부 P 태그는 본문 P 목록에서 제외
+3. 처리된 서브트리 해제
+4. ENDNOTE 기반 문제 추출 결과
+"""
+import base64
+import os
+import sys
+import tempfile
+import zlib
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.hangul.hml_parser import HMLParser
+
+
+IMAGE_BYTES = b'\x89PNG fake image payload' * 10
+
+
+def _compressed_b64(data: bytes) -> str:
+    """raw deflate + Base64 (HML BINDATA 형식)"""
+    compressor = zlib.compressobj(wbits=-15)
+    raw = compressor.compress(data) + compressor.flush()
+    return base64.b64encode(raw).decode()
+
+
+def _problem_paragraph(number: int, answer: str, with_picture: bool = False) -> str:
+    picture = ''
+    if with_picture:
+        picture = (
+            '<SHAPEOBJECT><PICTURE><SHAPECOMPONENT>'
+            '<IMAGE BinItem="1"/>'
+            '</SHAPECOMPONENT></PICTURE></SHAPEOBJECT>'
+        )
+    return (
+        '<P><TEXT>'
+        f'<AUTONUM Number="{number}" NumberType="Endnote"/>'
+        '<ENDNOTE><PARALIST><P><TEXT>'
+        f'<CHAR>[정답] {answer}</CHAR>'
+        '</TEXT></P></PARALIST></ENDNOTE>'
+        f'<CHAR>다음 식의 값을 구하시오. 문제{number}</CHAR>'
+        '<EQUATION><SCRIPT>{1} over {2}</SCRIPT></EQUATION>'
+        f'{picture}'
+        '</TEXT></P>'
+        '<P><TEXT><CHAR>① 1</CHAR></TEXT></P>'
+    )
+
+
+@pytest.fixture
+def sample_hml_file():
+    """ENDNOTE 3개 + 그림 + 압축 이미지가 있는 HML"""
+    body = ''.join(
+        _problem_paragraph(n, ans, with_picture=(n == 2))
+        for n, ans in [(1, '②'), (2, '③'), (3, '12')]
+    )
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<HWPML Version="2.8"><HEAD>'
+        '<DOCSUMMARY><TITLE>테스트 시험지</TITLE><AUTHOR>작성자</AUTHOR></DOCSUMMARY>'
+        '<MAPPINGTABLE><BINDATALIST><BINITEM BinData="1" Format="png"/></BINDATALIST></MAPPINGTABLE>'
+        '</HEAD><BODY><SECTION>'
+        f'{body}'
+        '</SECTION></BODY><TAIL><BINDATASTORAGE>'
+        f'<BINDATA Compress="true" Encoding="Base64" Id="1">{_compressed_b64(IMAGE_BYTES)}</BINDATA>'
+        '</BINDATASTORAGE></TAIL></HWPML>'
+    )
+    with tempfile.NamedTemporaryFile(
+        mode='w',
+        suffix='.hml',
+        delete=False,
+        encoding='utf-8'
+    ) as f:
+        f.write(content)
+        temp_path = f.name
+
+    yield temp_path
+
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+
+
+class TestSinglePassScan:
+    """단일 패스 스캔 결과 테스트"""
+
+    def test_collects_all_parts(self, sample_hml_file):
+        """한 번의 스캔으로 모든 정보가 수집되는지 확인"""
+        parser = HMLParser(sample_hml_file)
+        parser._scan_document()
+
+        assert len(parser._endnote_texts) == 3
+        assert parser._endnote_texts[0] == '[정답] ②'
+        assert [p['number'] for p in parser._autonum_positions] == [1, 2, 3]
+        assert parser._picture_locations == [{'bin_id': '1', 'p_index': 2}]
+        assert parser._images['1']['format'] == 'png'
+        assert parser._images['1']['handle'].read() == IMAGE_BYTES
+        assert parser._raw_metadata['title'] == '테스트 시험지'
+
+    def test_endnote_paragraphs_excluded_from_body(self, sample_hml_file):
+        """ENDNOTE 내부 P는 extract_text에는 포함, 본문 P 목록에서는 제외"""
+        parser = HMLParser(sample_hml_file)
+        paragraphs = parser.extract_text()
+
+        # 본문 P: 문제 P + 선택지 P (문제당 2개)
+        assert len(parser._body_tokens) == 6
+        assert '[정답] ②' in paragraphs
+
+    def test_processed_subtrees_cleared(self, sample_hml_file):
+        """처리된 문단과 BINDATA가 트리에서 해제되는지 확인"""
+        parser = HMLParser(sample_hml_file)
+        parser._scan_document()
+
+        assert all(len(p) == 0 for p in parser.root.iter('P'))
+        assert all(b.text is None for b in parser.root.iter('BINDATA'))
+
+    def test_scan_runs_once(self, sample_hml_file):
+        """extract_text/extract_images 반복 호출 시 재스캔하지 않음"""
+        parser = HMLParser(sample_hml_file)
+        first = parser.extract_text()
+        parser.extract_images()
+
+        assert parser.extract_text() is first
+
+
+class TestParseResult:
+    """ParseResult 테스트"""
+
+    def test_endnote_extraction(self, sample_hml_file):
+        """ENDNOTE 기반 문제 추출 결과"""
+        result = HMLParser(sample_hml_file).parse()
+
+        assert result.success
+        assert result.detected_metadata['extraction_method'] == 'endnote'
+        assert [p.answer for p in result.problems] == ['②', '③', '12']
+        assert r'\frac{1}{2}' in result.problems[0].content_latex
+        assert result.problems[1].content_images == ['1']
+        assert result.detected_metadata['image_count'] == 1
+
+    def test_invalid_xml(self):
+        """잘못된 XML은 파싱 오류로 보고"""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.hml', delete=False, encoding='utf-8'
+        ) as f:
+            f.write('<HWPML><BODY><P>')
+            temp_path = f.name
+
+        try:
+            result = HMLParser(temp_path).parse()
+            assert result.success is False
+            assert result.errors[0].startswith('XML 파싱 오류')
+        finally:
+            os.unlink(temp_path)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 63-B: BINDATA 지연 로딩 핸들 테스트
+
+테스트 항목:
+1. 파싱 시 오프셋만 기록 (디코딩하지 않음)
+2. read()/save() 결과가 원본 데이터와 일치
+3. 압축 해제 폴백 (raw deflate → zlib → 원본)
+4. 엔티티 포함 시 inline 폴백
+"""
+import base64
+import os
+import sys
+import zlib
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.hangul.hml_parser import HMLParser, BinDataHandle
+
+
+PAYLOAD = bytes(range(256)) * 2000   # 512KB (여러 청크)
+
+
+def _raw_deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _wrap(b64: str, width: int = 76) -> str:
+    """HML처럼 Base64를 줄바꿈하여 저장"""
+    return '\r\n'.join(b64[i:i + width] for i in range(0, len(b64), width))
+
+
+def _write_hml(tmp_path, bindata_xml: str):
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<HWPML><HEAD><MAPPINGTABLE><BINDATALIST>'
+        '<BINITEM BinData="1" Format="bmp"/><BINITEM BinData="2" Format="png"/>'
+        '</BINDATALIST></MAPPINGTABLE></HEAD>'
+        '<BODY><SECTION><P><TEXT><CHAR>본문</CHAR></TEXT></P></SECTION></BODY>'
+        f'<TAIL><BINDATASTORAGE>{bindata_xml}</BINDATASTORAGE></TAIL></HWPML>'
+    )
+    path = tmp_path / 'sample.hml'
+    path.write_bytes(content.encode('utf-8'))
+    return path
+
+
+@pytest.fixture
+def hml_with_images(tmp_path):
+    compressed = _wrap(base64.b64encode(_raw_deflate(PAYLOAD)).decode())
+    plain = _wrap(base64.b64encode(b'plain png bytes').decode())
+    return _write_hml(
+        tmp_path,
+        f'<BINDATA Compress="true" Encoding="Base64" Id="1">{compressed}</BINDATA>'
+        f'<BINDATA Encoding="Base64" Id="2">{plain}</BINDATA>'
+    )
+
+
+class TestLazyHandles:
+    """지연 로딩 핸들 테스트"""
+
+    def test_handles_reference_file_offsets(self, hml_with_images):
+        """파싱 결과는 데이터가 아닌 파일 위치만 보관"""
+        images = HMLParser(str(hml_with_images)).extract_images()
+
+        handle = images['1']['handle']
+        assert isinstance(handle, BinDataHandle)
+        assert handle.inline_text is None
+        assert handle.compressed is True
+        assert images['2']['handle'].compressed is False
+
+        raw = hml_with_images.read_bytes()
+        assert raw[handle.offset - 1:handle.offset] == b'>'
+        assert raw[handle.offset + handle.length:].startswith(b'</BINDATA>')
+
+    def test_read_decodes_on_demand(self, hml_with_images):
+        """read()가 압축 해제된 원본 데이터를 반환"""
+        images = HMLParser(str(hml_with_images)).extract_images()
+
+        assert images['1']['handle'].read() == PAYLOAD
+        assert images['2']['handle'].read() == b'plain png bytes'
+        assert images['1']['format'] == 'bmp'
+
+    def test_save_streams_to_disk(self, hml_with_images, tmp_path):
+        """save()가 청크 단위로 디스크에 기록"""
+        handle = HMLParser(str(hml_with_images)).extract_images()['1']['handle']
+        dest = tmp_path / 'out.bmp'
+
+        written = handle.save(dest)
+
+        assert written == len(PAYLOAD)
+        assert dest.read_bytes() == PAYLOAD
+
+
+class TestDecompressFallback:
+    """압축 해제 폴백 테스트"""
+
+    def test_zlib_header_fallback(self, tmp_path):
+        """raw deflate 실패 시 zlib 헤더 형식으로 재시도"""
+        b64 = base64.b64encode(zlib.compress(PAYLOAD)).decode()
+        path = _write_hml(tmp_path, f'<BINDATA Compress="true" Id="1">{b64}</BINDATA>')
+
+        handle = HMLParser(str(path)).extract_images()['1']['handle']
+        assert handle.read() == PAYLOAD
+
+    def test_not_actually_compressed(self, tmp_path):
+        """압축 해제가 모두 실패하면 원본 유지"""
+        b64 = base64.b64encode(b'not compressed').decode()
+        path = _write_hml(tmp_path, f'<BINDATA Compress="true" Id="1">{b64}</BINDATA>')
+
+        handle = HMLParser(str(path)).extract_images()['1']['handle']
+        assert handle.read() == b'not compressed'
+
+    def test_entity_falls_back_to_inline(self, tmp_path):
+        """엔티티가 포함된 본문은 파싱된 텍스트를 보관"""
+        b64 = base64.b64encode(b'entity data').decode()
+        path = _write_hml(tmp_path, f'<BINDATA Id="1">{b64[:8]}&#13;&#10;{b64[8:]}</BINDATA>')
+
+        handle = HMLParser(str(path)).extract_images()['1']['handle']
+        assert handle.inline_text is not None
+        assert handle.read() == b'entity data'
+
+    def test_invalid_base64_raises(self, tmp_path):
+        """손상된 Base64는 save() 시 ValueError"""
+        path = _write_hml(tmp_path, '<BINDATA Id="1">abcde</BINDATA>')
+
+        handle = HMLParser(str(path)).extract_images()['1']['handle']
+        with pytest.raises(ValueError):
+            handle.save(tmp_path / 'broken.bin')
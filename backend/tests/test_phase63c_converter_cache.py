@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 63-C: HWP→LaTeX 변환기 캐시/컴파일 패턴 테스트
+
+테스트 항목:
+1. LRU 캐시 적중 및 크기 제한
+2. 명령어 alternation 1회 스캔 == 기존 순차 치환
+3. 개발 환경 mtime 확인 주기 제한
+4. 변환 처리량 (Phase 20-A 테스트 수식 기준)
+"""
+import re
+import time
+import os
+import sys
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.hangul import hwp_latex_converter
+from app.services.hangul.hwp_latex_converter import HwpLatexConverter
+
+
+# Phase 20-A 테스트 수식 (test_phase20a_converter.py)
+PHASE20A_CORPUS = [
+    'rm A',
+    'overline{{rm{AB}} it }',
+    '{5} over {4}',
+    'LEFT ( x RIGHT )',
+    'test1',
+    'test2',
+    'test',
+]
+
+
+def _sequential_basic_commands(text: str) -> str:
+    """Phase 63-C 이전의 명령어별 순차 치환 (비교 기준)"""
+    for hwp_cmd, latex_cmd in sorted(
+        HwpLatexConverter.COMMAND_MAP.items(), key=lambda x: len(x[0]), reverse=True
+    ):
+        pattern = r'(?<!\\)\b' + re.escape(hwp_cmd) + r'(?![a-zA-Z])'
+        text = re.sub(pattern, latex_cmd.replace('\\', '\\\\'), text)
+    return text
+
+
+class TestConversionCache:
+    """변환 캐시 테스트"""
+
+    def test_repeated_equation_hits_cache(self):
+        """같은 수식 반복 변환 시 캐시 적중"""
+        converter = HwpLatexConverter()
+
+        first = converter.convert('{1} over {2}')
+        second = converter.convert('{1} over {2}')
+
+        assert first == second == r'\frac{1}{2}'
+        info = converter.cache_info()
+        assert info['hits'] == 1
+        assert info['misses'] == 1
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """캐시 크기가 CACHE_SIZE를 넘지 않음"""
+        monkeypatch.setattr(HwpLatexConverter, 'CACHE_SIZE', 8)
+        converter = HwpLatexConverter()
+
+        for i in range(20):
+            converter.convert(f'x SUP {i}')
+
+        assert converter.cache_info()['size'] == 8
+
+    def test_empty_equation_not_cached(self):
+        """빈 수식은 캐시를 거치지 않음"""
+        converter = HwpLatexConverter()
+
+        assert converter.convert('   ') == ''
+        assert converter.cache_info()['misses'] == 0
+
+
+class TestCompiledCommands:
+    """명령어 alternation 테스트"""
+
+    @pytest.mark.parametrize('text', [
+        'subseteq A', 'A subset B', 'leq5', 'geq0', 'x LEQ y',
+        'ALPHA + beta', 'lcm', '3 DEG', r'\geq geq', 'pipi', 'pi2pi',
+        'sin x cos y', 'alphabeta', 'RIGHTARROW to', 'in notin',
+    ])
+    def test_same_as_sequential(self, text):
+        """단일 스캔 결과가 순차 치환과 동일"""
+        converter = HwpLatexConverter()
+        assert converter._convert_basic_commands(text) == _sequential_basic_commands(text)
+
+
+class TestMtimeThrottle:
+    """mtime 확인 주기 제한 테스트"""
+
+    def test_mtime_checked_once_per_interval(self, monkeypatch):
+        """주기 안에서는 getmtime을 다시 호출하지 않음"""
+        calls = []
+        real_getmtime = os.path.getmtime
+
+        def counting_getmtime(path):
+            calls.append(path)
+            return real_getmtime(path)
+
+        monkeypatch.setenv('APP_ENV', 'development')
+        monkeypatch.setattr(hwp_latex_converter, 'MTIME_CHECK_INTERVAL', 60.0)
+        monkeypatch.setattr(hwp_latex_converter, '_last_mtime_check', float('-inf'))
+        monkeypatch.setattr(hwp_latex_converter._os.path, 'getmtime', counting_getmtime)
+
+        for _ in range(100):
+            hwp_latex_converter.hwp_to_latex('rm A')
+
+        assert len(calls) == 1
+
+
+class TestThroughput:
+    """변환 처리량 테스트"""
+
+    def test_cached_throughput(self):
+        """반복 수식은 캐시로 빠르게 변환"""
+        converter = HwpLatexConverter()
+        corpus = PHASE20A_CORPUS * 1000
+
+        start = time.perf_counter()
+        for eq in corpus:
+            converter.convert(eq)
+        elapsed = time.perf_counter() - start
+
+        assert converter.cache_info()['misses'] == len(PHASE20A_CORPUS)
+        # 7000개 변환 (대부분 캐시 적중) - 넉넉한 상한
+        assert elapsed < 1.0
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 63-D: 한글 파일 일괄 가져오기 API 테스트
+
+테스트 항목:
+1. 여러 HML 파일 + ZIP 묶음 병렬 파싱 (NDJSON 스트리밍)
+2. 지원하지 않는 파일은 해당 항목만 실패
+3. save=true 시 파싱 성공 파일 바로 저장
+4. SSE 형식
+5. 단일 /parse 응답 유지
+6. ZIP 압축 해제 한도 (파일당 / 묶음 전체) 초과 시 오류 항목
+"""
+import io
+import json
+import os
+import sys
+import zipfile
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import config
+from app.routers import hangul
+from app.services.hangul import batch_import
+
+
+def _hml_bytes(title: str, answers) -> bytes:
+    """ENDNOTE 정답이 있는 최소 HML (ENDNOTE 3개 이상 → 미주 기반 추출)"""
+    body = ''.join(
+        '<P><TEXT>'
+        f'<AUTONUM Number="{n}" NumberType="Endnote"/>'
+        f'<ENDNOTE><PARALIST><P><TEXT><CHAR>[정답] {ans}</CHAR></TEXT></P></PARALIST></ENDNOTE>'
+        f'<CHAR>{title} 문제{n}</CHAR>'
+        '</TEXT></P>'
+        for n, ans in enumerate(answers, start=1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<HWPML><HEAD><DOCSUMMARY><TITLE>{title}</TITLE></DOCSUMMARY></HEAD>'
+        f'<BODY><SECTION>{body}</SECTION></BODY></HWPML>'
+    ).encode('utf-8')
+
+
+def _zip_bytes(members) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """임시 DATASET_ROOT를 사용하는 한글 라우터 클라이언트"""
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setenv('HANGUL_IMPORT_WORKERS', '2')
+
+    app = FastAPI()
+    app.include_router(hangul.router, prefix="/api/hangul")
+    yield TestClient(app)
+
+    batch_import.shutdown_import_pool()
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+class TestBatchImport:
+    """일괄 가져오기 테스트"""
+
+    def test_parses_files_and_zip(self, client):
+        """개별 파일과 ZIP 내부 파일을 모두 파싱"""
+        archive = _zip_bytes({
+            'exams/c.hml': _hml_bytes('시험C', ['5', '6', '7']),
+            'readme.txt': b'ignored',
+        })
+        files = [
+            ('files', ('a.hml', _hml_bytes('시험A', ['①', '②', '④']), 'application/octet-stream')),
+            ('files', ('b.hml', _hml_bytes('시험B', ['③', '5', '⑤']), 'application/octet-stream')),
+            ('files', ('bundle.zip', archive, 'application/zip')),
+            ('files', ('notes.pdf', b'%PDF', 'application/pdf')),
+        ]
+
+        response = client.post('/api/hangul/parse/batch', files=files)
+
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+        records = _ndjson(response)
+        file_records = {r['filename']: r for r in records if r['type'] == 'file'}
+
+        assert set(file_records) == {'a.hml', 'b.hml', 'bundle.zip/c.hml', 'notes.pdf'}
+        assert [p['answer'] for p in file_records['a.hml']['result']['problems']] == ['①', '②', '④']
+        assert file_records['bundle.zip/c.hml']['success'] is True
+        assert file_records['notes.pdf']['success'] is False
+
+        summary = records[-1]
+        assert summary['type'] == 'summary'
+        assert summary['total'] == 4
+        assert summary['succeeded'] == 3
+        assert summary['failed'] == 1
+
+    def test_upload_total_limit(self, client, tmp_path, monkeypatch):
+        """업로드 파일 크기 합이 한도를 넘으면 저장 중 413, 작업 디렉토리 정리"""
+        a = _hml_bytes('시험A', ['①', '②', '④'])
+        monkeypatch.setattr(config, 'MAX_BATCH_UPLOAD_SIZE', len(a) + 10)
+        monkeypatch.setattr(hangul.tempfile, 'tempdir', str(tmp_path / 'tmp'))
+        (tmp_path / 'tmp').mkdir()
+        files = [
+            ('files', ('a.hml', a, 'application/octet-stream')),
+            ('files', ('b.hml', _hml_bytes('시험B', ['③']), 'application/octet-stream')),
+        ]
+
+        response = client.post('/api/hangul/parse/batch', files=files)
+
+        assert response.status_code == 413
+        assert '크기 합' in response.json()['detail'] and 'b.hml' in response.json()['detail']
+        assert list((tmp_path / 'tmp').iterdir()) == []
+
+    def test_save_on_success(self, client, tmp_path):
+        """save=true: 파싱된 문제를 문제은행에 바로 저장"""
+        files = [
+            ('files', ('a.hml', _hml_bytes('시험A', ['①', '②', '④']), 'application/octet-stream')),
+            ('files', ('b.hml', _hml_bytes('시험B', ['③', '5', '⑤']), 'application/octet-stream')),
+        ]
+        data = {'save': 'true', 'metadata': json.dumps({'subject': '수학'})}
+
+        response = client.post('/api/hangul/parse/batch', files=files, data=data)
+
+        records = _ndjson(response)
+        assert records[-1]['saved_count'] == 6
+        assert all(r['saved']['success'] for r in records if r['type'] == 'file')
+
+        index = json.loads((tmp_path / 'problem_bank' / 'index.json').read_text(encoding='utf-8'))
+        assert len(index['problems']) == 6
+        assert {p['subject'] for p in index['problems']} == {'수학'}
+
+    def test_sse_format(self, client):
+        """format=sse: event-stream 메시지"""
+        files = [('files', ('a.hml', _hml_bytes('시험A', ['①']), 'application/octet-stream'))]
+
+        response = client.post('/api/hangul/parse/batch?format=sse', files=files)
+
+        assert response.headers['content-type'].startswith('text/event-stream')
+        events = [chunk for chunk in response.text.split('\n\n') if chunk]
+        assert events[0].startswith('event: file\ndata: ')
+        assert events[-1].startswith('event: summary\ndata: ')
+
+    def test_no_supported_files(self, client):
+        """ZIP 안에 가져올 파일이 없으면 400"""
+        archive = _zip_bytes({'readme.txt': b'ignored'})
+        files = [('files', ('bundle.zip', archive, 'application/zip'))]
+
+        response = client.post('/api/hangul/parse/batch', files=files)
+
+        assert response.status_code == 400
+
+    def test_invalid_metadata(self, client):
+        """잘못된 메타데이터 JSON은 400"""
+        files = [('files', ('a.hml', _hml_bytes('시험A', ['①']), 'application/octet-stream'))]
+
+        response = client.post(
+            '/api/hangul/parse/batch', files=files, data={'metadata': '{not json'}
+        )
+
+        assert response.status_code == 400
+
+
+class TestZipLimits:
+    """ZIP 압축 해제 한도 테스트"""
+
+    def test_member_and_total_limits(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, 'MAX_ZIP_MEMBER_SIZE', 1000)
+        monkeypatch.setattr(config, 'MAX_ZIP_TOTAL_SIZE', 1500)
+        zip_path = tmp_path / 'bundle.zip'
+        # 압축률이 높은 내용 - 압축 크기가 아니라 해제 크기로 판단
+        zip_path.write_bytes(_zip_bytes({
+            'a.hml': b'a' * 800,
+            'big.hml': b'b' * 5000,
+            'c.hml': b'c' * 800,
+            'd.hml': b'd' * 10,
+        }))
+
+        items = batch_import.expand_zip(zip_path, tmp_path / 'work', 'bundle.zip', 0, 10)
+
+        assert [(i.filename, i.error is None) for i in items] == [
+            ('bundle.zip/a.hml', True), ('bundle.zip/big.hml', False), ('bundle.zip/c.hml', False),
+        ]
+        assert items[0].path.read_bytes() == b'a' * 800
+        assert '파일이 너무 큽니다' in items[1].error and '나머지' in items[2].error
+        assert not (tmp_path / 'work' / '1').exists()
+
+
+class TestSingleParse:
+    """단일 /parse 응답 유지 확인"""
+
+    def test_parse_single_file(self, client):
+        files = {'file': ('a.hml', _hml_bytes('시험A', ['①', '②', '④']), 'application/octet-stream')}
+
+        response = client.post('/api/hangul/parse', files=files)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body['file_name'] == 'a.hml'
+        assert body['stats']['total_problems'] == 3
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 63-E: HWPX 스트리밍 파서 테스트
+
+테스트 항목:
+1. ZIP 멤버 직접 읽기 (임시 디렉토리 압축 해제 없음)
+2. 문단 단위 분할 == 섹션 전체 결합 후 분할
+3. 수식 LaTeX/Unicode 1회 변환 (캐시)
+4. 섹션 순서 / 파싱 오류 섹션 제외
+"""
+import os
+import sys
+import tempfile
+import zipfile
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.hangul.hwpx_parser import HWPXParser
+from app.services.hangul.equation_converter import hancom_convert
+
+
+NS = 'http://www.hancom.co.kr/hwpml/2011/paragraph'
+
+
+def _section(*paragraphs: str) -> str:
+    body = ''.join(f'<hp:p>{p}</hp:p>' for p in paragraphs)
+    return f'<?xml version="1.0" encoding="UTF-8"?><hs:sec xmlns:hp="{NS}" xmlns:hs="urn:sec">{body}</hs:sec>'
+
+
+def _run(text: str) -> str:
+    return f'<hp:run><hp:t>{text}</hp:t></hp:run>'
+
+
+def _equation(script: str) -> str:
+    return f'<hp:run><hp:equation><hp:script>{script}</hp:script></hp:equation></hp:run>'
+
+
+@pytest.fixture
+def hwpx_file():
+    """섹션 2개 + 중첩 문단 + 반복 수식이 있는 HWPX"""
+    section0 = _section(
+        _run('1. 다음 값을 구하시오.') + _equation('x^{2} + 1'),
+        _run('보기 12.'),
+        _run('문단 경계에서 시작하는 번호') + _equation('x^{2} + 1'),
+        _run('2) 표 문제') + '<hp:tbl><hp:tc><hp:subList><hp:p>' + _run('셀 내용') + '</hp:p></hp:subList></hp:tc></hp:tbl>',
+        _run('[정답] ③'),
+    )
+    section1 = _section(_run('[2] 두 번째 섹션 문제'))
+
+    with tempfile.NamedTemporaryFile(suffix='.hwpx', delete=False) as f:
+        temp_path = f.name
+    with zipfile.ZipFile(temp_path, 'w') as zf:
+        zf.writestr('mimetype', 'application/hwp+zip')
+        zf.writestr('Contents/section1.xml', section1)
+        zf.writestr('Contents/section0.xml', section0)
+        zf.writestr('BinData/image1.png', b'PNGDATA')
+
+    yield temp_path
+
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+
+
+def _open(path: str) -> HWPXParser:
+    parser = HWPXParser(path)
+    parser.zip_file = zipfile.ZipFile(path)
+    return parser
+
+
+class TestStreamingSections:
+    """섹션 스트리밍 테스트"""
+
+    def test_no_temp_extraction(self, hwpx_file, monkeypatch):
+        """파싱 중 임시 디렉토리를 만들지 않음"""
+        def fail_mkdtemp(*args, **kwargs):
+            raise AssertionError('mkdtemp called')
+        monkeypatch.setattr(tempfile, 'mkdtemp', fail_mkdtemp)
+
+        result = HWPXParser(hwpx_file).parse()
+
+        assert result.success
+
+    def test_same_as_join_and_split(self, hwpx_file):
+        """문단 단위 분할 결과가 섹션 결합 후 분할과 동일"""
+        parser = _open(hwpx_file)
+        paragraphs = parser.extract_text()
+
+        expected = []
+        for member in parser._section_members():
+            items = list(parser._iter_section_items(member))
+            expected.extend(parser._split_into_paragraphs(' '.join(items)))
+
+        assert paragraphs == expected
+        # "12." + 다음 문단의 공백 → 문단 경계를 넘어 완성되는 분할 패턴
+        assert '2. 문단 경계에서 시작하는 번호 x² + 1' in paragraphs
+        assert paragraphs[-1] == '[2] 두 번째 섹션 문제'
+
+    def test_nested_paragraph_kept(self, hwpx_file):
+        """중첩 문단은 바깥 문단과 별도로도 반환 (기존 동작 유지)"""
+        parser = _open(hwpx_file)
+        items = list(parser._iter_section_items('Contents/section0.xml'))
+
+        assert items[3] == '2) 표 문제 셀 내용'
+        assert items[4] == '셀 내용'
+
+    def test_section_order(self, hwpx_file):
+        """섹션은 이름순으로 처리"""
+        parser = _open(hwpx_file)
+
+        assert parser._section_members() == ['Contents/section0.xml', 'Contents/section1.xml']
+
+    def test_broken_section_skipped(self, hwpx_file):
+        """XML 오류가 있는 섹션은 통째로 제외"""
+        with zipfile.ZipFile(hwpx_file, 'a') as zf:
+            zf.writestr('Contents/section2.xml', _section(_run('3. 깨진 섹션')) + '<hp:p>')
+
+        paragraphs = _open(hwpx_file).extract_text()
+
+        assert paragraphs[-1] == '[2] 두 번째 섹션 문제'
+
+
+class TestEquationConversion:
+    """수식 변환 테스트"""
+
+    def test_equation_converted_once(self, hwpx_file):
+        """같은 수식은 캐시에서 재사용, LaTeX/Unicode 모두 보관"""
+        hancom_convert.cache_clear()
+        parser = _open(hwpx_file)
+        parser.extract_text()
+
+        info = hancom_convert.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert len(parser.equations) == 2
+        latex, unicode_text = parser.equations[0]
+        assert latex == 'x^{2} + 1'
+        assert unicode_text == 'x² + 1'
+
+    def test_extract_images_from_zip(self, hwpx_file):
+        """BinData 이미지는 ZIP에서 직접 읽음"""
+        assert _open(hwpx_file).extract_images() == {'image1.png': b'PNGDATA'}
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 63-F: ProblemExtractor 단일 스캔 분류 테스트
+
+테스트 항목:
+1. 문제 번호 alternation == 기존 순차 매칭 (목록 순서 우선)
+2. 문서 패턴 감지 태그 집계
+3. 정답/해설 리터럴 사전 필터
+4. 추출 처리량
+"""
+import re
+import os
+import sys
+import time
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.hangul.problem_extractor import ProblemExtractor
+
+
+def _sequential_problem_start(text: str):
+    """Phase 63-F 이전의 패턴별 순차 매칭 (비교 기준)"""
+    for pattern, pattern_type in ProblemExtractor.PROBLEM_PATTERNS:
+        match = re.match(pattern, text.strip())
+        if match:
+            if pattern_type == 'sub':
+                return pattern_type, f"{match.group(1)}-{match.group(2)}"
+            return pattern_type, match.group(1)
+    return None
+
+
+INLINE_DOCUMENT = []
+for n in range(1, 8):
+    INLINE_DOCUMENT += [
+        f'{n}. 다음 식의 값을 구하시오.',
+        '① 1 ② 2 ③ 3 ④ 4 ⑤ 5',
+        f'[정답] {"①②③④⑤"[n % 5]}',
+        '[4.20점]',
+        '[해설] 양변을 정리한다.',
+    ]
+
+
+class TestProblemStart:
+    """문제 번호 매칭 테스트"""
+
+    @pytest.mark.parametrize('text', [
+        '1. 문제', '  12) 문제', '[3] 문제', '4번 문제', '문제 5', '문제5',
+        '01-2 문제', '【6】 문제', '1-2. 문제', '1.문제', '[출제의도 ]', '가나다',
+        '10번째', '2)', '[7]x',
+    ])
+    def test_same_as_sequential(self, text):
+        """alternation 결과가 순차 매칭과 동일"""
+        match = ProblemExtractor()._match_problem_start(text)
+        expected = _sequential_problem_start(text)
+
+        if expected is None:
+            assert match is None
+        else:
+            assert (match.pattern_type, match.value) == expected
+
+    def test_purpose_tag_without_number(self):
+        """번호 그룹이 없는 [출제의도]는 빈 번호로 매칭"""
+        match = ProblemExtractor()._match_problem_start('[출제의도] 지수법칙')
+
+        assert match.pattern_type == 'purpose'
+        assert match.value == ''
+
+
+class TestDocumentPattern:
+    """문서 패턴 감지 테스트"""
+
+    def test_tag_counts(self):
+        extractor = ProblemExtractor()
+        counts = extractor._count_document_tags('\n'.join(INLINE_DOCUMENT))
+
+        assert counts['inline'] == 7
+        assert counts['points'] == 7
+        assert counts['purpose'] == 0
+        assert counts['problem_number'] is True
+        assert counts['section'] is False
+
+    @pytest.mark.parametrize('text,expected', [
+        ('문제\n정답 및 해설', True),
+        ('문제\n정답과해설', True),
+        ('정답\n해설', True),
+        ('빠른 정답', True),
+        ('정답표', True),
+        ('[정답] ② 해설', False),
+    ])
+    def test_section_marker(self, text, expected):
+        """섹션 표시 감지 (여러 문단에 걸친 공백 포함)"""
+        assert ProblemExtractor()._count_document_tags(text)['section'] is expected
+
+    def test_inline_document(self):
+        extractor = ProblemExtractor()
+        full_text = '\n'.join(INLINE_DOCUMENT)
+
+        assert extractor._detect_document_pattern(full_text) == 'inline'
+
+        problems = extractor.extract_problems(INLINE_DOCUMENT)
+        assert [p.number for p in problems] == [str(n) for n in range(1, 8)]
+        assert problems[0].points == 4.2
+        assert problems[0].explanation == '양변을 정리한다.'
+
+
+class TestLiteralPrefilter:
+    """정답/해설 사전 필터 테스트"""
+
+    def test_answer_skipped_without_keyword(self):
+        assert ProblemExtractor()._match_answer('① 1 ② 2') is None
+
+    def test_answer_pattern_priority(self):
+        """앞쪽 정답 패턴 우선 (문자열 위치보다 패턴 순서)"""
+        match = ProblemExtractor()._match_answer('정답: ④ 그리고 [정답] ②')
+
+        assert match.pattern_type == 'choice'
+        assert match.value == '②'
+
+    def test_explanation(self):
+        extractor = ProblemExtractor()
+
+        assert extractor._match_explanation('문제 내용') is None
+        assert extractor._match_explanation('풀이: x=1') == 'x=1'
+
+
+class TestThroughput:
+    """추출 처리량 테스트"""
+
+    def test_extract_throughput(self):
+        """인라인 문서 200회 추출 - 넉넉한 상한"""
+        document = INLINE_DOCUMENT * 20
+
+        start = time.perf_counter()
+        for _ in range(200):
+            ProblemExtractor().extract_problems(document)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 5.0
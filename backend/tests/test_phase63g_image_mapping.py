@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 63-G: 이미지-문제 매핑 이진 탐색 테스트
+
+테스트 항목:
+1. 이진 탐색 결과 == 기존 순차 탐색 (무작위 경계/위치)
+2. 경계가 정렬되지 않은 경우 순차 탐색으로 처리
+3. 그림이 많은 문서 매핑 시간
+"""
+import os
+import random
+import sys
+import time
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.hangul.hml_parser import HMLParser
+from app.services.hangul.parser_base import ParsedProblem
+
+
+def _linear_find(p_index, autonum_positions):
+    """Phase 63-G 이전의 순차 탐색 (비교 기준)"""
+    for i, pos in enumerate(autonum_positions):
+        start_idx = pos['p_index']
+        if i + 1 < len(autonum_positions):
+            end_idx = autonum_positions[i + 1]['p_index']
+        else:
+            end_idx = float('inf')
+        if start_idx - 5 <= p_index < end_idx:
+            return pos['number']
+    return None
+
+
+def _parser() -> HMLParser:
+    # 매핑 메서드만 사용하므로 파일은 열지 않음
+    return HMLParser('unused.hml')
+
+
+class TestBinarySearch:
+    """이진 탐색 매핑 테스트"""
+
+    def test_matches_linear_scan(self):
+        parser = _parser()
+        rng = random.Random(63)
+
+        for _ in range(300):
+            starts = sorted(rng.randint(0, 200) for _ in range(rng.randint(1, 15)))
+            positions = [{'number': n + 1, 'p_index': p} for n, p in enumerate(starts)]
+            boundaries = parser._sorted_boundaries(positions)
+
+            for p_index in range(-10, 220):
+                assert parser._find_problem_for_position(p_index, positions, boundaries) \
+                    == _linear_find(p_index, positions)
+
+    def test_unsorted_boundaries_fallback(self):
+        """번호순 P 인덱스가 역전되면 순차 탐색 사용"""
+        parser = _parser()
+        positions = [
+            {'number': 1, 'p_index': 10},
+            {'number': 2, 'p_index': 4},
+            {'number': 3, 'p_index': 30},
+        ]
+
+        assert parser._sorted_boundaries(positions) is None
+        for p_index in range(0, 40):
+            assert parser._find_problem_for_position(p_index, positions) \
+                == _linear_find(p_index, positions)
+
+
+class TestFigureHeavyDocument:
+    """그림이 많은 문서 매핑 테스트"""
+
+    def test_many_pictures(self):
+        parser = _parser()
+        problem_count = 2000
+        parser._scanned = True
+        parser._autonum_positions = [
+            {'number': n + 1, 'p_index': n * 10} for n in range(problem_count)
+        ]
+        parser._picture_locations = [
+            {'bin_id': str(k), 'p_index': k * 2} for k in range(10 * problem_count)
+        ]
+        images = {str(k): {'format': 'png'} for k in range(10 * problem_count)}
+        problems = [ParsedProblem(number=str(n + 1)) for n in range(problem_count)]
+
+        start = time.perf_counter()
+        parser._map_images_to_problems(problems, images)
+        elapsed = time.perf_counter() - start
+
+        assert problems[0].content_images == ['0', '1', '2', '3', '4']
+        assert problems[-1].content_images[0] == str((problem_count - 1) * 5)
+        assert sum(len(p.content_images) for p in problems) == 10 * problem_count
+        # 순차 탐색이면 2000 x 20000 비교 - 이진 탐색은 넉넉히 1초 이내
+        assert elapsed < 1.0
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 63-H: 수식 일괄 변환 API 테스트
+
+테스트 항목:
+1. convert_equation_batch 중복 제거 / 입력 순서 유지
+2. 주입된 ILatexConverter로 위임 (convert_batch 기본 구현)
+3. 프로세스 풀 분산 결과 == 순차 변환
+4. HMLParser가 고유 수식만 일괄 변환
+5. clean_hwp_equation 결과 캐시
+"""
+import os
+import sys
+import tempfile
+from typing import List
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.hangul import hwp_latex_converter
+from app.services.hangul.hwp_latex_converter import (
+    convert_equation_batch,
+    convert_equation_list,
+    hwp_to_latex,
+)
+from app.services.hangul.hml_parser import HMLParser, clean_hwp_equation
+from app.services.hangul.interfaces import ILatexConverter
+
+
+class RecordingConverter(ILatexConverter):
+    """convert 호출을 기록하는 변환기 (convert_batch는 기본 구현 사용)"""
+
+    def __init__(self):
+        self.calls: List[str] = []
+
+    def convert(self, hwp_eq: str) -> str:
+        self.calls.append(hwp_eq)
+        return f"L({hwp_eq})"
+
+    def get_info(self) -> dict:
+        return {"instance_exists": True, "note": "recording"}
+
+
+class BatchRecordingConverter(RecordingConverter):
+    """convert_batch를 재정의한 변환기"""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: List[List[str]] = []
+
+    def convert_batch(self, equations: List[str]) -> List[str]:
+        self.batches.append(list(equations))
+        return [f"B({eq})" for eq in equations]
+
+
+EQUATIONS = [
+    '{5} over {4}',
+    'rm A',
+    'LEFT | x-5 RIGHT | < 3',
+    'rm A',
+    'sqrt {2}',
+    '{5} over {4}',
+]
+
+
+class TestConvertEquationBatch:
+    """일괄 변환 함수 테스트"""
+
+    def test_dedup_and_order(self):
+        result = convert_equation_batch(EQUATIONS)
+
+        assert list(result) == ['{5} over {4}', 'rm A', 'LEFT | x-5 RIGHT | < 3', 'sqrt {2}']
+        assert result['{5} over {4}'] == '\\frac{5}{4}'
+        assert all(result[eq] == hwp_to_latex(eq) for eq in result)
+
+    def test_empty(self):
+        assert convert_equation_batch([]) == {}
+
+    def test_convert_equation_list_keeps_duplicates(self):
+        pairs = convert_equation_list(EQUATIONS)
+
+        assert [eq for eq, _ in pairs] == EQUATIONS
+        assert pairs[0][1] == pairs[5][1] == '\\frac{5}{4}'
+
+    def test_injected_converter_default_batch(self):
+        """convert_batch 기본 구현: 고유 수식마다 convert 1회"""
+        converter = RecordingConverter()
+
+        result = convert_equation_batch(EQUATIONS, converter)
+
+        assert converter.calls == list(dict.fromkeys(EQUATIONS))
+        assert result['rm A'] == 'L(rm A)'
+
+    def test_injected_converter_override(self):
+        converter = BatchRecordingConverter()
+
+        result = convert_equation_batch(EQUATIONS, converter)
+
+        assert len(converter.batches) == 1
+        assert converter.calls == []
+        assert result['sqrt {2}'] == 'B(sqrt {2})'
+
+    def test_duck_typed_converter(self):
+        """convert만 있는 변환기도 허용"""
+        class PlainConverter:
+            def convert(self, hwp_eq):
+                return hwp_eq.upper()
+
+        assert convert_equation_batch(['rm a'], PlainConverter()) == {'rm a': 'RM A'}
+
+
+class TestProcessPool:
+    """프로세스 풀 분산 테스트"""
+
+    @pytest.fixture
+    def small_pool(self, monkeypatch):
+        monkeypatch.setenv('HANGUL_EQUATION_WORKERS', '2')
+        monkeypatch.setattr(hwp_latex_converter, 'BATCH_POOL_THRESHOLD', 10)
+        monkeypatch.setattr(hwp_latex_converter, 'BATCH_CHUNK_SIZE', 7)
+        yield
+        hwp_latex_converter.shutdown_equation_pool()
+
+    def test_pool_same_as_serial(self, small_pool):
+        equations = [f'{{{n}}} over {{{n + 1}}} + rm A_{n}' for n in range(40)] * 2
+
+        result = convert_equation_batch(equations)
+
+        assert hwp_latex_converter._batch_pool is not None
+        assert list(result) == list(dict.fromkeys(equations))
+        assert result == {eq: hwp_to_latex(eq) for eq in equations}
+
+    def test_no_nested_pool_in_worker(self, small_pool, monkeypatch):
+        """자식 프로세스(일괄 가져오기 워커) 안에서는 풀을 만들지 않음"""
+        monkeypatch.setattr(
+            hwp_latex_converter.multiprocessing, 'parent_process', lambda: object()
+        )
+
+        result = convert_equation_batch([f'x^{n}' for n in range(20)])
+
+        assert len(result) == 20
+        assert hwp_latex_converter._batch_pool is None
+
+    def test_below_threshold_serial(self, small_pool):
+        convert_equation_batch(['rm A', 'rm B'])
+
+        assert hwp_latex_converter._batch_pool is None
+
+
+def _equation_hml(problem_count: int) -> str:
+    """문제마다 수식 3개 (1개는 모든 문제 공통) + ENDNOTE 정답 수식"""
+    body = ''.join(
+        '<P><TEXT>'
+        f'<AUTONUM Number="{n}" NumberType="Endnote"/>'
+        f'<ENDNOTE><PARALIST><P><TEXT><CHAR>[정답] {{{n}}} over {{2}}</CHAR></TEXT></P></PARALIST></ENDNOTE>'
+        f'<CHAR>다음을 계산하시오. </CHAR>'
+        f'<EQUATION><SCRIPT>x^{{{n}}} + 1</SCRIPT></EQUATION>'
+        '<EQUATION><SCRIPT>rm A</SCRIPT></EQUATION>'
+        '</TEXT></P>'
+        '<P><TEXT>'
+        f'<EQUATION><SCRIPT>sqrt {{{n}}}</SCRIPT></EQUATION>'
+        '</TEXT></P>'
+        for n in range(1, problem_count + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<HWPML><HEAD><DOCSUMMARY><TITLE>수식</TITLE></DOCSUMMARY></HEAD>'
+        f'<BODY><SECTION>{body}</SECTION></BODY></HWPML>'
+    )
+
+
+@pytest.fixture
+def equation_hml_file():
+    with tempfile.NamedTemporaryFile(
+        mode='w', suffix='.hml', delete=False, encoding='utf-8'
+    ) as f:
+        f.write(_equation_hml(5))
+        temp_path = f.name
+
+    yield temp_path
+
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+
+
+class TestParserBatch:
+    """HMLParser 일괄 변환 테스트"""
+
+    def test_unique_equations_converted_once(self, equation_hml_file):
+        converter = RecordingConverter()
+
+        result = HMLParser(equation_hml_file, latex_converter=converter).parse()
+
+        assert result.success
+        assert len(result.problems) == 5
+        # 정답 5 + 본문 x^n 5 + sqrt n 5 + 공통 rm A 1
+        assert len(converter.calls) == 16
+        assert len(set(converter.calls)) == 16
+        assert result.problems[0].answer_latex == 'L({1} over {2})'
+        # 첫 문제 범위 (이후 문제는 앞 문단 3개까지 포함)
+        assert result.problems[0].content_equations_latex == [
+            'L(x^{1} + 1)', 'L(rm A)', 'L(sqrt {1})'
+        ]
+
+    def test_batch_override_used(self, equation_hml_file):
+        converter = BatchRecordingConverter()
+
+        result = HMLParser(equation_hml_file, latex_converter=converter).parse()
+
+        assert converter.calls == []
+        assert len(converter.batches) == 1
+        assert result.problems[0].content_latex.count('$B(') == 3
+
+    def test_same_as_default_converter(self, equation_hml_file):
+        """일괄 변환 결과 == 수식별 hwp_to_latex"""
+        result = HMLParser(equation_hml_file).parse()
+
+        problem = result.problems[3]
+        assert problem.answer_latex == hwp_to_latex('{4} over {2}')
+        assert problem.content_equations_latex == [
+            hwp_to_latex(eq) for eq in problem.content_equations
+        ]
+
+
+class TestCleanCache:
+    """clean_hwp_equation 캐시 테스트"""
+
+    def test_repeated_clean_hits_cache(self):
+        clean_hwp_equation.cache_clear()
+
+        first = clean_hwp_equation('LEFT ( {1} over {2} RIGHT ) leq rm x')
+        second = clean_hwp_equation('LEFT ( {1} over {2} RIGHT ) leq rm x')
+
+        assert first == second == '( (1)/(2) ) ≤ x'
+        assert clean_hwp_equation.cache_info().hits == 1
+
+    def test_literal_prefilter_keeps_order(self):
+        """규칙 건너뛰기와 무관하게 기존 순서대로 적용"""
+        assert clean_hwp_equation('{cases{x#y}}') == '{ x / y }'
+        assert clean_hwp_equation('overline{{rm{AB}} it }') == '(AB)'
+        assert clean_hwp_equation('sqrt {x over 2}') == '√(x/2)'
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 63-I: 한글 파싱 결과 캐시 테스트
+
+테스트 항목:
+1. 같은 파일 재업로드 시 파싱 없이 캐시 결과 반환 (새 문제 id / 새 이미지 세션)
+2. 키: 파일 해시 + 확장자 + 변환기 버전
+3. 용량 기반 LRU 정리
+4. 일괄 가져오기도 캐시 사용
+"""
+import base64
+import json
+import os
+import sys
+import time
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import config
+from app.routers import hangul
+from app.services.hangul import batch_import, parse_cache
+from app.services.hangul.hwp_latex_converter import get_converter_info
+from app.services.hangul.parse_cache import ParseResultCache, cache_key
+
+
+PNG_BYTES = b'\x89PNG\r\n\x1a\n' + b'\x00' * 32
+
+
+def _hml_bytes(title: str, answers, with_image: bool = False) -> bytes:
+    """ENDNOTE 정답 3개 이상 + (선택) 첫 문제 그림"""
+    picture = '<PICTURE><IMAGE BinItem="1"/></PICTURE>' if with_image else ''
+    body = ''.join(
+        '<P><TEXT>'
+        f'<AUTONUM Number="{n}" NumberType="Endnote"/>'
+        f'<ENDNOTE><PARALIST><P><TEXT><CHAR>[정답] {ans}</CHAR></TEXT></P></PARALIST></ENDNOTE>'
+        f'<CHAR>{title} 문제{n}</CHAR>'
+        f'{picture if n == 1 else ""}'
+        '</TEXT></P>'
+        for n, ans in enumerate(answers, start=1)
+    )
+    head = '<HEAD><DOCSUMMARY><TITLE>' + title + '</TITLE></DOCSUMMARY>'
+    tail = ''
+    if with_image:
+        head += '<MAPPINGTABLE><BINDATALIST><BINITEM BinData="1" Format="png"/></BINDATALIST></MAPPINGTABLE>'
+        encoded = base64.b64encode(PNG_BYTES).decode()
+        tail = f'<TAIL><BINDATASTORAGE><BINDATA Encoding="Base64" Id="1">{encoded}</BINDATA></BINDATASTORAGE></TAIL>'
+    head += '</HEAD>'
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<HWPML>{head}<BODY><SECTION>{body}</SECTION></BODY>{tail}</HWPML>'
+    ).encode('utf-8')
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """임시 DATASET_ROOT를 사용하는 한글 라우터 클라이언트"""
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setenv('HANGUL_IMPORT_WORKERS', '2')
+
+    app = FastAPI()
+    app.include_router(hangul.router, prefix="/api/hangul")
+    yield TestClient(app)
+
+    batch_import.shutdown_import_pool()
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    """현재 프로세스에서 실제 파싱 횟수 기록"""
+    calls = []
+    original = batch_import.parse_file_to_dict
+
+    def counting(file_path, images_dir):
+        calls.append(file_path)
+        return original(file_path, images_dir)
+
+    monkeypatch.setattr(batch_import, 'parse_file_to_dict', counting)
+    return calls
+
+
+def _upload(client, name: str, data: bytes):
+    return client.post('/api/hangul/parse', files={'file': (name, data, 'application/octet-stream')})
+
+
+class TestParseEndpointCache:
+    """/parse 캐시 테스트"""
+
+    def test_repeat_upload_hits_cache(self, client, count_parses, tmp_path):
+        data = _hml_bytes('시험A', ['①', '②', '④'], with_image=True)
+
+        first = _upload(client, 'a.hml', data).json()
+        second = _upload(client, 'a-renamed.hml', data).json()
+
+        assert len(count_parses) == 1
+        assert 'cache_hit' not in first['detected_metadata']
+        assert second['detected_metadata']['cache_hit'] is True
+        assert second['file_name'] == 'a-renamed.hml'
+        assert [p['answer'] for p in second['problems']] == ['①', '②', '④']
+        assert [p['content_images'] for p in second['problems']] == \
+            [p['content_images'] for p in first['problems']]
+
+        # 문제 id / 이미지 세션은 새로 발급 (중복 저장 방지)
+        assert {p['id'] for p in first['problems']}.isdisjoint(p['id'] for p in second['problems'])
+        assert first['detected_metadata']['session_id'] != second['detected_metadata']['session_id']
+
+        image_url = second['detected_metadata']['image_urls']['1']
+        image_path = tmp_path / 'temp_images' / image_url.rsplit('/', 1)[-1]
+        assert image_path.read_bytes() == PNG_BYTES
+
+    def test_different_content_misses(self, client, count_parses):
+        _upload(client, 'a.hml', _hml_bytes('시험A', ['①', '②', '④']))
+        _upload(client, 'a.hml', _hml_bytes('시험A', ['①', '②', '⑤']))
+
+        assert len(count_parses) == 2
+
+    def test_failed_parse_not_cached(self, client, count_parses):
+        _upload(client, 'broken.hml', b'<HWPML><BODY>')
+        _upload(client, 'broken.hml', b'<HWPML><BODY>')
+
+        assert len(count_parses) == 2
+
+    def test_batch_uses_cache(self, client, tmp_path):
+        """일괄 가져오기 워커도 같은 캐시를 사용"""
+        data = _hml_bytes('시험B', ['③', '5', '⑤'])
+        _upload(client, 'b.hml', data)
+
+        response = client.post(
+            '/api/hangul/parse/batch',
+            files=[('files', ('b.hml', data, 'application/octet-stream'))]
+        )
+
+        records = [json.loads(line) for line in response.text.splitlines() if line]
+        assert records[0]['result']['detected_metadata']['cache_hit'] is True
+
+
+class TestCacheKey:
+    """캐시 키 테스트"""
+
+    def test_converter_version_in_info(self):
+        version = get_converter_info()['version']
+
+        assert isinstance(version, str) and len(version) == 12
+        assert get_converter_info()['version'] == version
+
+    def test_key_depends_on_extension_and_version(self, monkeypatch):
+        file_hash = 'a' * 64
+        key = cache_key(file_hash, '.hml')
+
+        assert cache_key(file_hash, '.HML') == key
+        assert cache_key(file_hash, '.hwpx') != key
+
+        monkeypatch.setattr(parse_cache, 'get_converter_info', lambda: {'version': 'changed'})
+        assert cache_key(file_hash, '.hml') != key
+
+
+def _result(tag: str, size: int):
+    return {'success': True, 'file_name': f'{tag}.hml', 'problems': [],
+            'detected_metadata': {'padding': 'x' * size}}
+
+
+class TestLruEviction:
+    """용량 기반 LRU 테스트"""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ParseResultCache(tmp_path / 'cache', max_bytes=2500)
+        images_dir = tmp_path / 'images'
+
+        cache.put('k1', _result('k1', 1000), images_dir)
+        cache.put('k2', _result('k2', 1000), images_dir)
+        past = time.time() - 100
+        os.utime(tmp_path / 'cache' / 'k1', (past, past))
+        os.utime(tmp_path / 'cache' / 'k2', (past + 1, past + 1))
+
+        # k1 사용 → k2가 가장 오래됨
+        assert cache.get('k1', images_dir, 'k1.hml') is not None
+        cache.put('k3', _result('k3', 1000), images_dir)
+
+        assert cache.get('k2', images_dir, 'k2.hml') is None
+        assert cache.get('k1', images_dir, 'k1.hml') is not None
+        assert cache.get('k3', images_dir, 'k3.hml') is not None
+        assert cache.stats()['entries'] == 2
+
+    def test_stale_temp_entries_removed(self, tmp_path):
+        cache = ParseResultCache(tmp_path / 'cache', max_bytes=10 ** 6)
+        stale = tmp_path / 'cache' / '.tmp-stale'
+        stale.mkdir(parents=True)
+        past = time.time() - parse_cache.STALE_TEMP_SECONDS - 10
+        os.utime(stale, (past, past))
+
+        cache.evict()
+
+        assert not stale.exists()
+
+    def test_existing_entry_kept(self, tmp_path):
+        """이미 게시된 키는 덮어쓰지 않음 (다른 워커가 먼저 저장한 경우)"""
+        cache = ParseResultCache(tmp_path / 'cache', max_bytes=10 ** 6)
+        cache.put('k1', _result('first', 10), tmp_path)
+        cache.put('k1', _result('second', 10), tmp_path)
+
+        entry = json.loads((tmp_path / 'cache' / 'k1' / 'result.json').read_text(encoding='utf-8'))
+        assert entry['result']['file_name'] == 'first.hml'
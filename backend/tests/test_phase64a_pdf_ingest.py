@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 64-A: PDF 스트리밍 업로드 테스트
+
+테스트 항목:
+1. 청크 단위 기록 + SHA-256 (한 번에 계산한 값과 동일)
+2. 헤더 없는 파일은 앞 1KB 도착 시점에 거부
+3. 크기 초과 시 413, 임시 파일 정리
+4. 트레일러(startxref/%%EOF) 감지
+5. publish 전에는 같은 이름의 기존 파일 유지
+"""
+import asyncio
+import hashlib
+import io
+import os
+import sys
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import UploadFile
+
+from app.services.pdf_ingest import (
+    PDFIngestError,
+    StreamingPDFWriter,
+    ingest_upload,
+    safe_pdf_filename,
+)
+
+
+def _pdf_bytes(body_size: int = 5000) -> bytes:
+    """헤더/본문/트레일러를 갖춘 최소 PDF 형태의 바이트"""
+    return (
+        b'%PDF-1.7\n'
+        + b'%' + b'x' * body_size + b'\n'
+        + b'xref\n0 1\ntrailer\n<<>>\nstartxref\n9\n%%EOF\n'
+    )
+
+
+def _upload(data: bytes, filename: str = 'book.pdf') -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), filename=filename)
+
+
+def _part_files(directory):
+    return [p for p in directory.iterdir() if p.name.endswith('.part.pdf')]
+
+
+class TestStreamingWriter:
+    """청크 기록기 테스트"""
+
+    def test_hash_and_publish(self, tmp_path):
+        data = _pdf_bytes(3 * 1024 * 1024)
+        dest = tmp_path / 'book.pdf'
+
+        ingested = asyncio.run(ingest_upload(_upload(data), dest, 10 * 1024 * 1024))
+
+        assert ingested.sha256 == hashlib.sha256(data).hexdigest()
+        assert ingested.size == len(data)
+        assert ingested.trailer_ok is True
+        # 게시 전: 최종 경로에는 아직 없음
+        assert not dest.exists()
+        assert ingested.path.parent == tmp_path
+
+        assert ingested.publish() == dest
+        assert dest.read_bytes() == data
+        assert _part_files(tmp_path) == []
+
+    def test_header_rejected_early(self, tmp_path):
+        """앞 1KB 안에 %PDF- 가 없으면 나머지를 받기 전에 거부"""
+        writer = StreamingPDFWriter(tmp_path / 'fake.pdf', 10 ** 7)
+
+        with pytest.raises(PDFIngestError) as exc_info:
+            writer.write(b'PK\x03\x04' + b'\x00' * 2000)
+        writer.abort()
+
+        assert exc_info.value.status_code == 400
+        assert _part_files(tmp_path) == []
+
+    def test_header_split_across_chunks(self, tmp_path):
+        writer = StreamingPDFWriter(tmp_path / 'book.pdf', 10 ** 7)
+        data = b'\n' * 10 + _pdf_bytes(100)
+
+        for i in range(0, len(data), 7):
+            writer.write(data[i:i + 7])
+        ingested = writer.finish()
+
+        assert ingested.sha256 == hashlib.sha256(data).hexdigest()
+
+    def test_too_large(self, tmp_path):
+        with pytest.raises(PDFIngestError) as exc_info:
+            asyncio.run(ingest_upload(_upload(_pdf_bytes(5000)), tmp_path / 'big.pdf', 1000))
+
+        assert exc_info.value.status_code == 413
+        assert _part_files(tmp_path) == []
+
+    def test_truncated_upload_detected(self, tmp_path):
+        """끝부분이 잘린 업로드는 trailer_ok=False (PyMuPDF 검증에 맡김)"""
+        data = _pdf_bytes(5000)[:-40]
+
+        ingested = asyncio.run(ingest_upload(_upload(data), tmp_path / 'cut.pdf', 10 ** 7))
+
+        assert ingested.trailer_ok is False
+
+    def test_empty_file(self, tmp_path):
+        with pytest.raises(PDFIngestError):
+            asyncio.run(ingest_upload(_upload(b''), tmp_path / 'empty.pdf', 10 ** 7))
+
+    def test_discard_keeps_existing_file(self, tmp_path):
+        """검증 실패로 폐기하면 같은 이름의 기존 PDF는 그대로"""
+        dest = tmp_path / 'book.pdf'
+        dest.write_bytes(b'%PDF-old')
+
+        ingested = asyncio.run(ingest_upload(_upload(_pdf_bytes(10)), dest, 10 ** 7))
+        ingested.discard()
+
+        assert dest.read_bytes() == b'%PDF-old'
+        assert _part_files(tmp_path) == []
+
+
+class TestFilename:
+    """파일명 검증 테스트"""
+
+    def test_strips_directories(self):
+        assert safe_pdf_filename('../../etc/book.pdf') == 'book.pdf'
+        assert safe_pdf_filename('C:\\docs\\Book.PDF') == 'Book.PDF'
+
+    def test_rejects_non_pdf(self):
+        with pytest.raises(PDFIngestError):
+            safe_pdf_filename('book.hwp')
+        with pytest.raises(PDFIngestError):
+            safe_pdf_filename(None)
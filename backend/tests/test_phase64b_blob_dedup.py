@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 64-B: 내용 해시 기반 중복 제거 테스트
+
+테스트 항목:
+1. 같은 내용의 파일은 blob 하나를 하드 링크로 공유
+2. 문서 매니페스트 + 이미 등록된 파일은 다시 해시하지 않음
+3. 같은 원본 PDF 문서 복제 (pages/thumbs 링크, blocks 복사, meta 재작성)
+4. 처리 중인 문서 / 같은 ID는 재사용하지 않음
+5. 문서 삭제 후 참조 없는 blob 정리 (원본 PDF 포함, 다른 문서가 쓰는 PDF는 유지)
+6. 원본 색인은 같은 PDF를 쓰는 남은 문서로 이전
+"""
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.services import blob_store as blob_store_module
+from app.services.blob_store import BlobStore, get_blob_store
+
+
+SOURCE_SHA = 'f' * 64
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """임시 DATASET_ROOT 기준 blob 저장소"""
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setattr(config, 'DOCUMENTS_DIR', tmp_path / 'documents')
+    return get_blob_store()
+
+
+def _make_document(document_id: str, pages, status: str = 'ready'):
+    """pages: 페이지별 바이트 목록"""
+    doc_dir = config.DOCUMENTS_DIR / document_id
+    for sub in ('pages', 'thumbs', 'blocks'):
+        (doc_dir / sub).mkdir(parents=True, exist_ok=True)
+
+    for i, data in enumerate(pages):
+        (doc_dir / 'pages' / f'page_{i:04d}.webp').write_bytes(data)
+        (doc_dir / 'thumbs' / f'thumb_{i:04d}.webp').write_bytes(b'thumb-' + data)
+        (doc_dir / 'blocks' / f'page_{i:04d}_blocks.json').write_text(
+            json.dumps({'page_index': i, 'blocks': []}), encoding='utf-8'
+        )
+
+    meta = {
+        'document_id': document_id,
+        'total_pages': len(pages),
+        'analyzed_pages': len(pages),
+        'pdf_path': f'/raw/{document_id}.pdf',
+        'status': status,
+        'source_sha256': SOURCE_SHA,
+        'metadata': {'grade': '고1'},
+    }
+    (doc_dir / 'meta.json').write_text(json.dumps(meta), encoding='utf-8')
+    return doc_dir
+
+
+class TestBlobSharing:
+    """blob 공유 테스트"""
+
+    def test_identical_files_share_inode(self, store, tmp_path):
+        a = tmp_path / 'a.webp'
+        b = tmp_path / 'b.webp'
+        a.write_bytes(b'same-page')
+        b.write_bytes(b'same-page')
+
+        digest_a = store.adopt(a)
+        digest_b = store.adopt(b)
+
+        assert digest_a == digest_b
+        assert os.path.samefile(a, b)
+        assert os.path.samefile(a, store.blob_path(digest_a, '.webp'))
+        assert b.read_bytes() == b'same-page'
+
+    def test_identical_pages_across_documents(self, store):
+        """표지처럼 같은 페이지는 문서가 달라도 한 번만 저장"""
+        doc_a = _make_document('A', [b'cover', b'page-a1'])
+        doc_b = _make_document('B', [b'cover', b'page-b1'])
+
+        store.dedup_document(doc_a)
+        manifest_b = store.dedup_document(doc_b)
+
+        assert os.path.samefile(doc_a / 'pages' / 'page_0000.webp', doc_b / 'pages' / 'page_0000.webp')
+        assert not os.path.samefile(doc_a / 'pages' / 'page_0001.webp', doc_b / 'pages' / 'page_0001.webp')
+        assert set(manifest_b) == {'pages', 'thumbs'}
+        # blocks는 링크 대상 아님
+        assert os.stat(doc_b / 'blocks' / 'page_0000_blocks.json').st_nlink == 1
+
+    def test_linked_files_not_rehashed(self, store, monkeypatch):
+        doc_dir = _make_document('A', [b'p0', b'p1'])
+        store.dedup_document(doc_dir)
+
+        hashed = []
+        original = blob_store_module.file_sha256
+        monkeypatch.setattr(blob_store_module, 'file_sha256', lambda p: hashed.append(p) or original(p))
+
+        (doc_dir / 'pages' / 'page_0002.webp').write_bytes(b'p2')
+        manifest = store.dedup_document(doc_dir)
+
+        assert hashed == [doc_dir / 'pages' / 'page_0002.webp']
+        assert len(manifest['pages']) == 3
+
+
+class TestDocumentReuse:
+    """같은 원본 PDF 재사용 테스트"""
+
+    def test_reuse_completed_document(self, store):
+        source_dir = _make_document('원본', [b'p0', b'p1', b'p2'])
+        store.register_source(SOURCE_SHA, '원본')
+
+        meta = store.reuse_document(SOURCE_SHA, '사본', '/raw/copy.pdf')
+
+        target_dir = config.DOCUMENTS_DIR / '사본'
+        assert meta['document_id'] == '사본'
+        assert meta['pdf_path'] == '/raw/copy.pdf'
+        assert meta['deduplicated_from'] == '원본'
+        assert 'metadata' not in meta
+        assert json.loads((target_dir / 'meta.json').read_text(encoding='utf-8')) == meta
+
+        for i in range(3):
+            assert os.path.samefile(
+                source_dir / 'pages' / f'page_{i:04d}.webp',
+                target_dir / 'pages' / f'page_{i:04d}.webp'
+            )
+        # blocks는 복사 → 한쪽 편집이 다른 문서에 영향 없음
+        (target_dir / 'blocks' / 'page_0000_blocks.json').write_text('{}', encoding='utf-8')
+        assert json.loads((source_dir / 'blocks' / 'page_0000_blocks.json').read_text())['page_index'] == 0
+
+    def test_processing_document_not_reused(self, store):
+        _make_document('원본', [b'p0'], status='processing')
+        store.register_source(SOURCE_SHA, '원본')
+
+        assert store.reuse_document(SOURCE_SHA, '사본', '/raw/copy.pdf') is None
+        assert not (config.DOCUMENTS_DIR / '사본').exists()
+
+    def test_same_id_or_existing_target_not_reused(self, store):
+        _make_document('원본', [b'p0'])
+        _make_document('기존', [b'other'])
+        store.register_source(SOURCE_SHA, '원본')
+
+        assert store.reuse_document(SOURCE_SHA, '원본', '/raw/a.pdf') is None
+        assert store.reuse_document(SOURCE_SHA, '기존', '/raw/a.pdf') is None
+
+    def test_deleted_source_ignored(self, store):
+        doc_dir = _make_document('원본', [b'p0'])
+        store.register_source(SOURCE_SHA, '원본')
+        shutil.rmtree(doc_dir)
+
+        assert store.find_source(SOURCE_SHA) is None
+
+        # 사라진 문서 대신 새 문서 등록 가능
+        _make_document('새문서', [b'p0'])
+        store.register_source(SOURCE_SHA, '새문서')
+        assert store.find_source(SOURCE_SHA) == '새문서'
+
+
+class TestCollect:
+    """blob 정리 테스트"""
+
+    def test_blob_removed_after_last_reference(self, store):
+        doc_a = _make_document('A', [b'cover', b'a1'])
+        doc_b = _make_document('B', [b'cover', b'b1'])
+        store.dedup_document(doc_a)
+        store.dedup_document(doc_b)
+        store.register_source(SOURCE_SHA, 'A')
+
+        digests = store.release_document(doc_a)
+        shutil.rmtree(doc_a)
+        store.unregister_document('A')
+        removed = store.collect(digests)
+
+        # cover 페이지/썸네일은 B도 쓰므로 a1 페이지/썸네일 2개만 삭제
+        assert removed == 2
+        assert (doc_b / 'pages' / 'page_0000.webp').read_bytes() == b'cover'
+        assert store.find_source(SOURCE_SHA) is None
+
+        shutil.rmtree(doc_b)
+        assert store.collect() == 4
+
+    def test_raw_pdf_blob_removed_with_last_document(self, store, tmp_path, monkeypatch):
+        raw_dir = tmp_path / 'raw_pdfs'
+        raw_dir.mkdir()
+        monkeypatch.setattr(config, 'RAW_PDFS_DIR', raw_dir)
+
+        def upload(document_id, filename):
+            pdf_path = raw_dir / filename
+            pdf_path.write_bytes(b'%PDF-1.4 same')
+            digest = store.adopt(pdf_path)
+            doc_dir = _make_document(document_id, [document_id.encode()])
+            meta = json.loads((doc_dir / 'meta.json').read_text(encoding='utf-8'))
+            meta['pdf_path'] = str(pdf_path)
+            (doc_dir / 'meta.json').write_text(json.dumps(meta), encoding='utf-8')
+            store.dedup_document(doc_dir)
+            store.register_source(digest, document_id)
+            store.record_pdf(doc_dir, pdf_path, digest)
+            return doc_dir, digest
+
+        def delete(doc_dir):
+            digests = store.release_document(doc_dir)
+            shutil.rmtree(doc_dir)
+            store.unregister_document(doc_dir.name)
+            store.collect(digests)
+
+        doc_a, digest = upload('A', 'a.pdf')
+        doc_b, _ = upload('B', 'b.pdf')   # 같은 내용, 다른 파일명 → 같은 blob
+        doc_c, _ = upload('C', 'b.pdf')   # 같은 파일을 원본으로 쓰는 문서
+        blob = store.blob_path(digest, '.pdf')
+
+        assert store.find_source(digest) == 'A'
+
+        delete(doc_a)
+        assert not (raw_dir / 'a.pdf').exists() and blob.exists()
+        assert store.find_source(digest) == 'B'  # 남은 문서로 이전
+
+        delete(doc_b)
+        assert (raw_dir / 'b.pdf').exists() and blob.exists()
+        assert store.find_source(digest) == 'C'
+
+        delete(doc_c)
+        assert not (raw_dir / 'b.pdf').exists()
+        assert not blob.exists()
+        assert store.find_source(digest) is None
+        assert json.loads(store.pdf_refs_path.read_text(encoding='utf-8')) == {'names': {}, 'sources': {}}
+
+    def test_store_root_follows_config(self, store, tmp_path):
+        assert isinstance(store, BlobStore)
+        assert store.root == tmp_path / 'blobs'
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 65-A: groups.json 메모리 캐시 테스트
+
+테스트 항목:
+1. 같은 파일 반복 읽기 시 한 번만 파싱
+2. 외부 변경(원자적 교체 / 제자리 쓰기) 감지
+3. save() Write-Through (저장 후 재파싱 없음, 호출자 수정과 분리)
+4. 없는/손상된 파일 처리 (load_json / safe_json_read와 동일)
+5. 최대 파일 수 LRU
+6. SyncManager 반복 동기화 시 재파싱 생략
+"""
+import json
+import os
+import sys
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.work_session import WorkSession
+from app.services.file_lock import atomic_json_write
+from app.services.groups_cache import JsonFileCache, groups_cache
+from app.services.sync_manager import SyncManager
+
+
+def _groups(*group_ids):
+    return {'groups': [{'id': gid, 'problemInfo': {'problemNumber': gid}} for gid in group_ids]}
+
+
+@pytest.fixture
+def cache():
+    return JsonFileCache(max_entries=100)
+
+
+class TestReadCache:
+    """읽기 캐시 테스트"""
+
+    def test_repeat_read_parses_once(self, cache, tmp_path):
+        path = tmp_path / 'page_0000_groups.json'
+        atomic_json_write(path, _groups('L1'))
+
+        first = cache.read(path)
+        second = cache.read(path)
+
+        assert first is second
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['hits'] == 1
+
+    def test_detects_atomic_replace(self, cache, tmp_path):
+        path = tmp_path / 'page_0000_groups.json'
+        atomic_json_write(path, _groups('L1'))
+        cache.read(path)
+
+        atomic_json_write(path, _groups('L1', 'L2'))
+
+        assert [g['id'] for g in cache.read(path)['groups']] == ['L1', 'L2']
+
+    def test_detects_in_place_write(self, cache, tmp_path):
+        """다른 도구가 같은 inode에 다시 쓴 경우 (크기/mtime 변경)"""
+        path = tmp_path / 'page_0000_groups.json'
+        path.write_text(json.dumps(_groups('L1')), encoding='utf-8')
+        cache.read(path)
+
+        path.write_text(json.dumps(_groups('L1', 'R1')), encoding='utf-8')
+
+        assert len(cache.read(path)['groups']) == 2
+
+    def test_missing_and_corrupt(self, cache, tmp_path):
+        path = tmp_path / 'page_0000_groups.json'
+
+        with pytest.raises(FileNotFoundError):
+            cache.read(path)
+        assert cache.read_or_default(path, {'groups': []}) == {'groups': []}
+
+        path.write_text('{"groups": [', encoding='utf-8')
+        with pytest.raises(json.JSONDecodeError):
+            cache.read(path)
+        assert cache.read_or_default(path, None) is None
+
+    def test_deleted_file_dropped(self, cache, tmp_path):
+        path = tmp_path / 'page_0000_groups.json'
+        atomic_json_write(path, _groups('L1'))
+        cache.read(path)
+
+        path.unlink()
+
+        assert cache.read_or_default(path, {'groups': []}) == {'groups': []}
+        assert cache.stats()['entries'] == 0
+
+    def test_lru_limit(self, tmp_path):
+        cache = JsonFileCache(max_entries=2)
+        paths = [tmp_path / f'page_{i:04d}_groups.json' for i in range(3)]
+        for path in paths:
+            atomic_json_write(path, _groups('L1'))
+            cache.read(path)
+
+        assert cache.stats()['entries'] == 2
+        cache.read(paths[2])
+        assert cache.stats()['misses'] == 3
+
+
+class TestWriteThrough:
+    """Write-Through 테스트"""
+
+    def test_save_updates_cache_and_disk(self, cache, tmp_path):
+        path = tmp_path / 'groups' / 'page_0003_groups.json'
+        data = _groups('L1')
+
+        cache.save(path, data)
+        data['groups'].append({'id': 'mutated-after-save'})
+
+        cached = cache.read(path)
+        assert cache.stats()['misses'] == 0
+        assert [g['id'] for g in cached['groups']] == ['L1']
+        assert json.loads(path.read_text(encoding='utf-8')) == cached
+
+    def test_load_for_update_is_copy(self, cache, tmp_path):
+        path = tmp_path / 'page_0000_groups.json'
+        atomic_json_write(path, _groups('L1'))
+
+        data = cache.load_for_update(path, {'groups': []})
+        data['groups'].clear()
+
+        assert len(cache.read(path)['groups']) == 1
+        assert cache.load_for_update(tmp_path / 'none.json', {'groups': []}) == {'groups': []}
+
+
+class TestSyncManagerCache:
+    """SyncManager 반복 동기화 테스트"""
+
+    def test_repeat_sync_skips_parsing(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+        monkeypatch.setattr(config, 'DOCUMENTS_DIR', tmp_path)
+        groups_dir = tmp_path / 'doc' / 'groups'
+        for page in range(20):
+            atomic_json_write(groups_dir / f'page_{page:04d}_groups.json', _groups(f'L{page}'))
+
+        manager = SyncManager()
+        session = WorkSession(problemDocumentId='doc')
+        before = groups_cache.stats()['misses']
+
+        first = manager.sync_problems_to_session(session)
+        second = manager.sync_problems_to_session(session)
+        status = manager.get_sync_status(session)
+
+        assert first.problems_added == 20
+        assert second.problems_added == 0
+        assert status['status'] == 'synced'
+        assert groups_cache.stats()['misses'] - before == 20
+
+    def test_write_visible_to_next_read(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+        monkeypatch.setattr(config, 'DOCUMENTS_DIR', tmp_path)
+        groups_file = tmp_path / 'doc' / 'groups' / 'page_0000_groups.json'
+        atomic_json_write(groups_file, _groups('L1', 'L2'))
+
+        manager = SyncManager()
+        session = WorkSession(problemDocumentId='doc')
+        manager.sync_problems_to_session(session)
+
+        assert manager.delete_group_from_disk('doc', 0, 'L2') is True
+        result = manager.sync_problems_to_session(session)
+
+        assert result.problems_removed == 1
+        assert [p.groupId for p in session.problems] == ['L1']
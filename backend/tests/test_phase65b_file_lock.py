@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 65-B: 프로세스 간 파일 잠금 테스트
+
+테스트 항목:
+1. 여러 프로세스의 읽기-수정-쓰기가 유실 없이 직렬화
+2. 다른 프로세스가 잡은 배타 잠금 → TimeoutError
+3. 공유 잠금은 동시 보유, 배타 잠금은 대기
+4. 같은 경로 중첩 잠금은 재진입 (교착 없음), 공유 보유 중 배타 요청은 거부
+5. 통계 버킷이 같은 다른 경로는 서로 기다리지 않음
+6. 대기 시간 통계
+"""
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+# 경로 설정
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, BACKEND_DIR)
+
+from app.services import file_lock as file_lock_module
+from app.services.file_lock import (
+    file_lock,
+    get_lock_stats,
+    safe_json_read,
+    stripe_index,
+)
+
+
+WORKER_SCRIPT = textwrap.dedent('''
+    import sys
+    sys.path.insert(0, {backend!r})
+    from app.services.file_lock import file_lock, safe_json_read, atomic_json_write
+
+    path = {path!r}
+    for _ in range({rounds}):
+        with file_lock(path):
+            data = safe_json_read(path, {{'count': 0}})
+            data['count'] += 1
+            atomic_json_write(path, data)
+''')
+
+HOLDER_SCRIPT = textwrap.dedent('''
+    import sys, time
+    sys.path.insert(0, {backend!r})
+    from app.services.file_lock import file_lock
+
+    with file_lock({path!r}, shared={shared!r}):
+        print('locked', flush=True)
+        time.sleep({hold})
+''')
+
+
+@pytest.fixture
+def lock_dir(tmp_path, monkeypatch):
+    """잠금 파일을 임시 디렉토리에 생성 (자식 프로세스도 환경 변수로 공유)"""
+    path = tmp_path / 'locks'
+    monkeypatch.setenv('FILE_LOCK_DIR', str(path))
+    return path
+
+
+def _spawn(script: str, **kwargs) -> subprocess.Popen:
+    source = script.format(backend=os.path.abspath(BACKEND_DIR), **kwargs)
+    return subprocess.Popen(
+        [sys.executable, '-c', source],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+
+
+def _start_holder(path, shared: bool = False, hold: float = 1.5) -> subprocess.Popen:
+    proc = _spawn(HOLDER_SCRIPT, path=str(path), shared=shared, hold=hold)
+    assert proc.stdout.readline().strip() == 'locked'
+    return proc
+
+
+def _same_bucket(path, tmp_path):
+    """path와 통계 버킷(crc32)이 같은 다른 경로"""
+    target = stripe_index(str(path))
+    return next(
+        tmp_path / f'b{i}.json' for i in range(10000)
+        if stripe_index(str(tmp_path / f'b{i}.json')) == target
+    )
+
+
+@pytest.mark.skipif(file_lock_module.fcntl is None, reason="fcntl 없음 (Windows)")
+class TestCrossProcess:
+    """프로세스 간 잠금 테스트"""
+
+    def test_workers_do_not_lose_updates(self, lock_dir, tmp_path):
+        path = tmp_path / 'index.json'
+        workers = [_spawn(WORKER_SCRIPT, path=str(path), rounds=50) for _ in range(4)]
+        for proc in workers:
+            _, err = proc.communicate(timeout=60)
+            assert proc.returncode == 0, err
+
+        assert safe_json_read(path)['count'] == 200
+        assert len(list(lock_dir.glob('*.lock'))) == 1
+
+    def test_exclusive_held_by_other_process(self, lock_dir, tmp_path):
+        path = tmp_path / 'index.json'
+        holder = _start_holder(path)
+        try:
+            with pytest.raises(TimeoutError):
+                with file_lock(path, timeout=0.2):
+                    pass
+            # 공유 잠금도 배타 잠금과는 배타
+            with pytest.raises(TimeoutError):
+                with file_lock(path, timeout=0.2, shared=True):
+                    pass
+        finally:
+            holder.wait(timeout=10)
+
+        with file_lock(path, timeout=1):
+            pass
+
+    def test_shared_held_by_other_process(self, lock_dir, tmp_path):
+        path = tmp_path / 'index.json'
+        holder = _start_holder(path, shared=True)
+        try:
+            with file_lock(path, timeout=0.5, shared=True):
+                pass
+            with pytest.raises(TimeoutError):
+                with file_lock(path, timeout=0.2):
+                    pass
+        finally:
+            holder.wait(timeout=10)
+
+
+class TestInProcess:
+    """프로세스 내 공유/배타 잠금 테스트"""
+
+    def test_shared_holders_overlap(self, lock_dir, tmp_path):
+        path = tmp_path / 'groups.json'
+        inside = []
+        both_inside = threading.Event()
+
+        def reader():
+            with file_lock(path, shared=True):
+                inside.append(1)
+                if len(inside) == 2:
+                    both_inside.set()
+                both_inside.wait(2)
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert both_inside.is_set()
+
+    def test_exclusive_waits_for_shared(self, lock_dir, tmp_path):
+        path = tmp_path / 'groups.json'
+        order = []
+        reader_in = threading.Event()
+
+        def reader():
+            with file_lock(path, shared=True):
+                reader_in.set()
+                time.sleep(0.2)
+                order.append('reader-done')
+
+        t = threading.Thread(target=reader)
+        t.start()
+        reader_in.wait(2)
+        with file_lock(path):
+            order.append('writer')
+        t.join()
+
+        assert order == ['reader-done', 'writer']
+
+    def test_nested_reenters(self, lock_dir, tmp_path):
+        """같은 경로 중첩 잠금은 교착되지 않음"""
+        first = tmp_path / 'a.json'
+        second = _same_bucket(first, tmp_path)
+
+        with file_lock(first, timeout=0.5):
+            with file_lock(second, timeout=0.5):
+                with file_lock(first, timeout=0.5):
+                    pass
+
+        # 모두 해제됨 (사용이 끝난 잠금 객체도 정리)
+        with file_lock(second, timeout=0.5):
+            pass
+        assert not file_lock_module._locks
+
+    def test_nested_exclusive_under_shared_refused(self, lock_dir, tmp_path):
+        """같은 경로를 공유로 보유 중이면 배타 요청 거부 (승격 없음), 다른 경로는 상관없음"""
+        first = tmp_path / 'a.json'
+        second = _same_bucket(first, tmp_path)
+
+        with file_lock(first, timeout=0.5, shared=True):
+            with file_lock(first, timeout=0.5, shared=True):
+                pass
+            with pytest.raises(RuntimeError):
+                with file_lock(first, timeout=0.5):
+                    pass
+            with file_lock(second, timeout=0.5):
+                pass
+
+        # 배타 보유 중 공유 요청은 재진입, 해제 후 다른 스레드가 배타로 잡을 수 있음
+        with file_lock(first, timeout=0.5):
+            with file_lock(first, timeout=0.5, shared=True):
+                pass
+
+        acquired = []
+
+        def writer():
+            with file_lock(first, timeout=0.5):
+                acquired.append(True)
+
+        t = threading.Thread(target=writer)
+        t.start()
+        t.join()
+        assert acquired == [True]
+
+    def test_same_bucket_paths_independent(self, lock_dir, tmp_path):
+        """통계 버킷이 같아도 다른 경로의 배타 잠금은 서로 기다리지 않음"""
+        first = tmp_path / 'a.json'
+        second = _same_bucket(first, tmp_path)
+        holding = threading.Event()
+        done = threading.Event()
+
+        def holder():
+            with file_lock(first):
+                holding.set()
+                done.wait(2)
+
+        t = threading.Thread(target=holder)
+        t.start()
+        holding.wait(2)
+        try:
+            with file_lock(second, timeout=0.2):
+                pass
+        finally:
+            done.set()
+            t.join()
+
+    def test_wait_metrics(self, lock_dir, tmp_path):
+        path = tmp_path / 'index.json'
+        bucket = file_lock_module._stats[stripe_index(str(path))]
+        before = bucket.stats()
+        holding = threading.Event()
+
+        def holder():
+            with file_lock(path):
+                holding.set()
+                time.sleep(0.1)
+
+        t = threading.Thread(target=holder)
+        t.start()
+        holding.wait(2)
+        with file_lock(path):
+            pass
+        t.join()
+
+        after = bucket.stats()
+        assert after['acquisitions'] - before['acquisitions'] == 2
+        assert after['contended'] > before['contended']
+        assert after['wait_max_ms'] >= 50
+        assert after['last_path'] == str(path)
+
+        stats = get_lock_stats()
+        assert stats['stripes'] == file_lock_module.LOCK_STRIPES
+        assert any(s['stripe'] == bucket.index for s in stats['busiest'])
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 65-C: 그룹 커밋 쓰기 테스트
+
+테스트 항목:
+1. 동시 쓰기가 더 적은 플러시 주기로 묶임 (모든 호출자 완료), 리더는 자기 배치만 플러시
+2. 같은 경로는 제출 순서대로 교체 (마지막 쓰기 유지)
+3. 쓰기 오류는 해당 호출자에게만 전달, 임시 파일 정리 (인터럽트는 리더에서 전파)
+4. 반환 stat이 기록한 파일과 일치 (groups_cache 검증 값)
+5. 일괄 저장 (_save_problems_to_bank) + 실패 시 롤백
+"""
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.routers import hangul as hangul_router
+from app.services import file_lock as file_lock_module
+from app.services.file_lock import (
+    GroupCommitWriter,
+    atomic_json_write,
+    atomic_json_write_many,
+)
+
+
+@pytest.fixture
+def writer():
+    return GroupCommitWriter()
+
+
+def _read(path):
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+class TestBatching:
+    """배치 처리 테스트"""
+
+    def test_concurrent_writes_batched(self, writer, tmp_path, monkeypatch):
+        """첫 플러시가 진행 중인 동안 들어온 쓰기는 다음 배치 하나로 묶임"""
+        first_flush = threading.Event()
+        release = threading.Event()
+        original = writer._flush
+
+        def slow_flush(batch):
+            if not first_flush.is_set():
+                first_flush.set()
+                release.wait(5)
+            original(batch)
+
+        monkeypatch.setattr(writer, '_flush', slow_flush)
+
+        leader = threading.Thread(target=writer.write, args=(tmp_path / 'lead.json', {'n': -1}))
+        leader.start()
+        first_flush.wait(5)
+
+        followers = [
+            threading.Thread(target=writer.write, args=(tmp_path / f'{i}.json', {'n': i}))
+            for i in range(20)
+        ]
+        for t in followers:
+            t.start()
+        # 모두 대기열에 들어갈 때까지 대기
+        while len(writer._queue) < 20:
+            threading.Event().wait(0.01)
+        release.set()
+
+        leader.join(5)
+        for t in followers:
+            t.join(5)
+
+        stats = writer.stats()
+        assert stats['writes'] == 21
+        assert stats['batches'] == 2
+        assert stats['max_batch'] == 20
+        for i in range(20):
+            assert _read(tmp_path / f'{i}.json') == {'n': i}
+        assert list(tmp_path.glob('.*.tmp')) == []
+
+    def test_leader_flushes_only_its_batch(self, writer, tmp_path, monkeypatch):
+        """다음 배치는 그 배치의 대기자가 플러시 - 첫 리더는 바로 반환"""
+        flushes = []
+        first_in, release_first, second_in, release_second = (threading.Event() for _ in range(4))
+        original = writer._flush
+
+        def slow_flush(batch):
+            flushes.append(threading.current_thread().name)
+            entered, release = (first_in, release_first) if len(flushes) == 1 else (second_in, release_second)
+            entered.set()
+            release.wait(5)
+            original(batch)
+
+        monkeypatch.setattr(writer, '_flush', slow_flush)
+
+        leader = threading.Thread(target=writer.write, args=(tmp_path / 'lead.json', 0), name='leader')
+        leader.start()
+        first_in.wait(5)
+        follower = threading.Thread(target=writer.write, args=(tmp_path / 'next.json', 1), name='follower')
+        follower.start()
+        while not writer._queue:
+            threading.Event().wait(0.01)
+        release_first.set()
+
+        try:
+            assert second_in.wait(5)
+            leader.join(2)
+            assert not leader.is_alive()  # 두 번째 배치가 끝나기 전에 반환
+        finally:
+            release_second.set()
+            follower.join(5)
+
+        assert flushes == ['leader', 'follower']
+        assert _read(tmp_path / 'next.json') == 1
+
+    def test_write_many_keeps_order(self, writer, tmp_path):
+        path = tmp_path / 'same.json'
+
+        stats = writer.write_many([(path, {'v': 1}), (path, {'v': 2}), (tmp_path / 'other.json', [])])
+
+        assert _read(path) == {'v': 2}
+        assert len(stats) == 3
+        assert writer.stats()['batches'] == 1
+
+    def test_fdatasync_fallback(self, tmp_path, monkeypatch):
+        """syncfs가 없거나 배치가 작으면 파일별 fdatasync"""
+        synced, datasynced = [], []
+        monkeypatch.setattr(file_lock_module, '_load_syncfs', lambda: synced.append)
+        monkeypatch.setattr(file_lock_module, '_fdatasync', datasynced.append)
+        writer = GroupCommitWriter(syncfs_min=3)
+
+        writer.write_many([(tmp_path / f'{i}.json', i) for i in range(2)])
+        assert (synced, len(datasynced)) == ([], 2)
+
+        writer.write_many([(tmp_path / f'{i}.json', i) for i in range(3)])
+        assert (len(synced), len(datasynced)) == (1, 2)
+
+
+class TestErrors:
+    """오류 처리 테스트"""
+
+    def test_error_reaches_only_failing_caller(self, writer, tmp_path):
+        blocker = tmp_path / 'file'
+        blocker.write_text('x', encoding='utf-8')
+
+        with pytest.raises(OSError):
+            writer.write_many([(tmp_path / 'ok.json', 1), (blocker / 'bad.json', 2)])
+
+        # 같은 배치의 정상 항목은 기록됨
+        assert _read(tmp_path / 'ok.json') == 1
+        assert list(tmp_path.glob('.*.tmp')) == []
+
+        # 이후 쓰기 정상 동작 (리더 상태 복구)
+        writer.write(tmp_path / 'after.json', 3)
+        assert _read(tmp_path / 'after.json') == 3
+
+    def test_interrupt_propagates_from_leader(self, writer, tmp_path, monkeypatch):
+        def interrupted(batch):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(writer, '_flush', interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            writer.write(tmp_path / 'a.json', 1)
+        monkeypatch.undo()
+
+        # 리더 자리는 풀림
+        writer.write(tmp_path / 'b.json', 2)
+        assert _read(tmp_path / 'b.json') == 2
+
+    def test_unserializable_writes_nothing(self, writer, tmp_path):
+        with pytest.raises(TypeError):
+            writer.write_many([(tmp_path / 'a.json', 1), (tmp_path / 'b.json', object())])
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestStat:
+    """반환 stat 테스트"""
+
+    def test_stat_matches_written_file(self, tmp_path):
+        path = tmp_path / 'groups' / 'page_0000_groups.json'
+
+        written = atomic_json_write(path, {'groups': []})
+        [many] = atomic_json_write_many([(path, {'groups': [1]})])
+
+        current = os.stat(path)
+        assert (many.st_ino, many.st_size, many.st_mtime_ns) == \
+            (current.st_ino, current.st_size, current.st_mtime_ns)
+        assert written.st_ino != many.st_ino
+
+
+class TestSaveProblemsToBank:
+    """문제은행 일괄 저장 테스트"""
+
+    PROBLEMS = [
+        {'number': '1', 'content_text': '문제 1', 'answer': '③', 'explanation': '풀이 1'},
+        {'number': '2', 'content_text': '문제 2', 'answer': '12'},
+        {'number': '3', 'content_text': '문제 3'},
+    ]
+
+    def test_saves_records_and_index(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+
+        ids = hangul_router._save_problems_to_bank(self.PROBLEMS, {'subject': '수학'})
+
+        bank = tmp_path / 'problem_bank'
+        index = _read(bank / 'index.json')
+        assert [p['id'] for p in index['problems']] == ids
+        assert [p['has_answer'] for p in index['problems']] == [True, True, False]
+        assert len(list((bank / 'answers').iterdir())) == 2
+        assert len(list((bank / 'explanations').iterdir())) == 1
+
+        record = _read(bank / 'problems' / f'{ids[0]}.json')
+        assert _read(bank / 'answers' / f"{record['answer_id']}.json")['answer'] == '③'
+
+    def test_rollback_on_failure(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+        bank = tmp_path / 'problem_bank'
+        (bank / 'problems').mkdir(parents=True)
+        existing = bank / 'problems' / 'keep.json'
+        existing.write_text('{}', encoding='utf-8')
+
+        original = file_lock_module.atomic_json_write
+
+        def fail_index(path, data):
+            if path.name == 'index.json':
+                raise OSError('disk full')
+            return original(path, data)
+
+        monkeypatch.setattr(hangul_router, 'atomic_json_write', fail_index)
+        problems = self.PROBLEMS + [{'id': 'keep', 'number': '4'}]
+
+        with pytest.raises(OSError):
+            hangul_router._save_problems_to_bank(problems, {})
+
+        # 새로 만든 파일만 삭제, 기존 ID 파일은 유지
+        assert [p.name for p in (bank / 'problems').iterdir()] == ['keep.json']
+        assert list((bank / 'answers').iterdir()) == []
+        assert not (bank / 'index.json').exists()
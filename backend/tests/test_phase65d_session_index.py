@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 65-D: 작업 세션 인덱스 테스트
+
+테스트 항목:
+1. 문서 → 세션, (문서, 그룹) → 해설 연결 조회
+2. 반복 조회 시 세션 파일 재파싱 없음 (자기 저장 포함)
+3. 다른 워커의 저장/삭제 감지 (바뀐 세션만 재파싱)
+4. 라우터 (by-document, 해설 연결, linked-solutions)가 인덱스 결과 사용
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.work_session import ProblemReference, ProblemSolutionLink, WorkSession
+from app.routers import export as export_router
+from app.routers import matching as matching_router
+from app.routers import work_sessions as work_sessions_router
+from app.services import session_index as session_index_module
+from app.services.file_lock import atomic_json_write
+from app.services.session_index import WorkSessionIndex, session_index
+
+
+@pytest.fixture
+def sessions_dir(tmp_path, monkeypatch):
+    path = tmp_path / 'work_sessions'
+    path.mkdir()
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setattr(config, 'DOCUMENTS_DIR', tmp_path / 'documents')
+    monkeypatch.setattr(config, 'WORK_SESSIONS_DIR', path)
+    # 디렉토리 mtime을 바로 신뢰 (테스트는 연속 변경을 명시적으로 확인)
+    monkeypatch.setattr(session_index_module, '_RACY_NS', 0)
+    session_index.invalidate()
+    yield path
+    session_index.invalidate()
+
+
+def _session(problem_doc='문제', solution_doc='해설', links=(), session_id=None):
+    session = WorkSession(problemDocumentId=problem_doc, solutionDocumentId=solution_doc)
+    if session_id:
+        session.sessionId = session_id
+    for i, (group_id, linked_at) in enumerate(links):
+        session.problems.append(ProblemReference(
+            groupId=group_id, documentId=problem_doc, pageIndex=i, problemNumber=str(i + 1)
+        ))
+        session.links.append(ProblemSolutionLink(
+            problemGroupId=group_id, solutionGroupId=f'S{group_id}',
+            solutionDocumentId=solution_doc, solutionPageIndex=i, linkedAt=linked_at
+        ))
+    return session
+
+
+def _write_external(sessions_dir, session):
+    """다른 워커의 저장 (인덱스 put 없음)"""
+    atomic_json_write(sessions_dir / f'{session.sessionId}.json', session.model_dump())
+
+
+class TestLookups:
+    """조회 테스트"""
+
+    def test_by_document_and_link(self, sessions_dir):
+        _write_external(sessions_dir, _session('A', 'A해설', [('L1', 100)], session_id='ws-1'))
+        _write_external(sessions_dir, _session('B', 'A해설', [('L1', 200)], session_id='ws-2'))
+        index = WorkSessionIndex()
+
+        assert {s.sessionId for s in index.find_by_document('A해설')} == {'ws-1', 'ws-2'}
+        assert [s.sessionId for s in index.find_by_document('A')] == ['ws-1']
+        assert index.find_by_document('없음') == []
+
+        assert index.get_solution_link('A', 'L1').solutionGroupId == 'SL1'
+        assert index.get_solution_link('A', 'L2') is None
+        assert index.get_solution_link('해설', 'L1') is None
+
+    def test_latest_link_wins(self, sessions_dir):
+        _write_external(sessions_dir, _session('A', 'old', [('L1', 100)], session_id='ws-1'))
+        _write_external(sessions_dir, _session('A', 'new', [('L1', 300)], session_id='ws-2'))
+        index = WorkSessionIndex()
+
+        assert index.get_solution_link('A', 'L1').solutionDocumentId == 'new'
+        linked = index.linked_solutions()
+        assert linked == {'A|0|L1': {
+            'solutionDocumentId': 'new', 'solutionPageIndex': 0, 'solutionGroupId': 'SL1',
+            'sessionId': 'ws-2', 'matchedAt': 300, 'problemNumber': '1',
+        }}
+
+    def test_corrupt_file_skipped(self, sessions_dir):
+        (sessions_dir / 'ws-bad.json').write_text('{', encoding='utf-8')
+        _write_external(sessions_dir, _session('A', session_id='ws-1'))
+
+        assert [s.sessionId for s in WorkSessionIndex().list_sessions()] == ['ws-1']
+
+
+class TestRefresh:
+    """변경 감지 테스트"""
+
+    def test_repeat_lookups_do_not_reparse(self, sessions_dir):
+        for i in range(10):
+            _write_external(sessions_dir, _session(f'D{i}', links=[('L1', i)], session_id=f'ws-{i}'))
+
+        before = session_index.stats()
+        session_index.list_sessions()
+        for i in range(10):
+            session_index.get_solution_link(f'D{i}', 'L1')
+        assert session_index.stats()['parsed'] - before['parsed'] == 10
+        assert session_index.stats()['scans'] - before['scans'] == 1
+
+        # 자기 저장은 put()으로 반영 → 다시 스캔해도 파싱 없음
+        session = work_sessions_router._load_session('ws-3')
+        session.links.clear()
+        work_sessions_router._save_session(session)
+
+        assert session_index.get_solution_link('D3', 'L1') is None
+        assert session_index.stats()['parsed'] - before['parsed'] == 10
+
+    def test_external_save_and_delete_detected(self, sessions_dir):
+        _write_external(sessions_dir, _session('A', session_id='ws-1'))
+        _write_external(sessions_dir, _session('A', session_id='ws-2'))
+        before = session_index.stats()['parsed']
+        assert len(session_index.find_by_document('A')) == 2
+
+        _write_external(sessions_dir, _session('B', session_id='ws-2'))
+        (sessions_dir / 'ws-1.json').unlink()
+
+        assert session_index.find_by_document('A') == []
+        assert [s.sessionId for s in session_index.find_by_document('B')] == ['ws-2']
+        assert session_index.stats()['parsed'] - before == 3
+
+    def test_racy_directory_rechecked(self, sessions_dir, monkeypatch):
+        """방금 바뀐 디렉토리는 mtime이 같아도 다음 조회 때 다시 확인"""
+        monkeypatch.setattr(session_index_module, '_RACY_NS', 10 ** 18)
+        index = WorkSessionIndex()
+        index.list_sessions()
+        index.list_sessions()
+
+        assert index.stats()['scans'] == 2
+
+
+class TestRouters:
+    """라우터 연동 테스트"""
+
+    def test_session_routes_use_index(self, sessions_dir):
+        _write_external(sessions_dir, _session('A', 'A해설', [('L1', 100)], session_id='ws-1'))
+
+        found = asyncio.run(work_sessions_router.find_sessions_by_document('A해설'))
+        listed = asyncio.run(work_sessions_router.list_sessions(problem_doc_id='A'))
+        asyncio.run(work_sessions_router.delete_session('ws-1'))
+        after = asyncio.run(work_sessions_router.list_sessions())
+
+        assert [s.sessionId for s in found.items] == ['ws-1']
+        assert listed.total == 1
+        assert after.total == 0
+
+    def test_solution_link_routes(self, sessions_dir):
+        _write_external(sessions_dir, _session('A', 'A해설', [('L1', 100)], session_id='ws-1'))
+
+        result = asyncio.run(export_router.get_problem_solution_link('A', 0, 'L1'))
+        missing = asyncio.run(export_router.get_problem_solution_link('A', 0, 'L9'))
+        linked = asyncio.run(matching_router.get_linked_solutions())
+
+        assert result['has_solution'] is True
+        assert result['solution']['group_id'] == 'SL1'
+        assert result['solution']['image_path'] is None
+        assert missing == {'has_solution': False, 'solution': None}
+        assert linked['total'] == 1
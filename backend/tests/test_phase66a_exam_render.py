@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 66-A: 시험지 PDF 렌더링 서비스 테스트
+
+테스트 항목:
+1. Problem 모델(ProblemContent)로 문제지/정답지 내보내기
+2. 폰트 등록은 프로세스당 한 번
+3. 문제 이미지 축소 사본 (출력 DPI, 확대 없음, 재사용) → PDF 크기 감소
+4. 결과 캐시: 같은 내용은 다시 렌더링하지 않음, 내용/설정이 바뀌면 새로 렌더링
+5. 같은 시험지 동시 요청은 렌더링 한 번
+6. 캐시 정리는 렌더링 후 추정 용량이 한도를 넘을 때만 (적중 시 없음)
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+from PIL import Image as PILImage
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.exam_paper import ExamPaper, ExamProblemItem, ExamSection
+from app.models.problem import Problem, ProblemContent, ProblemSource
+from app.services.exam import ExamPdfExporter, ExamRenderService, shutdown_render_pool
+from app.services.exam import render_service
+from app.services.exam.render_service import ExamImageCache
+
+
+@pytest.fixture
+def dataset_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setattr(config, 'EXAM_PDF_IMAGE_DPI', 150)
+    monkeypatch.setenv('EXAM_RENDER_WORKERS', '1')
+    yield tmp_path
+    shutdown_render_pool()
+
+
+def _make_image(path, size=(1200, 800), color=True):
+    """원본 해상도 문제 이미지 (압축이 잘 안 되는 패턴)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    noise = PILImage.effect_noise(size, 64)
+    if color:
+        img = PILImage.merge('RGB', (noise, noise.transpose(PILImage.FLIP_LEFT_RIGHT), noise))
+    else:
+        img = noise.convert('RGB')
+    img.save(path, format='PNG')
+    return path
+
+
+def _problem(problem_id, image_rel, answer='③'):
+    return Problem(
+        id=problem_id,
+        content=ProblemContent(imageUrl=image_rel, answer=answer, solution='풀이'),
+        source=ProblemSource(name='테스트'),
+    )
+
+
+def _exam(problem_ids, **settings):
+    items = [
+        ExamProblemItem(id=f'item-{i}', problemId=pid, order=i + 1)
+        for i, pid in enumerate(problem_ids)
+    ]
+    exam = ExamPaper(
+        id='exam-1', name='중간고사',
+        sections=[ExamSection(id='s1', title='객관식', problems=items, order=1)],
+    )
+    for key, value in settings.items():
+        setattr(exam.settings, key, value)
+    return exam
+
+
+@pytest.fixture
+def exam_data(dataset_root):
+    _make_image(dataset_root / 'problems' / 'p1.png')
+    _make_image(dataset_root / 'problems' / 'p2.png', size=(120, 80))
+    problems = {
+        'p1': _problem('p1', 'problems/p1.png'),
+        'p2': _problem('p2', 'problems/p2.png'),
+    }
+    return _exam(['p1', 'p2', 'missing']), problems
+
+
+class TestExporter:
+    """ExamPdfExporter 테스트"""
+
+    def test_exports_problem_models(self, exam_data, dataset_root):
+        exam, problems = exam_data
+        exporter = ExamPdfExporter(dataset_root)
+
+        pdf = exporter.export_to_pdf(exam, problems, include_answer_key=True)
+
+        assert pdf.startswith(b'%PDF')
+
+    def test_fonts_registered_once(self, dataset_root, monkeypatch):
+        calls = []
+        monkeypatch.setattr(ExamPdfExporter, '_fonts_registered', False)
+        monkeypatch.setattr(ExamPdfExporter, '_register_fonts', lambda self: calls.append(1))
+
+        ExamPdfExporter(dataset_root)
+        ExamPdfExporter(dataset_root)
+
+        assert calls == [1]
+
+
+class TestImageCache:
+    """이미지 축소 테스트"""
+
+    def test_downscale_to_print_dpi(self, dataset_root):
+        source = _make_image(dataset_root / 'big.png')
+        cache = ExamImageCache(dataset_root / 'cache', dpi=150)
+
+        # 72pt = 1인치 → 150px
+        prepared = cache.prepare(source, 144, 96)
+        again = cache.prepare(source, 144, 96)
+
+        assert prepared != source and prepared == again
+        with PILImage.open(prepared) as img:
+            assert img.size == (300, 200)
+        assert (cache.created, cache.hits) == (1, 1)
+
+    def test_small_image_not_upscaled(self, dataset_root):
+        source = _make_image(dataset_root / 'small.png', size=(100, 50))
+        cache = ExamImageCache(dataset_root / 'cache', dpi=150)
+
+        assert cache.prepare(source, 144, 96) == source
+        assert not (dataset_root / 'cache').exists()
+
+    def test_colorless_image_stored_as_gray(self, dataset_root):
+        """색이 없는 캡처는 크기가 작아도 회색조 사본 (PDF에 1채널로 삽입)"""
+        source = _make_image(dataset_root / 'gray.png', size=(100, 50), color=False)
+        cache = ExamImageCache(dataset_root / 'cache', dpi=150)
+
+        prepared = cache.prepare(source, 144, 96)
+
+        assert prepared != source
+        with PILImage.open(prepared) as img:
+            assert (img.mode, img.size) == ('L', (100, 50))
+
+    def test_pdf_smaller_with_cache(self, exam_data, dataset_root):
+        exam, problems = exam_data
+        original = ExamPdfExporter(dataset_root).export_to_pdf(exam, problems)
+        # 160mm 너비 × 100dpi ≈ 630px (원본 1200px)
+        cache = ExamImageCache(dataset_root / 'cache', dpi=100)
+        downscaled = ExamPdfExporter(dataset_root, image_cache=cache).export_to_pdf(exam, problems)
+
+        assert len(downscaled) < len(original) / 2
+
+
+class TestRenderService:
+    """렌더링 서비스 테스트"""
+
+    def test_repeat_download_uses_cache(self, exam_data):
+        exam, problems = exam_data
+        service = ExamRenderService()
+
+        first = asyncio.run(service.render(exam, problems))
+        second = asyncio.run(service.render(exam, problems))
+
+        assert first == second
+        assert first.read_bytes().startswith(b'%PDF')
+        assert (service.renders, service.hits) == (1, 1)
+
+    def test_key_tracks_content_and_settings(self, exam_data, dataset_root):
+        exam, problems = exam_data
+        service = ExamRenderService()
+        base = service.render_key(exam, problems, False)
+
+        assert service.render_key(exam, problems, True) != base
+
+        edited = dict(problems, p2=_problem('p2', 'problems/p2.png', answer='⑤'))
+        assert service.render_key(exam, edited, False) != base
+
+        _make_image(dataset_root / 'problems' / 'p2.png', size=(130, 80))
+        assert service.render_key(exam, problems, False) != base
+
+        current = service.render_key(exam, problems, False)
+        larger = _exam(['p1', 'p2', 'missing'], fontSize='large')
+        assert service.render_key(larger, problems, False) != current
+
+        # 상태/수정 시각은 결과에 영향 없음
+        exam.status = 'published'
+        exam.updatedAt = exam.updatedAt.replace(year=2000)
+        assert service.render_key(exam, problems, False) == current
+
+    def test_key_without_exporter(self, exam_data, monkeypatch):
+        exam, problems = exam_data
+        service = ExamRenderService()
+        expected = service.render_key(exam, problems, False)
+
+        def fail(*args):
+            raise AssertionError("키 계산에 내보내기 객체를 만들지 않음")
+
+        monkeypatch.setattr(render_service, 'get_exporter', fail)
+        assert service.render_key(exam, problems, False) == expected
+
+    def test_evicts_only_over_estimate(self, exam_data, monkeypatch):
+        exam, problems = exam_data
+        service = ExamRenderService()
+        walks = []
+        evict = service.evict
+        monkeypatch.setattr(service, 'evict', lambda: walks.append(1) or evict())
+
+        # 처음은 용량을 모르므로 확인, 이후 한도 안이면 확인 없음 (적중도 없음)
+        asyncio.run(service.render(exam, problems))
+        asyncio.run(service.render(exam, problems, True))
+        asyncio.run(service.render(exam, problems, True))
+        assert (service.renders, len(walks)) == (2, 1)
+
+        monkeypatch.setattr(config, 'EXAM_RENDER_CACHE_MAX_BYTES', 1)
+        asyncio.run(service.render(_exam(['p1', 'p2'], fontSize='large'), problems))
+        assert len(walks) == 2
+        assert service.stats()['files'] == 0
+
+    def test_concurrent_requests_render_once(self, exam_data):
+        exam, problems = exam_data
+        service = ExamRenderService()
+
+        async def download_twice():
+            return await asyncio.gather(
+                service.render(exam, problems, True),
+                service.render(exam, problems, True),
+            )
+
+        first, second = asyncio.run(download_twice())
+
+        assert first == second
+        assert service.renders == 1
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 66-B: 시험지 PDF 스트리밍 테스트
+
+테스트 항목:
+1. export_to_file - 경로/파일 객체에 바로 기록
+2. 워커 렌더링은 bytes 버퍼를 거치지 않음
+3. open_pdf_stream - 청크 단위 전송, 전송 중 캐시 파일이 삭제되어도 끝까지 전송
+4. /export/pdf StreamingResponse (Content-Length, 한글 파일명)
+"""
+import os
+import sys
+from urllib.parse import quote
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.exam_paper import ExamPaper, ExamProblemItem, ExamSection
+from app.models.problem import Problem, ProblemContent, ProblemSource
+from app.routers import exam_papers
+from app.services.exam import ExamPdfExporter, open_pdf_stream, shutdown_render_pool
+from app.services.exam import render_service
+from app.services.exam_paper import get_exam_paper_service
+from app.services.problems import get_problem_service
+
+
+@pytest.fixture
+def dataset_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setenv('EXAM_RENDER_WORKERS', '1')
+    yield tmp_path
+    shutdown_render_pool()
+
+
+def _exam(name='중간고사 1회', count=3):
+    items = [ExamProblemItem(id=f'item-{i}', problemId=f'p{i}', order=i + 1) for i in range(count)]
+    return ExamPaper(
+        id='exam-1', name=name,
+        sections=[ExamSection(id='s1', title='객관식', problems=items, order=1)],
+    )
+
+
+def _problems(count=3):
+    return {
+        f'p{i}': Problem(
+            id=f'p{i}',
+            content=ProblemContent(imageUrl=f'problems/p{i}.png', ocrText=f'문제 {i}', answer=str(i)),
+            source=ProblemSource(name='테스트'),
+        )
+        for i in range(count)
+    }
+
+
+class TestExportToFile:
+    """파일 출력 테스트"""
+
+    def test_path_and_file_object(self, dataset_root):
+        exporter = ExamPdfExporter(dataset_root)
+        path = dataset_root / 'out.pdf'
+
+        exporter.export_to_file(_exam(), _problems(), path, include_answer_key=True)
+        with open(dataset_root / 'out2.pdf', 'wb') as f:
+            exporter.export_to_file(_exam(), _problems(), f)
+
+        assert path.read_bytes().startswith(b'%PDF')
+        assert (dataset_root / 'out2.pdf').read_bytes().startswith(b'%PDF')
+
+    def test_worker_writes_without_bytes_buffer(self, dataset_root, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError('export_to_pdf 사용')
+
+        monkeypatch.setattr(ExamPdfExporter, 'export_to_pdf', fail)
+        out_path = dataset_root / 'cache' / 'pdf' / 'key.pdf'
+
+        size = render_service.render_exam_to_file(
+            _exam(), _problems(), False, str(out_path),
+            str(dataset_root), str(dataset_root / 'cache'), 150,
+        )
+
+        assert size == out_path.stat().st_size
+        assert list(out_path.parent.glob('.*.tmp')) == []
+
+
+class TestStream:
+    """스트리밍 테스트"""
+
+    def test_chunks_and_size(self, tmp_path):
+        path = tmp_path / 'a.pdf'
+        data = os.urandom(10_000)
+        path.write_bytes(data)
+
+        stream, size = open_pdf_stream(path, chunk_size=4096)
+        chunks = list(stream)
+
+        assert size == len(data)
+        assert [len(c) for c in chunks] == [4096, 4096, 1808]
+        assert b''.join(chunks) == data
+
+    def test_survives_eviction(self, tmp_path):
+        path = tmp_path / 'a.pdf'
+        path.write_bytes(b'x' * 5000)
+
+        stream, _ = open_pdf_stream(path, chunk_size=1000)
+        first = next(stream)
+        path.unlink()
+
+        assert len(first + b''.join(stream)) == 5000
+
+
+class TestEndpoint:
+    """엔드포인트 테스트"""
+
+    def test_streaming_response(self, dataset_root):
+        exam = _exam()
+        problems = _problems()
+
+        class ExamService:
+            def get(self, exam_id):
+                return exam if exam_id == exam.id else None
+
+        class ProblemService:
+            def bulk_get(self, ids):
+                return [problems[i] for i in ids if i in problems]
+
+        app = FastAPI()
+        app.include_router(exam_papers.router)
+        app.dependency_overrides[get_exam_paper_service] = ExamService
+        app.dependency_overrides[get_problem_service] = ProblemService
+        client = TestClient(app)
+
+        response = client.get('/api/exams/exam-1/export/pdf', params={'include_answer_key': True})
+
+        assert response.status_code == 200
+        assert response.headers['content-type'] == 'application/pdf'
+        assert int(response.headers['content-length']) == len(response.content)
+        assert response.content.startswith(b'%PDF')
+        disposition = response.headers['content-disposition']
+        assert "filename*=UTF-8''" + quote('중간고사_1회.pdf') in disposition
+        assert client.get('/api/exams/none/export/pdf').status_code == 404
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 66-C: 시험지 변형 일괄 생성 테스트
+
+테스트 항목:
+1. build_variant - 시드 기반 결정적 섞기, 순서 번호 재부여, 섹션 순서 지정, 원본 유지
+2. stream_pdfs_zip - 항목별 PDF + 실패 항목은 .error.txt
+3. /export/variants - 문제 한 번 조회, 같은 내용 변형은 한 번 렌더링, ZIP 스트리밍
+"""
+import asyncio
+import io
+import os
+import sys
+import zipfile
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.exam_paper import ExamPaper, ExamProblemItem, ExamSection, ExamVariantSpec
+from app.models.problem import Problem, ProblemContent, ProblemSource
+from app.routers import exam_papers
+from app.services.exam import exam_render_service, shutdown_render_pool, stream_pdfs_zip
+from app.services.exam_paper import ExamPaperService, get_exam_paper_service
+from app.services.problems import get_problem_service
+
+
+@pytest.fixture
+def dataset_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setenv('EXAM_RENDER_WORKERS', '2')
+    yield tmp_path
+    shutdown_render_pool()
+
+
+@pytest.fixture
+def service(tmp_path):
+    return ExamPaperService(data_dir=tmp_path / 'exam_papers')
+
+
+def _exam():
+    sections = []
+    for s, title in enumerate(['객관식', '주관식']):
+        items = [
+            ExamProblemItem(id=f's{s}-item{i}', problemId=f's{s}-p{i}', order=i + 1)
+            for i in range(8)
+        ]
+        sections.append(ExamSection(id=f's{s}', title=title, problems=items, order=s + 1))
+    return ExamPaper(id='exam-1', name='기말고사', sections=sections)
+
+
+def _problem_ids(exam):
+    return [[item.problemId for item in section.problems] for section in exam.sections]
+
+
+class TestBuildVariant:
+    """변형 생성 테스트"""
+
+    def test_deterministic_shuffle(self, service):
+        exam = _exam()
+        original = _problem_ids(exam)
+
+        a = service.build_variant(exam, ExamVariantSpec(seed=7), 0)
+        b = service.build_variant(exam, ExamVariantSpec(seed=7), 5)
+        c = service.build_variant(exam, ExamVariantSpec(seed=8), 0)
+
+        assert _problem_ids(a) == _problem_ids(b)
+        assert _problem_ids(a) != _problem_ids(c)
+        assert _problem_ids(a) != original
+        assert _problem_ids(exam) == original
+        for section in a.sections:
+            assert [item.order for item in section.problems] == list(range(1, 9))
+        assert (a.id, a.name, b.name) == ('exam-1-v1', '기말고사_01', '기말고사_06')
+
+    def test_default_seed_is_index(self, service):
+        exam = _exam()
+        assert _problem_ids(service.build_variant(exam, ExamVariantSpec(), 3)) == \
+            _problem_ids(service.build_variant(exam, ExamVariantSpec(seed=3), 0))
+
+    def test_section_order(self, service):
+        exam = _exam()
+
+        variant = service.build_variant(
+            exam, ExamVariantSpec(name='B형', shuffleProblems=False, sectionOrder=['s1']), 0
+        )
+
+        assert [s.id for s in variant.sections] == ['s1', 's0']
+        assert [s.order for s in variant.sections] == [1, 2]
+        assert _problem_ids(variant) == list(reversed(_problem_ids(exam)))
+        assert variant.name == 'B형'
+
+
+class TestZipStream:
+    """ZIP 스트리밍 테스트"""
+
+    def test_entries_and_failures(self, tmp_path):
+        a = tmp_path / 'a.pdf'
+        a.write_bytes(b'%PDF-a' * 1000)
+
+        async def ok():
+            return a
+
+        async def fail():
+            raise RuntimeError('렌더링 오류')
+
+        async def collect():
+            entries = [('01_A.pdf', ok()), ('02_B.pdf', fail())]
+            return [chunk async for chunk in stream_pdfs_zip(entries, chunk_size=512)]
+
+        chunks = asyncio.run(collect())
+        zf = zipfile.ZipFile(io.BytesIO(b''.join(chunks)))
+
+        assert len(chunks) > 3
+        assert zf.namelist() == ['01_A.pdf', '02_B.pdf.error.txt']
+        assert zf.read('01_A.pdf') == a.read_bytes()
+        assert '렌더링 오류' in zf.read('02_B.pdf.error.txt').decode('utf-8')
+        assert zf.testzip() is None
+
+
+class TestEndpoint:
+    """엔드포인트 테스트"""
+
+    def test_variants_zip(self, dataset_root):
+        exam = _exam()
+        bulk_calls = []
+
+        class ProblemService:
+            def bulk_get(self, ids):
+                bulk_calls.append(list(ids))
+                return [
+                    Problem(id=pid, content=ProblemContent(imageUrl=f'none/{pid}.png', answer='1'),
+                            source=ProblemSource(name='테스트'))
+                    for pid in ids
+                ]
+
+        exam_service = ExamPaperService(data_dir=dataset_root / 'exam_papers')
+        exam_service._cache[exam.id] = exam
+
+        app = FastAPI()
+        app.include_router(exam_papers.router)
+        app.dependency_overrides[get_exam_paper_service] = lambda: exam_service
+        app.dependency_overrides[get_problem_service] = ProblemService
+        client = TestClient(app)
+
+        before = exam_render_service.renders
+        response = client.post('/api/exams/exam-1/export/variants', json={
+            'variants': [{'seed': 1}, {'seed': 2}, {'seed': 1, 'name': 'A형 재출력'}],
+            'includeAnswerKey': True,
+        })
+
+        assert response.status_code == 200
+        assert response.headers['content-type'] == 'application/zip'
+        zf = zipfile.ZipFile(io.BytesIO(response.content))
+        assert zf.namelist() == ['01_기말고사_01.pdf', '02_기말고사_02.pdf', '03_A형_재출력.pdf']
+        assert all(zf.read(name).startswith(b'%PDF') for name in zf.namelist())
+        # 같은 시드 → 같은 구성 → 렌더링 한 번
+        assert exam_render_service.renders - before == 2
+        assert len(bulk_calls) == 1
+
+        bad = client.post('/api/exams/exam-1/export/variants', json={
+            'variants': [{'sectionOrder': ['없음']}],
+        })
+        assert bad.status_code == 400
+        assert client.post('/api/exams/none/export/variants', json={'variants': [{}]}).status_code == 404
+        assert client.post('/api/exams/exam-1/export/variants', json={'variants': []}).status_code == 422
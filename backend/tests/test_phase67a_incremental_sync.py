@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 67-A: SyncManager 증분 동기화 테스트
+
+테스트 항목:
+1. 바뀐 페이지만 다시 파싱 (stat 동일 → 건너뜀, 좌표만 바뀜 → 세션 변경 없음)
+2. 페이지 델타: 그룹 추가/수정/삭제, 페이지 파일 삭제
+3. 세션에서 다른 경로로 문제가 추가/삭제되면 그 페이지 재동기화
+4. 링크 동기화: 값이 같으면 다시 쓰지 않고, 외부에서 지워진 link는 복구
+5. 동기화 버전은 세션 파일에 저장되어 다음 요청에서 재사용
+"""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.work_session import ProblemReference, ProblemSolutionLink, WorkSession
+from app.routers import work_sessions as work_sessions_router
+from app.services import sync_manager as sync_manager_module
+from app.services.file_lock import atomic_json_write
+from app.services.groups_cache import groups_cache
+from app.services.session_index import session_index
+from app.services.sync_manager import SyncManager
+
+
+@pytest.fixture
+def docs(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setattr(config, 'DOCUMENTS_DIR', tmp_path)
+    monkeypatch.setattr(config, 'WORK_SESSIONS_DIR', tmp_path / 'work_sessions')
+    # 방금 쓴 파일도 mtime을 바로 신뢰 (연속 변경은 테스트에서 mtime을 명시적으로 바꿈)
+    monkeypatch.setattr(sync_manager_module, '_RACY_NS', 0)
+    session_index.invalidate()
+    yield tmp_path
+    session_index.invalidate()
+
+
+def _group(group_id, number, x=0, **extra):
+    return {
+        'id': group_id, 'blockIds': [x],
+        'problemInfo': {'problemNumber': number, 'bookName': '책'}, **extra,
+    }
+
+
+def _write_page(root, doc, page, groups, bump=0):
+    path = root / doc / 'groups' / f'page_{page:04d}_groups.json'
+    atomic_json_write(path, {'groups': groups})
+    # 같은 크기의 연속 쓰기도 다른 버전으로 보이도록 mtime 지정
+    mtime = time.time_ns() - 10_000_000_000 + bump
+    os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+def _book(root, pages=50, per_page=3):
+    for page in range(pages):
+        _write_page(root, 'doc', page, [_group(f'L{i}', str(page * per_page + i)) for i in range(per_page)])
+
+
+class TestIncrementalProblems:
+    """groups.json → session.problems"""
+
+    def test_only_changed_page_parsed(self, docs):
+        _book(docs)
+        manager = SyncManager()
+        session = WorkSession(problemDocumentId='doc')
+
+        first = manager.sync_problems_to_session(session)
+        second = manager.sync_problems_to_session(session)
+
+        assert (first.problems_added, first.pages_parsed) == (150, 50)
+        assert (second.pages_parsed, second.state_changed) == (0, False)
+
+        _write_page(docs, 'doc', 7, [_group('L0', '100'), _group('L1', '22'), _group('L9', '999')], bump=1)
+        before = groups_cache.stats()['misses']
+        third = manager.sync_problems_to_session(session)
+
+        assert third.pages_parsed == 1
+        assert groups_cache.stats()['misses'] - before == 1
+        assert (third.problems_added, third.problems_removed, third.problems_updated) == (1, 1, 1)
+        page7 = {p.groupId: p for p in session.problems if p.pageIndex == 7}
+        assert set(page7) == {'L0', 'L1', 'L9'}
+        assert page7['L0'].problemNumber == '100'
+        assert page7['L0'].displayName == '책_p8_100번'
+        assert len(session.problems) == 150
+
+    def test_irrelevant_edit_keeps_session(self, docs):
+        _write_page(docs, 'doc', 0, [_group('L1', '1')])
+        manager = SyncManager()
+        session = WorkSession(problemDocumentId='doc')
+        manager.sync_problems_to_session(session)
+
+        # 좌표만 바뀜 → 파싱은 하지만 문제 변경 없음
+        _write_page(docs, 'doc', 0, [_group('L1', '1', x=5)], bump=1)
+        result = manager.sync_problems_to_session(session)
+
+        assert result.pages_parsed == 1
+        assert (result.problems_added, result.problems_removed, result.problems_updated) == (0, 0, 0)
+
+    def test_parent_flag_and_deleted_page(self, docs):
+        _write_page(docs, 'doc', 0, [_group('L1', '1')])
+        page1 = _write_page(docs, 'doc', 1, [_group('L1', '2')])
+        manager = SyncManager()
+        session = WorkSession(problemDocumentId='doc')
+        manager.sync_problems_to_session(session)
+
+        _write_page(docs, 'doc', 0, [_group('L1', '1', isParent=True)], bump=1)
+        page1.unlink()
+        result = manager.sync_problems_to_session(session)
+
+        assert result.problems_removed == 1
+        assert [(p.pageIndex, p.isParent) for p in session.problems] == [(0, True)]
+        assert list(session.syncState.problemPages) == [0]
+
+    def test_session_edit_elsewhere_resyncs_page(self, docs):
+        _write_page(docs, 'doc', 0, [_group('L1', '1')])
+        manager = SyncManager()
+        session = WorkSession(problemDocumentId='doc')
+        manager.sync_problems_to_session(session)
+
+        # groups.json에 없는 문제가 세션에만 추가됨 (기존 전체 동기화와 같이 제거)
+        session.problems.append(ProblemReference(
+            groupId='X', documentId='doc', pageIndex=0, problemNumber='9'
+        ))
+        result = manager.sync_problems_to_session(session)
+
+        assert result.problems_removed == 1
+        assert [p.groupId for p in session.problems] == ['L1']
+
+        # 세션에서만 빠진 문제는 다시 추가
+        session.problems.clear()
+        assert manager.sync_problems_to_session(session).problems_added == 1
+
+
+class TestIncrementalLinks:
+    """session.links → groups.json.link"""
+
+    def _session(self, docs):
+        _write_page(docs, 'doc', 0, [_group('L1', '1'), _group('L2', '2')])
+        for page in range(10):
+            _write_page(docs, 'sol', page, [_group('S1', str(page)), _group('S2', str(page))])
+        session = WorkSession(problemDocumentId='doc', solutionDocumentId='sol')
+        session.links = [
+            ProblemSolutionLink(problemGroupId='L1', solutionGroupId='S1',
+                                solutionDocumentId='sol', solutionPageIndex=3, linkedAt=1),
+            ProblemSolutionLink(problemGroupId='L2', solutionGroupId='S2',
+                                solutionDocumentId='sol', solutionPageIndex=3, linkedAt=2),
+        ]
+        return session
+
+    def test_unchanged_links_not_rewritten(self, docs):
+        session = self._session(docs)
+        manager = SyncManager()
+
+        first = manager.full_sync(session)
+        page3 = docs / 'sol' / 'groups' / 'page_0003_groups.json'
+        mtime = page3.stat().st_mtime_ns
+        second = manager.full_sync(session)
+
+        assert first.links_synced == 2
+        assert (second.links_synced, second.pages_parsed, second.state_changed) == (0, 0, False)
+        assert page3.stat().st_mtime_ns == mtime
+        link = groups_cache.read(page3)['groups'][0]['link']
+        assert (link['linkedGroupId'], link['linkedName']) == ('L1', '책_p1_1번')
+
+    def test_external_change_restored(self, docs):
+        session = self._session(docs)
+        manager = SyncManager()
+        manager.full_sync(session)
+
+        # 프론트엔드가 link 없이 페이지를 다시 저장
+        _write_page(docs, 'sol', 3, [_group('S1', '3'), _group('S2', '3')], bump=1)
+        result = manager.sync_links_to_groups(session)
+
+        assert (result.links_synced, result.pages_parsed) == (2, 1)
+
+        # 새 링크 → 그 페이지만 갱신
+        session.links.append(ProblemSolutionLink(
+            problemGroupId='L1', solutionGroupId='S1',
+            solutionDocumentId='sol', solutionPageIndex=8, linkedAt=3,
+        ))
+        result = manager.sync_links_to_groups(session)
+        assert (result.links_synced, result.pages_parsed) == (1, 1)
+
+
+class TestRouter:
+    """full-sync 라우터: 동기화 버전을 세션 파일에 저장"""
+
+    def test_versions_persisted(self, docs):
+        _book(docs, pages=5)
+        session = WorkSession(problemDocumentId='doc')
+        work_sessions_router._save_session(session)
+
+        first = asyncio.run(work_sessions_router.full_sync(session.sessionId))
+        second = asyncio.run(work_sessions_router.full_sync(session.sessionId))
+        stored = work_sessions_router._load_session(session.sessionId)
+
+        assert first['problems_added'] == 15
+        assert second['problems_added'] == 0
+        assert len(stored.problems) == 15
+        assert sorted(stored.syncState.problemPages) == list(range(5))
+        assert SyncManager().sync_problems_to_session(stored).pages_parsed == 0
+
+        # 초기화하면 버전도 비움
+        asyncio.run(work_sessions_router.reset_session(session.sessionId))
+        assert work_sessions_router._load_session(session.sessionId).syncState.problemPages == {}
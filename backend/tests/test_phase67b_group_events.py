@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 67-B: 그룹 변경 이벤트 버스 테스트
+
+테스트 항목:
+1. 같은 (문서, 페이지) 이벤트 합치기, 배치 전달
+2. 백프레셔: 대기 페이지 상한 초과 시 문서 전체 이벤트로 합침
+3. 구독자 예외 격리
+4. 그룹 삭제 → 관련 세션 자동 동기화 (문제 목록 + 해설 link)
+5. 세션 조건부 저장: 그 사이 다른 저장이 있으면 다시 로드해 재적용
+6. 그룹 수정 → 내보낸 문제 메타 problem_info 갱신
+"""
+import os
+import sys
+import threading
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.work_session import ProblemSolutionLink, WorkSession
+from app.routers import work_sessions as work_sessions_router
+from app.services.file_lock import atomic_json_write
+from app.services.group_events import GroupChange, GroupEventBus, group_events
+from app.services.groups_cache import groups_cache
+from app.services.session_index import session_index
+from app.services.sync_manager import SyncResult, sync_manager
+from app.utils import load_json
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    monkeypatch.setattr(config, 'GROUP_EVENTS_BATCH_MS', 0)
+    bus = GroupEventBus()
+    yield bus
+    bus.shutdown()
+
+
+def _blocker(bus):
+    """첫 배치에서 멈추는 구독자 (그동안 들어온 이벤트는 대기열에 쌓임)"""
+    entered, gate = threading.Event(), threading.Event()
+
+    def block(batch):
+        entered.set()
+        gate.wait(5)
+
+    bus.subscribe('block', block)
+    return entered, gate
+
+
+@pytest.fixture
+def docs(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setattr(config, 'DOCUMENTS_DIR', tmp_path)
+    monkeypatch.setattr(config, 'WORK_SESSIONS_DIR', tmp_path / 'work_sessions')
+    monkeypatch.setattr(config, 'GROUP_EVENTS_BATCH_MS', 0)
+    session_index.invalidate()
+    yield tmp_path
+    group_events.flush(5)
+    session_index.invalidate()
+
+
+def _group(group_id, number):
+    return {'id': group_id, 'problemInfo': {'problemNumber': number, 'bookName': '책'}}
+
+
+def _write_page(root, doc, page, groups):
+    atomic_json_write(root / doc / 'groups' / f'page_{page:04d}_groups.json', {'groups': groups})
+
+
+class TestBus:
+    """이벤트 버스 테스트"""
+
+    def test_coalesce_into_one_batch(self, bus):
+        entered, gate = _blocker(bus)
+        batches = []
+        bus.subscribe('record', batches.append)
+
+        bus.publish('A', 0)          # 첫 배치 (구독자가 gate에서 대기)
+        assert entered.wait(5)
+        bus.publish('A', 1, 'updated', ('L1',))
+        bus.publish('A', 1, 'updated', ('L2',))
+        bus.publish('A', 1, 'updated', ('L1',))
+        bus.publish('B', 3, 'deleted', ('L9',))
+        gate.set()
+
+        assert bus.flush(5)
+        assert batches == [
+            [GroupChange('A', 0)],
+            [GroupChange('A', 1, 'updated', ('L1', 'L2')), GroupChange('B', 3, 'deleted', ('L9',))],
+        ]
+        assert bus.stats()['coalesced'] == 2
+
+    def test_backpressure_collapses_document(self, bus, monkeypatch):
+        monkeypatch.setattr(config, 'GROUP_EVENTS_MAX_PENDING', 3)
+        entered, gate = _blocker(bus)
+        batches = []
+        bus.subscribe('record', batches.append)
+
+        bus.publish('X', 0)
+        assert entered.wait(5)
+        for page in range(10):
+            bus.publish('A', page)
+        bus.publish('A', 99)  # 문서 전체 이벤트에 합쳐짐
+        assert bus.stats()['pending'] <= 3
+        gate.set()
+
+        assert bus.flush(5)
+        assert GroupChange('A', None) in batches[-1]
+        assert all(change.document_id != 'A' or change.page_index is None for change in batches[-1])
+        assert bus.stats()['collapsed'] == 1
+
+    def test_subscriber_error_isolated(self, bus):
+        received = []
+
+        def fail(batch):
+            raise RuntimeError('구독자 오류')
+
+        bus.subscribe('fail', fail)
+        bus.subscribe('ok', received.extend)
+        bus.publish('A', 0)
+        bus.publish('A', 0)  # 지연 없이도 같은 배치거나 다음 배치로 전달
+        assert bus.flush(5)
+        bus.publish('A', 2)
+        assert bus.flush(5)
+
+        assert GroupChange('A', 2) in received
+        assert bus.stats()['errors'] == bus.stats()['batches']
+
+
+class TestSessionSync:
+    """세션 자동 동기화 테스트"""
+
+    def _session(self, docs):
+        _write_page(docs, 'doc', 0, [_group('L1', '1'), _group('L2', '2')])
+        _write_page(docs, 'sol', 0, [_group('S1', '1'), _group('S2', '2')])
+        session = WorkSession(problemDocumentId='doc', solutionDocumentId='sol')
+        sync_manager.sync_problems_to_session(session)
+        session.links = [ProblemSolutionLink(
+            problemGroupId='L1', solutionGroupId='S1', solutionDocumentId='sol', solutionPageIndex=0
+        )]
+        work_sessions_router._save_session(session)
+        return session
+
+    def test_delete_syncs_session(self, docs):
+        session = self._session(docs)
+
+        assert sync_manager.delete_group_from_disk('doc', 0, 'L2') is True
+        assert group_events.flush(5)
+
+        stored = work_sessions_router._load_session(session.sessionId)
+        assert [p.groupId for p in stored.problems] == ['L1']
+        # 같은 이벤트에서 해설 link도 기록
+        link = groups_cache.read(docs / 'sol' / 'groups' / 'page_0000_groups.json')['groups'][0]['link']
+        assert link['linkedGroupId'] == 'L1'
+        assert session_index.get(session.sessionId).problems == stored.problems
+
+    def test_unrelated_document_untouched(self, docs):
+        session = self._session(docs)
+        path = config.get_work_session_path(session.sessionId)
+        before = path.stat().st_mtime_ns
+
+        _write_page(docs, 'other', 0, [_group('L1', '1')])
+        sync_manager.delete_group_from_disk('other', 0, 'L1')
+        assert group_events.flush(5)
+
+        assert path.stat().st_mtime_ns == before
+
+    def test_conditional_save_retries(self, docs):
+        session = self._session(docs)
+        _write_page(docs, 'doc', 0, [_group('L1', '1'), _group('L2', '2'), _group('L3', '3')])
+        calls = []
+
+        def apply(loaded):
+            calls.append(1)
+            if len(calls) == 1:
+                # 요청 처리 중인 라우터가 그 사이 세션 저장 (링크 추가)
+                concurrent = work_sessions_router._load_session(session.sessionId)
+                concurrent.links.append(ProblemSolutionLink(
+                    problemGroupId='L2', solutionGroupId='S2', solutionDocumentId='sol', solutionPageIndex=0
+                ))
+                work_sessions_router._save_session(concurrent)
+            return sync_manager.full_sync(loaded)
+
+        result = sync_manager.update_session(session.sessionId, apply)
+        stored = work_sessions_router._load_session(session.sessionId)
+
+        assert len(calls) == 2
+        assert isinstance(result, SyncResult) and result.success
+        assert [p.groupId for p in stored.problems] == ['L1', 'L2', 'L3']
+        assert [l.problemGroupId for l in stored.links] == ['L1', 'L2']
+
+    def test_export_meta_refreshed(self, docs):
+        _write_page(docs, 'doc', 2, [_group('L1', '1')])
+        meta_path = docs / 'doc' / 'problems' / 'doc_p0002_L1.json'
+        atomic_json_write(meta_path, {'group_id': 'L1', 'problem_info': {'problemNumber': '1'}})
+
+        _write_page(docs, 'doc', 2, [_group('L1', '7')])
+        group_events.publish('doc', 2, 'updated', ('L1',))
+        assert group_events.flush(5)
+
+        assert load_json(meta_path)['problem_info'] == {'problemNumber': '7', 'bookName': '책'}
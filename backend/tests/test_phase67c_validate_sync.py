@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 67-C: validate-sync 페이지 단위 검증 테스트
+
+테스트 항목:
+1. groups.json은 페이지당 한 번만 읽음
+2. orphan 문제/연결 링크 제거, groups 파일 없는 페이지
+3. 같은 그룹 ID가 다른 페이지에 남아 있으면 그 문제와 링크는 유지
+4. dry_run: 보고만 하고 세션은 저장하지 않음
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.work_session import ProblemReference, ProblemSolutionLink, WorkSession
+from app.routers import work_sessions as work_sessions_router
+from app.services import groups_cache as groups_cache_module
+from app.services.file_lock import atomic_json_write
+from app.services.session_index import session_index
+
+
+@pytest.fixture
+def docs(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setattr(config, 'DOCUMENTS_DIR', tmp_path)
+    monkeypatch.setattr(config, 'WORK_SESSIONS_DIR', tmp_path / 'work_sessions')
+    session_index.invalidate()
+    yield tmp_path
+    session_index.invalidate()
+
+
+def _session(docs, pages=5, per_page=8):
+    session = WorkSession(problemDocumentId='doc', solutionDocumentId='sol')
+    for page in range(pages):
+        group_ids = [f'L{i}' for i in range(per_page)]
+        atomic_json_write(
+            docs / 'doc' / 'groups' / f'page_{page:04d}_groups.json',
+            {'groups': [{'id': g} for g in group_ids if not (page == 1 and g == 'L3')]},
+        )
+        for g in group_ids:
+            session.problems.append(ProblemReference(
+                groupId=g, documentId='doc', pageIndex=page, problemNumber='1'
+            ))
+    # groups 파일이 없는 페이지
+    session.problems.append(ProblemReference(groupId='Z1', documentId='doc', pageIndex=9, problemNumber='1'))
+    session.links = [
+        ProblemSolutionLink(problemGroupId=g, solutionGroupId=f'S{g}', solutionDocumentId='sol', solutionPageIndex=0)
+        for g in ('L3', 'Z1', 'L0')
+    ]
+    work_sessions_router._save_session(session)
+    return session
+
+
+class TestValidateSync:
+    """validate-sync 테스트"""
+
+    def test_one_read_per_page(self, docs, monkeypatch):
+        session = _session(docs)
+        reads = []
+        original = groups_cache_module.JsonFileCache.read
+
+        def counting_read(self, path):
+            reads.append(str(path))
+            return original(self, path)
+
+        monkeypatch.setattr(groups_cache_module.JsonFileCache, 'read', counting_read)
+        result = asyncio.run(work_sessions_router.validate_sync(session.sessionId))
+
+        assert len(reads) == len(set(reads)) == 6
+        assert result['status'] == 'fixed'
+        assert sorted((d['type'], d['page'], d['problem']) for d in result['details']) == [
+            ('missing_groups_file', 9, 'Z1'), ('orphan_problem', 1, 'L3'),
+        ]
+
+    def test_keeps_same_id_on_other_pages(self, docs):
+        session = _session(docs)
+
+        result = asyncio.run(work_sessions_router.validate_sync(session.sessionId))
+        stored = work_sessions_router._load_session(session.sessionId)
+
+        assert (result['issues_fixed'], result['links_removed']) == (2, 1)
+        assert len(stored.problems) == 40 - 1
+        # L3은 다른 페이지에 남아 있으므로 링크 유지, Z1 링크만 제거
+        assert [l.problemGroupId for l in stored.links] == ['L3', 'L0']
+        assert ('doc', 1, 'L3') not in {(p.documentId, p.pageIndex, p.groupId) for p in stored.problems}
+
+    def test_dry_run_does_not_save(self, docs):
+        session = _session(docs)
+        path = config.get_work_session_path(session.sessionId)
+        before = path.read_bytes()
+
+        result = asyncio.run(work_sessions_router.validate_sync(session.sessionId, dry_run=True))
+
+        assert path.read_bytes() == before
+        assert result['status'] == 'pending' and result['dry_run'] is True
+        assert (result['issues_found'], result['issues_fixed'], result['links_removed']) == (2, 0, 1)
+        assert {d['action'] for d in result['details']} == {'would_remove'}
+
+        # 실제 검증 후에는 dry_run도 ok
+        asyncio.run(work_sessions_router.validate_sync(session.sessionId))
+        assert asyncio.run(work_sessions_router.validate_sync(session.sessionId, dry_run=True))['status'] == 'ok'
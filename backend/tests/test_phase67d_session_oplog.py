@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 67-D: 작업 세션 로그 테스트
+
+테스트 항목:
+1. 문제 추가/연결 생성은 로그 한 줄 추가 (스냅샷 파일은 그대로), 새 저장소에서 재생하면 같은 상태
+2. 스냅샷 주기마다 압축 (로그는 되돌리기 이력만 유지)
+3. 끊긴 마지막 줄은 읽을 때 무시하고 다음 쓰기에서 잘라냄
+4. 다른 워커의 작업 추가 감지 (저장소 / session_index), 변경 기록에 있는 세션 로그만 확인,
+   다른 세션의 작업은 서로 기다리지 않음
+5. 되돌리기: 연결 교체 → 이전 연결 + 해설 groups.json link 복원, 문제 삭제는 409
+6. 조건부 저장: 그 사이 작업이 추가되면 다시 로드해 재적용 (sync_manager / 라우터), 계속 바뀌면 409
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.work_session import (
+    AddProblemRequest, CreateLinkRequest, ProblemSolutionLink, WorkSession, WorkSessionUpdate,
+)
+from app.routers import work_sessions as work_sessions_router
+from app.services.file_lock import atomic_json_write, stripe_index
+from app.services.groups_cache import groups_cache
+from app.services import session_index as session_index_module
+from app.services.session_index import session_index
+from app.services.session_store import WorkSessionStore, link_change, session_store
+from app.services.sync_manager import SyncResult, sync_manager
+
+
+@pytest.fixture
+def docs(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setattr(config, 'DOCUMENTS_DIR', tmp_path)
+    monkeypatch.setattr(config, 'WORK_SESSIONS_DIR', tmp_path / 'work_sessions')
+    session_index.invalidate()
+    session_store.invalidate()
+    yield tmp_path
+    session_index.invalidate()
+    session_store.invalidate()
+
+
+def _session(docs, problems=3, session_id=None):
+    atomic_json_write(
+        docs / 'sol' / 'groups' / 'page_0000_groups.json',
+        {'groups': [{'id': 'S1'}, {'id': 'S2'}]},
+    )
+    session = WorkSession(problemDocumentId='doc', solutionDocumentId='sol')
+    if session_id:
+        session.sessionId = session_id
+    work_sessions_router._save_session(session)
+    for i in range(problems):
+        asyncio.run(work_sessions_router.add_problem(
+            session.sessionId, AddProblemRequest(groupId=f'L{i}', pageIndex=0, problemNumber=str(i + 1))
+        ))
+    return session.sessionId
+
+
+def _link(session_id, problem, solution):
+    return asyncio.run(work_sessions_router.create_link(session_id, CreateLinkRequest(
+        problemGroupId=problem, solutionGroupId=solution, solutionDocumentId='sol', solutionPageIndex=0
+    )))
+
+
+def _state(session):
+    return (
+        [(p.groupId, p.problemNumber) for p in session.problems],
+        [(l.problemGroupId, l.solutionGroupId) for l in session.links],
+    )
+
+
+def _log_lines(session_id):
+    return config.get_work_session_log_path(session_id).read_bytes().splitlines()
+
+
+class TestOpLog:
+    """작업 로그 테스트"""
+
+    def test_append_without_snapshot_rewrite(self, docs):
+        session_id = _session(docs)
+        snapshot = config.get_work_session_path(session_id)
+        before = (snapshot.read_bytes(), snapshot.stat().st_mtime_ns)
+
+        _link(session_id, 'L0', 'S1')
+        session = asyncio.run(work_sessions_router.add_problem(
+            session_id, AddProblemRequest(groupId='L1', pageIndex=0, problemNumber='9')
+        ))
+
+        assert (snapshot.read_bytes(), snapshot.stat().st_mtime_ns) == before
+        assert len(_log_lines(session_id)) == 5
+        assert session.opSeq == 5
+        assert _state(session) == ([('L0', '1'), ('L1', '9'), ('L2', '3')], [('L0', 'S1')])
+        # 다른 프로세스(새 저장소)에서 스냅샷 + 로그 재생
+        assert _state(WorkSessionStore().load(session_id)) == _state(session)
+
+    def test_compaction_keeps_undo_history(self, docs, monkeypatch):
+        monkeypatch.setattr(config, 'SESSION_SNAPSHOT_EVERY', 4)
+        monkeypatch.setattr(config, 'SESSION_UNDO_DEPTH', 2)
+        session_id = _session(docs, problems=5)
+
+        stored = WorkSession(**json.loads(config.get_work_session_path(session_id).read_text(encoding='utf-8')))
+        assert stored.opSeq == 4
+        assert len(_log_lines(session_id)) == 3  # 압축 후 남긴 2개 + 이후 작업 1개
+
+        fresh = WorkSessionStore()
+        assert _state(fresh.load(session_id)) == _state(session_store.load(session_id))
+        assert fresh.stats()['replayed'] == 1
+        assert [h['seq'] for h in fresh.history(session_id)] == [5, 4, 3]
+
+    def test_torn_tail_ignored_and_truncated(self, docs):
+        session_id = _session(docs, problems=1)
+        log_path = config.get_work_session_log_path(session_id)
+        with open(log_path, 'ab') as f:
+            f.write(b'{"seq":2,"op":"add_pro')
+
+        assert len(WorkSessionStore().load(session_id).problems) == 1
+
+        _link(session_id, 'L0', 'S1')
+        lines = _log_lines(session_id)
+        assert len(lines) == 2 and lines[-1].startswith(b'{"seq":2,"op":"create_link"')
+        assert _state(WorkSessionStore().load(session_id)) == ([('L0', '1')], [('L0', 'S1')])
+
+    def test_other_worker_append_detected(self, docs):
+        session_id = _session(docs, problems=2)
+        assert session_index.get_solution_link('doc', 'L1') is None
+
+        # 다른 워커: 자기 저장소로 작업 추가 (이 프로세스의 put 없음, 디렉토리 mtime 그대로)
+        other = WorkSessionStore()
+        link = ProblemSolutionLink(
+            problemGroupId='L1', solutionGroupId='S2', solutionDocumentId='sol', solutionPageIndex=0
+        )
+        other.apply(session_id, 'create_link', lambda session: [link_change(None, link)])
+
+        assert session_index.get_solution_link('doc', 'L1').solutionGroupId == 'S2'
+        assert session_store.load(session_id).opSeq == 3
+
+    def test_only_changed_session_log_checked(self, docs, monkeypatch):
+        session_id = _session(docs, problems=2)
+        others = [_session(docs, problems=1) for _ in range(3)]
+        # 디렉토리 mtime을 과거로 → 파일 목록이 그대로인 경로
+        os.utime(config.WORK_SESSIONS_DIR, ns=(10**18, 10**18))
+        assert len(session_index.list_sessions()) == 4
+
+        checked = []
+        log_signature = session_index_module._log_signature
+
+        def counting(sid):
+            checked.append(sid)
+            return log_signature(sid)
+
+        monkeypatch.setattr(session_index_module, '_log_signature', counting)
+        assert session_index.get_solution_link('doc', 'L1') is None
+        assert checked == []
+
+        link = ProblemSolutionLink(
+            problemGroupId='L1', solutionGroupId='S2', solutionDocumentId='sol', solutionPageIndex=0
+        )
+        WorkSessionStore().apply(session_id, 'create_link', lambda session: [link_change(None, link)])
+
+        assert session_index.get_solution_link('doc', 'L1').solutionGroupId == 'S2'
+        assert checked == [session_id]
+        assert all(session_index.get(sid) is not None for sid in others)
+
+    def test_sessions_do_not_wait_for_each_other(self, docs):
+        # 경로 해시(crc32 % LOCK_STRIPES)가 같은 두 세션 - 스트라이프 잠금이면 서로 기다림
+        bucket = stripe_index(str(config.get_work_session_path('busy')))
+        other_id = next(
+            f'other{i}' for i in range(10000)
+            if stripe_index(str(config.get_work_session_path(f'other{i}'))) == bucket
+        )
+        busy, other = _session(docs, problems=1, session_id='busy'), _session(docs, problems=1, session_id=other_id)
+        entered, release = threading.Event(), threading.Event()
+
+        def slow_build(session):
+            entered.set()
+            release.wait(5)
+            return []
+
+        worker = threading.Thread(target=session_store.apply, args=(busy, 'noop', slow_build))
+        worker.start()
+        try:
+            assert entered.wait(5)
+            loaded = []
+            reader = threading.Thread(target=lambda: loaded.append(session_store.load(other)))
+            reader.start()
+            reader.join(2)
+            assert loaded and loaded[0].sessionId == other
+        finally:
+            release.set()
+            worker.join()
+
+
+class TestUndo:
+    """되돌리기 테스트"""
+
+    def test_undo_replaced_link(self, docs):
+        session_id = _session(docs)
+        sol_page = docs / 'sol' / 'groups' / 'page_0000_groups.json'
+        _link(session_id, 'L0', 'S1')
+        _link(session_id, 'L0', 'S2')  # 교체
+
+        session = asyncio.run(work_sessions_router.undo_operation(session_id))
+
+        assert _state(session)[1] == [('L0', 'S1')]
+        groups = {g['id']: g for g in groups_cache.read(sol_page)['groups']}
+        assert groups['S1']['link']['linkedGroupId'] == 'L0'
+        assert 'link' not in groups['S2']
+
+        history = asyncio.run(work_sessions_router.get_history(session_id))['items']
+        assert [(h['op'], h['undone']) for h in history[:3]] == [
+            ('undo', False), ('create_link', True), ('create_link', False),
+        ]
+
+        # 이어서 되돌리면 첫 연결, 그 다음은 문제 추가
+        asyncio.run(work_sessions_router.undo_operation(session_id))
+        session = asyncio.run(work_sessions_router.undo_operation(session_id))
+        assert _state(session) == ([('L0', '1'), ('L1', '2')], [])
+        assert 'link' not in groups_cache.read(sol_page)['groups'][0]
+
+    def test_remove_problem_not_undoable(self, docs):
+        session_id = _session(docs)
+        atomic_json_write(docs / 'doc' / 'groups' / 'page_0000_groups.json', {'groups': [{'id': 'L2'}]})
+        asyncio.run(work_sessions_router.remove_problem(session_id, 'L2'))
+
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(work_sessions_router.undo_operation(session_id))
+
+        assert exc.value.status_code == 409
+        assert [p.groupId for p in session_store.load(session_id).problems] == ['L0', 'L1']
+
+
+class TestConditionalSave:
+    """조건부 저장 테스트"""
+
+    def test_append_between_load_and_save_retries(self, docs):
+        session_id = _session(docs, problems=1)
+        calls = []
+
+        def apply(loaded):
+            calls.append(1)
+            if len(calls) == 1:
+                _link(session_id, 'L0', 'S1')  # 그 사이 다른 요청의 작업
+            loaded.lastProblemPage = 7
+            return SyncResult(success=True, state_changed=True)
+
+        result = sync_manager.update_session(session_id, apply)
+        stored = session_store.load(session_id)
+
+        assert len(calls) == 2 and result.success
+        assert stored.lastProblemPage == 7
+        assert _state(stored)[1] == [('L0', 'S1')]
+        assert WorkSessionStore().load(session_id).lastProblemPage == 7
+
+    def _race_loads(self, monkeypatch, session_id, times):
+        """load_for_update 직후 다른 요청의 연결 작업 (처음 times번)"""
+        load_for_update = session_store.load_for_update
+        calls = []
+
+        def racing(sid):
+            loaded = load_for_update(sid)
+            calls.append(1)
+            if len(calls) <= times:
+                # 라우터 이벤트 루프 안이므로 다른 스레드에서 실행
+                other = threading.Thread(target=_link, args=(session_id, 'L0', 'S1' if len(calls) % 2 else 'S2'))
+                other.start()
+                other.join()
+            return loaded
+
+        monkeypatch.setattr(session_store, 'load_for_update', racing)
+        return calls
+
+    def test_router_update_keeps_concurrent_link(self, docs, monkeypatch):
+        session_id = _session(docs, problems=1)
+        calls = self._race_loads(monkeypatch, session_id, times=1)
+
+        session = asyncio.run(work_sessions_router.update_session(
+            session_id, WorkSessionUpdate(lastProblemPage=7)
+        ))
+
+        assert len(calls) == 2
+        stored = WorkSessionStore().load(session_id)
+        for s in (session, stored):
+            assert s.lastProblemPage == 7 and _state(s)[1] == [('L0', 'S1')]
+
+    def test_router_update_conflict(self, docs, monkeypatch):
+        session_id = _session(docs, problems=1)
+        self._race_loads(monkeypatch, session_id, times=100)
+
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(work_sessions_router.update_session(session_id, WorkSessionUpdate(lastProblemPage=7)))
+
+        assert exc.value.status_code == 409
+        assert session_store.load(session_id).lastProblemPage != 7
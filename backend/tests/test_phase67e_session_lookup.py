@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 67-E: 작업 세션 키 색인 테스트
+
+테스트 항목:
+1. 문제(페이지:그룹) / 연결(문제 그룹) / 역방향(해설 페이지:그룹) 조회
+2. 리스트 교체/추가/삭제 후 조회하면 색인 다시 만듦
+3. 작업 적용 시 색인을 새 세션에 넘김 (다시 만들지 않음), 이전 세션 색인은 그대로
+4. session_index 부분 갱신 결과가 전체 색인과 같음
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.work_session import (
+    AddProblemRequest, CreateLinkRequest, ProblemReference, ProblemSolutionLink, WorkSession,
+)
+from app.routers import work_sessions as work_sessions_router
+from app.services.file_lock import atomic_json_write
+from app.services.session_index import session_index
+from app.services.session_store import apply_changes, link_change, problem_change, session_store
+
+
+@pytest.fixture
+def docs(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setattr(config, 'DOCUMENTS_DIR', tmp_path)
+    monkeypatch.setattr(config, 'WORK_SESSIONS_DIR', tmp_path / 'work_sessions')
+    session_index.invalidate()
+    session_store.invalidate()
+    yield tmp_path
+    session_index.invalidate()
+    session_store.invalidate()
+
+
+def _problem(group_id, page=0):
+    return ProblemReference(groupId=group_id, documentId='doc', pageIndex=page, problemNumber=group_id)
+
+
+def _link(problem, solution, page=0):
+    return ProblemSolutionLink(
+        problemGroupId=problem, solutionGroupId=solution, solutionDocumentId='sol', solutionPageIndex=page
+    )
+
+
+def _session():
+    return WorkSession(
+        problemDocumentId='doc',
+        solutionDocumentId='sol',
+        problems=[_problem('L0', 0), _problem('L1', 0), _problem('L1', 2)],
+        links=[_link('L0', 'S1'), _link('L1', 'S1', page=1)],
+    )
+
+
+class TestLookup:
+    """키 색인 조회 테스트"""
+
+    def test_keyed_queries(self):
+        session = _session()
+
+        assert session.find_problem('L1', 2) is session.problems[2]
+        assert session.find_problem('L1') is session.problems[1]
+        assert session.find_problem('L1', 5) is None
+        assert [p.pageIndex for p in session.problems_for_group('L1')] == [0, 2]
+        assert session.get_link('L0') is session.links[0]
+        assert session.get_link('L9') is None
+        assert session.links_for_solution(0, 'S1') == [session.links[0]]
+        assert session.links_for_solution(1, 'S1') == [session.links[1]]
+
+    def test_rebuilt_after_list_change(self):
+        session = _session()
+        first = session.lookup()
+
+        session.links.append(_link('L1', 'S2'))
+        assert session.lookup() is not first
+        assert [l.solutionGroupId for l in session.links_for_problem('L1')] == ['S1', 'S2']
+
+        session.problems = [_problem('L7')]
+        assert session.find_problem('L0') is None
+        assert session.find_problem('L7').groupId == 'L7'
+
+        # 개수를 유지한 교체는 명시적으로 무효화
+        session.problems[0] = _problem('L8')
+        session.invalidate_lookup()
+        assert session.find_problem('L8') is session.problems[0]
+
+
+class TestApplyChanges:
+    """작업 적용 시 색인 유지 테스트"""
+
+    def test_lookup_carried_to_new_session(self):
+        session = _session()
+        before = session.lookup()
+        old_link = session.links[0]
+
+        updated = apply_changes(session, [
+            link_change(old_link, _link('L0', 'S3')),
+            problem_change(None, _problem('L2', 1)),
+            problem_change(session.problems[1], None),
+        ], seq=1, at=0)
+
+        lookup = updated.__pydantic_private__['_lookup']
+        assert lookup is not before and lookup.valid_for(updated.problems, updated.links)
+        assert updated.get_link('L0').solutionGroupId == 'S3'
+        assert updated.links_for_solution(0, 'S1') == []
+        assert updated.find_problem('L2', 1) is updated.problems[-1]
+        assert [p.pageIndex for p in updated.problems_for_group('L1')] == [2]
+
+        # 이전 세션과 색인은 그대로
+        assert session.lookup() is before
+        assert session.get_link('L0') is old_link
+        assert len(session.problems_for_group('L1')) == 2
+
+
+def _create_link(session_id, problem, solution):
+    asyncio.run(work_sessions_router.create_link(session_id, CreateLinkRequest(
+        problemGroupId=problem, solutionGroupId=solution, solutionDocumentId='sol', solutionPageIndex=0
+    )))
+
+
+def _dump_links():
+    return {
+        key: {sid: (link.model_dump(), problem and problem.model_dump()) for sid, (link, problem) in entries.items()}
+        for key, entries in session_index._links.items()
+    }
+
+
+class TestSessionIndex:
+    """session_index 부분 갱신 테스트"""
+
+    def test_partial_put_matches_full_index(self, docs):
+        atomic_json_write(
+            docs / 'sol' / 'groups' / 'page_0000_groups.json', {'groups': [{'id': 'S1'}, {'id': 'S2'}]}
+        )
+        atomic_json_write(docs / 'doc' / 'groups' / 'page_0000_groups.json', {'groups': [{'id': 'L1'}]})
+        session = WorkSession(problemDocumentId='doc', solutionDocumentId='sol')
+        work_sessions_router._save_session(session)
+        session_id = session.sessionId
+        assert session_index.find_by_document('doc')  # 스캔 완료 → 이후 put은 부분 갱신
+
+        for group_id in ('L0', 'L1'):
+            asyncio.run(work_sessions_router.add_problem(
+                session_id, AddProblemRequest(groupId=group_id, pageIndex=0, problemNumber='1')
+            ))
+        for problem, solution in (('L0', 'S1'), ('L1', 'S2')):
+            _create_link(session_id, problem, solution)
+        asyncio.run(work_sessions_router.remove_problem(session_id, 'L1'))
+        _create_link(session_id, 'L0', 'S2')
+        asyncio.run(work_sessions_router.undo_operation(session_id))  # L0 → S1 복원
+
+        partial = _dump_links()
+        assert session_index.get_solution_link('doc', 'L0').solutionGroupId == 'S1'
+        assert session_index.get_solution_link('doc', 'L1') is None
+
+        session_index.invalidate()
+        session_index.find_by_document('doc')
+        assert partial == _dump_links()
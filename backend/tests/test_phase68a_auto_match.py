@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 68-A: 문제-해설 자동 매칭 테스트
+
+테스트 항목:
+1. 번호 정규화
+2. 단원마다 번호가 다시 시작해도 순서로 구분, 신뢰도 (유일/이웃)
+3. 번호가 빠진 그룹은 빈 구간 크기가 같을 때만 위치로 매칭
+4. 해설 읽기 순서는 groups.json 순서가 아니라 블록 배치 (왼쪽 단 → 오른쪽 단)
+5. apply: 기준 이상만 연결 + groups.json link, undo 한 번으로 전부 되돌림
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.work_session import (
+    AddProblemRequest, AutoMatchRequest, CreateLinkRequest, WorkSession,
+)
+from app.routers import work_sessions as work_sessions_router
+from app.services.auto_matcher import auto_matcher, match_items, normalize_number
+from app.services.file_lock import atomic_json_write
+from app.services.groups_cache import groups_cache
+from app.services.session_index import session_index
+from app.services.session_store import session_store
+
+
+@pytest.fixture
+def docs(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    monkeypatch.setattr(config, 'DOCUMENTS_DIR', tmp_path)
+    monkeypatch.setattr(config, 'WORK_SESSIONS_DIR', tmp_path / 'work_sessions')
+    session_index.invalidate()
+    session_store.invalidate()
+    yield tmp_path
+    session_index.invalidate()
+    session_store.invalidate()
+
+
+def _write_page(docs, document_id, page, groups):
+    """groups: [(그룹 ID, 번호, 단, y)] - 블록 하나씩"""
+    atomic_json_write(docs / document_id / 'groups' / f'page_{page:04d}_groups.json', {'groups': [
+        {'id': gid, 'column': column, 'block_ids': [i], 'problemInfo': {'problemNumber': number}}
+        for i, (gid, number, column, _) in enumerate(groups)
+    ]})
+    atomic_json_write(docs / document_id / 'blocks' / f'page_{page:04d}_blocks.json', {
+        'page_index': page, 'width': 1000, 'height': 1400,
+        'blocks': [
+            {'block_id': i, 'bbox': [100 if column == 'L' else 600, y, 400 if column == 'L' else 900, y + 50]}
+            for i, (_, _, column, y) in enumerate(groups)
+        ],
+    })
+
+
+class TestMatchItems:
+    """번호 + 순서 매칭 테스트"""
+
+    def test_normalize_number(self):
+        assert normalize_number(' 01번 ') == '1'
+        assert normalize_number('예제 02') == '예제2'
+        assert normalize_number('(10)') == '10'
+        assert normalize_number(None) == ''
+
+    def test_restarting_numbers_follow_order(self):
+        problems = ['1', '2', '3', '1', '2', '3']
+        solutions = ['1', '2', '3', '1', '2', '3']
+
+        result = match_items(problems, solutions)
+
+        assert [(p, s) for p, s, _, _ in result] == [(i, i) for i in range(6)]
+        # 번호가 중복 → 유일 보너스 없음, 끝 항목은 한쪽 이웃만
+        assert [c for _, _, c, _ in result] == [0.625, 0.75, 0.75, 0.75, 0.75, 0.625]
+
+    def test_unique_numbers_and_skipped_solution(self):
+        result = match_items(['1', '2', '3'], ['1', '2', '9', '3'])
+
+        assert [(p, s, c) for p, s, c, _ in result] == [(0, 0, 0.875), (1, 1, 0.875), (2, 3, 0.75)]
+
+    def test_position_fill_only_for_missing_numbers(self):
+        # 문제 2번 번호 누락, 해설 쪽 빈 구간도 하나 → 위치 매칭
+        result = match_items(['1', '', '3'], ['1', '2', '3'])
+        assert (1, 1, 0.4, 'position') in result
+
+        # 빈 구간 크기가 다르면 매칭하지 않음
+        result = match_items(['1', '', '3'], ['1', '2', '2', '3'])
+        assert all(r[3] == 'number' for r in result) and len(result) == 2
+
+        # 양쪽 번호가 있는데 다르면 후보로 내지 않음
+        result = match_items(['1', '5', '3'], ['1', '2', '3'])
+        assert [p for p, _, _, _ in result] == [0, 2]
+
+
+class TestSuggest:
+    """세션 후보 테스트"""
+
+    def _session(self, docs, linked=()):
+        _write_page(docs, 'doc', 0, [('P1', '1', 'L', 100), ('P2', '2', 'L', 600), ('P3', '3', 'R', 100)])
+        # groups.json 순서는 뒤섞였지만 블록 배치는 S1(왼쪽 위) → S2(왼쪽 아래) → S3(오른쪽)
+        _write_page(docs, 'sol', 0, [('S3', '3', 'R', 50), ('S1', '1', 'L', 100), ('S2', '2', 'L', 700)])
+        _write_page(docs, 'sol', 1, [('S4', '4', 'L', 100)])
+        session = WorkSession(problemDocumentId='doc', solutionDocumentId='sol')
+        work_sessions_router._save_session(session)
+        for gid, number in (('P1', '1'), ('P2', '2'), ('P3', '3')):
+            asyncio.run(work_sessions_router.add_problem(
+                session.sessionId, AddProblemRequest(groupId=gid, pageIndex=0, problemNumber=number)
+            ))
+        for problem, solution in linked:
+            asyncio.run(work_sessions_router.create_link(session.sessionId, CreateLinkRequest(
+                problemGroupId=problem, solutionGroupId=solution, solutionDocumentId='sol', solutionPageIndex=0
+            )))
+        return session.sessionId
+
+    def test_layout_order_and_linked_excluded(self, docs):
+        session_id = self._session(docs, linked=[('P1', 'S1')])
+
+        suggestions = auto_matcher.suggest(session_store.load(session_id))
+
+        assert [(s.problemGroupId, s.solutionGroupId, s.reason) for s in suggestions] == [
+            ('P2', 'S2', 'number'), ('P3', 'S3', 'number'),
+        ]
+        assert [s.confidence for s in suggestions] == [0.875, 0.875]
+
+    def test_apply_links_and_undo(self, docs):
+        session_id = self._session(docs)
+        # P2 번호를 지워 위치 매칭(검수 대상)으로
+        session = session_store.load(session_id)
+        work_sessions_router._save_session(session.model_copy(update={'problems': [
+            p.model_copy(update={'problemNumber': ''}) if p.groupId == 'P2' else p for p in session.problems
+        ]}))
+
+        result = asyncio.run(work_sessions_router.auto_match(session_id, AutoMatchRequest(apply=True)))
+
+        assert [(s.problemGroupId, s.reason, s.needsReview) for s in result.suggestions] == [
+            ('P1', 'number', False), ('P2', 'position', True), ('P3', 'number', False),
+        ]
+        assert (result.applied, result.needsReview, result.unmatched) == (2, 1, 0)
+        assert [(l.problemGroupId, l.solutionGroupId) for l in result.session.links] == [('P1', 'S1'), ('P3', 'S3')]
+        sol_groups = {g['id']: g for g in groups_cache.read(docs / 'sol' / 'groups' / 'page_0000_groups.json')['groups']}
+        assert sol_groups['S1']['link']['linkedGroupId'] == 'P1'
+        assert 'link' not in sol_groups['S2']
+
+        # 작업 하나로 기록 → undo 한 번에 전부 되돌림
+        session = asyncio.run(work_sessions_router.undo_operation(session_id))
+        assert session.links == []
+        sol_groups = groups_cache.read(docs / 'sol' / 'groups' / 'page_0000_groups.json')['groups']
+        assert all('link' not in g for g in sol_groups)
+
+    def test_dry_run_does_not_link(self, docs):
+        session_id = self._session(docs)
+
+        result = asyncio.run(work_sessions_router.auto_match(session_id, None))
+
+        assert result.applied == 0 and result.session is None
+        assert len(result.suggestions) == 3
+        assert session_store.load(session_id).links == []
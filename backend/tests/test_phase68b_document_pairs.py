@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 68-B: 문서 페어 색인 저장소 테스트
+
+테스트 항목:
+1. 페어 ID / 문서 쌍 / 문서별 색인 조회, 중복 생성, archived 재활성화
+2. 매칭 수 증가는 카운터 로그 한 줄 (스냅샷 그대로), 다른 인스턴스(워커)에서 재생
+3. 구조 변경 시 카운터를 스냅샷에 합침, 로그 삭제 전 중단돼도 중복 반영 없음
+4. 기존 리스트 형식 읽기, 압축 주기
+5. 여러 인스턴스 동시 증가 합계
+"""
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import config
+from app.models.document_pair import CreatePairRequest, UpdatePairRequest
+from app.services import document_pair_service as pair_module
+from app.services.document_pair_service import DocumentPairService
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATASET_ROOT', tmp_path)
+    return DocumentPairService()
+
+
+def _create(service, problem='doc', solution='sol'):
+    return service.create_pair(CreatePairRequest(problem_document_id=problem, solution_document_id=solution))
+
+
+class TestIndexedLookup:
+    """색인 조회 테스트"""
+
+    def test_lookups(self, service):
+        a = _create(service, 'doc', 'sol')
+        b = _create(service, 'doc', 'sol2')
+        assert _create(service, 'doc', 'sol').id == a.id
+
+        assert service.get_pair(b.id).solution_document_id == 'sol2'
+        assert service.get_pair('missing') is None
+        assert service.get_pair_by_documents('doc', 'sol2').id == b.id
+        assert [p.id for p in service.get_pairs_for_document('doc')] == [a.id, b.id]
+        assert [p.id for p in service.get_pairs_for_document('sol')] == [a.id]
+
+        assert service.delete_pair(a.id)
+        assert [p.id for p in service.list_pairs('archived')] == [a.id]
+        assert _create(service, 'doc', 'sol').status == 'active'
+
+        assert service.delete_pair(b.id, hard_delete=True)
+        assert service.get_pair_by_documents('doc', 'sol2') is None
+        assert [p.id for p in service.get_pairs_for_document('sol2')] == []
+
+    def test_reads_do_not_reparse(self, service):
+        pair = _create(service)
+        loads = service.stats()['loads']
+        for _ in range(5):
+            service.get_pair(pair.id)
+            service.get_pairs_for_document('doc')
+        assert service.stats()['loads'] == loads
+
+    def test_legacy_list_format(self, service):
+        service.system_dir.mkdir(parents=True)
+        service.pairs_file.write_text(json.dumps([{
+            'id': 'p1', 'problem_document_id': 'doc', 'solution_document_id': 'sol',
+            'created_at': '2024-01-01T00:00:00', 'status': 'active', 'matched_count': 4,
+        }]), encoding='utf-8')
+
+        assert service.increment_matched_count('p1').matched_count == 5
+        assert service.get_pair_by_documents('doc', 'sol').matched_count == 5
+
+
+class TestCounters:
+    """매칭 수 카운터 테스트"""
+
+    def test_increment_appends_without_snapshot_rewrite(self, service):
+        pair = _create(service)
+        before = (service.pairs_file.read_bytes(), service.pairs_file.stat().st_mtime_ns)
+
+        for _ in range(3):
+            service.increment_matched_count(pair.id)
+        assert service.increment_matched_count(pair.id, 2).matched_count == 5
+        assert service.increment_matched_count('missing') is None
+
+        assert (service.pairs_file.read_bytes(), service.pairs_file.stat().st_mtime_ns) == before
+        assert len(service.counters_file.read_bytes().splitlines()) == 4
+
+        # 다른 워커 (새 인스턴스)
+        other = DocumentPairService()
+        assert other.get_pair(pair.id).matched_count == 5
+        other.increment_matched_count(pair.id)
+        assert service.get_pair(pair.id).matched_count == 6
+        assert service.get_stats().total_matched == 6
+
+    def test_structural_change_folds_counters(self, service):
+        pair = _create(service)
+        service.increment_matched_count(pair.id, 3)
+
+        other = DocumentPairService()
+        other.update_pair(pair.id, UpdatePairRequest(last_session_id='ws-1'))
+
+        assert not service.counters_file.exists()
+        stored = json.loads(service.pairs_file.read_text(encoding='utf-8'))
+        assert stored['counterSeq'] == 1 and stored['pairs'][0]['matched_count'] == 3
+        assert service.get_pair(pair.id).model_dump(include={'matched_count', 'last_session_id'}) == {
+            'matched_count': 3, 'last_session_id': 'ws-1',
+        }
+
+    def test_stale_log_after_interrupted_fold(self, service):
+        pair = _create(service)
+        service.increment_matched_count(pair.id, 2)
+        log = service.counters_file.read_bytes()
+        service.update_pair(pair.id, UpdatePairRequest(status='active'))
+
+        # 스냅샷 교체 후 로그 삭제 전에 중단된 상태 재현
+        service.counters_file.write_bytes(log)
+        assert DocumentPairService().get_pair(pair.id).matched_count == 2
+
+        # 이후 증가는 이어지는 seq로 반영
+        fresh = DocumentPairService()
+        fresh.increment_matched_count(pair.id)
+        assert DocumentPairService().get_pair(pair.id).matched_count == 3
+
+    def test_compaction(self, service, monkeypatch):
+        monkeypatch.setattr(pair_module, 'COUNTER_COMPACT_EVERY', 3)
+        pair = _create(service)
+        for _ in range(4):
+            service.increment_matched_count(pair.id)
+
+        assert len(service.counters_file.read_bytes().splitlines()) == 1
+        assert json.loads(service.pairs_file.read_text(encoding='utf-8'))['pairs'][0]['matched_count'] == 3
+        assert DocumentPairService().get_pair(pair.id).matched_count == 4
+
+    def test_concurrent_increments(self, service):
+        pair = _create(service)
+        workers = [DocumentPairService() for _ in range(4)]
+
+        def run(worker):
+            for _ in range(25):
+                worker.increment_matched_count(pair.id)
+
+        threads = [threading.Thread(target=run, args=(w,)) for w in workers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert DocumentPairService().get_pair(pair.id).matched_count == 100
+        assert service.get_pair(pair.id).matched_count == 100
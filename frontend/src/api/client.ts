@@ -302,6 +302,8 @@ export interface WorkSession {
   // Phase 48: 마지막 작업 페이지
   lastProblemPage?: number;
   lastSolutionPage?: number;
+  // Phase 67-D: 마지막으로 반영된 작업 번호
+  opSeq?: number;
   createdAt: number;
   updatedAt: number;
   status: 'active' | 'completed' | 'cancelled';
@@ -323,6 +325,28 @@ export interface WorkSessionListResponse {
   total: number;
 }
 
+// Phase 68-A: 자동 매칭 후보
+export interface AutoMatchSuggestion {
+  problemGroupId: string;
+  problemPageIndex: number;
+  problemNumber: string;
+  solutionGroupId: string;
+  solutionDocumentId: string;
+  solutionPageIndex: number;
+  solutionNumber: string;
+  confidence: number;
+  reason: 'number' | 'position';
+  needsReview: boolean;
+}
+
+export interface AutoMatchResponse {
+  suggestions: AutoMatchSuggestion[];
+  applied: number;
+  needsReview: number;
+  unmatched: number;
+  session: WorkSession | null;
+}
+
 export interface AllGroupsResponse {
   document_id: string;
   total_groups: number;
@@ -1056,6 +1080,41 @@ export const api = {
     return response.data;
   },
 
+  // Phase 67-D: 가장 최근 작업 되돌리기 (문제 추가, 연결 생성/삭제)
+  undoSessionOperation: async (sessionId: string): Promise<WorkSession> => {
+    const response = await apiClient.post<WorkSession>(`/api/work-sessions/${sessionId}/undo`);
+    return response.data;
+  },
+
+  // Phase 67-D: 최근 작업 이력 (최신순)
+  getSessionHistory: async (sessionId: string, limit = 50): Promise<{
+    session_id: string;
+    items: Array<{
+      seq: number;
+      op: string;
+      at: number;
+      undoable: boolean;
+      undone: boolean;
+      target: number | null;
+    }>;
+    total: number;
+  }> => {
+    const response = await apiClient.get(`/api/work-sessions/${sessionId}/history`, { params: { limit } });
+    return response.data;
+  },
+
+  // Phase 68-A: 자동 매칭 (apply=false면 후보만, true면 신뢰도 기준 이상 연결)
+  autoMatchSession: async (
+    sessionId: string,
+    options: { apply?: boolean; minConfidence?: number } = {}
+  ): Promise<AutoMatchResponse> => {
+    const response = await apiClient.post<AutoMatchResponse>(
+      `/api/work-sessions/${sessionId}/auto-match`,
+      options
+    );
+    return response.data;
+  },
+
   // groups.json에서 문제 동기화
   syncProblemsFromGroups: async (sessionId: string): Promise<WorkSession> => {
     const response = await apiClient.post<WorkSession>(`/api/work-sessions/${sessionId}/sync-problems`);
@@ -1098,10 +1157,13 @@ export const api = {
   },
 
   // Phase 59-B: 동기화 검증 (orphan 문제 정리)
-  validateSync: async (sessionId: string): Promise<{
-    status: 'ok' | 'fixed';
+  // Phase 67-C: dryRun이면 저장하지 않고 제거 대상만 보고
+  validateSync: async (sessionId: string, dryRun = false): Promise<{
+    status: 'ok' | 'fixed' | 'pending';
+    dry_run: boolean;
     issues_found: number;
     issues_fixed: number;
+    links_removed: number;
     details: Array<{
       type: string;
       problem: string;
@@ -1110,7 +1172,9 @@ export const api = {
       action: string;
     }>;
   }> => {
-    const response = await apiClient.post(`/api/work-sessions/${sessionId}/validate-sync`);
+    const response = await apiClient.post(`/api/work-sessions/${sessionId}/validate-sync`, null, {
+      params: { dry_run: dryRun }
+    });
     return response.data;
   },
 
@@ -444,7 +444,8 @@ class PDFPipeline:
         document_id: Optional[str] = None,
         initial_pages: int = 10,
         dpi: int = 150,
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        metadata: Optional[dict] = None
     ) -> dict:
         """
         점진적 PDF 처리 (Phase 14-1)
@@ -462,6 +463,7 @@ class PDFPipeline:
             initial_pages: 초기 처리 페이지 수 (기본 10)
             dpi: 이미지 해상도
             progress_callback: 진행 상황 콜백
+            metadata: 이미 추출한 get_pdf_metadata 결과 (Phase 64-A, 있으면 재추출 생략)
 
         Returns:
             {
@@ -486,7 +488,8 @@ class PDFPipeline:
         if progress_callback:
             progress_callback("메타데이터 추출 중...", 0, 100)
 
-        metadata = self.pdf_processor.get_pdf_metadata(pdf_path)
+        if metadata is None:
+            metadata = self.pdf_processor.get_pdf_metadata(pdf_path)
         total_pages = metadata["total_pages"]
 
         print(f"\n[1/3] 메타데이터 추출 완료")
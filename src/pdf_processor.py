@@ -404,6 +404,9 @@ class PDFProcessor:
             image_filename = f"page_{page_num:04d}.png"
             image_path = pages_dir / image_filename
 
+            # Phase 64-B: 기존 파일은 blob 하드 링크일 수 있으므로 덮어쓰지 않고 새로 생성
+            image_path.unlink(missing_ok=True)
+
             # PNG로 저장
             pix.save(str(image_path))
 